@@ -0,0 +1,33 @@
+"""index agent_sessions.sdk_session_id
+
+Revision ID: 7b2d41c9e5a3
+Revises: c06fbe64c0cf
+Create Date: 2026-10-18 11:03:27.814092
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7b2d41c9e5a3"
+down_revision: Union[str, Sequence[str], None] = "c06fbe64c0cf"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        op.f("ix_agent_sessions_sdk_session_id"),
+        "agent_sessions",
+        ["sdk_session_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_agent_sessions_sdk_session_id"), table_name="agent_sessions")
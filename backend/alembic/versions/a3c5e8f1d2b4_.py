@@ -0,0 +1,29 @@
+"""add agent_sessions.state_seq
+
+Revision ID: a3c5e8f1d2b4
+Revises: 6dd7517c0d5f
+Create Date: 2026-02-09 10:12:44.318205
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a3c5e8f1d2b4"
+down_revision: Union[str, Sequence[str], None] = "6dd7517c0d5f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("agent_sessions", sa.Column("state_seq", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("agent_sessions", "state_seq")
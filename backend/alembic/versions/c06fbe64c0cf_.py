@@ -0,0 +1,134 @@
+"""add hot-path composite indexes and store payloads as JSONB
+
+Revision ID: c06fbe64c0cf
+Revises: a3c5e8f1d2b4
+Create Date: 2026-10-18 09:41:12.503118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c06fbe64c0cf"
+down_revision: Union[str, Sequence[str], None] = "a3c5e8f1d2b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+JSONB_COLUMNS: list[tuple[str, str, bool]] = [
+    ("agent_messages", "content", False),
+    ("agent_sessions", "config_snapshot", True),
+    ("agent_sessions", "state_patch", True),
+    ("agent_runs", "config_snapshot", True),
+    ("tool_executions", "tool_input", True),
+    ("tool_executions", "tool_output", True),
+]
+
+QUEUED_WHERE = "status = 'queued'"
+ACTIVE_WHERE = "status IN ('queued', 'claimed', 'running')"
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_agent_messages_session_id_id",
+        "agent_messages",
+        ["session_id", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tool_executions_session_id_created_at",
+        "tool_executions",
+        ["session_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tool_executions_session_id_message_id",
+        "tool_executions",
+        ["session_id", "message_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tool_executions_result_message_id",
+        "tool_executions",
+        ["result_message_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_agent_runs_queued_scheduled_at",
+        "agent_runs",
+        ["scheduled_at", "created_at"],
+        unique=False,
+        postgresql_where=sa.text(QUEUED_WHERE),
+        sqlite_where=sa.text(QUEUED_WHERE),
+    )
+    op.create_index(
+        "ix_agent_runs_session_active",
+        "agent_runs",
+        ["session_id", "created_at"],
+        unique=False,
+        postgresql_where=sa.text(ACTIVE_WHERE),
+        sqlite_where=sa.text(ACTIVE_WHERE),
+    )
+    op.create_index(
+        "ix_agent_runs_session_id_status_created_at",
+        "agent_runs",
+        ["session_id", "status", "created_at"],
+        unique=False,
+    )
+
+    if _is_postgresql():
+        for table, column, nullable in JSONB_COLUMNS:
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.JSON(),
+                type_=postgresql.JSONB(astext_type=sa.Text()),
+                existing_nullable=nullable,
+                postgresql_using=f"{column}::jsonb",
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _is_postgresql():
+        for table, column, nullable in reversed(JSONB_COLUMNS):
+            op.alter_column(
+                table,
+                column,
+                existing_type=postgresql.JSONB(astext_type=sa.Text()),
+                type_=sa.JSON(),
+                existing_nullable=nullable,
+                postgresql_using=f"{column}::json",
+            )
+
+    op.drop_index("ix_agent_runs_session_id_status_created_at", table_name="agent_runs")
+    op.drop_index(
+        "ix_agent_runs_session_active",
+        table_name="agent_runs",
+        postgresql_where=sa.text(ACTIVE_WHERE),
+        sqlite_where=sa.text(ACTIVE_WHERE),
+    )
+    op.drop_index(
+        "ix_agent_runs_queued_scheduled_at",
+        table_name="agent_runs",
+        postgresql_where=sa.text(QUEUED_WHERE),
+        sqlite_where=sa.text(QUEUED_WHERE),
+    )
+    op.drop_index("ix_tool_executions_result_message_id", table_name="tool_executions")
+    op.drop_index(
+        "ix_tool_executions_session_id_message_id", table_name="tool_executions"
+    )
+    op.drop_index(
+        "ix_tool_executions_session_id_created_at", table_name="tool_executions"
+    )
+    op.drop_index("ix_agent_messages_session_id_id", table_name="agent_messages")
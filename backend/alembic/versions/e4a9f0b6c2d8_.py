@@ -0,0 +1,33 @@
+"""add object keys for offloaded message and tool payloads
+
+Revision ID: e4a9f0b6c2d8
+Revises: 7b2d41c9e5a3
+Create Date: 2026-10-18 13:26:51.207734
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e4a9f0b6c2d8"
+down_revision: Union[str, Sequence[str], None] = "7b2d41c9e5a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("agent_messages", sa.Column("content_key", sa.Text(), nullable=True))
+    op.add_column(
+        "tool_executions", sa.Column("tool_output_key", sa.Text(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("tool_executions", "tool_output_key")
+    op.drop_column("agent_messages", "content_key")
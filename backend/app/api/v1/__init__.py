@@ -9,9 +9,11 @@ from app.api.v1 import (
     internal_env_vars,
     internal_slash_commands,
     internal_mcp_config,
+    internal_payloads,
     internal_scheduled_tasks,
     internal_skill_config,
     internal_subagents,
+    internal_user_config,
     internal_user_input_requests,
     mcp_servers,
     messages,
@@ -51,6 +53,8 @@ api_v1_router.include_router(internal_env_vars.router)
 api_v1_router.include_router(internal_mcp_config.router)
 api_v1_router.include_router(internal_skill_config.router)
 api_v1_router.include_router(internal_scheduled_tasks.router)
+api_v1_router.include_router(internal_payloads.router)
+api_v1_router.include_router(internal_user_config.router)
 api_v1_router.include_router(internal_user_input_requests.router)
 api_v1_router.include_router(internal_slash_commands.router)
 api_v1_router.include_router(internal_subagents.router)
@@ -2,33 +2,56 @@ import logging
 
 from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
-
-from app.core.deps import get_db
-from app.schemas.callback import AgentCallbackRequest, CallbackResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import get_async_db
+from app.schemas.callback import (
+    AgentCallbackBatchRequest,
+    AgentCallbackRequest,
+    CallbackResponse,
+)
 from app.schemas.response import Response, ResponseSchema
 from app.services.callback_service import CallbackService
+from app.services.payload_offload_service import PayloadOffloadService
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/callback", tags=["callback"])
 
 callback_service = CallbackService()
+payload_offload_service = PayloadOffloadService()
 
 
 @router.post("", response_model=ResponseSchema[CallbackResponse])
 async def receive_callback(
     callback: AgentCallbackRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Receives executor callback and updates session status."""
-    result = callback_service.process_agent_callback(db, callback)
+    await payload_offload_service.offload_callbacks_async([callback])
+    result = await db.run_sync(callback_service.process_agent_callback, callback)
     return Response.success(
         data=result,
         message="Callback processed successfully",
     )
 
 
+@router.post("/batch", response_model=ResponseSchema[list[CallbackResponse]])
+async def receive_callback_batch(
+    batch: AgentCallbackBatchRequest,
+    db: AsyncSession = Depends(get_async_db),
+) -> JSONResponse:
+    """Receives a batch of executor callbacks and persists them in one transaction."""
+    await payload_offload_service.offload_callbacks_async(batch.callbacks)
+    result = await db.run_sync(
+        callback_service.process_agent_callbacks, batch.callbacks
+    )
+    return Response.success(
+        data=result,
+        message="Callbacks processed successfully",
+    )
+
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -0,0 +1,56 @@
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from app.core.deps import get_db
+from app.core.errors.error_codes import ErrorCode
+from app.core.errors.exceptions import AppException
+from app.core.settings import get_settings
+from app.schemas.payload import PayloadBackfillRequest, PayloadBackfillResponse
+from app.schemas.response import Response, ResponseSchema
+from app.services.payload_offload_service import PayloadOffloadService
+
+router = APIRouter(prefix="/internal", tags=["internal"])
+
+payload_offload_service = PayloadOffloadService()
+
+
+def require_internal_token(
+    x_internal_token: str | None = Header(default=None, alias="X-Internal-Token"),
+) -> None:
+    settings = get_settings()
+    if not settings.internal_api_token:
+        raise AppException(
+            error_code=ErrorCode.FORBIDDEN,
+            message="Internal API token is not configured",
+        )
+    if not x_internal_token or x_internal_token != settings.internal_api_token:
+        raise AppException(
+            error_code=ErrorCode.FORBIDDEN,
+            message="Invalid internal token",
+        )
+
+
+@router.post(
+    "/payloads/offload-backfill",
+    response_model=ResponseSchema[PayloadBackfillResponse],
+)
+def backfill_payload_offload(
+    request: PayloadBackfillRequest,
+    _: None = Depends(require_internal_token),
+    db: Session = Depends(get_db),
+) -> JSONResponse:
+    """Move one batch of existing oversized payloads to object storage.
+
+    Runs in the threadpool since it uploads to S3. Repeat with the returned
+    ``last_*`` ids as ``after_*`` cursors until it reports ``done``.
+    """
+    result = payload_offload_service.backfill(
+        db,
+        limit=request.limit,
+        after_message_id=request.after_message_id,
+        after_tool_execution_id=request.after_tool_execution_id,
+    )
+    return Response.success(
+        data=result.model_dump(), message="Payload backfill batch processed"
+    )
@@ -38,7 +38,7 @@ def require_internal_token(
     "/scheduled-tasks/dispatch-due",
     response_model=ResponseSchema[ScheduledTaskDispatchResponse],
 )
-async def dispatch_due_scheduled_tasks(
+def dispatch_due_scheduled_tasks(
     request: ScheduledTaskDispatchRequest,
     _: None = Depends(require_internal_token),
     db: Session = Depends(get_db),
@@ -1,10 +1,15 @@
+import asyncio
+import time
 import uuid
+from contextlib import suppress
+from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, Header
+from fastapi import APIRouter, Depends, Header, Query
 from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.deps import get_db
+from app.core.deps import get_async_db, get_db
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
 from app.core.settings import get_settings
@@ -13,8 +18,13 @@ from app.schemas.user_input_request import (
     UserInputRequestCreateRequest,
     UserInputRequestResponse,
 )
+from app.services.user_input_notifier import user_input_notifier
 from app.services.user_input_request_service import UserInputRequestService
 
+# Answers committed by another backend process send no wake-up; waiters re-read
+# the request at least this often.
+WAIT_RECHECK_SECONDS = 5.0
+
 router = APIRouter(prefix="/internal", tags=["internal"])
 
 user_input_service = UserInputRequestService()
@@ -60,3 +70,46 @@ async def get_user_input_request(
 ) -> JSONResponse:
     result = user_input_service.get_request(db, request_id=str(request_id))
     return Response.success(data=result, message="User input request retrieved")
+
+
+@router.get(
+    "/user-input-requests/{request_id}/wait",
+    response_model=ResponseSchema[UserInputRequestResponse],
+)
+async def wait_user_input_request(
+    request_id: uuid.UUID,
+    wait_seconds: float = Query(default=0, ge=0),
+    _: None = Depends(require_internal_token),
+    db: AsyncSession = Depends(get_async_db),
+) -> JSONResponse:
+    """Get a request, long-polling up to ``wait_seconds`` while it is pending.
+
+    Returns as soon as the request is answered or expires, or with the still
+    pending request once the wait is over.
+    """
+    key = str(request_id)
+    max_wait = max(0.0, get_settings().user_input_max_wait_seconds)
+    deadline = time.monotonic() + min(wait_seconds, max_wait)
+    while True:
+        # Subscribe before reading so an answer committed meanwhile is not missed.
+        wakeup = user_input_notifier.subscribe(key)
+        try:
+            result = await db.run_sync(user_input_service.get_request, key)
+            # End the read transaction so the next pass sees new commits.
+            await db.rollback()
+            remaining = deadline - time.monotonic()
+            if result.status != "pending" or remaining <= 0:
+                break
+            until_expiry = (
+                result.expires_at - datetime.now(timezone.utc)
+            ).total_seconds()
+            with suppress(TimeoutError):
+                await asyncio.wait_for(
+                    wakeup.wait(),
+                    timeout=max(
+                        0.0, min(remaining, until_expiry, WAIT_RECHECK_SECONDS)
+                    ),
+                )
+        finally:
+            user_input_notifier.unsubscribe(key, wakeup)
+    return Response.success(data=result, message="User input request retrieved")
@@ -1,30 +1,36 @@
+from typing import Any
+
 from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import get_current_user_id, get_db
+from app.core.deps import get_async_db, get_current_user_id
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
 from app.schemas.message import MessageResponse
 from app.schemas.response import Response, ResponseSchema
 from app.services.message_service import MessageService
+from app.services.payload_offload_service import PayloadOffloadService
 from app.services.session_service import SessionService
+from app.services.tool_execution_service import ToolExecutionService
 
 router = APIRouter(prefix="/messages", tags=["messages"])
 
 message_service = MessageService()
 session_service = SessionService()
+tool_execution_service = ToolExecutionService()
+payload_offload_service = PayloadOffloadService()
 
 
 @router.get("/{message_id}", response_model=ResponseSchema[MessageResponse])
 async def get_message(
     message_id: int,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Gets a message by ID."""
-    message = message_service.get_message(db, message_id)
-    db_session = session_service.get_session(db, message.session_id)
+    message = await db.run_sync(message_service.get_message, message_id)
+    db_session = await db.run_sync(session_service.get_session, message.session_id)
     if db_session.user_id != user_id:
         raise AppException(
             error_code=ErrorCode.FORBIDDEN,
@@ -34,3 +40,60 @@ async def get_message(
         data=MessageResponse.model_validate(message),
         message="Message retrieved successfully",
     )
+
+
+@router.get("/{message_id}/content", response_model=ResponseSchema[dict[str, Any]])
+async def get_message_content(
+    message_id: int,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db),
+) -> JSONResponse:
+    """Gets the full content of a message whose content was offloaded."""
+    message = await db.run_sync(message_service.get_message, message_id)
+    db_session = await db.run_sync(session_service.get_session, message.session_id)
+    if db_session.user_id != user_id:
+        raise AppException(
+            error_code=ErrorCode.FORBIDDEN,
+            message="Message does not belong to the user",
+        )
+    content_key = message.content_key
+    content = message.content
+    await db.close()
+    if content_key:
+        content = await payload_offload_service.load_async(content_key)
+    return Response.success(data=content, message="Message content retrieved")
+
+
+@router.get(
+    "/{message_id}/tool-outputs/{tool_use_id}",
+    response_model=ResponseSchema[dict[str, Any] | None],
+)
+async def get_message_tool_output(
+    message_id: int,
+    tool_use_id: str,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db),
+) -> JSONResponse:
+    """Gets the full output of a tool result in a message.
+
+    Lets clients expand a truncated ToolResultBlock without knowing the tool
+    execution id.
+    """
+    message = await db.run_sync(message_service.get_message, message_id)
+    db_session = await db.run_sync(session_service.get_session, message.session_id)
+    if db_session.user_id != user_id:
+        raise AppException(
+            error_code=ErrorCode.FORBIDDEN,
+            message="Message does not belong to the user",
+        )
+    execution = await db.run_sync(
+        tool_execution_service.get_tool_execution_by_tool_use_id,
+        message.session_id,
+        tool_use_id,
+    )
+    output_key = execution.tool_output_key
+    output = execution.tool_output
+    await db.close()
+    if output_key:
+        output = await payload_offload_service.load_async(output_key)
+    return Response.success(data=output, message="Tool output retrieved")
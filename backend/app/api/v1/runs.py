@@ -1,20 +1,27 @@
+import asyncio
+import time
 import uuid
+from contextlib import suppress
 
 from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import get_current_user_id, get_db
+from app.core.deps import get_async_db, get_current_user_id
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
+from app.core.settings import get_settings
 from app.schemas.response import Response, ResponseSchema
 from app.schemas.run import (
+    RunClaimBatchRequest,
     RunClaimRequest,
     RunClaimResponse,
     RunFailRequest,
+    RunReleaseRequest,
     RunResponse,
     RunStartRequest,
 )
+from app.services.run_queue_notifier import run_queue_notifier
 from app.services.run_service import RunService
 from app.services.session_service import SessionService
 
@@ -27,32 +34,73 @@ session_service = SessionService()
 @router.post("/claim", response_model=ResponseSchema[RunClaimResponse | None])
 async def claim_next_run(
     request: RunClaimRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Claim the next available run for execution."""
-    result = run_service.claim_next_run(db, request)
+    result = await db.run_sync(run_service.claim_next_run, request)
     return Response.success(data=result, message="Run claimed" if result else "No runs")
 
 
+@router.post("/claim-batch", response_model=ResponseSchema[list[RunClaimResponse]])
+async def claim_runs(
+    request: RunClaimBatchRequest,
+    db: AsyncSession = Depends(get_async_db),
+) -> JSONResponse:
+    """Claim up to ``limit`` runs in one round trip.
+
+    With ``wait_seconds`` the request long-polls: it returns as soon as runs
+    become claimable (new run enqueued, session freed, lease released) or
+    with an empty list once the wait expires.
+    """
+    max_wait = max(0.0, get_settings().run_claim_max_wait_seconds)
+    deadline = time.monotonic() + min(request.wait_seconds, max_wait)
+    while True:
+        # Subscribe before claiming so runs enqueued meanwhile are not missed.
+        wakeup = run_queue_notifier.subscribe()
+        try:
+            result = await db.run_sync(run_service.claim_runs, request)
+            remaining = deadline - time.monotonic()
+            if result or remaining <= 0:
+                break
+            with suppress(TimeoutError):
+                await asyncio.wait_for(wakeup.wait(), timeout=remaining)
+        finally:
+            run_queue_notifier.unsubscribe(wakeup)
+    return Response.success(
+        data=result, message=f"Claimed {len(result)} runs" if result else "No runs"
+    )
+
+
 @router.post("/{run_id}/start", response_model=ResponseSchema[RunResponse])
 async def start_run(
     run_id: uuid.UUID,
     request: RunStartRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Mark a run as running (after dispatch accepted)."""
-    result = run_service.start_run(db, run_id, request)
+    result = await db.run_sync(run_service.start_run, run_id, request)
     return Response.success(data=result, message="Run started")
 
 
+@router.post("/{run_id}/release", response_model=ResponseSchema[RunResponse])
+async def release_run(
+    run_id: uuid.UUID,
+    request: RunReleaseRequest,
+    db: AsyncSession = Depends(get_async_db),
+) -> JSONResponse:
+    """Return a claimed run to the queue (the worker could not start it)."""
+    result = await db.run_sync(run_service.release_run, run_id, request)
+    return Response.success(data=result, message="Run released")
+
+
 @router.post("/{run_id}/fail", response_model=ResponseSchema[RunResponse])
 async def fail_run(
     run_id: uuid.UUID,
     request: RunFailRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Mark a run as failed."""
-    result = run_service.fail_run(db, run_id, request)
+    result = await db.run_sync(run_service.fail_run, run_id, request)
     return Response.success(data=result, message="Run marked as failed")
 
 
@@ -60,11 +108,11 @@ async def fail_run(
 async def get_run(
     run_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Get run details."""
-    result = run_service.get_run(db, run_id)
-    db_session = session_service.get_session(db, result.session_id)
+    result = await db.run_sync(run_service.get_run, run_id)
+    db_session = await db.run_sync(session_service.get_session, result.session_id)
     if db_session.user_id != user_id:
         raise AppException(
             error_code=ErrorCode.FORBIDDEN,
@@ -79,14 +127,16 @@ async def list_runs_by_session(
     user_id: str = Depends(get_current_user_id),
     limit: int = 100,
     offset: int = 0,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """List runs for a session."""
-    db_session = session_service.get_session(db, session_id)
+    db_session = await db.run_sync(session_service.get_session, session_id)
     if db_session.user_id != user_id:
         raise AppException(
             error_code=ErrorCode.FORBIDDEN,
             message="Session does not belong to the user",
         )
-    runs = run_service.list_runs(db, session_id, limit=limit, offset=offset)
+    runs = await db.run_sync(
+        run_service.list_runs, session_id, limit=limit, offset=offset
+    )
     return Response.success(data=runs, message="Runs retrieved successfully")
@@ -1,15 +1,18 @@
+import asyncio
+import time
 import uuid
 import json
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import Response as FastAPIResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.observability.request_context import get_request_id, get_trace_id
 from app.core.settings import get_settings
-from app.core.deps import get_current_user_id, get_db
+from app.core.deps import get_async_db, get_current_user_id
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
 from app.schemas.message import MessageResponse, MessageWithFilesResponse
@@ -27,11 +30,20 @@ from app.schemas.tool_execution import ToolExecutionResponse
 from app.schemas.usage import UsageResponse
 from app.schemas.workspace import FileNode, WorkspaceArchiveResponse
 from app.services.message_service import MessageService
+from app.services.session_event_service import (
+    SessionEventCursor,
+    SessionEventService,
+    publish_session_events,
+)
 from app.services.session_service import SessionService
 from app.services.storage_service import S3StorageService
 from app.services.tool_execution_service import ToolExecutionService
 from app.services.usage_service import UsageService
-from app.utils.computer import build_browser_screenshot_key
+from app.utils.computer import (
+    build_browser_screenshot_prefix,
+    pick_browser_screenshot_keys,
+)
+from app.utils.etag import compute_etag, etag_matches, not_modified
 from app.utils.workspace import build_workspace_file_nodes
 from app.utils.workspace_manifest import (
     build_nodes_from_manifest,
@@ -45,6 +57,7 @@ session_service = SessionService()
 message_service = MessageService()
 tool_execution_service = ToolExecutionService()
 usage_service = UsageService()
+session_event_service = SessionEventService()
 storage_service = S3StorageService()
 
 
@@ -91,14 +104,60 @@ def _cancel_executor_manager(session_id: uuid.UUID, reason: str | None) -> bool:
     return False
 
 
+def _build_workspace_archive(session_id: uuid.UUID) -> str | None:
+    """Ask Executor Manager to build the session's archive.zip if it is stale.
+
+    Returns the archive key, or None if the workspace has no archive.
+
+    Raises:
+        AppException: If Executor Manager is unavailable or the build failed
+    """
+    settings = get_settings()
+    url = (
+        f"{settings.executor_manager_url}/api/v1/workspace/export-archive/{session_id}"
+    )
+
+    headers = {"accept": "application/json"}
+    request_id = get_request_id()
+    if request_id:
+        headers["X-Request-ID"] = request_id
+    trace_id = get_trace_id()
+    if trace_id:
+        headers["X-Trace-ID"] = trace_id
+
+    try:
+        req = Request(url, headers=headers, method="POST")  # noqa: S310
+        # Zipping a large workspace can take a while.
+        with urlopen(req, timeout=120) as resp:  # noqa: S310
+            payload = json.loads(resp.read().decode("utf-8"))
+    except HTTPError as e:
+        raise AppException(
+            error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+            message=f"Executor Manager archive request failed: {e.code}",
+        ) from e
+    except URLError as e:
+        raise AppException(
+            error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+            message=f"Executor Manager unavailable: {e.reason}",
+        ) from e
+    except Exception as e:
+        raise AppException(
+            error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+            message=f"Failed to build workspace archive: {e}",
+        ) from e
+    data = payload.get("data") if isinstance(payload, dict) else None
+    archive_key = data.get("archive_key") if isinstance(data, dict) else None
+    return archive_key if isinstance(archive_key, str) and archive_key else None
+
+
 @router.post("", response_model=ResponseSchema[SessionResponse])
 async def create_session(
     request: SessionCreateRequest,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Creates a new session."""
-    db_session = session_service.create_session(db, user_id, request)
+    db_session = await db.run_sync(session_service.create_session, user_id, request)
     return Response.success(
         data=SessionResponse.model_validate(db_session),
         message="Session created successfully",
@@ -112,13 +171,13 @@ async def list_sessions(
     offset: int = 0,
     project_id: uuid.UUID | None = Query(default=None),
     kind: str = Query(default="chat"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Lists sessions."""
     kind_filter = kind.strip().lower()
     kind_value = None if kind_filter in {"", "all"} else kind_filter
-    sessions = session_service.list_sessions(
-        db,
+    sessions = await db.run_sync(
+        session_service.list_sessions,
         user_id,
         limit,
         offset,
@@ -135,10 +194,10 @@ async def list_sessions(
 async def get_session(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Gets session details."""
-    db_session = session_service.get_session(db, session_id)
+    db_session = await db.run_sync(session_service.get_session, session_id)
     if db_session.user_id != user_id:
         raise AppException(
             error_code=ErrorCode.FORBIDDEN,
@@ -154,10 +213,10 @@ async def get_session(
 async def get_session_state(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Gets session state details."""
-    db_session = session_service.get_session(db, session_id)
+    db_session = await db.run_sync(session_service.get_session, session_id)
     if db_session.user_id != user_id:
         raise AppException(
             error_code=ErrorCode.FORBIDDEN,
@@ -169,21 +228,52 @@ async def get_session_state(
     )
 
 
+@router.get("/{session_id}/events")
+async def stream_session_events(
+    session_id: uuid.UUID,
+    cursor: str | None = Query(default=None),
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db),
+) -> StreamingResponse:
+    """Streams new messages, tool executions and state changes (SSE).
+
+    Without a cursor the full history is replayed first. Each event id is a
+    cursor; reconnecting clients resume from it via Last-Event-ID or ?cursor=.
+    """
+    db_session = await db.run_sync(session_service.get_session, session_id)
+    if db_session.user_id != user_id:
+        raise AppException(
+            error_code=ErrorCode.FORBIDDEN,
+            message="Session does not belong to the user",
+        )
+    start = SessionEventCursor.decode(last_event_id or cursor)
+    # The stream opens short-lived sessions per read; don't pin a connection.
+    await db.close()
+
+    return StreamingResponse(
+        session_event_service.stream(session_id, start),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.patch("/{session_id}", response_model=ResponseSchema[SessionResponse])
 async def update_session(
     session_id: uuid.UUID,
     request: SessionUpdateRequest,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Updates a session."""
-    db_session = session_service.get_session(db, session_id)
+    db_session = await db.run_sync(session_service.get_session, session_id)
     if db_session.user_id != user_id:
         raise AppException(
             error_code=ErrorCode.FORBIDDEN,
             message="Session does not belong to the user",
         )
-    db_session = session_service.update_session(db, session_id, request)
+    db_session = await db.run_sync(session_service.update_session, session_id, request)
+    publish_session_events([session_id])
     return Response.success(
         data=SessionResponse.model_validate(db_session),
         message="Session updated successfully",
@@ -197,13 +287,19 @@ async def cancel_session(
     session_id: uuid.UUID,
     request: SessionCancelRequest,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Cancel a session (cancel all unfinished runs and stop executor container)."""
-    db_session, canceled_runs, expired_requests = session_service.cancel_session(
-        db, session_id, user_id=user_id, reason=request.reason
+    db_session, canceled_runs, expired_requests = await db.run_sync(
+        session_service.cancel_session,
+        session_id,
+        user_id=user_id,
+        reason=request.reason,
+    )
+    publish_session_events([session_id])
+    executor_cancelled = await asyncio.to_thread(
+        _cancel_executor_manager, session_id, request.reason
     )
-    executor_cancelled = _cancel_executor_manager(session_id, request.reason)
 
     return Response.success(
         data=SessionCancelResponse(
@@ -221,16 +317,16 @@ async def cancel_session(
 async def delete_session(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Soft deletes a session."""
-    db_session = session_service.get_session(db, session_id)
+    db_session = await db.run_sync(session_service.get_session, session_id)
     if db_session.user_id != user_id:
         raise AppException(
             error_code=ErrorCode.FORBIDDEN,
             message="Session does not belong to the user",
         )
-    session_service.delete_session(db, session_id)
+    await db.run_sync(session_service.delete_session, session_id)
     return Response.success(
         data={"id": session_id},
         message="Session deleted successfully",
@@ -243,21 +339,43 @@ async def delete_session(
 async def get_session_messages(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
-) -> JSONResponse:
-    """Gets all messages for a session."""
+    limit: int = Query(default=100, ge=1, le=1000),
+    after_id: int | None = Query(default=None, ge=0),
+    before_id: int | None = Query(default=None, ge=1),
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
+    db: AsyncSession = Depends(get_async_db),
+) -> FastAPIResponse:
+    """Gets messages for a session (keyset paginated by message ID)."""
     # Verify session exists
-    db_session = session_service.get_session(db, session_id)
+    db_session = await db.run_sync(session_service.get_session, session_id)
     if db_session.user_id != user_id:
         raise AppException(
             error_code=ErrorCode.FORBIDDEN,
             message="Session does not belong to the user",
         )
-    messages = message_service.get_messages(db, session_id)
-    return Response.success(
+    version = await db.run_sync(
+        message_service.get_messages_version,
+        session_id,
+        after_id=after_id,
+        before_id=before_id,
+    )
+    etag = compute_etag("messages", session_id, limit, after_id, before_id, *version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    messages = await db.run_sync(
+        message_service.get_messages,
+        session_id,
+        limit=limit,
+        after_id=after_id,
+        before_id=before_id,
+    )
+    response = Response.success(
         data=[MessageResponse.model_validate(m) for m in messages],
         message="Messages retrieved successfully",
     )
+    response.headers["ETag"] = etag
+    return response
 
 
 @router.get(
@@ -267,21 +385,57 @@ async def get_session_messages(
 async def get_session_messages_with_files(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
-) -> JSONResponse:
-    """Gets all messages for a session with per-message attachments."""
-    db_session = session_service.get_session(db, session_id)
+    limit: int = Query(default=1000, ge=1, le=1000),
+    after_id: int | None = Query(default=None, ge=0),
+    before_id: int | None = Query(default=None, ge=1),
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
+    db: AsyncSession = Depends(get_async_db),
+) -> FastAPIResponse:
+    """Gets messages for a session with per-message attachments.
+
+    Pages are keyed by message ID; a full page means more messages may follow.
+    """
+    db_session = await db.run_sync(session_service.get_session, session_id)
     if db_session.user_id != user_id:
         raise AppException(
             error_code=ErrorCode.FORBIDDEN,
             message="Session does not belong to the user",
         )
 
-    messages = message_service.get_messages_with_files(db, session_id, user_id=user_id)
-    return Response.success(
+    version = await db.run_sync(
+        message_service.get_messages_version,
+        session_id,
+        after_id=after_id,
+        before_id=before_id,
+    )
+    # Attachment URLs are presigned; rotate the ETag before they expire.
+    presign_window = max(1, get_settings().s3_presign_expires // 2)
+    etag = compute_etag(
+        "messages-with-files",
+        session_id,
+        limit,
+        after_id,
+        before_id,
+        *version,
+        int(time.time()) // presign_window,
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    messages = await db.run_sync(
+        message_service.get_messages_with_files,
+        session_id,
+        user_id=user_id,
+        limit=limit,
+        after_id=after_id,
+        before_id=before_id,
+    )
+    response = Response.success(
         data=messages,
         message="Messages retrieved successfully",
     )
+    response.headers["ETag"] = etag
+    return response
 
 
 @router.get(
@@ -293,26 +447,55 @@ async def get_session_tool_executions(
     user_id: str = Depends(get_current_user_id),
     limit: int = Query(default=500, ge=1, le=2000),
     offset: int = Query(default=0, ge=0),
-    db: Session = Depends(get_db),
-) -> JSONResponse:
-    """Gets all tool executions for a session."""
+    after_message_id: int | None = Query(default=None, ge=0),
+    before_message_id: int | None = Query(default=None, ge=1),
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
+    db: AsyncSession = Depends(get_async_db),
+) -> FastAPIResponse:
+    """Gets tool executions for a session.
+
+    ``after_message_id`` returns executions created or completed after that
+    message, so pollers can fetch only what changed.
+    """
     # Verify session exists
-    db_session = session_service.get_session(db, session_id)
+    db_session = await db.run_sync(session_service.get_session, session_id)
     if db_session.user_id != user_id:
         raise AppException(
             error_code=ErrorCode.FORBIDDEN,
             message="Session does not belong to the user",
         )
-    executions = tool_execution_service.get_tool_executions(
-        db,
+    version = await db.run_sync(
+        tool_execution_service.get_tool_executions_version,
+        session_id,
+        after_message_id=after_message_id,
+        before_message_id=before_message_id,
+    )
+    etag = compute_etag(
+        "tool-executions",
+        session_id,
+        limit,
+        offset,
+        after_message_id,
+        before_message_id,
+        *version,
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    executions = await db.run_sync(
+        tool_execution_service.get_tool_executions,
         session_id,
         limit=limit,
         offset=offset,
+        after_message_id=after_message_id,
+        before_message_id=before_message_id,
     )
-    return Response.success(
+    response = Response.success(
         data=[ToolExecutionResponse.model_validate(e) for e in executions],
         message="Tool executions retrieved successfully",
     )
+    response.headers["ETag"] = etag
+    return response
 
 
 @router.get(
@@ -323,31 +506,46 @@ async def get_session_browser_screenshot(
     session_id: uuid.UUID,
     tool_use_id: str,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Return a presigned URL for a browser screenshot (Poco Computer)."""
-    db_session = session_service.get_session(db, session_id)
+    db_session = await db.run_sync(session_service.get_session, session_id)
     if db_session.user_id != user_id:
         raise AppException(
             error_code=ErrorCode.FORBIDDEN,
             message="Session does not belong to the user",
         )
 
-    key = build_browser_screenshot_key(
+    # One list request finds the image (jpg/webp/png) and its thumbnail.
+    prefix = build_browser_screenshot_prefix(
         user_id=user_id,
         session_id=str(session_id),
         tool_use_id=tool_use_id,
     )
-    if not storage_service.exists(key):
+    key, content_type, thumbnail_key = pick_browser_screenshot_keys(
+        prefix, await storage_service.list_keys_async(prefix, limit=10)
+    )
+    if not key:
         raise HTTPException(status_code=404, detail="Browser screenshot not ready")
     url = storage_service.presign_get(
         key,
         response_content_disposition="inline",
-        response_content_type="image/png",
+        response_content_type=content_type,
+    )
+    thumbnail_url = (
+        storage_service.presign_get(
+            thumbnail_key,
+            response_content_disposition="inline",
+            response_content_type="image/jpeg",
+        )
+        if thumbnail_key
+        else None
     )
 
     return Response.success(
-        data=ComputerBrowserScreenshotResponse(tool_use_id=tool_use_id, url=url),
+        data=ComputerBrowserScreenshotResponse(
+            tool_use_id=tool_use_id, url=url, thumbnail_url=thumbnail_url
+        ),
         message="Browser screenshot URL generated",
     )
 
@@ -356,17 +554,17 @@ async def get_session_browser_screenshot(
 async def get_session_usage(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Gets usage statistics for a session."""
     # Verify session exists
-    db_session = session_service.get_session(db, session_id)
+    db_session = await db.run_sync(session_service.get_session, session_id)
     if db_session.user_id != user_id:
         raise AppException(
             error_code=ErrorCode.FORBIDDEN,
             message="Session does not belong to the user",
         )
-    usage = usage_service.get_usage_summary(db, session_id)
+    usage = await db.run_sync(usage_service.get_usage_summary, session_id)
     return Response.success(
         data=usage,
         message="Usage statistics retrieved successfully",
@@ -380,10 +578,10 @@ async def get_session_usage(
 async def get_session_workspace_files(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """List workspace files for a session (served via OSS manifest)."""
-    db_session = session_service.get_session(db, session_id)
+    db_session = await db.run_sync(session_service.get_session, session_id)
     if db_session.user_id != user_id:
         raise AppException(
             error_code=ErrorCode.FORBIDDEN,
@@ -392,7 +590,9 @@ async def get_session_workspace_files(
     if not db_session.workspace_manifest_key:
         return Response.success(data=[], message="Workspace export not ready")
 
-    manifest = storage_service.get_manifest(db_session.workspace_manifest_key)
+    manifest = await storage_service.get_manifest_async(
+        db_session.workspace_manifest_key
+    )
     raw_nodes = build_nodes_from_manifest(manifest)
     manifest_files = extract_manifest_files(manifest)
     prefix = (db_session.workspace_files_prefix or "").rstrip("/")
@@ -437,10 +637,14 @@ async def get_session_workspace_files(
 async def get_session_workspace_archive(
     session_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
-    """Get a presigned download URL for the exported workspace archive."""
-    db_session = session_service.get_session(db, session_id)
+    """Get a presigned download URL for the exported workspace archive.
+
+    The archive is built on request by Executor Manager, only when the exported
+    files changed since the last build.
+    """
+    db_session = await db.run_sync(session_service.get_session, session_id)
     if db_session.user_id != user_id:
         raise AppException(
             error_code=ErrorCode.FORBIDDEN,
@@ -455,6 +659,13 @@ async def get_session_workspace_archive(
             message="Workspace export not ready",
         )
 
+    archive_key = await asyncio.to_thread(_build_workspace_archive, session_id)
+    if not archive_key:
+        return Response.success(
+            data=WorkspaceArchiveResponse(url=None, filename=filename),
+            message="Workspace archive not available",
+        )
+
     url = storage_service.presign_get(
         archive_key,
         response_content_disposition=f'attachment; filename="{filename}"',
@@ -1,14 +1,16 @@
 import uuid
+from typing import Any
 
 from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import get_current_user_id, get_db
+from app.core.deps import get_async_db, get_current_user_id
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
 from app.schemas.response import Response, ResponseSchema
 from app.schemas.tool_execution import ToolExecutionResponse
+from app.services.payload_offload_service import PayloadOffloadService
 from app.services.session_service import SessionService
 from app.services.tool_execution_service import ToolExecutionService
 
@@ -16,17 +18,20 @@ router = APIRouter(prefix="/tool-executions", tags=["tool-executions"])
 
 tool_execution_service = ToolExecutionService()
 session_service = SessionService()
+payload_offload_service = PayloadOffloadService()
 
 
 @router.get("/{execution_id}", response_model=ResponseSchema[ToolExecutionResponse])
 async def get_tool_execution(
     execution_id: uuid.UUID,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Gets a tool execution by ID."""
-    execution = tool_execution_service.get_tool_execution(db, execution_id)
-    db_session = session_service.get_session(db, execution.session_id)
+    execution = await db.run_sync(
+        tool_execution_service.get_tool_execution, execution_id
+    )
+    db_session = await db.run_sync(session_service.get_session, execution.session_id)
     if db_session.user_id != user_id:
         raise AppException(
             error_code=ErrorCode.FORBIDDEN,
@@ -36,3 +41,29 @@ async def get_tool_execution(
         data=ToolExecutionResponse.model_validate(execution),
         message="Tool execution retrieved successfully",
     )
+
+
+@router.get(
+    "/{execution_id}/output", response_model=ResponseSchema[dict[str, Any] | None]
+)
+async def get_tool_execution_output(
+    execution_id: uuid.UUID,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db),
+) -> JSONResponse:
+    """Gets the full output of a tool execution whose output was offloaded."""
+    execution = await db.run_sync(
+        tool_execution_service.get_tool_execution, execution_id
+    )
+    db_session = await db.run_sync(session_service.get_session, execution.session_id)
+    if db_session.user_id != user_id:
+        raise AppException(
+            error_code=ErrorCode.FORBIDDEN,
+            message="Tool execution does not belong to the user",
+        )
+    output_key = execution.tool_output_key
+    output = execution.tool_output
+    await db.close()
+    if output_key:
+        output = await payload_offload_service.load_async(output_key)
+    return Response.success(data=output, message="Tool output retrieved")
@@ -1,30 +1,82 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, func, create_engine
+from sqlalchemy import JSON, DateTime, func, create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
 
 from app.core.settings import get_settings
 
 settings = get_settings()
 
+
+def _split_pool(total: int) -> tuple[int, int]:
+    """Split a pool limit between the sync and async engines (at least 1 each)."""
+    async_share = max(1, (total + 1) // 2)
+    return max(1, total - async_share), async_share
+
+
+# DB_POOL_SIZE / DB_MAX_OVERFLOW are a per-process budget shared by both engines,
+# with the larger half going to the async engine that serves the hot routes.
+_sync_pool_size, _async_pool_size = _split_pool(settings.db_pool_size)
+_sync_max_overflow, _async_max_overflow = _split_pool(settings.db_max_overflow)
+
 engine = create_engine(
     settings.database_url,
     # Avoid logging full SQL statements by default (can be enabled via LOG_SQL=true).
     echo=settings.log_sql,
     hide_parameters=True,
     pool_pre_ping=True,
-    pool_size=settings.db_pool_size,
-    max_overflow=settings.db_max_overflow,
+    pool_size=_sync_pool_size,
+    max_overflow=_sync_max_overflow,
     pool_timeout=settings.db_pool_timeout_seconds,
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def _async_database_url(url: str) -> str:
+    """Map the configured database URL onto its asyncio driver."""
+    scheme, sep, rest = url.partition("://")
+    if not sep:
+        return url
+    dialect = scheme.split("+", 1)[0]
+    if dialect in {"postgresql", "postgres"}:
+        return f"postgresql+asyncpg://{rest}"
+    if dialect == "sqlite":
+        return f"sqlite+aiosqlite://{rest}"
+    return url
+
+
+# Async engine used by the hot API routes. Repositories stay synchronous and are
+# driven through ``AsyncSession.run_sync``, which runs them on the async driver's
+# connection without blocking the event loop.
+async_engine = create_async_engine(
+    settings.async_database_url or _async_database_url(settings.database_url),
+    echo=settings.log_sql,
+    hide_parameters=True,
+    pool_pre_ping=True,
+    pool_size=_async_pool_size,
+    max_overflow=_async_max_overflow,
+    pool_timeout=settings.db_pool_timeout_seconds,
+)
+
+# Objects must stay readable after commit: expiring them would trigger lazy IO
+# outside of ``run_sync`` when responses are serialized.
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+
 class Base(DeclarativeBase):
     pass
 
 
+# JSON payload columns: JSONB on PostgreSQL (binary, no reparsing on read),
+# plain JSON elsewhere.
+JSONBType = JSON().with_variant(JSONB(), "postgresql")
+
+
 class TimestampMixin:
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
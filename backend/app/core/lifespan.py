@@ -1,9 +1,11 @@
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 
-from app.core.database import engine
+from app.core.database import async_engine, engine
+from app.services.run_claim_sweeper import run_claim_sweeper
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +16,13 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting application...")
     logger.info("Database engine initialized")
+    claim_sweeper = asyncio.create_task(run_claim_sweeper())
     yield
     # Shutdown
+    claim_sweeper.cancel()
+    with suppress(asyncio.CancelledError):
+        await claim_sweeper
     logger.info("Shutting down database engine...")
     engine.dispose()
+    await async_engine.dispose()
     logger.info("Database engine disposed")
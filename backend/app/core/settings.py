@@ -16,6 +16,8 @@ class Settings(BaseSettings):
     port: int = Field(default=8000)
 
     database_url: str = Field(default="sqlite:///./opencowork.db")
+    # Optional override; derived from database_url (asyncpg/aiosqlite) when unset.
+    async_database_url: str | None = Field(default=None, alias="ASYNC_DATABASE_URL")
     db_pool_size: int = Field(default=5)
     db_max_overflow: int = Field(default=10)
     db_pool_timeout_seconds: int = Field(default=30)
@@ -53,6 +55,43 @@ class Settings(BaseSettings):
     )
     max_upload_size_mb: int = Field(default=100, alias="MAX_UPLOAD_SIZE_MB")
 
+    # Large message/tool payloads are stored in S3 with an inline preview (0 disables).
+    payload_offload_threshold_bytes: int = Field(
+        default=262144, alias="PAYLOAD_OFFLOAD_THRESHOLD_BYTES"
+    )
+    payload_preview_max_chars: int = Field(
+        default=2000, alias="PAYLOAD_PREVIEW_MAX_CHARS"
+    )
+
+    # Run queue
+    run_claim_max_wait_seconds: float = Field(
+        default=30.0, alias="RUN_CLAIM_MAX_WAIT_SECONDS"
+    )
+    run_claim_sweep_interval_seconds: float = Field(
+        default=10.0, alias="RUN_CLAIM_SWEEP_INTERVAL_SECONDS"
+    )
+
+    # Long-poll cap for waiting on user input answers
+    user_input_max_wait_seconds: float = Field(
+        default=30.0, alias="USER_INPUT_MAX_WAIT_SECONDS"
+    )
+
+    # Callback session/run resolution cache
+    callback_target_cache_max_entries: int = Field(
+        default=4096, alias="CALLBACK_TARGET_CACHE_MAX_ENTRIES"
+    )
+    callback_target_cache_ttl_seconds: float = Field(
+        default=300.0, alias="CALLBACK_TARGET_CACHE_TTL_SECONDS"
+    )
+
+    # Session event stream (SSE)
+    session_events_keepalive_seconds: float = Field(
+        default=15.0, alias="SESSION_EVENTS_KEEPALIVE_SECONDS"
+    )
+    session_events_batch_size: int = Field(
+        default=200, alias="SESSION_EVENTS_BATCH_SIZE"
+    )
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
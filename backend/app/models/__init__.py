@@ -1,4 +1,4 @@
-from app.core.database import Base, TimestampMixin
+from app.core.database import Base, JSONBType, TimestampMixin
 
 from app.models.agent_message import AgentMessage
 from app.models.agent_run import AgentRun
@@ -20,6 +20,7 @@ from app.models.user_skill_install import UserSkillInstall
 
 __all__ = [
     "Base",
+    "JSONBType",
     "TimestampMixin",
     "AgentMessage",
     "AgentRun",
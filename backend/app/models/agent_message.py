@@ -1,10 +1,10 @@
 import uuid
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import JSON, BigInteger, ForeignKey, String, Text
+from sqlalchemy import BigInteger, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models import Base, TimestampMixin
+from app.models import Base, JSONBType, TimestampMixin
 
 if TYPE_CHECKING:
     from app.models.agent_session import AgentSession
@@ -13,14 +13,20 @@ if TYPE_CHECKING:
 
 class AgentMessage(Base, TimestampMixin):
     __tablename__ = "agent_messages"
+    __table_args__ = (
+        # Session reads page by id (keyset) and poll for new ids.
+        Index("ix_agent_messages_session_id_id", "session_id", "id"),
+    )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     session_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("agent_sessions.id", ondelete="CASCADE"), nullable=False
     )
     role: Mapped[str] = mapped_column(String(50), nullable=False)
-    content: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    content: Mapped[dict[str, Any]] = mapped_column(JSONBType, nullable=False)
     text_preview: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Object key of the full content when it was offloaded (content is a preview).
+    content_key: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     session: Mapped["AgentSession"] = relationship(back_populates="messages")
     tool_executions: Mapped[list["ToolExecution"]] = relationship(
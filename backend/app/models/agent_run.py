@@ -6,8 +6,8 @@ from sqlalchemy import (
     BigInteger,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
-    JSON,
     String,
     Text,
     func,
@@ -15,7 +15,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models import Base, TimestampMixin
+from app.models import Base, JSONBType, TimestampMixin
 
 if TYPE_CHECKING:
     from app.models.agent_message import AgentMessage
@@ -26,6 +26,30 @@ if TYPE_CHECKING:
 
 class AgentRun(Base, TimestampMixin):
     __tablename__ = "agent_runs"
+    __table_args__ = (
+        # Claim queue: queued runs in dispatch order.
+        Index(
+            "ix_agent_runs_queued_scheduled_at",
+            "scheduled_at",
+            "created_at",
+            postgresql_where=text("status = 'queued'"),
+            sqlite_where=text("status = 'queued'"),
+        ),
+        # Unfinished runs of a session (callbacks, cancel, one-run-per-session).
+        Index(
+            "ix_agent_runs_session_active",
+            "session_id",
+            "created_at",
+            postgresql_where=text("status IN ('queued', 'claimed', 'running')"),
+            sqlite_where=text("status IN ('queued', 'claimed', 'running')"),
+        ),
+        Index(
+            "ix_agent_runs_session_id_status_created_at",
+            "session_id",
+            "status",
+            "created_at",
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
@@ -59,7 +83,7 @@ class AgentRun(Base, TimestampMixin):
         nullable=True,
         index=True,
     )
-    config_snapshot: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    config_snapshot: Mapped[dict | None] = mapped_column(JSONBType, nullable=True)
     scheduled_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
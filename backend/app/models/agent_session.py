@@ -1,10 +1,10 @@
 import uuid
 from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import ForeignKey, JSON, Boolean, String, Text, text
+from sqlalchemy import ForeignKey, Boolean, Integer, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models import Base, TimestampMixin
+from app.models import Base, JSONBType, TimestampMixin
 
 if TYPE_CHECKING:
     from app.models.agent_message import AgentMessage
@@ -28,10 +28,16 @@ class AgentSession(Base, TimestampMixin):
         nullable=True,
         index=True,
     )
-    sdk_session_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
-    config_snapshot: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    sdk_session_id: Mapped[str | None] = mapped_column(
+        String(255), nullable=True, index=True
+    )
+    config_snapshot: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONBType, nullable=True
+    )
     workspace_archive_url: Mapped[str | None] = mapped_column(Text, nullable=True)
-    state_patch: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    state_patch: Mapped[dict[str, Any] | None] = mapped_column(JSONBType, nullable=True)
+    # Sequence number of the executor state stored in state_patch (for deltas).
+    state_seq: Mapped[int | None] = mapped_column(Integer, nullable=True)
     workspace_files_prefix: Mapped[str | None] = mapped_column(Text, nullable=True)
     workspace_manifest_key: Mapped[str | None] = mapped_column(Text, nullable=True)
     workspace_archive_key: Mapped[str | None] = mapped_column(Text, nullable=True)
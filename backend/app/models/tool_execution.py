@@ -2,17 +2,18 @@ import uuid
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import (
-    JSON,
     Boolean,
     ForeignKey,
+    Index,
     Integer,
     String,
+    Text,
     UniqueConstraint,
     text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models import Base, TimestampMixin
+from app.models import Base, JSONBType, TimestampMixin
 
 if TYPE_CHECKING:
     from app.models.agent_message import AgentMessage
@@ -27,6 +28,9 @@ class ToolExecution(Base, TimestampMixin):
             "tool_use_id",
             name="uq_tool_executions_session_tool_use_id",
         ),
+        Index("ix_tool_executions_session_id_created_at", "session_id", "created_at"),
+        Index("ix_tool_executions_session_id_message_id", "session_id", "message_id"),
+        Index("ix_tool_executions_result_message_id", "result_message_id"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -40,8 +44,10 @@ class ToolExecution(Base, TimestampMixin):
     )
     tool_use_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
     tool_name: Mapped[str] = mapped_column(String(100), nullable=False)
-    tool_input: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
-    tool_output: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    tool_input: Mapped[dict[str, Any] | None] = mapped_column(JSONBType, nullable=True)
+    tool_output: Mapped[dict[str, Any] | None] = mapped_column(JSONBType, nullable=True)
+    # Object key of the full output when it was offloaded (tool_output is a preview).
+    tool_output_key: Mapped[str | None] = mapped_column(Text, nullable=True)
     result_message_id: Mapped[int | None] = mapped_column(
         ForeignKey("agent_messages.id", ondelete="SET NULL"), nullable=True
     )
@@ -1,7 +1,9 @@
 import uuid
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Text, cast, func
+from sqlalchemy.orm import Query, Session
 
 from app.models.agent_message import AgentMessage
 
@@ -16,6 +18,7 @@ class MessageRepository:
         role: str,
         content: dict[str, Any],
         text_preview: str | None = None,
+        content_key: str | None = None,
     ) -> AgentMessage:
         """Creates a new message."""
         message = AgentMessage(
@@ -23,10 +26,26 @@ class MessageRepository:
             role=role,
             content=content,
             text_preview=text_preview,
+            content_key=content_key,
         )
         session_db.add(message)
         return message
 
+    @staticmethod
+    def list_oversized(
+        session_db: Session, min_length: int, limit: int, after_id: int = 0
+    ) -> list[AgentMessage]:
+        """Lists inline messages after after_id whose content exceeds min_length."""
+        return (
+            session_db.query(AgentMessage)
+            .filter(AgentMessage.id > after_id)
+            .filter(AgentMessage.content_key.is_(None))
+            .filter(func.length(cast(AgentMessage.content, Text)) > min_length)
+            .order_by(AgentMessage.id.asc())
+            .limit(limit)
+            .all()
+        )
+
     @staticmethod
     def get_by_id(session_db: Session, message_id: int) -> AgentMessage | None:
         """Gets a message by ID."""
@@ -34,17 +53,92 @@ class MessageRepository:
             session_db.query(AgentMessage).filter(AgentMessage.id == message_id).first()
         )
 
+    @staticmethod
+    def list_by_ids(session_db: Session, message_ids: list[int]) -> list[AgentMessage]:
+        """Gets the messages with the given IDs."""
+        if not message_ids:
+            return []
+        return (
+            session_db.query(AgentMessage)
+            .filter(AgentMessage.id.in_(message_ids))
+            .all()
+        )
+
+    @staticmethod
+    def _filter_range(
+        query: Query,
+        session_id: uuid.UUID,
+        after_id: int | None,
+        before_id: int | None,
+    ) -> Query:
+        query = query.filter(AgentMessage.session_id == session_id)
+        if after_id is not None:
+            query = query.filter(AgentMessage.id > after_id)
+        if before_id is not None:
+            query = query.filter(AgentMessage.id < before_id)
+        return query
+
     @staticmethod
     def list_by_session(
-        session_db: Session, session_id: uuid.UUID, limit: int = 100, offset: int = 0
+        session_db: Session,
+        session_id: uuid.UUID,
+        limit: int = 100,
+        offset: int = 0,
+        *,
+        after_id: int | None = None,
+        before_id: int | None = None,
     ) -> list[AgentMessage]:
-        """Lists messages for a session."""
+        """Lists messages for a session in ID order.
+
+        With ``before_id`` (and no ``after_id``) the page closest to
+        ``before_id`` is returned, still in ascending order.
+        """
+        query = MessageRepository._filter_range(
+            session_db.query(AgentMessage), session_id, after_id, before_id
+        )
+        if before_id is not None and after_id is None:
+            messages = (
+                query.order_by(AgentMessage.id.desc()).limit(limit).offset(offset).all()
+            )
+            messages.reverse()
+            return messages
+        return query.order_by(AgentMessage.id.asc()).limit(limit).offset(offset).all()
+
+    @staticmethod
+    def get_version(
+        session_db: Session,
+        session_id: uuid.UUID,
+        *,
+        after_id: int | None = None,
+        before_id: int | None = None,
+    ) -> tuple[int, int | None, datetime | None]:
+        """Returns (count, max id, max updated_at) of a message range."""
+        query = MessageRepository._filter_range(
+            session_db.query(
+                func.count(AgentMessage.id),
+                func.max(AgentMessage.id),
+                func.max(AgentMessage.updated_at),
+            ),
+            session_id,
+            after_id,
+            before_id,
+        )
+        count, max_id, max_updated_at = query.one()
+        return int(count or 0), max_id, max_updated_at
+
+    @staticmethod
+    def list_after_id(
+        session_db: Session, session_id: uuid.UUID, after_id: int, limit: int = 100
+    ) -> list[AgentMessage]:
+        """Lists messages of a session created after the given message ID."""
         return (
             session_db.query(AgentMessage)
-            .filter(AgentMessage.session_id == session_id)
-            .order_by(AgentMessage.created_at.asc())
+            .filter(
+                AgentMessage.session_id == session_id,
+                AgentMessage.id > after_id,
+            )
+            .order_by(AgentMessage.id.asc())
             .limit(limit)
-            .offset(offset)
             .all()
         )
 
@@ -62,6 +62,22 @@ class RunRepository:
             .all()
         )
 
+    @staticmethod
+    def list_by_user_message_ids(
+        session_db: Session, session_id: uuid.UUID, user_message_ids: list[int]
+    ) -> list[AgentRun]:
+        """Lists the runs of a session started by any of the user messages."""
+        if not user_message_ids:
+            return []
+        return (
+            session_db.query(AgentRun)
+            .filter(
+                AgentRun.session_id == session_id,
+                AgentRun.user_message_id.in_(user_message_ids),
+            )
+            .all()
+        )
+
     @staticmethod
     def list_by_scheduled_task(
         session_db: Session,
@@ -79,6 +95,22 @@ class RunRepository:
             .all()
         )
 
+    @staticmethod
+    def list_active_session_ids(
+        session_db: Session, session_ids: list[uuid.UUID]
+    ) -> set[uuid.UUID]:
+        """Returns the sessions (of the given ones) with an unfinished run."""
+        if not session_ids:
+            return set()
+        rows = (
+            session_db.query(AgentRun.session_id)
+            .filter(AgentRun.session_id.in_(session_ids))
+            .filter(AgentRun.status.in_(["queued", "claimed", "running"]))
+            .distinct()
+            .all()
+        )
+        return {row[0] for row in rows}
+
     @staticmethod
     def release_expired_claims(session_db: Session) -> int:
         """Release expired claimed runs back to queued.
@@ -104,15 +136,35 @@ class RunRepository:
         lease_seconds: int = 30,
         schedule_modes: list[str] | None = None,
     ) -> AgentRun | None:
-        """Claims the next available run for execution.
+        """Claims the next available run for execution."""
+        runs = RunRepository.claim_batch(
+            session_db,
+            worker_id,
+            limit=1,
+            lease_seconds=lease_seconds,
+            schedule_modes=schedule_modes,
+        )
+        return runs[0] if runs else None
+
+    @staticmethod
+    def claim_batch(
+        session_db: Session,
+        worker_id: str,
+        *,
+        limit: int,
+        lease_seconds: int = 30,
+        schedule_modes: list[str] | None = None,
+    ) -> list[AgentRun]:
+        """Claims up to ``limit`` available runs in one query.
 
         Uses SELECT ... FOR UPDATE SKIP LOCKED to support multiple workers.
-        Ensures only one claimed/running run per session at a time.
+        Ensures only one claimed/running run per session at a time; expired
+        leases are released separately by the claim sweeper.
         """
         if lease_seconds <= 0:
             lease_seconds = 30
-
-        _ = RunRepository.release_expired_claims(session_db)
+        if limit <= 0:
+            return []
 
         now = datetime.now(timezone.utc)
         lease_until = now + timedelta(seconds=lease_seconds)
@@ -132,16 +184,20 @@ class RunRepository:
             .where(~has_active_run)
             .order_by(AgentRun.scheduled_at.asc(), AgentRun.created_at.asc())
             .with_for_update(skip_locked=True)
-            .limit(1)
+            .limit(limit)
         )
         if schedule_modes:
             stmt = stmt.where(AgentRun.schedule_mode.in_(schedule_modes))
 
-        run = session_db.execute(stmt).scalars().first()
-        if not run:
-            return None
-
-        run.status = "claimed"
-        run.claimed_by = worker_id
-        run.lease_expires_at = lease_until
-        return run
+        claimed: list[AgentRun] = []
+        claimed_sessions: set[uuid.UUID] = set()
+        for run in session_db.execute(stmt).scalars():
+            # Several queued runs of one session: only the oldest may start.
+            if run.session_id in claimed_sessions:
+                continue
+            claimed_sessions.add(run.session_id)
+            run.status = "claimed"
+            run.claimed_by = worker_id
+            run.lease_expires_at = lease_until
+            claimed.append(run)
+        return claimed
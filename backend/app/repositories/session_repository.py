@@ -44,6 +44,22 @@ class SessionRepository:
             .first()
         )
 
+    @staticmethod
+    def list_by_ids(
+        session_db: Session, session_ids: list[uuid.UUID]
+    ) -> list[AgentSession]:
+        """Gets the (non-deleted) sessions with the given IDs."""
+        if not session_ids:
+            return []
+        return (
+            session_db.query(AgentSession)
+            .filter(
+                AgentSession.id.in_(session_ids),
+                AgentSession.is_deleted.is_(False),
+            )
+            .all()
+        )
+
     @staticmethod
     def get_by_sdk_session_id(
         session_db: Session, sdk_session_id: str
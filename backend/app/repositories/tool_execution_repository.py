@@ -1,7 +1,10 @@
 import uuid
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Integer, Text, cast, func, or_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Query, Session
 
 from app.models.tool_execution import ToolExecution
 
@@ -37,6 +40,26 @@ class ToolExecutionRepository:
         session_db.add(tool_execution)
         return tool_execution
 
+    @staticmethod
+    def list_oversized_outputs(
+        session_db: Session,
+        min_length: int,
+        limit: int,
+        after_id: uuid.UUID | None = None,
+    ) -> list[ToolExecution]:
+        """Lists inline tool outputs after after_id whose size exceeds min_length."""
+        query = session_db.query(ToolExecution)
+        if after_id is not None:
+            query = query.filter(ToolExecution.id > after_id)
+        return (
+            query.filter(ToolExecution.tool_output_key.is_(None))
+            .filter(ToolExecution.tool_output.is_not(None))
+            .filter(func.length(cast(ToolExecution.tool_output, Text)) > min_length)
+            .order_by(ToolExecution.id.asc())
+            .limit(limit)
+            .all()
+        )
+
     @staticmethod
     def get_by_id(session_db: Session, execution_id: uuid.UUID) -> ToolExecution | None:
         """Gets a tool execution by ID."""
@@ -62,19 +85,170 @@ class ToolExecutionRepository:
             .first()
         )
 
+    @staticmethod
+    def _insert(session_db: Session):
+        dialect = session_db.get_bind().dialect.name
+        if dialect == "sqlite":
+            return sqlite.insert(ToolExecution)
+        return postgresql.insert(ToolExecution)
+
+    @staticmethod
+    def upsert_tool_uses(
+        session_db: Session,
+        session_id: uuid.UUID,
+        message_id: int,
+        tool_uses: list[dict[str, Any]],
+    ) -> None:
+        """Records tool calls in one INSERT ... ON CONFLICT statement.
+
+        Args:
+            tool_uses: Dicts with ``tool_use_id``, ``tool_name`` and ``tool_input``,
+                unique by ``tool_use_id``. A result placeholder created earlier
+                keeps its output and gets the call details.
+        """
+        if not tool_uses:
+            return
+        stmt = ToolExecutionRepository._insert(session_db).values(
+            [
+                {"session_id": session_id, "message_id": message_id, **tool_use}
+                for tool_use in tool_uses
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ToolExecution.session_id, ToolExecution.tool_use_id],
+            set_={
+                "tool_name": stmt.excluded.tool_name,
+                "tool_input": stmt.excluded.tool_input,
+                "message_id": stmt.excluded.message_id,
+                "updated_at": func.now(),
+            },
+        )
+        session_db.execute(stmt)
+
+    @staticmethod
+    def upsert_tool_results(
+        session_db: Session,
+        session_id: uuid.UUID,
+        message_id: int,
+        tool_results: list[dict[str, Any]],
+    ) -> None:
+        """Records tool results in one INSERT ... ON CONFLICT statement.
+
+        Args:
+            tool_results: Dicts with ``tool_use_id``, ``tool_output``,
+                ``tool_output_key`` and ``is_error``, unique by ``tool_use_id``.
+                Results without a recorded call are inserted as ``unknown``
+                placeholders.
+        """
+        if not tool_results:
+            return
+        stmt = ToolExecutionRepository._insert(session_db).values(
+            [
+                {
+                    "session_id": session_id,
+                    "message_id": message_id,
+                    "result_message_id": message_id,
+                    "tool_name": "unknown",
+                    **tool_result,
+                }
+                for tool_result in tool_results
+            ]
+        )
+        if session_db.get_bind().dialect.name == "sqlite":
+            elapsed_ms = (
+                func.julianday("now") - func.julianday(ToolExecution.created_at)
+            ) * 86_400_000
+        else:
+            elapsed_ms = (
+                func.extract("epoch", func.now() - ToolExecution.created_at) * 1000
+            )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ToolExecution.session_id, ToolExecution.tool_use_id],
+            set_={
+                "tool_output": stmt.excluded.tool_output,
+                "tool_output_key": stmt.excluded.tool_output_key,
+                "result_message_id": stmt.excluded.result_message_id,
+                "is_error": stmt.excluded.is_error,
+                "duration_ms": func.coalesce(
+                    ToolExecution.duration_ms, cast(elapsed_ms, Integer)
+                ),
+                "updated_at": func.now(),
+            },
+        )
+        session_db.execute(stmt)
+
+    @staticmethod
+    def _filter_range(
+        query: Query,
+        session_id: uuid.UUID,
+        after_message_id: int | None,
+        before_message_id: int | None,
+    ) -> Query:
+        query = query.filter(ToolExecution.session_id == session_id)
+        if after_message_id is not None:
+            # Include executions completed after the cursor, not only new ones.
+            query = query.filter(
+                or_(
+                    ToolExecution.message_id > after_message_id,
+                    ToolExecution.result_message_id > after_message_id,
+                )
+            )
+        if before_message_id is not None:
+            query = query.filter(ToolExecution.message_id < before_message_id)
+        return query
+
     @staticmethod
     def list_by_session(
-        session_db: Session, session_id: uuid.UUID, limit: int = 100, offset: int = 0
+        session_db: Session,
+        session_id: uuid.UUID,
+        limit: int = 100,
+        offset: int = 0,
+        *,
+        after_message_id: int | None = None,
+        before_message_id: int | None = None,
     ) -> list[ToolExecution]:
-        """Lists tool executions for a session."""
-        return (
-            session_db.query(ToolExecution)
-            .filter(ToolExecution.session_id == session_id)
-            .order_by(ToolExecution.created_at.asc())
-            .limit(limit)
-            .offset(offset)
-            .all()
+        """Lists tool executions for a session.
+
+        The range is keyed on the (BigInteger) ID of the message that created
+        or completed each execution.
+        """
+        query = ToolExecutionRepository._filter_range(
+            session_db.query(ToolExecution),
+            session_id,
+            after_message_id,
+            before_message_id,
+        )
+        order = (ToolExecution.message_id, ToolExecution.created_at, ToolExecution.id)
+        if before_message_id is not None and after_message_id is None:
+            executions = (
+                query.order_by(*(column.desc() for column in order))
+                .limit(limit)
+                .offset(offset)
+                .all()
+            )
+            executions.reverse()
+            return executions
+        return query.order_by(*order).limit(limit).offset(offset).all()
+
+    @staticmethod
+    def get_version(
+        session_db: Session,
+        session_id: uuid.UUID,
+        *,
+        after_message_id: int | None = None,
+        before_message_id: int | None = None,
+    ) -> tuple[int, datetime | None]:
+        """Returns (count, max updated_at) of a tool execution range."""
+        query = ToolExecutionRepository._filter_range(
+            session_db.query(
+                func.count(ToolExecution.id), func.max(ToolExecution.updated_at)
+            ),
+            session_id,
+            after_message_id,
+            before_message_id,
         )
+        count, max_updated_at = query.one()
+        return int(count or 0), max_updated_at
 
     @staticmethod
     def list_unfinished_by_session(
@@ -99,6 +273,26 @@ class ToolExecutionRepository:
             .all()
         )
 
+    @staticmethod
+    def list_touched_by_messages(
+        session_db: Session, session_id: uuid.UUID, message_ids: list[int]
+    ) -> list[ToolExecution]:
+        """Lists tool executions created or completed by any of the messages."""
+        if not message_ids:
+            return []
+        return (
+            session_db.query(ToolExecution)
+            .filter(ToolExecution.session_id == session_id)
+            .filter(
+                or_(
+                    ToolExecution.message_id.in_(message_ids),
+                    ToolExecution.result_message_id.in_(message_ids),
+                )
+            )
+            .order_by(ToolExecution.created_at.asc())
+            .all()
+        )
+
     @staticmethod
     def count_by_session(session_db: Session, session_id: uuid.UUID) -> int:
         """Counts tool executions for a session."""
@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class CallbackStatus(str, Enum):
@@ -52,6 +52,16 @@ class WorkspaceState(BaseModel):
     last_change: datetime
 
 
+class WorkspaceStateDelta(BaseModel):
+    """Workspace changes relative to the previously reported workspace state."""
+
+    repository: str | None = None
+    branch: str | None = None
+    last_change: datetime
+    file_keys: list[str] = Field(default_factory=list)  # "<status>:<path>"
+    upserted_files: list[FileChange] = Field(default_factory=list)
+
+
 class BrowserState(BaseModel):
     """Browser/desktop capability state exposed to the UI."""
 
@@ -68,6 +78,19 @@ class AgentCurrentState(BaseModel):
     current_step: str | None = None
 
 
+class AgentStateDelta(BaseModel):
+    """Changed sections of the agent state relative to ``base_seq``."""
+
+    base_seq: int
+    changed: list[str] = Field(default_factory=list)
+    todos: list[TodoItem] | None = None
+    mcp_status: list[McpStatus] | None = None
+    browser: BrowserState | None = None
+    workspace_state: WorkspaceState | None = None
+    current_step: str | None = None
+    workspace_delta: WorkspaceStateDelta | None = None
+
+
 class AgentCallbackRequest(BaseModel):
     """Agent execution callback request."""
 
@@ -78,12 +101,40 @@ class AgentCallbackRequest(BaseModel):
     error_message: str | None = None
     new_message: Any | None = None
     state_patch: AgentCurrentState | None = None
+    state_delta: AgentStateDelta | None = None
+    state_seq: int | None = None
     sdk_session_id: str | None = None
     workspace_files_prefix: str | None = None
     workspace_manifest_key: str | None = None
     workspace_archive_key: str | None = None
     workspace_export_status: str | None = None
 
+    # Object keys of payloads moved to S3, set by the payload offloader only.
+    _content_key: str | None = PrivateAttr(default=None)
+    _tool_output_keys: dict[str, str] = PrivateAttr(default_factory=dict)
+
+    @property
+    def content_key(self) -> str | None:
+        """Object key of the full new_message when it was offloaded."""
+        return self._content_key
+
+    @property
+    def tool_output_keys(self) -> dict[str, str]:
+        """Object keys of offloaded tool results, by tool_use_id."""
+        return self._tool_output_keys
+
+    def set_offloaded_keys(
+        self, content_key: str | None, tool_output_keys: dict[str, str]
+    ) -> None:
+        self._content_key = content_key
+        self._tool_output_keys = tool_output_keys
+
+
+class AgentCallbackBatchRequest(BaseModel):
+    """A batch of executor callbacks for one session, in send order."""
+
+    callbacks: list[AgentCallbackRequest] = Field(default_factory=list)
+
 
 class CallbackResponse(BaseModel):
     """Callback response."""
@@ -92,3 +143,5 @@ class CallbackResponse(BaseModel):
     status: str
     callback_status: CallbackStatus | None = None
     message: str | None = None
+    # The state delta was dropped (base mismatch); the sender must resend a snapshot.
+    state_resync_required: bool = False
@@ -4,3 +4,4 @@ from pydantic import BaseModel
 class ComputerBrowserScreenshotResponse(BaseModel):
     tool_use_id: str
     url: str
+    thumbnail_url: str | None = None
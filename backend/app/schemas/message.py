@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 from app.schemas.input_file import InputFile
 
@@ -21,9 +21,18 @@ class MessageResponse(BaseModel):
     text_preview: str | None
     created_at: datetime
     updated_at: datetime
+    content_key: str | None = Field(default=None, exclude=True)
 
     model_config = ConfigDict(from_attributes=True)
 
+    @computed_field
+    @property
+    def content_url(self) -> str | None:
+        """Set when ``content`` is a truncated preview; fetches the full content."""
+        if not self.content_key:
+            return None
+        return f"/api/v1/messages/{self.id}/content"
+
 
 class MessageWithFilesResponse(MessageResponse):
     """Message response including user-uploaded attachments.
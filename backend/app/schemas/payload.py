@@ -0,0 +1,21 @@
+import uuid
+
+from pydantic import BaseModel, Field
+
+
+class PayloadBackfillRequest(BaseModel):
+    limit: int = Field(default=100, ge=1, le=1000)
+    # Cursors from the previous response; rows up to them are skipped.
+    after_message_id: int = Field(default=0, ge=0)
+    after_tool_execution_id: uuid.UUID | None = None
+
+
+class PayloadBackfillResponse(BaseModel):
+    messages: int = 0
+    tool_outputs: int = 0
+    failed: int = 0
+    # Cursors for the next call: the last row examined in each table.
+    last_message_id: int = 0
+    last_tool_execution_id: uuid.UUID | None = None
+    # True when no rows were left after the cursors.
+    done: bool = False
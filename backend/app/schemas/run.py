@@ -52,6 +52,13 @@ class RunClaimRequest(BaseModel):
     schedule_modes: list[str] | None = None
 
 
+class RunClaimBatchRequest(RunClaimRequest):
+    """Claim up to ``limit`` runs, optionally waiting for one to become available."""
+
+    limit: int = Field(default=1, ge=1, le=100)
+    wait_seconds: float = Field(default=0, ge=0)
+
+
 class RunClaimResponse(BaseModel):
     """Claim next run response for worker dispatch."""
 
@@ -68,6 +75,12 @@ class RunStartRequest(BaseModel):
     worker_id: str
 
 
+class RunReleaseRequest(BaseModel):
+    """Return a claimed run to the queue request."""
+
+    worker_id: str
+
+
 class RunFailRequest(BaseModel):
     """Mark run as failed request."""
 
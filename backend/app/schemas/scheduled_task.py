@@ -51,7 +51,7 @@ class ScheduledTaskTriggerResponse(BaseModel):
 
 
 class ScheduledTaskDispatchRequest(BaseModel):
-    limit: int = 50
+    limit: int = Field(default=200, ge=1, le=1000)
 
 
 class ScheduledTaskDispatchResponse(BaseModel):
@@ -59,3 +59,7 @@ class ScheduledTaskDispatchResponse(BaseModel):
     run_ids: list[UUID] = Field(default_factory=list)
     skipped: int = 0
     errors: int = 0
+    claimed: int = 0
+    # Delay between the scheduled fire time and dispatch, over claimed tasks.
+    lag_ms_max: int = 0
+    lag_ms_avg: int = 0
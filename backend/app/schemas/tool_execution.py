@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 
 class ToolExecutionResponse(BaseModel):
@@ -17,5 +17,14 @@ class ToolExecutionResponse(BaseModel):
     is_error: bool
     duration_ms: int | None
     created_at: datetime
+    tool_output_key: str | None = Field(default=None, exclude=True)
 
     model_config = ConfigDict(from_attributes=True)
+
+    @computed_field
+    @property
+    def tool_output_url(self) -> str | None:
+        """Set when ``tool_output`` is a truncated preview; fetches the full output."""
+        if not self.tool_output_key:
+            return None
+        return f"/api/v1/tool-executions/{self.id}/output"
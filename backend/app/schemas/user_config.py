@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class UserConfigVersionResponse(BaseModel):
+    """Opaque version of a user's execution config inputs."""
+
+    version: str
@@ -6,20 +6,31 @@ from typing import Any
 from sqlalchemy.orm import Session
 
 from app.models.agent_run import AgentRun
+from app.models.agent_session import AgentSession
 from app.repositories.scheduled_task_repository import ScheduledTaskRepository
 from app.repositories.message_repository import MessageRepository
 from app.repositories.tool_execution_repository import ToolExecutionRepository
 from app.repositories.usage_log_repository import UsageLogRepository
 from app.schemas.callback import (
     AgentCallbackRequest,
+    AgentCurrentState,
+    AgentStateDelta,
     CallbackResponse,
     CallbackStatus,
 )
 from app.schemas.session import SessionUpdateRequest
+from app.services.callback_target_cache import (
+    CallbackTarget,
+    callback_target_cache,
+)
+from app.services.run_queue_notifier import run_queue_notifier
+from app.services.session_event_service import publish_session_events
 from app.services.session_service import SessionService
 
 logger = logging.getLogger(__name__)
 
+ACTIVE_RUN_STATUSES = ("claimed", "running")
+
 
 class CallbackService:
     """Service layer for processing executor callbacks."""
@@ -93,11 +104,20 @@ class CallbackService:
         message: dict[str, Any],
         session_id: uuid.UUID,
         message_id: int,
+        tool_output_keys: dict[str, str] | None = None,
     ) -> None:
+        """Upsert the tool calls and results of a message.
+
+        Uses at most two statements however many tool blocks the message has.
+        """
         content = message.get("content", [])
         if not isinstance(content, list):
             return
 
+        # Keyed by tool_use_id: a statement may not upsert the same row twice.
+        tool_uses: dict[str, dict[str, Any]] = {}
+        tool_results: dict[str, dict[str, Any]] = {}
+
         for block in content:
             if not isinstance(block, dict):
                 continue
@@ -107,84 +127,50 @@ class CallbackService:
             if "ToolUseBlock" in block_type:
                 tool_use_id = block.get("id")
                 tool_name = block.get("name")
-                tool_input = block.get("input")
-
                 if not tool_use_id or not tool_name:
                     continue
-
-                existing = ToolExecutionRepository.get_by_session_and_tool_use_id(
-                    session_db=session_db,
-                    session_id=session_id,
-                    tool_use_id=tool_use_id,
-                )
-                if existing:
-                    existing.tool_name = tool_name
-                    existing.tool_input = tool_input
-                    existing.message_id = message_id
-                    logger.debug(
-                        f"Updated tool execution (tool_use_id={tool_use_id}) in message {message_id}"
-                    )
-                    continue
-
-                ToolExecutionRepository.create(
-                    session_db=session_db,
-                    session_id=session_id,
-                    message_id=message_id,
-                    tool_use_id=tool_use_id,
-                    tool_name=tool_name,
-                    tool_input=tool_input,
-                )
-                logger.debug(
-                    f"Created tool execution (tool_use_id={tool_use_id}, tool={tool_name}) in message {message_id}"
-                )
+                tool_uses[tool_use_id] = {
+                    "tool_use_id": tool_use_id,
+                    "tool_name": tool_name,
+                    "tool_input": block.get("input"),
+                }
 
             elif "ToolResultBlock" in block_type:
                 tool_use_id = block.get("tool_use_id")
-                result_content = block.get("content")
-                is_error = block.get("is_error", False)
-
                 if not tool_use_id:
                     continue
-
                 # Persist an explicit tool_output payload even when the tool returns an empty/None content.
                 # This lets the UI reliably treat the tool step as "done" once a ToolResultBlock arrives.
-                tool_output = {"content": result_content}
-                existing = ToolExecutionRepository.get_by_session_and_tool_use_id(
-                    session_db=session_db,
-                    session_id=session_id,
-                    tool_use_id=tool_use_id,
-                )
-
-                if not existing:
-                    ToolExecutionRepository.create(
-                        session_db=session_db,
-                        session_id=session_id,
-                        message_id=message_id,
-                        tool_use_id=tool_use_id,
-                        tool_name="unknown",
-                        tool_output=tool_output,
-                        result_message_id=message_id,
-                        is_error=bool(is_error),
-                    )
-                    logger.debug(
-                        f"Created tool execution placeholder (tool_use_id={tool_use_id}) in message {message_id}"
-                    )
-                    continue
-
-                existing.tool_output = tool_output
-                existing.result_message_id = message_id
-                existing.is_error = bool(is_error)
-
-                if existing.duration_ms is None and existing.created_at is not None:
-                    duration = datetime.now(timezone.utc) - existing.created_at
-                    existing.duration_ms = int(duration.total_seconds() * 1000)
-
-                logger.debug(
-                    f"Updated tool execution result (tool_use_id={tool_use_id}) in message {message_id}"
-                )
+                tool_results[tool_use_id] = {
+                    "tool_use_id": tool_use_id,
+                    "tool_output": {"content": block.get("content")},
+                    "tool_output_key": (tool_output_keys or {}).get(tool_use_id),
+                    "is_error": bool(block.get("is_error", False)),
+                }
+
+        ToolExecutionRepository.upsert_tool_uses(
+            session_db, session_id, message_id, list(tool_uses.values())
+        )
+        ToolExecutionRepository.upsert_tool_results(
+            session_db, session_id, message_id, list(tool_results.values())
+        )
+        if tool_uses or tool_results:
+            logger.debug(
+                "tool_executions_upserted",
+                extra={
+                    "session_id": str(session_id),
+                    "message_id": message_id,
+                    "tool_uses": len(tool_uses),
+                    "tool_results": len(tool_results),
+                },
+            )
 
     def _extract_and_persist_usage(
-        self, db: Session, session_id: uuid.UUID, message: dict[str, Any]
+        self,
+        db: Session,
+        session_id: uuid.UUID,
+        message: dict[str, Any],
+        db_run: AgentRun | None,
     ) -> None:
         """Extracts and persists usage data from a ResultMessage."""
         message_type = message.get("_type", "")
@@ -200,14 +186,6 @@ class CallbackService:
         total_cost_usd = message.get("total_cost_usd")
         duration_ms = message.get("duration_ms")
 
-        db_run = (
-            db.query(AgentRun)
-            .filter(AgentRun.session_id == session_id)
-            .filter(AgentRun.status.in_(["claimed", "running"]))
-            .order_by(AgentRun.created_at.desc())
-            .first()
-        )
-
         UsageLogRepository.create(
             session_db=db,
             session_id=session_id,
@@ -216,7 +194,6 @@ class CallbackService:
             duration_ms=duration_ms,
             usage_json=usage_data,
         )
-        db.commit()
 
         input_tokens = usage_data.get("input_tokens")
         output_tokens = usage_data.get("output_tokens")
@@ -234,7 +211,13 @@ class CallbackService:
         )
 
     def _persist_message_and_tools(
-        self, db: Session, session_id: uuid.UUID, message: dict[str, Any]
+        self,
+        db: Session,
+        session_id: uuid.UUID,
+        message: dict[str, Any],
+        *,
+        content_key: str | None = None,
+        tool_output_keys: dict[str, str] | None = None,
     ) -> None:
         role = self._extract_role_from_message(message)
 
@@ -252,13 +235,15 @@ class CallbackService:
             role=role,
             content=message,
             text_preview=text_preview,
+            content_key=content_key,
         )
 
         db.flush()
 
-        self._extract_tool_executions(db, message, session_id, db_message.id)
+        self._extract_tool_executions(
+            db, message, session_id, db_message.id, tool_output_keys
+        )
 
-        db.commit()
         logger.debug(
             "message_persisted",
             extra={
@@ -268,14 +253,162 @@ class CallbackService:
             },
         )
 
+    @staticmethod
+    def _apply_state_delta(
+        state: dict[str, Any] | None,
+        state_seq: int | None,
+        delta: AgentStateDelta,
+    ) -> dict[str, Any] | None:
+        """Apply a state delta to the stored state.
+
+        Returns:
+            The merged state, or None if the delta does not apply to the stored
+            state (sequence mismatch or missing base workspace state).
+        """
+        if state_seq is None or state_seq != delta.base_seq:
+            return None
+        if not isinstance(state, dict):
+            return None
+
+        dumped = delta.model_dump(mode="json")
+        merged = dict(state)
+        for section in delta.changed:
+            if section in AgentCurrentState.model_fields:
+                merged[section] = dumped.get(section)
+
+        workspace_delta = dumped.get("workspace_delta")
+        if workspace_delta is None:
+            return merged
+
+        workspace = merged.get("workspace_state")
+        if not isinstance(workspace, dict):
+            return None
+
+        def file_key(file_change: dict[str, Any]) -> str:
+            return f"{file_change.get('status')}:{file_change.get('path')}"
+
+        files = {file_key(fc): fc for fc in workspace.get("file_changes") or []}
+        for file_change in workspace_delta["upserted_files"]:
+            files[file_key(file_change)] = file_change
+        file_changes = [
+            files[key] for key in workspace_delta["file_keys"] if key in files
+        ]
+
+        merged["workspace_state"] = {
+            **workspace,
+            "repository": workspace_delta["repository"],
+            "branch": workspace_delta["branch"],
+            "last_change": workspace_delta["last_change"],
+            "file_changes": file_changes,
+            "total_added_lines": sum(
+                int(fc.get("added_lines") or 0) for fc in file_changes
+            ),
+            "total_deleted_lines": sum(
+                int(fc.get("deleted_lines") or 0) for fc in file_changes
+            ),
+        }
+        return merged
+
     def process_agent_callback(
         self, db: Session, callback: AgentCallbackRequest
     ) -> CallbackResponse:
-        session_service = SessionService()
-        db_session = session_service.find_session_by_sdk_id_or_uuid(
-            db, callback.session_id
+        result = self._apply_agent_callback(db, callback)
+        db.commit()
+        publish_session_events([result.session_id])
+        self._notify_run_queue([result])
+        return result
+
+    def process_agent_callbacks(
+        self, db: Session, callbacks: list[AgentCallbackRequest]
+    ) -> list[CallbackResponse]:
+        """Persist a batch of callbacks (in order) in a single transaction."""
+        results = [self._apply_agent_callback(db, callback) for callback in callbacks]
+        db.commit()
+        publish_session_events(result.session_id for result in results)
+        self._notify_run_queue(results)
+        logger.debug(
+            "callback_batch_persisted",
+            extra={"callback_count": len(callbacks)},
+        )
+        return results
+
+    @staticmethod
+    def _notify_run_queue(results: list[CallbackResponse]) -> None:
+        # A finished run frees its session for the next queued run.
+        finished = [
+            result
+            for result in results
+            if result.callback_status
+            in (CallbackStatus.COMPLETED, CallbackStatus.FAILED)
+        ]
+        if not finished:
+            return
+        session_ids: list[uuid.UUID] = []
+        for result in finished:
+            try:
+                session_ids.append(uuid.UUID(result.session_id))
+            except ValueError:
+                continue
+        callback_target_cache.invalidate_sessions(session_ids)
+        run_queue_notifier.notify()
+
+    @staticmethod
+    def _get_active_run(db: Session, session_id: uuid.UUID) -> AgentRun | None:
+        return (
+            db.query(AgentRun)
+            .filter(AgentRun.session_id == session_id)
+            .filter(AgentRun.status.in_(ACTIVE_RUN_STATUSES))
+            .order_by(AgentRun.created_at.desc())
+            .first()
         )
 
+    def _resolve_target(
+        self, db: Session, callback_session_id: str
+    ) -> tuple[AgentSession | None, AgentRun | None]:
+        """Resolve the session and active run a callback is addressed to.
+
+        Cached targets are loaded by primary key (served from the identity map
+        within a batch); the active run is re-queried only if it finished.
+        """
+        target = callback_target_cache.get(callback_session_id)
+        if target is not None:
+            db_session = db.get(AgentSession, target.session_id)
+            if db_session is not None and not db_session.is_deleted:
+                db_run = (
+                    db.get(AgentRun, target.active_run_id)
+                    if target.active_run_id
+                    else None
+                )
+                if target.active_run_id is None or (
+                    db_run is not None and db_run.status in ACTIVE_RUN_STATUSES
+                ):
+                    return db_session, db_run
+                db_run = self._get_active_run(db, db_session.id)
+                callback_target_cache.set(
+                    callback_session_id,
+                    CallbackTarget(db_session.id, db_run.id if db_run else None),
+                )
+                return db_session, db_run
+
+        db_session = SessionService().find_session_by_sdk_id_or_uuid(
+            db, callback_session_id
+        )
+        if db_session is None:
+            return None, None
+        db_run = self._get_active_run(db, db_session.id)
+        callback_target_cache.set(
+            callback_session_id,
+            CallbackTarget(db_session.id, db_run.id if db_run else None),
+        )
+        return db_session, db_run
+
+    def _apply_agent_callback(
+        self, db: Session, callback: AgentCallbackRequest
+    ) -> CallbackResponse:
+        """Apply one callback to the session without committing."""
+        session_service = SessionService()
+        db_session, db_run = self._resolve_target(db, callback.session_id)
+
         if not db_session:
             logger.warning(
                 "callback_session_not_found",
@@ -307,6 +440,7 @@ class CallbackService:
             )
 
         update_data: dict[str, Any] = {}
+        state_resync_required = False
 
         if (
             derived_sdk_session_id
@@ -323,6 +457,25 @@ class CallbackService:
 
         if callback.state_patch is not None:
             update_data["state_patch"] = callback.state_patch.model_dump(mode="json")
+            update_data["state_seq"] = callback.state_seq
+        elif callback.state_delta is not None:
+            merged_state = self._apply_state_delta(
+                db_session.state_patch, db_session.state_seq, callback.state_delta
+            )
+            if merged_state is None:
+                # A delta was missed; keep the stored state and ask for a snapshot.
+                state_resync_required = True
+                logger.warning(
+                    "callback_state_delta_out_of_sequence",
+                    extra={
+                        "session_id": str(db_session.id),
+                        "state_seq": db_session.state_seq,
+                        "base_seq": callback.state_delta.base_seq,
+                    },
+                )
+            else:
+                update_data["state_patch"] = merged_state
+                update_data["state_seq"] = callback.state_seq
 
         if callback.workspace_files_prefix is not None:
             update_data["workspace_files_prefix"] = callback.workspace_files_prefix
@@ -334,8 +487,8 @@ class CallbackService:
             update_data["workspace_export_status"] = callback.workspace_export_status
 
         if update_data:
-            db_session = session_service.update_session(
-                db, db_session.id, SessionUpdateRequest(**update_data)
+            session_service.apply_update(
+                db, db_session, SessionUpdateRequest(**update_data)
             )
             if "sdk_session_id" in update_data:
                 logger.info(
@@ -356,17 +509,17 @@ class CallbackService:
                 )
 
         if callback.new_message:
-            self._persist_message_and_tools(db, db_session.id, callback.new_message)
+            self._persist_message_and_tools(
+                db,
+                db_session.id,
+                callback.new_message,
+                content_key=callback.content_key,
+                tool_output_keys=callback.tool_output_keys,
+            )
             # Extract and persist usage data if this is a ResultMessage
-            self._extract_and_persist_usage(db, db_session.id, callback.new_message)
-
-        db_run = (
-            db.query(AgentRun)
-            .filter(AgentRun.session_id == db_session.id)
-            .filter(AgentRun.status.in_(["claimed", "running"]))
-            .order_by(AgentRun.created_at.desc())
-            .first()
-        )
+            self._extract_and_persist_usage(
+                db, db_session.id, callback.new_message, db_run
+            )
 
         if db_run:
             db_run.progress = int(callback.progress or 0)
@@ -387,10 +540,13 @@ class CallbackService:
                         db_run.last_error = callback.error_message
 
             self._sync_scheduled_task_last_status(db, db_run)
-            db.commit()
+
+        # Later callbacks of the same batch query the run/session state.
+        db.flush()
 
         return CallbackResponse(
             session_id=str(db_session.id),
             status=db_session.status,
             callback_status=callback.status,
+            state_resync_required=state_resync_required,
         )
@@ -0,0 +1,79 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from app.core.settings import get_settings
+
+
+@dataclass(frozen=True)
+class CallbackTarget:
+    """What a callback session id resolved to."""
+
+    session_id: uuid.UUID
+    active_run_id: uuid.UUID | None
+
+
+class CallbackTargetCache:
+    """Bounded LRU cache (with TTL) of callback session id -> CallbackTarget.
+
+    Callbacks address sessions by SDK session id or UUID; resolving that and
+    the active run on every message costs two queries. Cached targets are
+    re-loaded by primary key and the run is re-checked to still be active, so
+    a stale entry only costs a fallback lookup. Entries are invalidated when
+    a session's runs are claimed, finished or canceled.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._max_entries = max(0, max_entries)
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, CallbackTarget]] = OrderedDict()
+        self._keys_by_session: dict[uuid.UUID, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CallbackTarget | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, target = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return target
+
+    def set(self, key: str, target: CallbackTarget) -> None:
+        if self._max_entries <= 0 or self._ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, target)
+            self._keys_by_session.setdefault(target.session_id, set()).add(key)
+            while len(self._entries) > self._max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_sessions(self, session_ids: Iterable[uuid.UUID]) -> None:
+        with self._lock:
+            for session_id in set(session_ids):
+                for key in self._keys_by_session.pop(session_id, set()):
+                    self._entries.pop(key, None)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        keys = self._keys_by_session.get(entry[1].session_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                self._keys_by_session.pop(entry[1].session_id, None)
+
+
+_settings = get_settings()
+callback_target_cache = CallbackTargetCache(
+    max_entries=_settings.callback_target_cache_max_entries,
+    ttl_seconds=_settings.callback_target_cache_ttl_seconds,
+)
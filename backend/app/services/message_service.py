@@ -1,5 +1,6 @@
 import logging
 import uuid
+from datetime import datetime
 
 from pydantic import ValidationError
 
@@ -11,11 +12,7 @@ from app.models.agent_message import AgentMessage
 from app.repositories.message_repository import MessageRepository
 from app.repositories.run_repository import RunRepository
 from app.schemas.input_file import InputFile
-from app.schemas.message import (
-    InputFileWithUrl,
-    MessageResponse,
-    MessageWithFilesResponse,
-)
+from app.schemas.message import InputFileWithUrl, MessageWithFilesResponse
 from app.services.storage_service import S3StorageService
 
 logger = logging.getLogger(__name__)
@@ -24,20 +21,50 @@ logger = logging.getLogger(__name__)
 class MessageService:
     """Service layer for message queries."""
 
-    def get_messages(self, db: Session, session_id: uuid.UUID) -> list[AgentMessage]:
-        """Gets all messages for a session.
+    def get_messages(
+        self,
+        db: Session,
+        session_id: uuid.UUID,
+        *,
+        limit: int = 100,
+        after_id: int | None = None,
+        before_id: int | None = None,
+    ) -> list[AgentMessage]:
+        """Gets messages for a session.
 
         Args:
             db: Database session
             session_id: Session ID
+            limit: Maximum number of messages
+            after_id: Only messages with a greater ID
+            before_id: Only messages with a smaller ID (the closest page)
 
         Returns:
-            List of messages ordered by creation time
+            List of messages ordered by ID
         """
-        messages = MessageRepository.list_by_session(db, session_id)
+        messages = MessageRepository.list_by_session(
+            db,
+            session_id,
+            limit=max(1, int(limit)),
+            after_id=after_id,
+            before_id=before_id,
+        )
         logger.debug(f"Retrieved {len(messages)} messages for session {session_id}")
         return messages
 
+    def get_messages_version(
+        self,
+        db: Session,
+        session_id: uuid.UUID,
+        *,
+        after_id: int | None = None,
+        before_id: int | None = None,
+    ) -> tuple[int, int | None, datetime | None]:
+        """Cheap change marker of a message range (used for ETags)."""
+        return MessageRepository.get_version(
+            db, session_id, after_id=after_id, before_id=before_id
+        )
+
     def get_message(self, db: Session, message_id: int) -> AgentMessage:
         """Gets a message by ID.
 
@@ -60,7 +87,14 @@ class MessageService:
         return message
 
     def get_messages_with_files(
-        self, db: Session, session_id: uuid.UUID, *, user_id: str
+        self,
+        db: Session,
+        session_id: uuid.UUID,
+        *,
+        user_id: str,
+        limit: int = 1000,
+        after_id: int | None = None,
+        before_id: int | None = None,
     ) -> list[MessageWithFilesResponse]:
         """Gets messages for a session and attaches per-run uploaded files.
 
@@ -68,11 +102,18 @@ class MessageService:
         message content schema to any upstream agent SDK format.
         """
 
-        storage_service = S3StorageService()
         key_prefix = f"attachments/{user_id}/"
 
-        messages = MessageRepository.list_by_session(db, session_id, limit=1000)
-        runs = RunRepository.list_by_session(db, session_id, limit=1000)
+        messages = MessageRepository.list_by_session(
+            db,
+            session_id,
+            limit=max(1, int(limit)),
+            after_id=after_id,
+            before_id=before_id,
+        )
+        runs = RunRepository.list_by_user_message_ids(
+            db, session_id, [msg.id for msg in messages]
+        )
 
         message_id_to_attachments: dict[int, list[InputFile]] = {}
         for run in runs:
@@ -96,15 +137,15 @@ class MessageService:
             if parsed:
                 message_id_to_attachments[run.user_message_id] = parsed
 
+        storage_service = S3StorageService() if message_id_to_attachments else None
         result: list[MessageWithFilesResponse] = []
         for msg in messages:
-            base = MessageResponse.model_validate(msg)
             raw_attachments = message_id_to_attachments.get(msg.id) or []
             attachments: list[InputFileWithUrl] = []
             for file in raw_attachments:
                 key = (file.source or "").strip()
                 url = None
-                if key and key.startswith(key_prefix):
+                if storage_service and key and key.startswith(key_prefix):
                     try:
                         url = storage_service.presign_get(
                             key,
@@ -120,9 +161,8 @@ class MessageService:
                     )
                 )
             result.append(
-                MessageWithFilesResponse(
-                    **base.model_dump(mode="json"),
-                    attachments=attachments,
+                MessageWithFilesResponse.model_validate(msg).model_copy(
+                    update={"attachments": attachments}
                 )
             )
 
@@ -0,0 +1,228 @@
+import asyncio
+import json
+import logging
+import re
+import uuid
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.core.errors.exceptions import AppException
+from app.core.settings import get_settings
+from app.repositories.message_repository import MessageRepository
+from app.repositories.tool_execution_repository import ToolExecutionRepository
+from app.schemas.callback import AgentCallbackRequest
+from app.schemas.payload import PayloadBackfillResponse
+from app.services.storage_service import S3StorageService
+
+logger = logging.getLogger(__name__)
+
+_UNSAFE_KEY_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def payload_size(value: Any) -> int:
+    """Size of a value serialized as compact JSON, in bytes."""
+    return len(
+        json.dumps(
+            value, ensure_ascii=False, separators=(",", ":"), default=str
+        ).encode("utf-8")
+    )
+
+
+def build_preview(value: Any, max_chars: int) -> Any:
+    """Copy a JSON value with long strings truncated and inline binaries dropped.
+
+    The structure (block types, ids, keys) is kept so previews render like the
+    original payload.
+    """
+    if isinstance(value, str):
+        if len(value) <= max_chars:
+            return value
+        return f"{value[:max_chars]}… [truncated {len(value) - max_chars} chars]"
+    if isinstance(value, list):
+        return [build_preview(item, max_chars) for item in value]
+    if isinstance(value, dict):
+        if value.get("type") == "base64" and isinstance(value.get("data"), str):
+            # Truncated base64 would only render as a broken image.
+            return {**value, "data": ""}
+        return {key: build_preview(item, max_chars) for key, item in value.items()}
+    return value
+
+
+def _key_segment(value: str) -> str:
+    return _UNSAFE_KEY_CHARS.sub("_", value)[:128] or "unknown"
+
+
+class PayloadOffloadService:
+    """Moves oversized message and tool payloads to object storage.
+
+    Rows keep a truncated preview plus the object key; the full payload is
+    fetched lazily. Offloading is best effort: when storage is unavailable
+    payloads stay inline.
+    """
+
+    def __init__(self) -> None:
+        settings = get_settings()
+        self.threshold_bytes = settings.payload_offload_threshold_bytes
+        self.preview_max_chars = max(1, settings.payload_preview_max_chars)
+        self.enabled = self.threshold_bytes > 0 and bool(settings.s3_bucket)
+        self._storage: S3StorageService | None = None
+
+    @property
+    def storage(self) -> S3StorageService:
+        if self._storage is None:
+            self._storage = S3StorageService()
+        return self._storage
+
+    @staticmethod
+    def message_key(session_id: str) -> str:
+        return f"payloads/{_key_segment(session_id)}/messages/{uuid.uuid4().hex}.json"
+
+    @staticmethod
+    def tool_output_key(session_id: str, tool_use_id: str) -> str:
+        return (
+            f"payloads/{_key_segment(session_id)}/tool-outputs/"
+            f"{_key_segment(tool_use_id)}-{uuid.uuid4().hex[:8]}.json"
+        )
+
+    def offload(self, key: str, payload: Any) -> Any | None:
+        """Store a payload and return its preview, or None if the upload failed."""
+        try:
+            self.storage.put_json(key, payload)
+        except AppException as exc:
+            logger.warning(
+                "payload_offload_failed", extra={"key": key, "error": exc.message}
+            )
+            return None
+        return build_preview(payload, self.preview_max_chars)
+
+    def offload_callback(self, callback: AgentCallbackRequest) -> None:
+        """Offload the oversized parts of a callback message in place.
+
+        Large tool results are stored one object per tool call (they back
+        ``ToolExecution.tool_output``); if the message is still too large, the
+        whole message is stored as well.
+        """
+        message = callback.new_message
+        if not self.enabled or not isinstance(message, dict):
+            return
+        if payload_size(message) <= self.threshold_bytes:
+            return
+
+        message = dict(message)
+        tool_output_keys: dict[str, str] = {}
+        content = message.get("content")
+        if isinstance(content, list):
+            blocks: list[Any] = []
+            for block in content:
+                tool_use_id = (
+                    block.get("tool_use_id") if isinstance(block, dict) else None
+                )
+                if (
+                    not tool_use_id
+                    or "ToolResultBlock" not in str(block.get("_type", ""))
+                    or payload_size(block.get("content")) <= self.threshold_bytes
+                ):
+                    blocks.append(block)
+                    continue
+                key = self.tool_output_key(callback.session_id, tool_use_id)
+                # Stored in the ToolExecution.tool_output shape.
+                preview = self.offload(key, {"content": block.get("content")})
+                if preview is None:
+                    blocks.append(block)
+                    continue
+                tool_output_keys[tool_use_id] = key
+                blocks.append({**block, "content": preview["content"]})
+            message["content"] = blocks
+
+        content_key: str | None = None
+        if payload_size(message) > self.threshold_bytes:
+            key = self.message_key(callback.session_id)
+            preview = self.offload(key, message)
+            if preview is not None:
+                content_key = key
+                message = preview
+
+        callback.new_message = message
+        callback.set_offloaded_keys(content_key, tool_output_keys)
+
+    async def offload_callbacks_async(
+        self, callbacks: list[AgentCallbackRequest]
+    ) -> None:
+        """Offload callback payloads on a worker thread (uploads are blocking)."""
+        if not self.enabled:
+            return
+        if not any(isinstance(c.new_message, dict) for c in callbacks):
+            return
+
+        def offload_all() -> None:
+            for callback in callbacks:
+                self.offload_callback(callback)
+
+        await asyncio.to_thread(offload_all)
+
+    def load(self, key: str) -> Any:
+        """Fetch an offloaded payload."""
+        return self.storage.get_json(key)
+
+    async def load_async(self, key: str) -> Any:
+        return await asyncio.to_thread(self.load, key)
+
+    def backfill(
+        self,
+        db: Session,
+        *,
+        limit: int,
+        after_message_id: int = 0,
+        after_tool_execution_id: uuid.UUID | None = None,
+    ) -> PayloadBackfillResponse:
+        """Offload up to ``limit`` existing oversized messages and tool outputs.
+
+        Rows are scanned in id order after the given cursors; pass the returned
+        ``last_*`` ids back until ``done``. Rows that failed to upload are
+        counted and skipped, so they don't stall later batches; a fresh pass
+        without cursors retries them.
+        """
+        result = PayloadBackfillResponse(
+            last_message_id=after_message_id,
+            last_tool_execution_id=after_tool_execution_id,
+        )
+        if not self.enabled:
+            result.done = True
+            return result
+
+        for message in MessageRepository.list_oversized(
+            db, self.threshold_bytes, limit, after_id=after_message_id
+        ):
+            result.last_message_id = message.id
+            key = self.message_key(str(message.session_id))
+            preview = self.offload(key, message.content)
+            if preview is None:
+                result.failed += 1
+                continue
+            message.content = preview
+            message.content_key = key
+            result.messages += 1
+
+        for execution in ToolExecutionRepository.list_oversized_outputs(
+            db, self.threshold_bytes, limit, after_id=after_tool_execution_id
+        ):
+            result.last_tool_execution_id = execution.id
+            key = self.tool_output_key(
+                str(execution.session_id), execution.tool_use_id or str(execution.id)
+            )
+            preview = self.offload(key, execution.tool_output)
+            if preview is None:
+                result.failed += 1
+                continue
+            execution.tool_output = preview
+            execution.tool_output_key = key
+            result.tool_outputs += 1
+
+        result.done = (
+            result.last_message_id == after_message_id
+            and result.last_tool_execution_id == after_tool_execution_id
+        )
+        db.commit()
+        logger.info("payload_backfill_batch", extra=result.model_dump(mode="json"))
+        return result
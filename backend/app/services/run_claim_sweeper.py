@@ -0,0 +1,43 @@
+import asyncio
+import logging
+
+from sqlalchemy.orm import Session
+
+from app.core.database import AsyncSessionLocal
+from app.core.settings import get_settings
+from app.repositories.run_repository import RunRepository
+from app.services.run_queue_notifier import run_queue_notifier
+
+logger = logging.getLogger(__name__)
+
+
+def _release_expired_claims(db: Session) -> int:
+    released = RunRepository.release_expired_claims(db)
+    db.commit()
+    return released
+
+
+async def sweep_expired_claims() -> int:
+    """Return runs with expired leases to the queue."""
+    async with AsyncSessionLocal() as db:
+        released = await db.run_sync(_release_expired_claims)
+    if released:
+        logger.info("run_claims_released", extra={"count": released})
+    return released
+
+
+async def run_claim_sweeper() -> None:
+    """Periodically release expired run claims and re-check waiting claims.
+
+    Claims no longer sweep leases themselves, which kept an UPDATE over the
+    runs table on every poll. Every tick also wakes long-polling claims so
+    runs whose ``scheduled_at`` has passed are picked up without an event.
+    """
+    interval = max(1.0, get_settings().run_claim_sweep_interval_seconds)
+    while True:
+        try:
+            await sweep_expired_claims()
+        except Exception:
+            logger.exception("run_claim_sweep_failed")
+        run_queue_notifier.notify()
+        await asyncio.sleep(interval)
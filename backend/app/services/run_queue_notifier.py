@@ -0,0 +1,36 @@
+import asyncio
+
+
+class RunQueueNotifier:
+    """Wakes long-polling run claims when queued runs may have become claimable.
+
+    Notifications are hints only: waiters re-run the claim query, and the wait
+    is bounded, so a missed wake-up only delays dispatch.
+    """
+
+    def __init__(self) -> None:
+        self._waiters: set[asyncio.Event] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def subscribe(self) -> asyncio.Event:
+        self._loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+        self._waiters.add(wakeup)
+        return wakeup
+
+    def unsubscribe(self, wakeup: asyncio.Event) -> None:
+        self._waiters.discard(wakeup)
+
+    def notify(self) -> None:
+        """Wake all waiting claims (safe to call from any thread)."""
+        loop = self._loop
+        if loop is None or loop.is_closed() or not self._waiters:
+            return
+        loop.call_soon_threadsafe(self._wake)
+
+    def _wake(self) -> None:
+        for wakeup in self._waiters:
+            wakeup.set()
+
+
+run_queue_notifier = RunQueueNotifier()
@@ -1,3 +1,4 @@
+import logging
 import uuid
 from datetime import datetime, timezone
 
@@ -5,19 +6,27 @@ from sqlalchemy.orm import Session
 
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
+from app.models.agent_run import AgentRun
+from app.models.agent_session import AgentSession
 from app.repositories.scheduled_task_repository import ScheduledTaskRepository
 from app.repositories.message_repository import MessageRepository
 from app.repositories.run_repository import RunRepository
 from app.repositories.session_repository import SessionRepository
 from app.schemas.run import (
+    RunClaimBatchRequest,
     RunClaimRequest,
     RunClaimResponse,
     RunFailRequest,
+    RunReleaseRequest,
     RunResponse,
     RunStartRequest,
 )
+from app.services.callback_target_cache import callback_target_cache
+from app.services.run_queue_notifier import run_queue_notifier
 from app.services.usage_service import UsageService
 
+logger = logging.getLogger(__name__)
+
 usage_service = UsageService()
 
 
@@ -90,9 +99,10 @@ class RunService:
             item.usage = usage_by_run_id.get(item.run_id)
         return responses
 
-    def claim_next_run(
-        self, db: Session, request: RunClaimRequest
-    ) -> RunClaimResponse | None:
+    @staticmethod
+    def _parse_claim_request(
+        request: RunClaimRequest,
+    ) -> tuple[str, list[str] | None]:
         worker_id = request.worker_id.strip()
         if not worker_id:
             raise AppException(
@@ -109,6 +119,12 @@ class RunService:
             if request.schedule_modes
             else None
         )
+        return worker_id, schedule_modes
+
+    def claim_next_run(
+        self, db: Session, request: RunClaimRequest
+    ) -> RunClaimResponse | None:
+        worker_id, schedule_modes = self._parse_claim_request(request)
 
         db_run = RunRepository.claim_next(
             session_db=db,
@@ -148,6 +164,7 @@ class RunService:
 
         db.commit()
         db.refresh(db_run)
+        callback_target_cache.invalidate_sessions([db_run.session_id])
 
         return RunClaimResponse(
             run=RunResponse.model_validate(db_run),
@@ -157,6 +174,84 @@ class RunService:
             sdk_session_id=db_session.sdk_session_id,
         )
 
+    def claim_runs(
+        self, db: Session, request: RunClaimBatchRequest
+    ) -> list[RunClaimResponse]:
+        """Claim up to ``request.limit`` runs and build their dispatch payloads.
+
+        Runs whose session or prompt cannot be resolved are failed instead of
+        failing the whole batch.
+        """
+        worker_id, schedule_modes = self._parse_claim_request(request)
+
+        db_runs = RunRepository.claim_batch(
+            db,
+            worker_id,
+            limit=request.limit,
+            lease_seconds=request.lease_seconds,
+            schedule_modes=schedule_modes,
+        )
+        if not db_runs:
+            db.commit()
+            return []
+
+        sessions = {
+            s.id: s
+            for s in SessionRepository.list_by_ids(
+                db, list({run.session_id for run in db_runs})
+            )
+        }
+        messages = {
+            m.id: m
+            for m in MessageRepository.list_by_ids(
+                db, [run.user_message_id for run in db_runs]
+            )
+        }
+
+        claimed: list[tuple[AgentRun, AgentSession, str]] = []
+        for db_run in db_runs:
+            db_session = sessions.get(db_run.session_id)
+            db_message = messages.get(db_run.user_message_id)
+            prompt = (
+                (
+                    self._extract_prompt_from_message(db_message.content)
+                    or db_message.text_preview
+                )
+                if db_message
+                else None
+            )
+            if not db_session or not prompt:
+                db_run.status = "failed"
+                db_run.claimed_by = None
+                db_run.lease_expires_at = None
+                db_run.finished_at = datetime.now(timezone.utc)
+                db_run.last_error = (
+                    "Session not found"
+                    if not db_session
+                    else "Unable to extract prompt from message"
+                )
+                self._sync_scheduled_task_last_status(db, db_run.id)
+                logger.warning(
+                    "run_claim_invalid",
+                    extra={"run_id": str(db_run.id), "error": db_run.last_error},
+                )
+                continue
+            claimed.append((db_run, db_session, prompt))
+
+        db.commit()
+        callback_target_cache.invalidate_sessions(run.session_id for run in db_runs)
+
+        return [
+            RunClaimResponse(
+                run=RunResponse.model_validate(db_run),
+                user_id=db_session.user_id,
+                prompt=prompt,
+                config_snapshot=db_run.config_snapshot or db_session.config_snapshot,
+                sdk_session_id=db_session.sdk_session_id,
+            )
+            for db_run, db_session, prompt in claimed
+        ]
+
     def start_run(
         self, db: Session, run_id: uuid.UUID, request: RunStartRequest
     ) -> RunResponse:
@@ -217,6 +312,51 @@ class RunService:
 
         return RunResponse.model_validate(db_run)
 
+    def release_run(
+        self,
+        db: Session,
+        run_id: uuid.UUID,
+        request: RunReleaseRequest,
+    ) -> RunResponse:
+        """Return a claimed run to the queue without counting an attempt.
+
+        Used by workers that claimed a run but cannot start it (no capacity).
+        Runs in any other state are returned unchanged.
+        """
+        worker_id = request.worker_id.strip()
+        if not worker_id:
+            raise AppException(
+                error_code=ErrorCode.BAD_REQUEST,
+                message="worker_id cannot be empty",
+            )
+
+        db_run = RunRepository.get_by_id(db, run_id)
+        if not db_run:
+            raise AppException(
+                error_code=ErrorCode.NOT_FOUND,
+                message=f"Run not found: {run_id}",
+            )
+
+        if db_run.status != "claimed":
+            return RunResponse.model_validate(db_run)
+
+        if db_run.claimed_by and db_run.claimed_by != worker_id:
+            raise AppException(
+                error_code=ErrorCode.FORBIDDEN,
+                message="Run is claimed by another worker",
+            )
+
+        db_run.status = "queued"
+        db_run.claimed_by = None
+        db_run.lease_expires_at = None
+        db.commit()
+        db.refresh(db_run)
+        callback_target_cache.invalidate_sessions([db_run.session_id])
+        # Another worker with free capacity may pick it up right away.
+        run_queue_notifier.notify()
+
+        return RunResponse.model_validate(db_run)
+
     def fail_run(
         self,
         db: Session,
@@ -256,5 +396,8 @@ class RunService:
         self._sync_scheduled_task_last_status(db, db_run.id)
         db.commit()
         db.refresh(db_run)
+        callback_target_cache.invalidate_sessions([db_run.session_id])
+        # The session is free again; its next queued run can be claimed.
+        run_queue_notifier.notify()
 
         return RunResponse.model_validate(db_run)
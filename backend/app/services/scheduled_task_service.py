@@ -1,6 +1,9 @@
 import logging
+import threading
+import time
 import uuid
 from datetime import datetime, timezone
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 from croniter import croniter
@@ -10,6 +13,7 @@ from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
 from app.models.agent_run import AgentRun
 from app.models.agent_scheduled_task import AgentScheduledTask
+from app.models.agent_session import AgentSession
 from app.repositories.message_repository import MessageRepository
 from app.repositories.project_repository import ProjectRepository
 from app.repositories.run_repository import RunRepository
@@ -22,11 +26,51 @@ from app.schemas.scheduled_task import (
     ScheduledTaskTriggerResponse,
     ScheduledTaskUpdateRequest,
 )
+from app.services.run_queue_notifier import run_queue_notifier
 from app.services.task_service import TaskService
 
 logger = logging.getLogger(__name__)
 
 
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+class _CronTimeline:
+    """A parsed cron expression bound to its timezone.
+
+    Parsing the expression and loading the zone dominate next-run computation,
+    so timelines are built once and re-based for every lookup.
+    """
+
+    def __init__(self, cron_expr: str, timezone_name: str) -> None:
+        self.tz = ZoneInfo(timezone_name)
+        self._itr = croniter(cron_expr, datetime.now(self.tz))
+        self._lock = threading.Lock()
+
+    def next_after(self, now_utc: datetime) -> datetime:
+        base = _as_utc(now_utc).astimezone(self.tz)
+        with self._lock:
+            self._itr.set_current(base, force=True)
+            next_local = self._itr.get_next(datetime)
+        if not isinstance(next_local, datetime):
+            raise AppException(
+                error_code=ErrorCode.INTERNAL_ERROR,
+                message="Failed to compute next_run_at",
+            )
+        if next_local.tzinfo is None:
+            next_local = next_local.replace(tzinfo=self.tz)
+        return next_local.astimezone(timezone.utc)
+
+
+@lru_cache(maxsize=4096)
+def _cron_timeline(cron_expr: str, timezone_name: str) -> _CronTimeline:
+    # Keyed by the schedule itself, so edited tasks get a fresh timeline.
+    return _CronTimeline(cron_expr, timezone_name)
+
+
 class ScheduledTaskService:
     """Service layer for scheduled task management and dispatch."""
 
@@ -67,20 +111,7 @@ class ScheduledTaskService:
         timezone_name: str,
         now_utc: datetime,
     ) -> datetime:
-        if now_utc.tzinfo is None:
-            now_utc = now_utc.replace(tzinfo=timezone.utc)
-        tz = ZoneInfo(timezone_name)
-        base = now_utc.astimezone(tz)
-        itr = croniter(cron_expr, base)
-        next_local = itr.get_next(datetime)
-        if isinstance(next_local, datetime) and next_local.tzinfo is None:
-            next_local = next_local.replace(tzinfo=tz)
-        if not isinstance(next_local, datetime):
-            raise AppException(
-                error_code=ErrorCode.INTERNAL_ERROR,
-                message="Failed to compute next_run_at",
-            )
-        return next_local.astimezone(timezone.utc)
+        return _cron_timeline(cron_expr, timezone_name).next_after(now_utc)
 
     @staticmethod
     def _normalize_name(value: str) -> str:
@@ -109,6 +140,20 @@ class ScheduledTaskService:
             "content": [{"_type": "TextBlock", "text": prompt}],
         }
 
+    @staticmethod
+    def _build_run_snapshot(task: AgentScheduledTask) -> dict:
+        run_snapshot = dict(task.config_snapshot or {})
+        if task.input_files:
+            run_snapshot["input_files"] = list(task.input_files)
+        return run_snapshot
+
+    @staticmethod
+    def _reset_session_state(db_session: AgentSession) -> None:
+        # Clear previous execution state so the UI doesn't show stale file changes.
+        db_session.state_patch = {}
+        db_session.state_seq = None
+        db_session.status = "pending"
+
     def create_task(
         self, db: Session, user_id: str, request: ScheduledTaskCreateRequest
     ) -> ScheduledTaskResponse:
@@ -303,6 +348,7 @@ class ScheduledTaskService:
         db.commit()
         db.refresh(db_task)
         db.refresh(run)
+        run_queue_notifier.notify()
         return ScheduledTaskTriggerResponse(session_id=run.session_id, run_id=run.id)
 
     def dispatch_due(
@@ -311,65 +357,158 @@ class ScheduledTaskService:
         *,
         limit: int = 50,
     ) -> ScheduledTaskDispatchResponse:
+        """Enqueue runs for up to ``limit`` due tasks in one transaction.
+
+        Work is batched across the claimed tasks: pinned sessions and active
+        runs are looked up with one query each, and sessions, messages and
+        runs are inserted with one flush per table.
+        """
+        started = time.perf_counter()
         now_utc = datetime.now(timezone.utc)
         tasks = ScheduledTaskRepository.claim_due_for_update(
             db, limit=limit, now_utc=now_utc
         )
+        if not tasks:
+            return ScheduledTaskDispatchResponse(dispatched=0)
+
+        lags_ms = [
+            max(0, int((now_utc - _as_utc(task.next_run_at)).total_seconds() * 1000))
+            for task in tasks
+        ]
+        # Tasks sharing a schedule share the next fire time.
+        next_run_by_schedule: dict[tuple[str, str], datetime] = {}
+
+        def advance(task: AgentScheduledTask) -> None:
+            key = (task.cron, task.timezone)
+            if key not in next_run_by_schedule:
+                next_run_by_schedule[key] = self._compute_next_run_at(
+                    cron_expr=task.cron, timezone_name=task.timezone, now_utc=now_utc
+                )
+            task.next_run_at = next_run_by_schedule[key]
 
-        dispatched: list[uuid.UUID] = []
+        pinned_ids = [t.session_id for t in tasks if t.reuse_session and t.session_id]
+        pinned_sessions = {
+            s.id: s for s in SessionRepository.list_by_ids(db, pinned_ids)
+        }
+        # Only dispatch when no active/queued run is present for the session.
+        busy_session_ids = RunRepository.list_active_session_ids(
+            db, list(pinned_sessions)
+        )
+
+        pending: list[tuple[AgentScheduledTask, AgentSession, str]] = []
         skipped = 0
         errors = 0
-
         for task in tasks:
             try:
-                # Only dispatch when no active/queued run is present for this task/session.
-                run = self._enqueue_run_for_task(
-                    db,
-                    task=task,
-                    scheduled_at=task.next_run_at,
-                    force=False,
-                )
-                if not run:
-                    skipped += 1
-                    # Coalesce missed executions when an active run already exists.
-                    # Otherwise the task remains due and will be re-claimed every dispatch cycle.
-                    task.next_run_at = self._compute_next_run_at(
-                        cron_expr=task.cron,
-                        timezone_name=task.timezone,
-                        now_utc=now_utc,
+                prompt = self._normalize_prompt(task.prompt)
+                if task.reuse_session:
+                    db_session = self._resolve_pinned_session(task, pinned_sessions)
+                    if db_session.id in busy_session_ids:
+                        skipped += 1
+                        # Coalesce missed executions when an active run already exists.
+                        # Otherwise the task remains due and will be re-claimed every dispatch cycle.
+                        advance(task)
+                        continue
+                    busy_session_ids.add(db_session.id)
+                else:
+                    # Create a fresh session/workspace for this run.
+                    db_session = SessionRepository.create(
+                        session_db=db,
+                        user_id=task.user_id,
+                        config=task.config_snapshot or {},
+                        project_id=None,
+                        kind="scheduled",
                     )
-                    continue
-
-                task.last_run_id = run.id
-                task.last_run_status = run.status
-                task.last_error = None
-                task.next_run_at = self._compute_next_run_at(
-                    cron_expr=task.cron,
-                    timezone_name=task.timezone,
-                    now_utc=now_utc,
-                )
-                dispatched.append(run.id)
-            except Exception as e:
+                pending.append((task, db_session, prompt))
+            except AppException as e:
                 errors += 1
-                task.last_error = str(e)
-                logger.exception(
+                task.last_error = e.message
+                logger.warning(
                     "scheduled_task_dispatch_failed",
-                    extra={"scheduled_task_id": str(task.id)},
+                    extra={"scheduled_task_id": str(task.id), "error": e.message},
                 )
                 # If a pinned session is missing, disable the task to avoid infinite failures.
-                if task.reuse_session and task.session_id is not None:
-                    db_session = SessionRepository.get_by_id(db, task.session_id)
-                    if not db_session:
-                        task.enabled = False
+                if (
+                    task.reuse_session
+                    and task.session_id is not None
+                    and task.session_id not in pinned_sessions
+                ):
+                    task.enabled = False
+
+        # One flush per table: new sessions, then messages, then runs.
+        db.flush()
+        messages = []
+        for _, db_session, prompt in pending:
+            self._reset_session_state(db_session)
+            messages.append(
+                MessageRepository.create(
+                    session_db=db,
+                    session_id=db_session.id,
+                    role="user",
+                    content=self._build_user_message_content(prompt),
+                    text_preview=prompt[:500],
+                )
+            )
+        db.flush()
+        runs = []
+        for (task, db_session, _), db_message in zip(pending, messages, strict=True):
+            db_run = RunRepository.create(
+                session_db=db,
+                session_id=db_session.id,
+                user_message_id=db_message.id,
+                permission_mode="default",
+                schedule_mode="scheduled",
+                scheduled_at=_as_utc(task.next_run_at),
+                config_snapshot=self._build_run_snapshot(task) or None,
+            )
+            db_run.scheduled_task_id = task.id
+            runs.append(db_run)
+        db.flush()
+
+        for (task, _, _), db_run in zip(pending, runs, strict=True):
+            task.last_run_id = db_run.id
+            task.last_run_status = db_run.status
+            task.last_error = None
+            advance(task)
 
         db.commit()
+        if runs:
+            run_queue_notifier.notify()
 
-        return ScheduledTaskDispatchResponse(
-            dispatched=len(dispatched),
-            run_ids=dispatched,
+        result = ScheduledTaskDispatchResponse(
+            dispatched=len(runs),
+            run_ids=[run.id for run in runs],
             skipped=skipped,
             errors=errors,
+            claimed=len(tasks),
+            lag_ms_max=max(lags_ms),
+            lag_ms_avg=sum(lags_ms) // len(lags_ms),
         )
+        logger.info(
+            "scheduled_tasks_dispatched",
+            extra={
+                **result.model_dump(exclude={"run_ids"}),
+                "duration_ms": int((time.perf_counter() - started) * 1000),
+            },
+        )
+        return result
+
+    @staticmethod
+    def _resolve_pinned_session(
+        task: AgentScheduledTask, sessions: dict[uuid.UUID, AgentSession]
+    ) -> AgentSession:
+        if not task.session_id:
+            raise AppException(
+                error_code=ErrorCode.BAD_REQUEST,
+                message="reuse_session=true but session_id is missing",
+            )
+        db_session = sessions.get(task.session_id)
+        if not db_session:
+            raise AppException(
+                error_code=ErrorCode.NOT_FOUND,
+                message=f"Session not found: {task.session_id}",
+            )
+        return db_session
 
     def _enqueue_run_for_task(
         self,
@@ -385,9 +524,7 @@ class ScheduledTaskService:
             AgentRun instance when enqueued, or None when skipped.
         """
         prompt = self._normalize_prompt(task.prompt)
-        if scheduled_at.tzinfo is None:
-            scheduled_at = scheduled_at.replace(tzinfo=timezone.utc)
-        scheduled_at = scheduled_at.astimezone(timezone.utc)
+        scheduled_at = _as_utc(scheduled_at)
 
         session_id: uuid.UUID
         if task.reuse_session:
@@ -427,9 +564,7 @@ class ScheduledTaskService:
             if existing_run:
                 return None
 
-        # Clear previous execution state so the UI doesn't show stale file changes.
-        db_session.state_patch = {}
-        db_session.status = "pending"
+        self._reset_session_state(db_session)
 
         user_message_content = self._build_user_message_content(prompt)
         db_message = MessageRepository.create(
@@ -441,9 +576,7 @@ class ScheduledTaskService:
         )
         db.flush()
 
-        run_snapshot = dict(task.config_snapshot or {})
-        if task.input_files:
-            run_snapshot["input_files"] = list(task.input_files)
+        run_snapshot = self._build_run_snapshot(task)
 
         db_run = RunRepository.create(
             session_db=db,
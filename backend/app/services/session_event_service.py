@@ -0,0 +1,217 @@
+import asyncio
+import logging
+import uuid
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.core.database import AsyncSessionLocal
+from app.core.errors.error_codes import ErrorCode
+from app.core.errors.exceptions import AppException
+from app.core.settings import get_settings
+from app.repositories.message_repository import MessageRepository
+from app.repositories.session_repository import SessionRepository
+from app.repositories.tool_execution_repository import ToolExecutionRepository
+from app.schemas.message import MessageResponse
+from app.schemas.session import SessionStateResponse
+from app.schemas.tool_execution import ToolExecutionResponse
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SessionEventCursor:
+    """Resume position of a session event stream.
+
+    Encoded as ``<last message id>.<session updated_at in µs>`` and sent as the
+    SSE event id, so browsers resume via the ``Last-Event-ID`` header.
+    """
+
+    message_id: int = 0
+    state_version: int = 0
+
+    def encode(self) -> str:
+        return f"{self.message_id}.{self.state_version}"
+
+    @classmethod
+    def decode(cls, raw: str | None) -> "SessionEventCursor":
+        value = (raw or "").strip()
+        if not value:
+            return cls()
+        try:
+            message_id, _, state_version = value.partition(".")
+            return cls(
+                message_id=max(0, int(message_id)),
+                state_version=int(state_version or 0),
+            )
+        except ValueError as exc:
+            raise AppException(
+                error_code=ErrorCode.BAD_REQUEST,
+                message=f"Invalid session event cursor: {value}",
+            ) from exc
+
+
+class SessionEventBroker:
+    """In-process fan-out of "session changed" signals to event streams.
+
+    Only a wake-up is published; streams re-read new rows from the database,
+    so a missed signal is recovered by the next keepalive poll.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: dict[uuid.UUID, set[asyncio.Event]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def subscribe(self, session_id: uuid.UUID) -> asyncio.Event:
+        self._loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+        self._subscribers.setdefault(session_id, set()).add(wakeup)
+        return wakeup
+
+    def unsubscribe(self, session_id: uuid.UUID, wakeup: asyncio.Event) -> None:
+        subscribers = self._subscribers.get(session_id)
+        if subscribers is None:
+            return
+        subscribers.discard(wakeup)
+        if not subscribers:
+            self._subscribers.pop(session_id, None)
+
+    def publish(self, session_id: uuid.UUID) -> None:
+        """Wake the streams of a session (safe to call from any thread)."""
+        loop = self._loop
+        if loop is None or loop.is_closed() or session_id not in self._subscribers:
+            return
+        loop.call_soon_threadsafe(self._wake, session_id)
+
+    def _wake(self, session_id: uuid.UUID) -> None:
+        for wakeup in self._subscribers.get(session_id, ()):
+            wakeup.set()
+
+
+session_event_broker = SessionEventBroker()
+
+
+def publish_session_events(session_ids: Iterable[str | uuid.UUID]) -> None:
+    """Notify event streams that the sessions have new committed data."""
+    for raw in set(session_ids):
+        try:
+            session_id = raw if isinstance(raw, uuid.UUID) else uuid.UUID(str(raw))
+        except ValueError:
+            continue
+        session_event_broker.publish(session_id)
+
+
+def _format_event(event: str, cursor: SessionEventCursor, data: BaseModel) -> str:
+    return f"id: {cursor.encode()}\nevent: {event}\ndata: {data.model_dump_json()}\n\n"
+
+
+def _state_version(updated_at: datetime) -> int:
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    return int(updated_at.timestamp() * 1_000_000)
+
+
+class SessionEventService:
+    """Builds the server-sent event stream of a session."""
+
+    def collect_events(
+        self,
+        db: Session,
+        session_id: uuid.UUID,
+        cursor: SessionEventCursor,
+        *,
+        batch_size: int,
+    ) -> tuple[list[str], SessionEventCursor, bool]:
+        """Read everything persisted after the cursor.
+
+        Tool executions are emitted with the message that created or completed
+        them, so the message id alone tracks their progress.
+
+        Returns:
+            The SSE frames, the advanced cursor and whether the session still exists.
+        """
+        frames: list[str] = []
+        db_session = SessionRepository.get_by_id(db, session_id)
+        if db_session is None:
+            return frames, cursor, False
+
+        while True:
+            messages = MessageRepository.list_after_id(
+                db, session_id, cursor.message_id, limit=batch_size
+            )
+            if not messages:
+                break
+            executions_by_message: dict[int, list[ToolExecutionResponse]] = {}
+            executions = ToolExecutionRepository.list_touched_by_messages(
+                db, session_id, [m.id for m in messages]
+            )
+            for execution in executions:
+                # A completed execution is reported with its result message.
+                message_id = execution.result_message_id or execution.message_id
+                executions_by_message.setdefault(message_id, []).append(
+                    ToolExecutionResponse.model_validate(execution)
+                )
+            for message in messages:
+                cursor = SessionEventCursor(message.id, cursor.state_version)
+                frames.append(
+                    _format_event(
+                        "message", cursor, MessageResponse.model_validate(message)
+                    )
+                )
+                for execution in executions_by_message.get(message.id, []):
+                    frames.append(_format_event("tool_execution", cursor, execution))
+            if len(messages) < batch_size:
+                break
+
+        state_version = _state_version(db_session.updated_at)
+        if state_version != cursor.state_version:
+            cursor = SessionEventCursor(cursor.message_id, state_version)
+            frames.append(
+                _format_event(
+                    "state", cursor, SessionStateResponse.model_validate(db_session)
+                )
+            )
+        return frames, cursor, True
+
+    async def stream(
+        self,
+        session_id: uuid.UUID,
+        cursor: SessionEventCursor,
+    ) -> AsyncIterator[str]:
+        """Yield SSE frames for a session.
+
+        The response is cancelled by Starlette when the client disconnects.
+        """
+        settings = get_settings()
+        wakeup = session_event_broker.subscribe(session_id)
+        try:
+            while True:
+                # Clear first so data committed while reading triggers another pass.
+                wakeup.clear()
+                async with AsyncSessionLocal() as db:
+                    frames, cursor, exists = await db.run_sync(
+                        self.collect_events,
+                        session_id,
+                        cursor,
+                        batch_size=max(1, settings.session_events_batch_size),
+                    )
+                for frame in frames:
+                    yield frame
+                if not exists:
+                    yield "event: end\ndata: {}\n\n"
+                    return
+                try:
+                    await asyncio.wait_for(
+                        wakeup.wait(),
+                        timeout=settings.session_events_keepalive_seconds,
+                    )
+                except TimeoutError:
+                    yield ": keepalive\n\n"
+        finally:
+            session_event_broker.unsubscribe(session_id, wakeup)
+            logger.debug(
+                "session_event_stream_closed", extra={"session_id": str(session_id)}
+            )
@@ -14,6 +14,7 @@ from app.repositories.session_repository import SessionRepository
 from app.repositories.tool_execution_repository import ToolExecutionRepository
 from app.repositories.user_input_request_repository import UserInputRequestRepository
 from app.schemas.session import SessionCreateRequest, SessionUpdateRequest
+from app.services.callback_target_cache import callback_target_cache
 
 logger = logging.getLogger(__name__)
 
@@ -64,10 +65,35 @@ class SessionService:
         return db_session
 
     def update_session(
-        self, db: Session, session_id: uuid.UUID, request: SessionUpdateRequest
+        self,
+        db: Session,
+        session_id: uuid.UUID,
+        request: SessionUpdateRequest,
+        *,
+        commit: bool = True,
     ) -> AgentSession:
-        """Updates session fields."""
+        """Updates session fields.
+
+        With ``commit=False`` the changes are only flushed, so callers can group
+        them with other writes in one transaction.
+        """
         db_session = self.get_session(db, session_id)
+        self.apply_update(db, db_session, request)
+
+        if not commit:
+            db.flush()
+            return db_session
+
+        db.commit()
+        db.refresh(db_session)
+
+        logger.info(f"Updated session {session_id}")
+        return db_session
+
+    def apply_update(
+        self, db: Session, db_session: AgentSession, request: SessionUpdateRequest
+    ) -> None:
+        """Applies update fields to a loaded session without flushing."""
         if "project_id" in request.model_fields_set:
             project_id = request.project_id
             if project_id is None:
@@ -106,6 +132,8 @@ class SessionService:
             db_session.workspace_archive_url = request.workspace_archive_url
         if request.state_patch is not None:
             db_session.state_patch = request.state_patch
+        if "state_seq" in request.model_fields_set:
+            db_session.state_seq = request.state_seq
         if request.workspace_files_prefix is not None:
             db_session.workspace_files_prefix = request.workspace_files_prefix
         if request.workspace_manifest_key is not None:
@@ -115,12 +143,6 @@ class SessionService:
         if request.workspace_export_status is not None:
             db_session.workspace_export_status = request.workspace_export_status
 
-        db.commit()
-        db.refresh(db_session)
-
-        logger.info(f"Updated session {session_id}")
-        return db_session
-
     def delete_session(self, db: Session, session_id: uuid.UUID) -> AgentSession:
         """Soft deletes a session."""
         db_session = self.get_session(db, session_id)
@@ -251,5 +273,6 @@ class SessionService:
 
         db.commit()
         db.refresh(db_session)
+        callback_target_cache.invalidate_sessions([db_session.id])
 
         return db_session, canceled_runs, expired_requests
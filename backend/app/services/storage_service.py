@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 from pathlib import Path
@@ -91,6 +92,41 @@ class S3StorageService:
                 details={"key": key, "error": str(exc)},
             ) from exc
 
+    def get_json(self, key: str) -> Any:
+        """Fetch and decode a JSON object."""
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=key)
+            return json.loads(response["Body"].read().decode("utf-8"))
+        except (ClientError, BotoCoreError, json.JSONDecodeError) as exc:
+            logger.error(f"Failed to fetch object {key}: {exc}")
+            raise AppException(
+                error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+                message="Failed to fetch stored payload",
+                details={"key": key, "error": str(exc)},
+            ) from exc
+
+    def put_json(self, key: str, payload: Any) -> None:
+        """Store a value as a JSON object."""
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+        try:
+            self.client.put_object(
+                Bucket=self.bucket,
+                Key=key,
+                Body=body,
+                ContentType="application/json",
+            )
+        except (ClientError, BotoCoreError) as exc:
+            logger.error(f"Failed to upload object {key}: {exc}")
+            raise AppException(
+                error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+                message="Failed to store payload",
+                details={"key": key, "error": str(exc)},
+            ) from exc
+
+    async def get_manifest_async(self, key: str) -> dict[str, Any]:
+        """Fetch a manifest without blocking the event loop."""
+        return await asyncio.to_thread(self.get_manifest, key)
+
     def presign_get(
         self,
         key: str,
@@ -142,6 +178,30 @@ class S3StorageService:
                 details={"key": key, "error": str(exc)},
             ) from exc
 
+    async def exists_async(self, key: str) -> bool:
+        """Check object existence without blocking the event loop."""
+        return await asyncio.to_thread(self.exists, key)
+
+    def list_keys(self, prefix: str, *, limit: int = 1000) -> list[str]:
+        """Return up to ``limit`` object keys under a prefix (one list request)."""
+        try:
+            response = self.client.list_objects_v2(
+                Bucket=self.bucket, Prefix=prefix, MaxKeys=limit
+            )
+        except (ClientError, BotoCoreError) as exc:
+            logger.error(f"Failed to list objects for {prefix}: {exc}")
+            raise AppException(
+                error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+                message="Failed to list objects",
+                details={"prefix": prefix, "error": str(exc)},
+            ) from exc
+        return [
+            item["Key"] for item in response.get("Contents") or [] if item.get("Key")
+        ]
+
+    async def list_keys_async(self, prefix: str, *, limit: int = 1000) -> list[str]:
+        return await asyncio.to_thread(self.list_keys, prefix, limit=limit)
+
     def upload_fileobj(
         self,
         *,
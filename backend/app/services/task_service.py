@@ -14,6 +14,7 @@ from app.repositories.user_mcp_install_repository import UserMcpInstallRepositor
 from app.repositories.user_skill_install_repository import UserSkillInstallRepository
 from app.schemas.session import TaskConfig
 from app.schemas.task import TaskEnqueueRequest, TaskEnqueueResponse
+from app.services.run_queue_notifier import run_queue_notifier
 
 
 class TaskService:
@@ -157,6 +158,7 @@ class TaskService:
             # Clear previous execution state so the UI doesn't show stale file changes
             # while a new run is queued/starting.
             db_session.state_patch = {}
+            db_session.state_seq = None
             if project_id is not None and db_session.project_id != project_id:
                 raise AppException(
                     error_code=ErrorCode.BAD_REQUEST,
@@ -248,6 +250,7 @@ class TaskService:
         db.commit()
         db.refresh(db_session)
         db.refresh(db_run)
+        run_queue_notifier.notify()
 
         return TaskEnqueueResponse(
             session_id=db_session.id,
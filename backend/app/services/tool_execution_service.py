@@ -1,5 +1,6 @@
 import logging
 import uuid
+from datetime import datetime
 
 from sqlalchemy.orm import Session
 
@@ -21,27 +22,49 @@ class ToolExecutionService:
         *,
         limit: int = 500,
         offset: int = 0,
+        after_message_id: int | None = None,
+        before_message_id: int | None = None,
     ) -> list[ToolExecution]:
-        """Gets all tool executions for a session.
+        """Gets tool executions for a session.
 
         Args:
             db: Database session
             session_id: Session ID
+            after_message_id: Only executions created or completed by a later message
+            before_message_id: Only executions created by an earlier message
 
         Returns:
-            List of tool executions ordered by creation time
+            List of tool executions ordered by message ID and creation time
         """
         executions = ToolExecutionRepository.list_by_session(
             db,
             session_id,
             limit=max(1, int(limit)),
             offset=max(0, int(offset)),
+            after_message_id=after_message_id,
+            before_message_id=before_message_id,
         )
         logger.debug(
             f"Retrieved {len(executions)} tool executions for session {session_id}"
         )
         return executions
 
+    def get_tool_executions_version(
+        self,
+        db: Session,
+        session_id: uuid.UUID,
+        *,
+        after_message_id: int | None = None,
+        before_message_id: int | None = None,
+    ) -> tuple[int, datetime | None]:
+        """Cheap change marker of a tool execution range (used for ETags)."""
+        return ToolExecutionRepository.get_version(
+            db,
+            session_id,
+            after_message_id=after_message_id,
+            before_message_id=before_message_id,
+        )
+
     def get_tool_execution(self, db: Session, execution_id: uuid.UUID) -> ToolExecution:
         """Gets a tool execution by ID.
 
@@ -62,3 +85,21 @@ class ToolExecutionService:
                 message=f"Tool execution not found: {execution_id}",
             )
         return execution
+
+    def get_tool_execution_by_tool_use_id(
+        self, db: Session, session_id: uuid.UUID, tool_use_id: str
+    ) -> ToolExecution:
+        """Gets the tool execution of a tool call in a session.
+
+        Raises:
+            AppException: If tool execution not found
+        """
+        execution = ToolExecutionRepository.get_by_session_and_tool_use_id(
+            db, session_id, tool_use_id
+        )
+        if not execution:
+            raise AppException(
+                error_code=ErrorCode.NOT_FOUND,
+                message=f"Tool execution not found: {tool_use_id}",
+            )
+        return execution
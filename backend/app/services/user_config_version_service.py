@@ -0,0 +1,66 @@
+import hashlib
+
+from sqlalchemy import extract, func, literal, or_, select, union_all
+from sqlalchemy.orm import Session
+
+from app.models.claude_md import UserClaudeMdSetting
+from app.models.env_var import UserEnvVar
+from app.models.mcp_server import McpServer
+from app.models.skill import Skill
+from app.models.slash_command import SlashCommand
+from app.models.sub_agent import SubAgent
+from app.models.user_mcp_install import UserMcpInstall
+from app.models.user_skill_install import UserSkillInstall
+from app.schemas.user_config import UserConfigVersionResponse
+from app.services.env_var_service import SYSTEM_USER_ID
+
+
+class UserConfigVersionService:
+    """Fingerprints everything that feeds a user's execution config.
+
+    Covers env vars (including system ones), MCP servers and installs, skills
+    and installs, slash commands, subagents and CLAUDE.md. Any insert, update
+    or delete changes the row count or the ``updated_at`` aggregates, so the
+    executor manager can reuse its cached lookups while the version holds.
+    """
+
+    def get_version(self, db: Session, user_id: str) -> UserConfigVersionResponse:
+        sources = [
+            ("env_vars", UserEnvVar, UserEnvVar.user_id.in_([user_id, SYSTEM_USER_ID])),
+            (
+                "mcp_servers",
+                McpServer,
+                or_(McpServer.owner_user_id == user_id, McpServer.scope == "system"),
+            ),
+            ("mcp_installs", UserMcpInstall, UserMcpInstall.user_id == user_id),
+            (
+                "skills",
+                Skill,
+                or_(Skill.owner_user_id == user_id, Skill.scope == "system"),
+            ),
+            ("skill_installs", UserSkillInstall, UserSkillInstall.user_id == user_id),
+            ("slash_commands", SlashCommand, SlashCommand.user_id == user_id),
+            ("subagents", SubAgent, SubAgent.user_id == user_id),
+            ("claude_md", UserClaudeMdSetting, UserClaudeMdSetting.user_id == user_id),
+        ]
+        stmt = union_all(
+            *(
+                select(
+                    literal(name).label("source"),
+                    func.count().label("rows"),
+                    func.max(model.updated_at).label("max_updated_at"),
+                    # Catches updates committed with an older timestamp than the max.
+                    func.sum(extract("epoch", model.updated_at)).label(
+                        "sum_updated_at"
+                    ),
+                ).where(condition)
+                for name, model, condition in sources
+            )
+        )
+        rows = sorted(db.execute(stmt).all(), key=lambda row: row.source)
+        raw = "|".join(
+            f"{row.source}:{row.rows}:{row.max_updated_at}:{row.sum_updated_at}"
+            for row in rows
+        )
+        digest = hashlib.sha1(raw.encode("utf-8"), usedforsecurity=False).hexdigest()
+        return UserConfigVersionResponse(version=digest)
@@ -0,0 +1,42 @@
+import asyncio
+
+
+class UserInputNotifier:
+    """Wakes long-polling waiters when a user input request changes state.
+
+    Notifications are hints only: waiters re-read the request, and the wait is
+    bounded and re-checked periodically, so an answer committed by another
+    process is still picked up.
+    """
+
+    def __init__(self) -> None:
+        self._waiters: dict[str, set[asyncio.Event]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def subscribe(self, request_id: str) -> asyncio.Event:
+        self._loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+        self._waiters.setdefault(request_id, set()).add(wakeup)
+        return wakeup
+
+    def unsubscribe(self, request_id: str, wakeup: asyncio.Event) -> None:
+        waiters = self._waiters.get(request_id)
+        if waiters is None:
+            return
+        waiters.discard(wakeup)
+        if not waiters:
+            self._waiters.pop(request_id, None)
+
+    def notify(self, request_id: str) -> None:
+        """Wake the waiters of a request (safe to call from any thread)."""
+        loop = self._loop
+        if loop is None or loop.is_closed() or request_id not in self._waiters:
+            return
+        loop.call_soon_threadsafe(self._wake, request_id)
+
+    def _wake(self, request_id: str) -> None:
+        for wakeup in self._waiters.get(request_id, ()):
+            wakeup.set()
+
+
+user_input_notifier = UserInputNotifier()
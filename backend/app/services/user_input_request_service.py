@@ -13,6 +13,7 @@ from app.schemas.user_input_request import (
     UserInputRequestCreateRequest,
     UserInputRequestResponse,
 )
+from app.services.user_input_notifier import user_input_notifier
 
 DEFAULT_EXPIRES_SECONDS = 60
 
@@ -113,4 +114,5 @@ class UserInputRequestService:
         entry.answered_at = now
         db.commit()
         db.refresh(entry)
+        user_input_notifier.notify(str(entry.id))
         return UserInputRequestResponse.model_validate(entry)
@@ -13,9 +13,36 @@ def sanitize_storage_token(value: str) -> str:
     return token or "unknown"
 
 
-def build_browser_screenshot_key(
+# Screenshot object extensions in lookup order, with their content types.
+BROWSER_SCREENSHOT_TYPES = {
+    "jpg": "image/jpeg",
+    "webp": "image/webp",
+    "png": "image/png",
+}
+BROWSER_THUMBNAIL_EXTENSION = "thumb.jpg"
+
+
+def build_browser_screenshot_prefix(
     *, user_id: str, session_id: str, tool_use_id: str
 ) -> str:
+    """Key prefix shared by a tool call's screenshot and thumbnail objects."""
     safe_session_id = sanitize_storage_token(session_id)
     safe_tool_use_id = sanitize_storage_token(tool_use_id)
-    return f"replays/{user_id}/{safe_session_id}/browser/{safe_tool_use_id}.png"
+    return f"replays/{user_id}/{safe_session_id}/browser/{safe_tool_use_id}."
+
+
+def pick_browser_screenshot_keys(
+    prefix: str, keys: list[str]
+) -> tuple[str | None, str | None, str | None]:
+    """Pick the screenshot among the objects listed under ``prefix``.
+
+    Returns:
+        (image key, image content type, thumbnail key)
+    """
+    extensions = {key[len(prefix) :]: key for key in keys if key.startswith(prefix)}
+    thumbnail_key = extensions.get(BROWSER_THUMBNAIL_EXTENSION)
+    for extension, content_type in BROWSER_SCREENSHOT_TYPES.items():
+        key = extensions.get(extension)
+        if key:
+            return key, content_type, thumbnail_key
+    return None, None, thumbnail_key
@@ -0,0 +1,29 @@
+import hashlib
+from typing import Any
+
+from fastapi.responses import Response as FastAPIResponse
+
+
+def compute_etag(*parts: Any) -> str:
+    """Build a weak ETag from values that change whenever the response does."""
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    digest = hashlib.sha1(raw.encode("utf-8"), usedforsecurity=False).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return whether an If-None-Match header matches the ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    value = if_none_match.strip()
+    if value == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque for candidate in value.split(",")
+    )
+
+
+def not_modified(etag: str) -> FastAPIResponse:
+    """Empty 304 response for a matching conditional request."""
+    return FastAPIResponse(status_code=304, headers={"ETag": etag})
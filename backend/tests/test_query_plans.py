@@ -0,0 +1,214 @@
+"""Query-plan regression tests for the hot-path indexes (revision c06fbe64c0cf).
+
+The tests seed a realistic dataset into a throwaway schema, capture the SQL the
+application emits for each hot query and assert that ``EXPLAIN`` picks the
+intended index. They need a disposable PostgreSQL database and are skipped
+otherwise:
+
+    TEST_DATABASE_URL=postgresql://postgres@localhost:5432/poco_test \\
+        uv run --with pytest pytest tests
+"""
+
+import os
+import uuid
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine, event, insert, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.models import AgentMessage, AgentRun, AgentSession, Base, ToolExecution
+from app.repositories.message_repository import MessageRepository
+from app.repositories.run_repository import RunRepository
+from app.repositories.tool_execution_repository import ToolExecutionRepository
+from app.services.callback_service import CallbackService
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "")
+
+SESSIONS = 400
+MESSAGES_PER_SESSION = 40
+RUNS_PER_SESSION = 15
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL.startswith(("postgresql", "postgres")),
+    reason="TEST_DATABASE_URL does not point at PostgreSQL",
+)
+
+
+def _seed(db: Session) -> uuid.UUID:
+    """Seed sessions with message history, tool calls and mostly finished runs.
+
+    Returns the session that has an unfinished run.
+    """
+    now = datetime.now(timezone.utc)
+    session_ids = [uuid.uuid4() for _ in range(SESSIONS)]
+    db.execute(
+        insert(AgentSession),
+        [{"id": sid, "user_id": f"user-{i % 50}"} for i, sid in enumerate(session_ids)],
+    )
+
+    messages: list[dict[str, Any]] = []
+    tools: list[dict[str, Any]] = []
+    runs: list[dict[str, Any]] = []
+    message_id = 0
+    for sid in session_ids:
+        for j in range(MESSAGES_PER_SESSION):
+            message_id += 1
+            created_at = now - timedelta(minutes=MESSAGES_PER_SESSION - j)
+            messages.append(
+                {
+                    "id": message_id,
+                    "session_id": sid,
+                    "role": "assistant" if j % 2 else "user",
+                    "content": {"text": f"message {j}"},
+                }
+            )
+            if j % 2:
+                tools.append(
+                    {
+                        "id": uuid.uuid4(),
+                        "session_id": sid,
+                        "message_id": message_id,
+                        "result_message_id": message_id + 1,
+                        "tool_use_id": f"toolu_{message_id}",
+                        "tool_name": "Bash",
+                        "tool_input": {"command": "ls"},
+                        "created_at": created_at,
+                    }
+                )
+            if j % 2 == 0 and j // 2 < RUNS_PER_SESSION:
+                runs.append(
+                    {
+                        "id": uuid.uuid4(),
+                        "session_id": sid,
+                        "user_message_id": message_id,
+                        "status": "completed",
+                        "scheduled_at": created_at,
+                        "created_at": created_at,
+                    }
+                )
+        # A claim backlog: the latest run of every session is still queued (with
+        # only a handful of queued rows any plan is cheap).
+        runs[-1]["status"] = "queued"
+
+    db.execute(insert(AgentMessage), messages)
+    # Results point at the next message; the last one has none.
+    tools[-1]["result_message_id"] = None
+    db.execute(insert(ToolExecution), tools)
+
+    active_session = session_ids[-1]
+    runs[-1]["status"] = "running"
+    db.execute(insert(AgentRun), runs)
+    db.commit()
+    return active_session
+
+
+@pytest.fixture(scope="module")
+def seeded() -> Iterator[tuple[Engine, uuid.UUID]]:
+    """Seeded engine and the ID of the session with an unfinished run."""
+    schema = f"plan_test_{uuid.uuid4().hex[:12]}"
+    admin = create_engine(TEST_DATABASE_URL)
+    try:
+        with admin.begin() as conn:
+            conn.execute(text(f'CREATE SCHEMA "{schema}"'))
+    except OperationalError as exc:
+        admin.dispose()
+        pytest.skip(f"PostgreSQL is not reachable: {exc}")
+
+    engine = create_engine(
+        TEST_DATABASE_URL, connect_args={"options": f"-csearch_path={schema}"}
+    )
+    try:
+        Base.metadata.create_all(engine)
+        with Session(engine) as db:
+            active_session = _seed(db)
+        with engine.connect() as conn:
+            conn.execution_options(isolation_level="AUTOCOMMIT").execute(
+                text("ANALYZE")
+            )
+        yield engine, active_session
+    finally:
+        engine.dispose()
+        with admin.begin() as conn:
+            conn.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+        admin.dispose()
+
+
+def _index_names(plan: Any) -> set[str]:
+    names: set[str] = set()
+    if isinstance(plan, dict):
+        if "Index Name" in plan:
+            names.add(plan["Index Name"])
+        for value in plan.values():
+            names |= _index_names(value)
+    elif isinstance(plan, list):
+        for item in plan:
+            names |= _index_names(item)
+    return names
+
+
+def _explain(engine: Engine, query: Callable[[Session], Any]) -> set[str]:
+    """Run ``query`` and return the indexes used by the first SELECT it emits."""
+    captured: list[tuple[str, Any]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        if not captured and statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with Session(engine) as db:
+            query(db)
+            assert captured, "query did not emit a SELECT"
+            statement, parameters = captured[0]
+            plan = (
+                db.connection()
+                .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+                .scalar_one()
+            )
+            db.rollback()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    return _index_names(plan)
+
+
+def test_claim_uses_partial_queue_index(seeded: tuple[Engine, uuid.UUID]) -> None:
+    engine, _ = seeded
+    indexes = _explain(
+        engine, lambda db: RunRepository.claim_batch(db, "plan-test", limit=10)
+    )
+    assert "ix_agent_runs_queued_scheduled_at" in indexes
+
+
+def test_callback_run_lookup_uses_partial_active_index(
+    seeded: tuple[Engine, uuid.UUID],
+) -> None:
+    engine, session_id = seeded
+    indexes = _explain(
+        engine, lambda db: CallbackService._get_active_run(db, session_id)
+    )
+    assert "ix_agent_runs_session_active" in indexes
+
+
+def test_message_list_uses_session_id_index(seeded: tuple[Engine, uuid.UUID]) -> None:
+    engine, session_id = seeded
+    indexes = _explain(
+        engine,
+        lambda db: MessageRepository.list_by_session(db, session_id, limit=100),
+    )
+    assert "ix_agent_messages_session_id_id" in indexes
+
+
+def test_tool_execution_list_uses_session_index(
+    seeded: tuple[Engine, uuid.UUID],
+) -> None:
+    engine, session_id = seeded
+    indexes = _explain(
+        engine,
+        lambda db: ToolExecutionRepository.list_by_session(db, session_id, limit=100),
+    )
+    assert "ix_tool_executions_session_id_message_id" in indexes
@@ -37,7 +37,7 @@ async def run_task(req: TaskRun, background_tasks: BackgroundTasks) -> dict:
     user_input_client = UserInputClient(base_url=base_url)
     computer_client = ComputerClient(base_url=base_url)
     hooks: list[AgentHook] = [
-        WorkspaceHook(),
+        WorkspaceHook(run_id=req.run_id),
         TodoHook(),
         CallbackHook(client=callback_client),
     ]
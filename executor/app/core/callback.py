@@ -1,6 +1,9 @@
+from typing import Any
+
 import httpx
 
-from app.schemas.callback import AgentCallbackRequest
+from app.core.http_client import get_http_client
+from app.schemas.callback import AgentCallbackBatchRequest, AgentCallbackRequest
 from app.core.observability.request_context import (
     generate_request_id,
     generate_trace_id,
@@ -16,15 +19,43 @@ class CallbackClient:
 
     async def send(self, report: AgentCallbackRequest) -> bool:
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    self.callback_url,
-                    json=report.model_dump(mode="json"),
-                    headers={
-                        "X-Request-ID": get_request_id() or generate_request_id(),
-                        "X-Trace-ID": get_trace_id() or generate_trace_id(),
-                    },
-                )
-                return response.is_success
+            client = get_http_client()
+            response = await client.post(
+                self.callback_url,
+                timeout=self.timeout,
+                json=report.model_dump(mode="json"),
+                headers={
+                    "X-Request-ID": get_request_id() or generate_request_id(),
+                    "X-Trace-ID": get_trace_id() or generate_trace_id(),
+                },
+            )
+            return response.is_success
         except httpx.RequestError:
             return False
+
+    async def send_batch(
+        self, reports: list[AgentCallbackRequest]
+    ) -> list[dict[str, Any]] | None:
+        """Send several callbacks (in order) in a single request.
+
+        Returns:
+            The per-callback results, or None if the batch was not accepted.
+        """
+        batch = AgentCallbackBatchRequest(callbacks=reports)
+        try:
+            client = get_http_client()
+            response = await client.post(
+                f"{self.callback_url.rstrip('/')}/batch",
+                timeout=self.timeout,
+                json=batch.model_dump(mode="json"),
+                headers={
+                    "X-Request-ID": get_request_id() or generate_request_id(),
+                    "X-Trace-ID": get_trace_id() or generate_trace_id(),
+                },
+            )
+            if not response.is_success:
+                return None
+            data = response.json().get("data")
+        except (httpx.RequestError, ValueError):
+            return None
+        return [item for item in data or [] if isinstance(item, dict)]
@@ -0,0 +1,313 @@
+import asyncio
+import base64
+import json
+import logging
+from contextlib import suppress
+from typing import Any
+
+import websockets
+
+from app.core.http_client import get_http_client
+
+logger = logging.getLogger(__name__)
+
+_BLANK_URLS = {"", "about:blank", "chrome://newtab/"}
+
+
+class CdpError(Exception):
+    """A CDP command failed or the browser connection is gone."""
+
+
+class CdpSession:
+    """Long-lived Chrome DevTools connection that follows the active page.
+
+    One browser-level websocket is kept open for the whole run. Page targets are
+    tracked from ``Target.*`` events (the most recently created or navigated
+    page is the active one) and attached to once, with flattened sessions, so a
+    screenshot is a single command instead of a target lookup, a new websocket
+    and ``Page.enable`` each time. The connection is re-established lazily after
+    a failure.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        viewport: tuple[int, int] | None = None,
+        command_timeout: float = 8.0,
+    ) -> None:
+        self.endpoint = endpoint.rstrip("/")
+        self.viewport = viewport
+        self.command_timeout = command_timeout
+        self._ws: Any = None
+        self._reader: asyncio.Task[None] | None = None
+        self._connect_lock = asyncio.Lock()
+        self._attach_lock = asyncio.Lock()
+        self._next_id = 0
+        self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        # targetId -> url, ordered by last activity (most recent last).
+        self._pages: dict[str, str] = {}
+        self._sessions: dict[str, str] = {}
+
+    @property
+    def connected(self) -> bool:
+        return self._reader is not None and not self._reader.done()
+
+    async def close(self) -> None:
+        reader, ws = self._reader, self._ws
+        self._reader = None
+        self._ws = None
+        if ws is not None:
+            with suppress(Exception):
+                await ws.close()
+        if reader is not None:
+            reader.cancel()
+            with suppress(asyncio.CancelledError, Exception):
+                await reader
+        self._reset()
+
+    def _reset(self) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(CdpError("CDP connection closed"))
+        self._pending.clear()
+        self._pages.clear()
+        self._sessions.clear()
+
+    async def _ensure_connected(self) -> None:
+        if self.connected:
+            return
+        async with self._connect_lock:
+            if self.connected:
+                return
+            await self.close()
+
+            client = get_http_client()
+            resp = await client.get(f"{self.endpoint}/json/version", timeout=5.0)
+            resp.raise_for_status()
+            ws_url = resp.json().get("webSocketDebuggerUrl")
+            if not isinstance(ws_url, str) or not ws_url.strip():
+                raise CdpError("Browser websocket URL not available")
+
+            self._ws = await websockets.connect(
+                ws_url.strip(), max_size=50 * 1024 * 1024
+            )
+            self._reader = asyncio.create_task(self._read_loop(self._ws))
+            try:
+                await self.send("Target.setDiscoverTargets", {"discover": True})
+                # Events only cover changes from now on; seed the pages that exist.
+                result = await self.send("Target.getTargets")
+            except BaseException:
+                await self.close()
+                raise
+            for info in result.get("targetInfos") or []:
+                self._track_target(info)
+
+    async def _read_loop(self, ws: Any) -> None:
+        try:
+            async for raw in ws:
+                try:
+                    message = json.loads(raw)
+                except ValueError:
+                    continue
+                if not isinstance(message, dict):
+                    continue
+                call_id = message.get("id")
+                if call_id is not None:
+                    future = self._pending.pop(call_id, None)
+                    if future is None or future.done():
+                        continue
+                    error = message.get("error")
+                    if error:
+                        future.set_exception(CdpError(str(error)))
+                    else:
+                        result = message.get("result")
+                        future.set_result(result if isinstance(result, dict) else {})
+                    continue
+                self._on_event(message.get("method"), message.get("params") or {})
+        except Exception as exc:
+            logger.debug("cdp_connection_lost", extra={"error": str(exc)})
+        finally:
+            if self._ws is ws:
+                self._reset()
+
+    def _on_event(self, method: Any, params: dict[str, Any]) -> None:
+        if method in {"Target.targetCreated", "Target.targetInfoChanged"}:
+            self._track_target(params.get("targetInfo") or {})
+        elif method == "Target.targetDestroyed":
+            target_id = params.get("targetId")
+            self._pages.pop(target_id, None)
+            self._sessions.pop(target_id, None)
+        elif method == "Target.detachedFromTarget":
+            target_id = params.get("targetId")
+            if target_id:
+                self._sessions.pop(target_id, None)
+            else:
+                session_id = params.get("sessionId")
+                for tid, sid in list(self._sessions.items()):
+                    if sid == session_id:
+                        self._sessions.pop(tid, None)
+
+    def _track_target(self, info: dict[str, Any]) -> None:
+        target_id = info.get("targetId")
+        if info.get("type") != "page" or not isinstance(target_id, str):
+            return
+        # Re-inserting moves the page to the end: it is now the most recent one.
+        self._pages.pop(target_id, None)
+        self._pages[target_id] = str(info.get("url") or "").strip()
+
+    def active_target(self) -> str | None:
+        """Most recently active page; blank tabs only when nothing else is open."""
+        fallback = None
+        for target_id, url in reversed(self._pages.items()):
+            if url not in _BLANK_URLS:
+                return target_id
+            fallback = fallback or target_id
+        return fallback
+
+    async def send(
+        self,
+        method: str,
+        params: dict[str, Any] | None = None,
+        *,
+        session_id: str | None = None,
+    ) -> dict[str, Any]:
+        ws = self._ws
+        if ws is None:
+            raise CdpError("CDP connection is not open")
+        self._next_id += 1
+        call_id = self._next_id
+        payload: dict[str, Any] = {"id": call_id, "method": method}
+        if params is not None:
+            payload["params"] = params
+        if session_id is not None:
+            payload["sessionId"] = session_id
+        future: asyncio.Future[dict[str, Any]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._pending[call_id] = future
+        try:
+            await ws.send(json.dumps(payload))
+            return await asyncio.wait_for(future, timeout=self.command_timeout)
+        finally:
+            self._pending.pop(call_id, None)
+
+    async def page_session(self) -> tuple[str, str] | None:
+        """Return ``(target_id, session_id)`` of the active page, attaching once."""
+        await self._ensure_connected()
+        target_id = self.active_target()
+        if not target_id:
+            return None
+        session_id = self._sessions.get(target_id)
+        if session_id:
+            return target_id, session_id
+
+        async with self._attach_lock:
+            session_id = self._sessions.get(target_id)
+            if session_id:
+                return target_id, session_id
+            result = await self.send(
+                "Target.attachToTarget", {"targetId": target_id, "flatten": True}
+            )
+            session_id = result.get("sessionId")
+            if not isinstance(session_id, str) or not session_id:
+                return None
+            self._sessions[target_id] = session_id
+            await self._prepare_page(target_id, session_id)
+        return target_id, session_id
+
+    async def _prepare_page(self, target_id: str, session_id: str) -> None:
+        with suppress(CdpError, TimeoutError):
+            await self.send("Page.enable", session_id=session_id)
+        if not self.viewport:
+            return
+
+        # Best-effort: lock the viewport to a desktop size so responsive pages don't
+        # render as mobile when the underlying display/window is small. The override
+        # lasts as long as this session stays attached.
+        width, height = self.viewport
+        with suppress(CdpError, TimeoutError):
+            await self.send(
+                "Emulation.setDeviceMetricsOverride",
+                {
+                    "width": width,
+                    "height": height,
+                    "deviceScaleFactor": 1,
+                    "mobile": False,
+                },
+                session_id=session_id,
+            )
+        # If the browser is headful, also resize the window for noVNC.
+        with suppress(CdpError, TimeoutError):
+            win = await self.send("Browser.getWindowForTarget", {"targetId": target_id})
+            window_id = win.get("windowId")
+            if isinstance(window_id, int):
+                await self.send(
+                    "Browser.setWindowBounds",
+                    {
+                        "windowId": window_id,
+                        "bounds": {"width": width, "height": height},
+                    },
+                )
+
+    async def capture_screenshot(
+        self,
+        *,
+        image_format: str = "jpeg",
+        quality: int | None = None,
+        width: int | None = None,
+    ) -> bytes | None:
+        """Capture the active page's viewport.
+
+        Args:
+            image_format: ``jpeg``, ``webp`` or ``png`` (encoded by the browser).
+            quality: Compression quality for ``jpeg``/``webp`` (0-100).
+            width: Scale the capture down to this many pixels wide.
+        """
+        page = await self.page_session()
+        if not page:
+            return None
+        _, session_id = page
+
+        params: dict[str, Any] = {"format": image_format}
+        if quality is not None and image_format != "png":
+            params["quality"] = max(0, min(100, quality))
+        if width:
+            # Clip coordinates are document-relative: start at the scroll offset.
+            viewport = await self._visual_viewport(session_id)
+            if viewport and width < viewport[2]:
+                x, y, view_width, view_height = viewport
+                params["clip"] = {
+                    "x": x,
+                    "y": y,
+                    "width": view_width,
+                    "height": view_height,
+                    "scale": width / view_width,
+                }
+
+        result = await self.send(
+            "Page.captureScreenshot", params, session_id=session_id
+        )
+        data = result.get("data")
+        if not isinstance(data, str) or not data:
+            return None
+        return base64.b64decode(data, validate=True)
+
+    async def _visual_viewport(
+        self, session_id: str
+    ) -> tuple[float, float, float, float] | None:
+        """Scroll offset and size of the visible area, in CSS pixels."""
+        with suppress(CdpError, TimeoutError):
+            metrics = await self.send("Page.getLayoutMetrics", session_id=session_id)
+            viewport = metrics.get("cssVisualViewport") or {}
+            x, y = viewport.get("pageX"), viewport.get("pageY")
+            width, height = viewport.get("clientWidth"), viewport.get("clientHeight")
+            if (
+                isinstance(x, int | float)
+                and isinstance(y, int | float)
+                and isinstance(width, int | float)
+                and isinstance(height, int | float)
+                and width > 0
+            ):
+                return float(x), float(y), float(width), float(height)
+        return None
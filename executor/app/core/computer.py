@@ -2,6 +2,7 @@ import logging
 
 import httpx
 
+from app.core.http_client import get_http_client
 from app.core.observability.request_context import (
     generate_request_id,
     generate_trace_id,
@@ -11,6 +12,8 @@ from app.core.observability.request_context import (
 
 logger = logging.getLogger(__name__)
 
+SCREENSHOT_EXTENSIONS = {"image/png": "png", "image/jpeg": "jpg", "image/webp": "webp"}
+
 
 class ComputerClient:
     """Client for sending Poco Computer artifacts to Executor Manager."""
@@ -24,34 +27,70 @@ class ComputerClient:
         *,
         session_id: str,
         tool_use_id: str,
-        png_bytes: bytes,
+        image_bytes: bytes,
+        content_type: str = "image/png",
+        thumbnail_bytes: bytes | None = None,
     ) -> bool:
+        """Upload a screenshot and, optionally, its JPEG thumbnail."""
+        extension = SCREENSHOT_EXTENSIONS.get(content_type, "png")
+        files: dict[str, tuple[str, bytes, str]] = {
+            "file": (f"screenshot.{extension}", image_bytes, content_type),
+        }
+        if thumbnail_bytes:
+            files["thumbnail"] = ("thumbnail.jpg", thumbnail_bytes, "image/jpeg")
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/v1/computer/screenshots",
-                    data={
+            client = get_http_client()
+            response = await client.post(
+                f"{self.base_url}/api/v1/computer/screenshots",
+                timeout=self.timeout,
+                data={
+                    "session_id": session_id,
+                    "tool_use_id": tool_use_id,
+                },
+                files=files,
+                headers=self._headers(),
+            )
+            if not response.is_success:
+                logger.warning(
+                    "computer_screenshot_upload_failed",
+                    extra={
                         "session_id": session_id,
                         "tool_use_id": tool_use_id,
-                    },
-                    files={
-                        "file": ("screenshot.png", png_bytes, "image/png"),
-                    },
-                    headers={
-                        "X-Request-ID": get_request_id() or generate_request_id(),
-                        "X-Trace-ID": get_trace_id() or generate_trace_id(),
+                        "status_code": response.status_code,
+                        "response_text": response.text[:300],
                     },
                 )
-                if not response.is_success:
-                    logger.warning(
-                        "computer_screenshot_upload_failed",
-                        extra={
-                            "session_id": session_id,
-                            "tool_use_id": tool_use_id,
-                            "status_code": response.status_code,
-                            "response_text": response.text[:300],
-                        },
-                    )
-                return response.is_success
+            return response.is_success
         except httpx.RequestError:
             return False
+
+    async def copy_browser_screenshot(
+        self,
+        *,
+        session_id: str,
+        tool_use_id: str,
+        source_tool_use_id: str,
+    ) -> bool:
+        """Reuse the already uploaded screenshot of another tool call (no upload)."""
+        try:
+            client = get_http_client()
+            response = await client.post(
+                f"{self.base_url}/api/v1/computer/screenshots/copy",
+                timeout=self.timeout,
+                json={
+                    "session_id": session_id,
+                    "tool_use_id": tool_use_id,
+                    "source_tool_use_id": source_tool_use_id,
+                },
+                headers=self._headers(),
+            )
+            return response.is_success
+        except httpx.RequestError:
+            return False
+
+    @staticmethod
+    def _headers() -> dict[str, str]:
+        return {
+            "X-Request-ID": get_request_id() or generate_request_id(),
+            "X-Trace-ID": get_trace_id() or generate_trace_id(),
+        }
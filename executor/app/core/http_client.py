@@ -0,0 +1,130 @@
+import logging
+import os
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+_client: httpx.AsyncClient | None = None
+# Long-polls hold a connection for their whole wait, so they get their own pool and
+# cannot starve callbacks on the shared one.
+_long_poll_client: httpx.AsyncClient | None = None
+# Connection reuse counters reported on /health.
+_requests = 0
+_new_connections = 0
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    return raw.strip().lower() in {"1", "true", "yes", "y", "on"}
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw.strip())
+    except Exception:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw.strip())
+    except Exception:
+        return default
+
+
+async def _trace(event_name: str, info: dict[str, Any]) -> None:
+    global _new_connections
+    # httpcore emits connect events only when the pool opens a new connection.
+    if event_name == "connection.connect_tcp.complete":
+        _new_connections += 1
+
+
+async def _on_request(request: httpx.Request) -> None:
+    global _requests
+    _requests += 1
+    request.extensions["trace"] = _trace
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _build_client(max_connections: int | None, max_keepalive: int) -> httpx.AsyncClient:
+    http2 = _env_bool("HTTP_CLIENT_HTTP2", False)
+    if http2 and not _http2_available():
+        logger.warning("http_client_http2_unavailable_falling_back_to_http1")
+        http2 = False
+
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive,
+        keepalive_expiry=_env_float("HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS", 30.0),
+    )
+    # Transport-level retries only cover establishing a connection (connect
+    # errors/timeouts), never a sent request, so they are safe for POSTs. Failed or
+    # timed-out requests are not retried here.
+    transport = httpx.AsyncHTTPTransport(
+        http2=http2,
+        limits=limits,
+        retries=max(0, _env_int("HTTP_CLIENT_CONNECT_RETRIES", 2)),
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(_env_float("HTTP_CLIENT_TIMEOUT_SECONDS", 10.0)),
+        event_hooks={"request": [_on_request]},
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled HTTP client (created lazily)."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client(
+            _env_int("HTTP_CLIENT_MAX_CONNECTIONS", 20),
+            _env_int("HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS", 10),
+        )
+    return _client
+
+
+def get_long_poll_http_client() -> httpx.AsyncClient:
+    """Return the pooled HTTP client reserved for long-poll requests.
+
+    Each waiter holds a connection for its whole wait, so the pool has no
+    connection cap (a capped pool would fail extra waiters with PoolTimeout);
+    only the number of idle connections kept alive is bounded.
+    """
+    global _long_poll_client
+    if _long_poll_client is None or _long_poll_client.is_closed:
+        _long_poll_client = _build_client(
+            None,
+            max(0, _env_int("HTTP_CLIENT_LONG_POLL_MAX_KEEPALIVE_CONNECTIONS", 5)),
+        )
+    return _long_poll_client
+
+
+async def close_http_client() -> None:
+    global _client, _long_poll_client
+    clients = (_client, _long_poll_client)
+    _client = _long_poll_client = None
+    for client in clients:
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+
+def get_http_client_stats() -> dict[str, int]:
+    return {"requests": _requests, "new_connections": _new_connections}
@@ -1,9 +1,11 @@
 import asyncio
-from datetime import datetime, timezone
+import logging
+import time
 from typing import Any
 
 import httpx
 
+from app.core.http_client import get_http_client, get_long_poll_http_client
 from app.core.observability.request_context import (
     generate_request_id,
     generate_trace_id,
@@ -11,17 +13,24 @@ from app.core.observability.request_context import (
     get_trace_id,
 )
 
+logger = logging.getLogger(__name__)
+
+# Backoff between long-poll attempts after a transport error or a 5xx.
+WAIT_RETRY_MIN_DELAY_SECONDS = 0.5
+WAIT_RETRY_MAX_DELAY_SECONDS = 5.0
+
 
 class UserInputClient:
     def __init__(
         self,
         base_url: str,
         timeout: float = 10.0,
-        poll_interval: float = 0.5,
+        long_poll_seconds: float = 25.0,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self.poll_interval = poll_interval
+        # Per-request wait; the backend caps it (USER_INPUT_MAX_WAIT_SECONDS).
+        self.long_poll_seconds = long_poll_seconds
 
     @staticmethod
     def resolve_base_url(callback_url: str, callback_base_url: str | None) -> str:
@@ -32,42 +41,86 @@ class UserInputClient:
         return callback_url.rstrip("/")
 
     async def create_request(self, payload: dict[str, Any]) -> dict[str, Any]:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/user-input-requests",
-                json=payload,
-                headers={
-                    "X-Request-ID": get_request_id() or generate_request_id(),
-                    "X-Trace-ID": get_trace_id() or generate_trace_id(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {})
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/user-input-requests",
+            timeout=self.timeout,
+            json=payload,
+            headers={
+                "X-Request-ID": get_request_id() or generate_request_id(),
+                "X-Trace-ID": get_trace_id() or generate_trace_id(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {})
 
     async def get_request(self, request_id: str) -> dict[str, Any]:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/user-input-requests/{request_id}",
-                headers={
-                    "X-Request-ID": get_request_id() or generate_request_id(),
-                    "X-Trace-ID": get_trace_id() or generate_trace_id(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {})
+        client = get_http_client()
+        response = await client.get(
+            f"{self.base_url}/api/v1/user-input-requests/{request_id}",
+            timeout=self.timeout,
+            headers={
+                "X-Request-ID": get_request_id() or generate_request_id(),
+                "X-Trace-ID": get_trace_id() or generate_trace_id(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {})
+
+    async def wait_request(
+        self, request_id: str, wait_seconds: float
+    ) -> dict[str, Any]:
+        """Get a request, long-polling up to ``wait_seconds`` while it is pending."""
+        client = get_long_poll_http_client()
+        response = await client.get(
+            f"{self.base_url}/api/v1/user-input-requests/{request_id}/wait",
+            params={"wait_seconds": wait_seconds},
+            timeout=wait_seconds + self.timeout,
+            headers={
+                "X-Request-ID": get_request_id() or generate_request_id(),
+                "X-Trace-ID": get_trace_id() or generate_trace_id(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {})
 
     async def wait_for_answer(
         self, request_id: str, timeout_seconds: float = 60
     ) -> dict[str, Any] | None:
-        deadline = datetime.now(timezone.utc).timestamp() + timeout_seconds
-        while datetime.now(timezone.utc).timestamp() < deadline:
-            payload = await self.get_request(request_id)
+        """Wait for the user's answer; the backend wakes the request on answer.
+
+        Transport errors and 5xx responses are retried with backoff until the
+        deadline, so a busy or restarting manager doesn't fail the question.
+        """
+        deadline = time.monotonic() + timeout_seconds
+        retry_delay = WAIT_RETRY_MIN_DELAY_SECONDS
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                payload = await self.wait_request(
+                    request_id, wait_seconds=min(remaining, self.long_poll_seconds)
+                )
+            except (httpx.TransportError, httpx.HTTPStatusError) as exc:
+                if (
+                    isinstance(exc, httpx.HTTPStatusError)
+                    and exc.response.status_code < 500
+                ):
+                    raise
+                logger.warning(
+                    "user_input_wait_retry",
+                    extra={"request_id": request_id, "error": repr(exc)},
+                )
+                await asyncio.sleep(
+                    min(retry_delay, max(0.0, deadline - time.monotonic()))
+                )
+                retry_delay = min(retry_delay * 2, WAIT_RETRY_MAX_DELAY_SECONDS)
+                continue
+            retry_delay = WAIT_RETRY_MIN_DELAY_SECONDS
             status = payload.get("status")
             if status == "answered":
                 return payload
             if status == "expired":
                 return None
-            await asyncio.sleep(self.poll_interval)
         return None
@@ -7,6 +7,7 @@ from pathlib import Path
 from urllib.parse import urlparse
 
 from app.schemas.request import TaskConfig
+from app.utils.git.async_runner import GIT_NETWORK_TIMEOUT_SECONDS, run_git
 from app.utils.git.operations import (
     GitCommandError,
     GitError,
@@ -60,9 +61,13 @@ class WorkspaceManager:
             self.root_path.mkdir(parents=True, exist_ok=True)
 
         await self._setup_session_persistence()
-        self.work_path = self._prepare_repository(config)
+        # Clone/fetch/checkout run on the git thread pool so the event loop stays
+        # responsive (health checks, callbacks) while the repository is prepared.
+        self.work_path = await run_git(
+            self._prepare_repository, config, timeout=GIT_NETWORK_TIMEOUT_SECONDS
+        )
         self._ensure_inputs_dir(self.work_path)
-        self._ensure_git_excludes(self.work_path)
+        await run_git(self._ensure_git_excludes, self.work_path)
 
     async def _setup_session_persistence(self):
         self.persistent_claude_data.mkdir(exist_ok=True)
@@ -1,3 +1,5 @@
+import asyncio
+import logging
 from typing import Any, Optional
 
 from claude_agent_sdk.types import ResultMessage, SystemMessage
@@ -6,14 +8,66 @@ from app.core.callback import CallbackClient
 from app.hooks.base import AgentHook, ExecutionContext
 from app.schemas.callback import AgentCallbackRequest
 from app.schemas.enums import CallbackStatus, TodoStatus
+from app.schemas.state import (
+    AgentCurrentState,
+    AgentStateDelta,
+    FileChange,
+    WorkspaceStateDelta,
+)
 from app.utils.serializer import serialize_message
 
+logger = logging.getLogger(__name__)
+
+# Send a full state snapshot at least every N state updates so receivers that
+# missed a delta can recover.
+STATE_SNAPSHOT_INTERVAL = 20
+
+# Callbacks are queued and flushed in batches when either limit is reached.
+CALLBACK_BATCH_MAX_SIZE = 20
+CALLBACK_FLUSH_INTERVAL_SECONDS = 0.2
+# Bounded queue: when full, agent message handling waits for the flusher.
+CALLBACK_QUEUE_MAX_SIZE = 500
+CALLBACK_TEARDOWN_TIMEOUT_SECONDS = 30.0
+
+_TERMINAL_STATUSES = (CallbackStatus.COMPLETED, CallbackStatus.FAILED)
+
+_STATE_SECTIONS = ("todos", "mcp_status", "browser", "current_step")
+
+
+def _file_change_key(file_change: dict[str, Any]) -> str:
+    return f"{file_change.get('status')}:{file_change.get('path')}"
+
 
 class CallbackHook(AgentHook):
-    def __init__(self, client: CallbackClient):
+    """Report agent progress to the manager through a batching callback queue.
+
+    Messages are queued without waiting on the manager/backend; a background task
+    flushes them in order, attaching the current state (snapshot or delta) to the
+    last callback of each batch. Terminal callbacks are flushed immediately.
+    """
+
+    def __init__(
+        self,
+        client: CallbackClient,
+        *,
+        max_batch_size: int = CALLBACK_BATCH_MAX_SIZE,
+        flush_interval: float = CALLBACK_FLUSH_INTERVAL_SECONDS,
+        max_queue_size: int = CALLBACK_QUEUE_MAX_SIZE,
+    ):
         self.client = client
         self.execution_error: Optional[Exception] = None
         self.sdk_session_id: Optional[str] = None
+        # State as last acknowledged by the manager, keyed by sequence number.
+        self._state_seq = 0
+        self._sent_state: dict[str, Any] | None = None
+        self._deltas_since_snapshot = 0
+        self._max_batch_size = max(1, max_batch_size)
+        self._flush_interval = flush_interval
+        self._queue: asyncio.Queue[AgentCallbackRequest] = asyncio.Queue(
+            maxsize=max_queue_size
+        )
+        self._context: ExecutionContext | None = None
+        self._flusher: asyncio.Task[None] | None = None
 
     def _build_report(
         self,
@@ -29,10 +83,136 @@ class CallbackHook(AgentHook):
             progress=progress,
             error_message=error_message,
             new_message=serialize_message(new_message),
-            state_patch=context.current_state,
             sdk_session_id=self.sdk_session_id,
         )
 
+    def _attach_state(
+        self, report: AgentCallbackRequest, context: ExecutionContext, full_state: bool
+    ) -> dict[str, Any]:
+        """Attach the current state to a report as a snapshot or a delta."""
+        state = context.current_state
+        dumped = state.model_dump(mode="json")
+        if (
+            full_state
+            or self._sent_state is None
+            or self._deltas_since_snapshot >= STATE_SNAPSHOT_INTERVAL
+        ):
+            report.state_patch = state
+            report.state_seq = self._state_seq + 1
+        elif dumped != self._sent_state:
+            report.state_delta = self._build_state_delta(
+                state, dumped, self._sent_state
+            )
+            report.state_seq = self._state_seq + 1
+        return dumped
+
+    def _build_state_delta(
+        self,
+        state: AgentCurrentState,
+        dumped: dict[str, Any],
+        previous: dict[str, Any],
+    ) -> AgentStateDelta:
+        delta = AgentStateDelta(base_seq=self._state_seq)
+        for section in _STATE_SECTIONS:
+            if dumped.get(section) != previous.get(section):
+                delta.changed.append(section)
+                setattr(delta, section, getattr(state, section))
+
+        workspace = dumped.get("workspace_state")
+        previous_workspace = previous.get("workspace_state")
+        if workspace == previous_workspace:
+            return delta
+        if workspace is None or previous_workspace is None:
+            delta.changed.append("workspace_state")
+            delta.workspace_state = state.workspace_state
+            return delta
+
+        previous_files = {
+            _file_change_key(fc): fc for fc in previous_workspace["file_changes"]
+        }
+        file_keys: list[str] = []
+        upserted: list[FileChange] = []
+        for file_change, raw in zip(
+            state.workspace_state.file_changes, workspace["file_changes"]
+        ):
+            key = _file_change_key(raw)
+            file_keys.append(key)
+            if previous_files.get(key) != raw:
+                upserted.append(file_change)
+
+        delta.workspace_delta = WorkspaceStateDelta(
+            repository=state.workspace_state.repository,
+            branch=state.workspace_state.branch,
+            last_change=state.workspace_state.last_change,
+            file_keys=file_keys,
+            upserted_files=upserted,
+        )
+        return delta
+
+    async def _enqueue(
+        self, context: ExecutionContext, report: AgentCallbackRequest
+    ) -> None:
+        self._context = context
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_loop())
+        await self._queue.put(report)
+
+    async def _flush_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            terminal = batch[0].status in _TERMINAL_STATUSES
+            deadline = loop.time() + self._flush_interval
+            while not terminal and len(batch) < self._max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    report = await asyncio.wait_for(self._queue.get(), timeout)
+                except TimeoutError:
+                    break
+                batch.append(report)
+                terminal = report.status in _TERMINAL_STATUSES
+
+            try:
+                await self._send_batch(batch, full_state=terminal)
+            except Exception:
+                logger.exception(
+                    "callback_batch_send_failed",
+                    extra={"callback_count": len(batch)},
+                )
+            if terminal:
+                return
+
+    async def _send_batch(
+        self, batch: list[AgentCallbackRequest], *, full_state: bool
+    ) -> None:
+        # Intermediate states are coalesced: only the last callback carries state.
+        report = batch[-1]
+        dumped_state = self._attach_state(report, self._context, full_state)
+        results = await self.client.send_batch(batch)
+        ok = results is not None
+        if not ok:
+            logger.warning(
+                "callback_batch_rejected",
+                extra={
+                    "session_id": report.session_id,
+                    "callback_count": len(batch),
+                },
+            )
+        if report.state_seq is None:
+            return
+        if not ok or any(r.get("state_resync_required") for r in results):
+            # The receiver did not apply this update; resync with a snapshot.
+            self._sent_state = None
+            return
+        self._state_seq = report.state_seq
+        self._sent_state = dumped_state
+        if report.state_patch is not None:
+            self._deltas_since_snapshot = 0
+        else:
+            self._deltas_since_snapshot += 1
+
     def _calculate_progress(self, todos) -> int:
         if not todos:
             return 0
@@ -47,13 +227,14 @@ class CallbackHook(AgentHook):
         elif isinstance(message, ResultMessage):
             self.sdk_session_id = message.session_id
 
-        await self.client.send(
+        await self._enqueue(
+            context,
             self._build_report(
                 context=context,
                 status=CallbackStatus.RUNNING,
                 progress=self._calculate_progress(context.current_state.todos),
                 new_message=message,
-            )
+            ),
         )
 
     async def on_teardown(self, context: ExecutionContext):
@@ -71,14 +252,28 @@ class CallbackHook(AgentHook):
                 detail = detail[:2000] + "..."
             error_message = detail
 
-        await self.client.send(
+        # Terminal callbacks flush the queue immediately and carry the full state.
+        await self._enqueue(
+            context,
             self._build_report(
                 context=context,
                 status=status,
                 progress=progress,
                 error_message=error_message,
-            )
+            ),
         )
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(self._flusher), CALLBACK_TEARDOWN_TIMEOUT_SECONDS
+            )
+        except TimeoutError:
+            logger.warning(
+                "callback_flush_timeout",
+                extra={
+                    "session_id": context.session_id,
+                    "pending": self._queue.qsize(),
+                },
+            )
 
     async def on_error(self, context: ExecutionContext, error: Exception):
         self.execution_error = error
@@ -1,22 +1,32 @@
 import asyncio
 import base64
-import json
 import logging
 import os
+import zlib
 from typing import Any
 
-import httpx
-import websockets
-
+from app.core.cdp import CdpSession
 from app.core.computer import ComputerClient
 from app.hooks.base import AgentHook, ExecutionContext
 from app.utils.browser import parse_viewport_size
+from app.utils.image import decode_png_grayscale, dhash, hamming_distance
 from app.utils.serializer import serialize_message
 
 POCO_PLAYWRIGHT_MCP_PREFIX = "mcp____poco_playwright__"
+SCREENSHOT_FORMATS = {"jpeg", "webp", "png"}
+THUMBNAIL_QUALITY = 70
+# Width of the frame captured for perceptual hashing (decoded in pure Python).
+HASH_CAPTURE_WIDTH = 64
 logger = logging.getLogger(__name__)
 
 
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, "").strip() or default)
+    except ValueError:
+        return default
+
+
 class BrowserScreenshotHook(AgentHook):
     """Capture a screenshot after each browser tool call and upload it to the manager.
 
@@ -39,26 +49,39 @@ class BrowserScreenshotHook(AgentHook):
             viewport_size or os.environ.get("POCO_BROWSER_VIEWPORT_SIZE") or ""
         ).strip()
         self._viewport = parse_viewport_size(viewport_raw) or (1366, 768)
-        self._viewport_applied: set[str] = set()
+        self._cdp = CdpSession(self._cdp_endpoint, viewport=self._viewport)
+
+        image_format = (
+            os.environ.get("POCO_BROWSER_SCREENSHOT_FORMAT", "").strip().lower()
+        )
+        self._format = image_format if image_format in SCREENSHOT_FORMATS else "jpeg"
+        self._quality = _env_int("POCO_BROWSER_SCREENSHOT_QUALITY", 80)
+        self._thumbnail_width = _env_int("POCO_BROWSER_SCREENSHOT_THUMBNAIL_WIDTH", 320)
+        # Max perceptual-hash distance (of 256 bits) for a frame to count as
+        # unchanged; negative disables deduplication.
+        self._dedup_distance = _env_int("POCO_BROWSER_SCREENSHOT_DEDUP_DISTANCE", 4)
+        self._capture_lock = asyncio.Lock()
+        # (tool_use_id, frame hash) of the last captured upload.
+        self._last_upload: tuple[str, int] | None = None
         self._tool_name_by_use_id: dict[str, str] = {}
         self._scheduled: set[str] = set()
         self._tasks: set[asyncio.Task[None]] = set()
 
     async def on_teardown(self, context: ExecutionContext) -> None:
         # Best-effort flush pending screenshot tasks.
-        if not self._tasks:
-            return
-
         pending = list(self._tasks)
         self._tasks.clear()
         try:
-            done, still_pending = await asyncio.wait(pending, timeout=15.0)
-            # Avoid leaking tasks beyond teardown; cancellation is best-effort.
-            for task in still_pending:
-                task.cancel()
-            _ = done
+            if pending:
+                done, still_pending = await asyncio.wait(pending, timeout=15.0)
+                # Avoid leaking tasks beyond teardown; cancellation is best-effort.
+                for task in still_pending:
+                    task.cancel()
+                _ = done
         except Exception:
-            return
+            pass
+        finally:
+            await self._cdp.close()
 
     async def on_agent_response(self, context: ExecutionContext, message: Any) -> None:
         payload = serialize_message(message)
@@ -116,37 +139,111 @@ class BrowserScreenshotHook(AgentHook):
         tool_name: str,
         tool_result_content: Any,
     ) -> None:
+        log_extra = {
+            "session_id": session_id,
+            "tool_use_id": tool_use_id,
+            "tool_name": tool_name,
+        }
         try:
-            png_bytes = self._extract_png_from_tool_result(tool_result_content)
-            if not png_bytes:
-                png_bytes = await self._capture_png_with_retry()
-            if not png_bytes:
-                logger.debug(
-                    "browser_screenshot_capture_skipped",
-                    extra={
-                        "session_id": session_id,
-                        "tool_use_id": tool_use_id,
-                        "tool_name": tool_name,
-                    },
+            image_bytes = self._extract_png_from_tool_result(tool_result_content)
+            if image_bytes:
+                ok = await self._client.upload_browser_screenshot(
+                    session_id=session_id,
+                    tool_use_id=tool_use_id,
+                    image_bytes=image_bytes,
+                    # Screenshot tools may return JPEG as well.
+                    content_type=(
+                        "image/jpeg"
+                        if image_bytes.startswith(b"\xff\xd8")
+                        else "image/png"
+                    ),
                 )
-                return
+            else:
+                # Frames are compared with the previous upload, so keep them ordered.
+                async with self._capture_lock:
+                    ok = await self._capture_and_upload(
+                        session_id=session_id, tool_use_id=tool_use_id
+                    )
+            if ok is None:
+                logger.debug("browser_screenshot_capture_skipped", extra=log_extra)
+            elif not ok:
+                logger.warning("browser_screenshot_upload_failed", extra=log_extra)
+        except Exception:
+            return
 
-            ok = await self._client.upload_browser_screenshot(
+    async def _capture_and_upload(
+        self, *, session_id: str, tool_use_id: str
+    ) -> bool | None:
+        """Capture the active page and upload it, unless it matches the last frame.
+
+        Returns:
+            Whether the upload succeeded, or None if nothing could be captured.
+        """
+        frame_hash = await self._frame_hash() if self._dedup_distance >= 0 else None
+        last = self._last_upload
+        # Unchanged page: point this tool call at the previous screenshot instead
+        # of capturing and uploading it again.
+        if (
+            frame_hash is not None
+            and last is not None
+            and hamming_distance(frame_hash, last[1]) <= self._dedup_distance
+            and await self._client.copy_browser_screenshot(
                 session_id=session_id,
                 tool_use_id=tool_use_id,
-                png_bytes=png_bytes,
+                source_tool_use_id=last[0],
             )
-            if not ok:
-                logger.warning(
-                    "browser_screenshot_upload_failed",
-                    extra={
-                        "session_id": session_id,
-                        "tool_use_id": tool_use_id,
-                        "tool_name": tool_name,
-                    },
-                )
-        except Exception:
-            return
+        ):
+            return True
+
+        image = await self._capture_with_retry(
+            image_format=self._format, quality=self._quality
+        )
+        if not image:
+            return None
+        thumbnail = None
+        if self._thumbnail_width > 0:
+            thumbnail = await self._capture_with_retry(
+                image_format="jpeg",
+                quality=THUMBNAIL_QUALITY,
+                width=self._thumbnail_width,
+            )
+
+        ok = await self._client.upload_browser_screenshot(
+            session_id=session_id,
+            tool_use_id=tool_use_id,
+            image_bytes=image,
+            content_type=f"image/{self._format}",
+            thumbnail_bytes=thumbnail,
+        )
+        if ok and frame_hash is not None:
+            self._last_upload = (tool_use_id, frame_hash)
+        return ok
+
+    async def _frame_hash(self) -> int | None:
+        """Perceptual hash of the active page, from a tiny browser-side PNG."""
+        frame = await self._capture_with_retry(
+            image_format="png", width=HASH_CAPTURE_WIDTH
+        )
+        if not frame:
+            return None
+        try:
+            return dhash(*decode_png_grayscale(frame))
+        except (ValueError, zlib.error):
+            return None
+
+    async def _capture_with_retry(self, **kwargs: Any) -> bytes | None:
+        # CDP calls can be flaky on cold starts or after the browser restarted;
+        # retry once on a fresh connection with a small delay.
+        for attempt in range(2):
+            try:
+                image = await self._cdp.capture_screenshot(**kwargs)
+                if image:
+                    return image
+            except Exception:
+                await self._cdp.close()
+            if attempt == 0:
+                await asyncio.sleep(0.2)
+        return None
 
     @staticmethod
     def _extract_png_from_tool_result(tool_result_content: Any) -> bytes | None:
@@ -182,175 +279,3 @@ class BrowserScreenshotHook(AgentHook):
                 return None
 
         return None
-
-    async def _capture_png_with_retry(self) -> bytes | None:
-        # CDP calls can be flaky on cold starts; retry once with a small delay.
-        for attempt in range(2):
-            png = await self._capture_png()
-            if png:
-                return png
-            if attempt == 0:
-                try:
-                    await asyncio.sleep(0.2)
-                except Exception:
-                    return None
-        return None
-
-    async def _capture_png(self) -> bytes | None:
-        target = await self._resolve_page_ws_url()
-        if not target:
-            return None
-        ws_url, target_id = target
-
-        payload = await self._cdp_capture_screenshot(ws_url, target_id)
-        if not payload:
-            return None
-
-        try:
-            return base64.b64decode(payload, validate=True)
-        except Exception:
-            return None
-
-    async def _resolve_page_ws_url(self) -> tuple[str, str | None] | None:
-        # Prefer /json/list to get a page target (Page.captureScreenshot works on page sessions).
-        url = f"{self._cdp_endpoint}/json/list"
-        try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                resp = await client.get(url)
-                resp.raise_for_status()
-                targets = resp.json()
-        except Exception:
-            return None
-
-        if not isinstance(targets, list):
-            return None
-
-        pages: list[dict[str, Any]] = []
-        for item in targets:
-            if not isinstance(item, dict):
-                continue
-            if item.get("type") != "page":
-                continue
-            ws_url = item.get("webSocketDebuggerUrl")
-            if isinstance(ws_url, str) and ws_url.strip():
-                pages.append(item)
-
-        if not pages:
-            return None
-
-        def _score(page: dict[str, Any]) -> int:
-            raw_url = str(page.get("url") or "").strip()
-            if not raw_url:
-                return 0
-            if raw_url in {"about:blank", "chrome://newtab/"}:
-                return 0
-            return 1
-
-        pages.sort(key=_score, reverse=True)
-        picked = pages[0]
-        ws_url = picked.get("webSocketDebuggerUrl")
-        target_id = picked.get("id")
-        ws_url = ws_url.strip() if isinstance(ws_url, str) and ws_url.strip() else None
-        target_id = (
-            target_id.strip()
-            if isinstance(target_id, str) and target_id.strip()
-            else None
-        )
-        if not ws_url:
-            return None
-        return ws_url, target_id
-
-    async def _cdp_call(
-        self,
-        ws: Any,
-        *,
-        call_id: int,
-        method: str,
-        params: dict[str, Any] | None = None,
-    ) -> dict[str, Any] | None:
-        payload: dict[str, Any] = {"id": call_id, "method": method}
-        if params is not None:
-            payload["params"] = params
-        await ws.send(json.dumps(payload))
-
-        while True:
-            raw = await asyncio.wait_for(ws.recv(), timeout=8.0)
-            message = json.loads(raw)
-            if not isinstance(message, dict):
-                continue
-            if message.get("id") != call_id:
-                continue
-            if message.get("error"):
-                return None
-            result = message.get("result")
-            if result is None:
-                return {}
-            return result if isinstance(result, dict) else {}
-
-    async def _cdp_capture_screenshot(
-        self, ws_url: str, target_id: str | None
-    ) -> str | None:
-        try:
-            async with websockets.connect(ws_url, max_size=50 * 1024 * 1024) as ws:
-                # Ensure Page domain is enabled for consistent screenshots.
-                await self._cdp_call(ws, call_id=1, method="Page.enable")
-
-                # Best-effort: lock viewport to a desktop size so responsive pages don't render
-                # as mobile when the underlying display/window is small.
-                apply_key = target_id or ws_url
-                if apply_key not in self._viewport_applied:
-                    width, height = self._viewport
-                    _ = await self._cdp_call(
-                        ws,
-                        call_id=2,
-                        method="Emulation.setDeviceMetricsOverride",
-                        params={
-                            "width": width,
-                            "height": height,
-                            "deviceScaleFactor": 1,
-                            "mobile": False,
-                        },
-                    )
-
-                    # If the browser is headful, also try to resize the window for noVNC.
-                    if target_id:
-                        win = await self._cdp_call(
-                            ws,
-                            call_id=3,
-                            method="Browser.getWindowForTarget",
-                            params={"targetId": target_id},
-                        )
-                        window_id = (
-                            int(win["windowId"])
-                            if isinstance(win, dict)
-                            and isinstance(win.get("windowId"), int)
-                            else None
-                        )
-                        if window_id is not None:
-                            _ = await self._cdp_call(
-                                ws,
-                                call_id=4,
-                                method="Browser.setWindowBounds",
-                                params={
-                                    "windowId": window_id,
-                                    "bounds": {
-                                        "width": width,
-                                        "height": height,
-                                    },
-                                },
-                            )
-
-                    self._viewport_applied.add(apply_key)
-
-                result = await self._cdp_call(
-                    ws,
-                    call_id=5,
-                    method="Page.captureScreenshot",
-                    params={"format": "png"},
-                )
-                if not isinstance(result, dict):
-                    return None
-                data = result.get("data")
-                return data if isinstance(data, str) and data else None
-        except Exception:
-            return None
@@ -1,23 +1,37 @@
+import asyncio
 import logging
 import re
 from datetime import datetime, timezone
 from pathlib import Path
 
 from app.hooks.base import AgentHook, ExecutionContext
+from app.utils.git.async_runner import run_git
 from app.utils.git.operations import (
     GitError,
     GitNotRepositoryError,
-    add_files,
-    commit,
     has_commits,
     init_repository,
     is_repository,
     set_config,
     tag_ref,
 )
+from app.utils.git.snapshot import (
+    SnapshotPolicy,
+    SnapshotResult,
+    adopt_snapshot,
+    create_snapshot,
+    prune_run_refs,
+    run_gc,
+)
 
 logger = logging.getLogger(__name__)
 
+RUN_REF_PREFIX = "refs/tags/poco/run"
+
+# Background `git gc` per repository; a reference keeps the task alive after
+# the hook that started it is gone.
+_gc_tasks: dict[str, asyncio.Task[None]] = {}
+
 
 def _sanitize_ref_token(value: str) -> str:
     """Return a safe token for git ref names (keeps ASCII and replaces others)."""
@@ -29,7 +43,7 @@ def _sanitize_ref_token(value: str) -> str:
     return token.strip("._-") or "unknown"
 
 
-def _build_run_ref(run_id: str, kind: str) -> str:
+def build_run_ref(run_id: str, kind: str) -> str:
     # Use slash-separated namespace for easy browsing via `git tag -l 'poco/run/*'`.
     return f"poco/run/{_sanitize_ref_token(run_id)}/{kind}"
 
@@ -37,12 +51,21 @@ def _build_run_ref(run_id: str, kind: str) -> str:
 class RunSnapshotHook(AgentHook):
     """Create git snapshots (commit + tags) per run.
 
+    Snapshots are built by ``app.utils.git.snapshot`` from a private index, so
+    HEAD, the branch and the user's staging area are left alone; large and
+    binary files are excluded by ``SnapshotPolicy``. Tags of old runs are pruned
+    at teardown and ``git gc`` runs in the background once the object store
+    crosses the policy thresholds.
+
     This hook is intentionally self-contained: it only interacts with the local git
     repository in the workspace, and does not depend on callback/session state.
     """
 
-    def __init__(self, run_id: str | None = None) -> None:
+    def __init__(
+        self, run_id: str | None = None, policy: SnapshotPolicy | None = None
+    ) -> None:
         self._run_id_input = run_id
+        self._policy = policy or SnapshotPolicy.from_env()
         self._resolved_run_id: str | None = None
         self._failed: bool = False
         self._error_type: str | None = None
@@ -61,22 +84,39 @@ class RunSnapshotHook(AgentHook):
 
     @staticmethod
     def _ensure_git_ready(cwd: Path) -> None:
-        """Ensure a git repository exists and is commit-ready."""
+        """Ensure a git repository exists.
 
-        if not is_repository(cwd):
-            init_repository(cwd)
+        Snapshot commits carry their own identity, so the config is only written
+        for repositories created here (to keep the agent's own commits working).
+        """
 
-        # Make commits work reliably inside containers.
+        if is_repository(cwd):
+            return
+        init_repository(cwd)
         set_config("user.name", "poco", cwd=cwd)
         set_config("user.email", "poco@local", cwd=cwd)
         set_config("commit.gpgsign", "false", cwd=cwd)
 
+    def _snapshot(self, cwd: Path, message: str) -> SnapshotResult:
+        return create_snapshot(cwd, message, policy=self._policy)
+
+    def _init_baseline(self, cwd: Path) -> SnapshotResult | None:
+        """Create the first commit of a repository without commits.
+
+        Returns the snapshot it was built from, or None if HEAD already exists.
+        """
+        if has_commits(cwd):
+            return None
+        result = self._snapshot(cwd, "poco:init")
+        adopt_snapshot(result.commit, cwd)
+        return result
+
     async def on_setup(self, context: ExecutionContext) -> None:
         run_id = self._resolve_run_id(context)
         cwd = Path(context.cwd)
 
         try:
-            self._ensure_git_ready(cwd)
+            await run_git(self._ensure_git_ready, cwd)
         except (GitNotRepositoryError, GitError, OSError) as exc:
             logger.warning(
                 "run_snapshot_setup_failed",
@@ -90,14 +130,7 @@ class RunSnapshotHook(AgentHook):
 
         # Ensure HEAD exists so subsequent status/diff are relative to a concrete baseline.
         try:
-            if not has_commits(cwd):
-                add_files(".", cwd=cwd, all_files=True)
-                commit(
-                    message="poco:init",
-                    cwd=cwd,
-                    allow_empty=True,
-                    no_verify=True,
-                )
+            baseline = await run_git(self._init_baseline, cwd)
         except Exception as exc:
             logger.warning(
                 "run_snapshot_init_commit_failed",
@@ -111,7 +144,16 @@ class RunSnapshotHook(AgentHook):
 
         # Tag the baseline for this run (state before any agent modifications).
         try:
-            tag_ref(_build_run_ref(run_id, "base"), ref="HEAD", cwd=cwd, force=True)
+            result = baseline or await run_git(
+                self._snapshot, cwd, f"poco:run {run_id} base"
+            )
+            await run_git(
+                tag_ref,
+                build_run_ref(run_id, "base"),
+                ref=result.commit,
+                cwd=cwd,
+                force=True,
+            )
         except Exception as exc:
             logger.warning(
                 "run_snapshot_base_tag_failed",
@@ -121,6 +163,10 @@ class RunSnapshotHook(AgentHook):
                     "error": str(exc),
                 },
             )
+            return
+
+        self._log_snapshot(context, run_id, "base", result)
+        self._maybe_start_gc(cwd, result)
 
     async def on_error(self, context: ExecutionContext, error: Exception) -> None:
         self._failed = True
@@ -131,7 +177,7 @@ class RunSnapshotHook(AgentHook):
         cwd = Path(context.cwd)
 
         try:
-            self._ensure_git_ready(cwd)
+            await run_git(self._ensure_git_ready, cwd)
         except Exception as exc:
             logger.warning(
                 "run_snapshot_teardown_git_unavailable",
@@ -149,49 +195,107 @@ class RunSnapshotHook(AgentHook):
             message = f"{message} {self._error_type}"
 
         try:
-            add_files(".", cwd=cwd, all_files=True)
+            result = await run_git(self._snapshot, cwd, message)
         except Exception as exc:
             logger.warning(
-                "run_snapshot_add_failed",
+                "run_snapshot_commit_failed",
                 extra={
                     "session_id": context.session_id,
                     "run_id": run_id,
                     "error": str(exc),
                 },
             )
+            return
 
-        commit_hash: str | None = None
         try:
-            commit_hash = commit(
-                message=message,
+            await run_git(
+                tag_ref,
+                build_run_ref(run_id, "result"),
+                ref=result.commit,
                 cwd=cwd,
-                allow_empty=True,
-                no_verify=True,
+                force=True,
             )
         except Exception as exc:
             logger.warning(
-                "run_snapshot_commit_failed",
+                "run_snapshot_result_tag_failed",
                 extra={
                     "session_id": context.session_id,
                     "run_id": run_id,
                     "error": str(exc),
                 },
             )
-            return
+        self._log_snapshot(context, run_id, "result", result)
 
         try:
-            tag_ref(
-                _build_run_ref(run_id, "result"),
-                ref=commit_hash or "HEAD",
-                cwd=cwd,
-                force=True,
+            pruned = await run_git(
+                prune_run_refs, RUN_REF_PREFIX, self._policy.keep_runs, cwd
             )
+            if pruned:
+                logger.info(
+                    "run_snapshot_refs_pruned",
+                    extra={"run_id": run_id, "refs": len(pruned)},
+                )
         except Exception as exc:
             logger.warning(
-                "run_snapshot_result_tag_failed",
+                "run_snapshot_prune_failed",
                 extra={
                     "session_id": context.session_id,
                     "run_id": run_id,
                     "error": str(exc),
                 },
             )
+        self._maybe_start_gc(cwd, result)
+
+    @staticmethod
+    def _log_snapshot(
+        context: ExecutionContext, run_id: str, kind: str, result: SnapshotResult
+    ) -> None:
+        logger.info(
+            "run_snapshot_created",
+            extra={
+                "session_id": context.session_id,
+                "run_id": run_id,
+                "kind": kind,
+                "commit": result.commit,
+                "duration_ms": result.duration_ms,
+                "timings_ms": result.timings_ms,
+                "changed_paths": result.changed_paths,
+                "excluded_paths": len(result.excluded_paths),
+                "objects_written": result.objects_written,
+                "loose_objects": result.objects.loose,
+                "packs": result.objects.packs,
+                "pack_kb": result.objects.pack_kb,
+            },
+        )
+
+    def _maybe_start_gc(self, cwd: Path, result: SnapshotResult) -> None:
+        key = str(cwd)
+        running = _gc_tasks.get(key)
+        if (running and not running.done()) or not self._policy.needs_gc(
+            result.objects
+        ):
+            return
+        _gc_tasks[key] = asyncio.create_task(self._gc(cwd, result))
+
+    async def _gc(self, cwd: Path, result: SnapshotResult) -> None:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            # Repacking a large repository can take a while; no per-command timeout.
+            await run_git(run_gc, cwd, self._policy.gc_prune, timeout=None)
+        except Exception as exc:
+            logger.warning(
+                "run_snapshot_gc_failed", extra={"cwd": str(cwd), "error": str(exc)}
+            )
+            return
+        finally:
+            _gc_tasks.pop(str(cwd), None)
+        logger.info(
+            "run_snapshot_gc_done",
+            extra={
+                "cwd": str(cwd),
+                "duration_ms": int((loop.time() - started) * 1000),
+                "loose_objects_before": result.objects.loose,
+                "packs_before": result.objects.packs,
+            },
+        )
@@ -1,55 +1,151 @@
+import os
 from datetime import datetime, timezone
 from typing import Any
 
+from claude_agent_sdk import (
+    AssistantMessage,
+    ResultMessage,
+    ToolResultBlock,
+    ToolUseBlock,
+    UserMessage,
+)
+
 from app.hooks.base import AgentHook, ExecutionContext
+from app.hooks.run_snapshot import build_run_ref
 from app.schemas.enums import FileStatus
 from app.schemas.state import FileChange, WorkspaceState
+from app.utils.git.async_runner import run_git
 from app.utils.git.operations import (
+    GitDiffEntry,
     GitNotRepositoryError,
     diff,
-    get_numstat,
+    diff_files,
+    get_diff_entries,
     get_status,
     is_repository,
     list_remotes,
+    list_untracked_files,
     remote_url,
 )
+from app.utils.git.snapshot import (
+    read_excluded_paths,
+    resolve_commit,
+    seed_base_index,
+)
+
+# Tools whose results may have changed files in the workspace.
+MUTATING_TOOLS = frozenset({"Write", "Edit", "MultiEdit", "NotebookEdit", "Bash"})
+
+_DiffSignature = tuple[Any, ...]
 
 
 class WorkspaceHook(AgentHook):
-    """Hook that monitors workspace file changes and updates state."""
+    """Hook that monitors workspace file changes and updates state.
+
+    The workspace is only rescanned after tool results that can mutate files
+    (and once at the start and end of a run). Per-file diffs are cached by
+    blob id / mtime and refreshed with a single batched ``git diff``.
+
+    Changes are reported against the run's base snapshot
+    (``poco/run/<run_id>/base``) when it exists, so they cover this run only;
+    otherwise against HEAD and the index. Paths the snapshot policy left out of
+    the base snapshot are not reported, as there is nothing to diff them against.
+    """
+
+    def __init__(self, run_id: str | None = None) -> None:
+        self._run_id = (run_id or "").strip() or None
+        # Base snapshot commit, the env selecting the index that describes it and
+        # the paths left out of the snapshot.
+        self._base: tuple[str, dict[str, str], frozenset[str]] | None = None
+        self._dirty = True
+        self._tool_name_by_use_id: dict[str, str] = {}
+        self._diff_cache: dict[tuple[bool, str], tuple[_DiffSignature, str]] = {}
 
     async def on_agent_response(self, context: ExecutionContext, message: Any) -> None:
-        """Capture Git-tracked file changes after each agent response.
+        """Capture Git-tracked file changes when the workspace may have changed.
+
+        The scan completes before later hooks (the callback) see the message, so
+        each callback carries the state as of that message. Git runs on the git
+        thread pool, off the event loop.
 
         Args:
             context: The execution context containing workspace state.
-            message: The agent response message (unused).
+            message: The agent response message.
         """
+        self._track_tool_calls(message)
+
+        if self._dirty or isinstance(message, ResultMessage):
+            self._dirty = False
+            await self._scan(context)
+
+    async def _scan(self, context: ExecutionContext) -> None:
         try:
-            if not is_repository(context.cwd):
-                context.current_state.workspace_state = WorkspaceState()
-                return
-
-            git_status = get_status(context.cwd)
-            repository = self._get_repository_url(context.cwd)
-            file_changes = self._collect_file_changes(git_status, context.cwd)
-
-            total_added = sum(fc.added_lines for fc in file_changes)
-            total_deleted = sum(fc.deleted_lines for fc in file_changes)
-
-            context.current_state.workspace_state = WorkspaceState(
-                repository=repository,
-                branch=git_status.branch,
-                total_added_lines=total_added,
-                total_deleted_lines=total_deleted,
-                file_changes=file_changes,
-                last_change=datetime.now(timezone.utc),
+            context.current_state.workspace_state = await run_git(
+                self._build_workspace_state, context.cwd
             )
         except GitNotRepositoryError:
             context.current_state.workspace_state = WorkspaceState()
         except Exception:
             context.current_state.workspace_state = WorkspaceState()
 
+    def _build_workspace_state(self, cwd: str) -> WorkspaceState:
+        """Compute the workspace state (blocking; runs on the git thread pool)."""
+        if not is_repository(cwd):
+            return WorkspaceState()
+
+        git_status = get_status(cwd)
+        repository = self._get_repository_url(cwd)
+        base = self._resolve_base(cwd)
+        if base is not None:
+            file_changes = self._collect_run_changes(cwd, *base)
+        else:
+            file_changes = self._collect_file_changes(git_status, cwd)
+
+        total_added = sum(fc.added_lines for fc in file_changes)
+        total_deleted = sum(fc.deleted_lines for fc in file_changes)
+
+        return WorkspaceState(
+            repository=repository,
+            branch=git_status.branch,
+            total_added_lines=total_added,
+            total_deleted_lines=total_deleted,
+            file_changes=file_changes,
+            last_change=datetime.now(timezone.utc),
+        )
+
+    def _resolve_base(
+        self, cwd: str
+    ) -> tuple[str, dict[str, str], frozenset[str]] | None:
+        """Return the run's base snapshot and its index, once the tag exists."""
+        if self._base is not None or self._run_id is None:
+            return self._base
+        commit = resolve_commit(build_run_ref(self._run_id, "base"), cwd)
+        if commit is None:
+            return None
+        self._base = (
+            commit,
+            seed_base_index(commit, cwd),
+            read_excluded_paths(commit, cwd),
+        )
+        # Cached diffs were taken against the index, not the snapshot.
+        self._diff_cache.clear()
+        return self._base
+
+    def _track_tool_calls(self, message: Any) -> None:
+        """Mark the workspace dirty once a mutating tool call has returned."""
+        if isinstance(message, AssistantMessage):
+            for block in message.content:
+                if isinstance(block, ToolUseBlock):
+                    self._tool_name_by_use_id[block.id] = block.name
+        elif isinstance(message, UserMessage) and isinstance(message.content, list):
+            for block in message.content:
+                if not isinstance(block, ToolResultBlock):
+                    continue
+                tool_name = self._tool_name_by_use_id.pop(block.tool_use_id, None)
+                # Unknown tool ids (e.g. resumed sessions) are treated as mutating.
+                if tool_name is None or tool_name in MUTATING_TOOLS:
+                    self._dirty = True
+
     def _collect_file_changes(self, git_status, cwd: str) -> list[FileChange]:
         """Collect file changes with diff information.
 
@@ -62,32 +158,34 @@ class WorkspaceHook(AgentHook):
         """
         file_changes = []
 
-        unstaged_numstat = get_numstat(cwd, cached=False)
-        staged_numstat = get_numstat(cwd, cached=True)
+        unstaged_entries = get_diff_entries(cwd, cached=False)
+        staged_entries = get_diff_entries(cwd, cached=True)
+        unstaged_diffs = self._get_diffs(git_status.modified, unstaged_entries, cwd)
+        staged_diffs = self._get_diffs(
+            git_status.staged, staged_entries, cwd, cached=True
+        )
 
         for file in git_status.modified:
-            added, deleted = unstaged_numstat.get(file, (0, 0))
-            diff_content = diff(file=file, cwd=cwd, cached=False)
+            entry = unstaged_entries.get(file)
             file_changes.append(
                 FileChange(
                     path=file,
                     status=FileStatus.MODIFIED,
-                    added_lines=added,
-                    deleted_lines=deleted,
-                    diff=diff_content or None,
+                    added_lines=entry.added_lines if entry else 0,
+                    deleted_lines=entry.deleted_lines if entry else 0,
+                    diff=unstaged_diffs.get(file) or None,
                 )
             )
 
         for file in git_status.staged:
-            added, deleted = staged_numstat.get(file, (0, 0))
-            diff_content = diff(file=file, cwd=cwd, cached=True)
+            entry = staged_entries.get(file)
             file_changes.append(
                 FileChange(
                     path=file,
                     status=FileStatus.STAGED,
-                    added_lines=added,
-                    deleted_lines=deleted,
-                    diff=diff_content or None,
+                    added_lines=entry.added_lines if entry else 0,
+                    deleted_lines=entry.deleted_lines if entry else 0,
+                    diff=staged_diffs.get(file) or None,
                 )
             )
 
@@ -121,6 +219,132 @@ class WorkspaceHook(AgentHook):
 
         return file_changes
 
+    def _collect_run_changes(
+        self,
+        cwd: str,
+        base: str,
+        env: dict[str, str],
+        excluded: frozenset[str] = frozenset(),
+    ) -> list[FileChange]:
+        """Collect changes of the work tree since the run's base snapshot.
+
+        Args:
+            cwd: Current working directory.
+            base: Base snapshot commit.
+            env: Environment selecting the index that describes ``base``.
+            excluded: Paths left out of the base snapshot; they are skipped.
+
+        Returns:
+            List of FileChange objects.
+        """
+        entries = {
+            path: entry
+            for path, entry in get_diff_entries(cwd, base=base, env=env).items()
+            if path not in excluded
+        }
+        modified = [path for path, entry in entries.items() if entry.status != "D"]
+        diffs = self._get_diffs(modified, entries, cwd, base=base, env=env)
+
+        file_changes = [
+            FileChange(
+                path=path,
+                status=FileStatus.MODIFIED,
+                added_lines=entries[path].added_lines,
+                deleted_lines=entries[path].deleted_lines,
+                diff=diffs.get(path) or None,
+            )
+            for path in modified
+        ]
+        file_changes.extend(
+            FileChange(
+                path=path, status=FileStatus.ADDED, added_lines=0, deleted_lines=0
+            )
+            for path in list_untracked_files(cwd, env=env)
+            if path not in excluded
+        )
+        file_changes.extend(
+            FileChange(
+                path=path, status=FileStatus.DELETED, added_lines=0, deleted_lines=0
+            )
+            for path, entry in entries.items()
+            if entry.status == "D"
+        )
+        return file_changes
+
+    def _get_diffs(
+        self,
+        files: list[str],
+        entries: dict[str, GitDiffEntry],
+        cwd: str,
+        cached: bool = False,
+        base: str | None = None,
+        env: dict[str, str] | None = None,
+    ) -> dict[str, str]:
+        """Return diffs for files, reusing cached diffs whose inputs are unchanged.
+
+        Args:
+            files: Files to diff.
+            entries: Raw diff entries for the same side (staged or unstaged).
+            cwd: Current working directory.
+            cached: If True, diff the index against HEAD.
+            base: Commit to diff the work tree against instead of the index.
+            env: Environment selecting the index that describes ``base``.
+
+        Returns:
+            Mapping of file path to diff text.
+        """
+        diffs: dict[str, str] = {}
+        signatures: dict[str, _DiffSignature | None] = {}
+        stale: list[str] = []
+
+        for file in files:
+            signature = self._diff_signature(entries.get(file), cwd, cached)
+            cached_entry = self._diff_cache.get((cached, file))
+            if signature is not None and cached_entry and cached_entry[0] == signature:
+                diffs[file] = cached_entry[1]
+                continue
+            signatures[file] = signature
+            stale.append(file)
+
+        fresh = diff_files(stale, cached=cached, cwd=cwd, base=base, env=env)
+        for file in stale:
+            content = fresh.get(file)
+            if content is None and file in entries:
+                # Paths git quotes in diff headers cannot be split out of the batch.
+                content = diff(file=file, cwd=cwd, cached=cached, base=base, env=env)
+            diffs[file] = content or ""
+
+        for key in [k for k in self._diff_cache if k[0] == cached]:
+            if key[1] not in diffs:
+                del self._diff_cache[key]
+        for file, signature in signatures.items():
+            if signature is not None:
+                self._diff_cache[(cached, file)] = (signature, diffs[file])
+
+        return diffs
+
+    @staticmethod
+    def _diff_signature(
+        entry: GitDiffEntry | None, cwd: str, cached: bool
+    ) -> _DiffSignature | None:
+        """Build the cache key of a file diff, or None if it cannot be cached."""
+        if entry is None:
+            return None
+        if cached:
+            return (entry.src_mode, entry.dst_mode, entry.src_blob, entry.dst_blob)
+        # Work tree blobs are not hashed by git diff, so use the file's stat instead.
+        try:
+            stat = os.stat(os.path.join(cwd, entry.path))
+        except OSError:
+            return None
+        return (
+            entry.src_mode,
+            entry.src_blob,
+            entry.dst_mode,
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+
     def _get_repository_url(self, cwd: str) -> str | None:
         """Get repository URL from Git remotes.
 
@@ -1,9 +1,11 @@
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 
 from app.api import task_router
+from app.core.http_client import close_http_client, get_http_client_stats
 from app.core.middleware import setup_middleware
 from app.core.observability.logging import configure_logging
 
@@ -12,7 +14,14 @@ configure_logging(
     service_name="executor",
 )
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await close_http_client()
+
+
+app = FastAPI(lifespan=lifespan)
 
 setup_middleware(app)
 app.include_router(task_router)
@@ -21,7 +30,7 @@ app.include_router(task_router)
 @app.get("/health")
 async def health_check() -> JSONResponse:
     """Health check endpoint."""
-    return JSONResponse({"status": "ok"})
+    return JSONResponse({"status": "ok", "http_client": get_http_client_stats()})
 
 
 if __name__ == "__main__":
@@ -4,7 +4,7 @@ from typing import Any, Optional
 from pydantic import BaseModel, Field
 
 from app.schemas.enums import CallbackStatus
-from app.schemas.state import AgentCurrentState
+from app.schemas.state import AgentCurrentState, AgentStateDelta
 
 
 class AgentCallbackRequest(BaseModel):
@@ -17,4 +17,12 @@ class AgentCallbackRequest(BaseModel):
     error_message: str | None = None
     new_message: Optional[Any] = None
     state_patch: Optional[AgentCurrentState] = None
+    state_delta: Optional[AgentStateDelta] = None
+    state_seq: Optional[int] = None
     sdk_session_id: Optional[str] = None
+
+
+class AgentCallbackBatchRequest(BaseModel):
+    """A batch of callbacks for one session, in send order."""
+
+    callbacks: list[AgentCallbackRequest] = Field(default_factory=list)
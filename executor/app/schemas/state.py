@@ -44,6 +44,21 @@ class WorkspaceState(BaseModel):
     last_change: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+class WorkspaceStateDelta(BaseModel):
+    """Workspace changes relative to the previously reported workspace state.
+
+    ``file_keys`` lists every current file change (as ``"<status>:<path>"``) in
+    order; only new or changed entries are included in ``upserted_files``.
+    Totals are derived from the merged file changes by the receiver.
+    """
+
+    repository: str | None = None
+    branch: str | None = None
+    last_change: datetime
+    file_keys: list[str] = Field(default_factory=list)
+    upserted_files: list[FileChange] = Field(default_factory=list)
+
+
 class BrowserState(BaseModel):
     """Browser/desktop capability state exposed to the UI."""
 
@@ -58,3 +73,20 @@ class AgentCurrentState(BaseModel):
     browser: BrowserState | None = None
     workspace_state: WorkspaceState | None = None
     current_step: str | None = None
+
+
+class AgentStateDelta(BaseModel):
+    """Changed sections of AgentCurrentState relative to the state at ``base_seq``.
+
+    Sections named in ``changed`` replace the stored value (None clears it).
+    ``workspace_delta`` patches the stored workspace state in place.
+    """
+
+    base_seq: int
+    changed: list[str] = Field(default_factory=list)
+    todos: list[TodoItem] | None = None
+    mcp_status: list[McpStatus] | None = None
+    browser: BrowserState | None = None
+    workspace_state: WorkspaceState | None = None
+    current_step: str | None = None
+    workspace_delta: WorkspaceStateDelta | None = None
@@ -0,0 +1,75 @@
+"""
+Run blocking git operations off the event loop.
+
+Git commands are executed on a dedicated thread pool so hooks and workspace
+preparation do not stall SDK message streaming, ``/health`` or other tasks.
+Every command started by the wrapped call gets a timeout, and cancelling the
+awaiting task kills the running git process.
+"""
+
+import asyncio
+import contextvars
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from app.utils.git.operations import GitCommandScope, command_scope
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw.strip())
+    except Exception:
+        return default
+
+
+# Per-command timeouts: local commands vs. commands that hit the network.
+GIT_COMMAND_TIMEOUT_SECONDS = _env_float("GIT_COMMAND_TIMEOUT_SECONDS", 120.0)
+GIT_NETWORK_TIMEOUT_SECONDS = _env_float("GIT_NETWORK_TIMEOUT_SECONDS", 600.0)
+
+_git_executor = ThreadPoolExecutor(
+    max_workers=max(1, int(_env_float("GIT_MAX_WORKERS", 4))),
+    thread_name_prefix="git",
+)
+
+
+async def run_git[T](
+    func: Callable[..., T],
+    *args: Any,
+    timeout: float | None = GIT_COMMAND_TIMEOUT_SECONDS,
+    **kwargs: Any,
+) -> T:
+    """Run a blocking git operation on the git thread pool.
+
+    Args:
+        func: Function running one or more git commands (e.g. from operations).
+        *args: Positional arguments for ``func``.
+        timeout: Timeout applied to each git command started by ``func``.
+        **kwargs: Keyword arguments for ``func``.
+
+    Returns:
+        The return value of ``func``.
+
+    Raises:
+        GitTimeoutError: If a git command exceeded the timeout.
+        asyncio.CancelledError: If the awaiting task was cancelled (the running
+            git command is killed).
+    """
+    scope = GitCommandScope(timeout=timeout)
+    context = contextvars.copy_context()
+
+    def call() -> T:
+        with command_scope(scope):
+            return func(*args, **kwargs)
+
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(_git_executor, context.run, call)
+    try:
+        return await future
+    except asyncio.CancelledError:
+        scope.cancel()
+        raise
@@ -6,9 +6,13 @@ completely decoupled from the executor project.
 All functions require explicit cwd parameter.
 """
 
+import contextvars
 import os
 import shlex
 import subprocess
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -42,6 +46,71 @@ class GitNotRepositoryError(GitError):
     pass
 
 
+class GitTimeoutError(GitError):
+    """Exception raised when a git command exceeds its timeout."""
+
+    command: str
+    timeout: float
+
+    def __init__(self, command: str, timeout: float):
+        self.command = command
+        self.timeout = timeout
+        super().__init__(f"Git command '{command}' timed out after {timeout:g}s")
+
+
+class GitCancelledError(GitError):
+    """Exception raised when a git command was cancelled."""
+
+
+class GitCommandScope:
+    """Timeout and cancellation for the git commands run inside ``command_scope``.
+
+    ``cancel`` may be called from any thread; it kills running commands and makes
+    subsequent commands in the scope fail with GitCancelledError.
+    """
+
+    def __init__(self, timeout: float | None = None):
+        self.timeout = timeout
+        self.cancelled = False
+        self._processes: set[subprocess.Popen[str]] = set()
+        self._lock = threading.Lock()
+
+    def cancel(self) -> None:
+        with self._lock:
+            self.cancelled = True
+            processes = list(self._processes)
+        for process in processes:
+            with suppress(OSError):
+                process.kill()
+
+    def _register(self, process: subprocess.Popen[str]) -> None:
+        with self._lock:
+            self._processes.add(process)
+            cancelled = self.cancelled
+        if cancelled:
+            with suppress(OSError):
+                process.kill()
+
+    def _unregister(self, process: subprocess.Popen[str]) -> None:
+        with self._lock:
+            self._processes.discard(process)
+
+
+_command_scope: contextvars.ContextVar[GitCommandScope | None] = contextvars.ContextVar(
+    "git_command_scope", default=None
+)
+
+
+@contextmanager
+def command_scope(scope: GitCommandScope) -> Iterator[GitCommandScope]:
+    """Apply a GitCommandScope to all git commands run in this context."""
+    token = _command_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _command_scope.reset(token)
+
+
 def _looks_like_not_a_repository(stderr: str) -> bool:
     lower = stderr.lower()
     return (
@@ -106,6 +175,20 @@ class GitRemote:
     push_url: str
 
 
+@dataclass
+class GitDiffEntry:
+    """Represents one changed path from ``git diff --raw --numstat``."""
+
+    path: str
+    src_mode: str
+    dst_mode: str
+    src_blob: str
+    dst_blob: str
+    status: str
+    added_lines: int = 0
+    deleted_lines: int = 0
+
+
 def _run_git_command(
     command: list[str],
     cwd: str | Path | None = None,
@@ -113,6 +196,8 @@ def _run_git_command(
     capture_output: bool = True,
     text: bool = True,
     env: dict[str, str] | None = None,
+    timeout: float | None = None,
+    input: str | None = None,
 ) -> subprocess.CompletedProcess[str]:
     """
     Run a git command and return result.
@@ -124,42 +209,74 @@ def _run_git_command(
         capture_output: If True, capture stdout and stderr
         text: If True, return output as string
         env: Environment variables for the command
+        timeout: Seconds before the command is killed (defaults to the timeout of
+            the active command_scope, if any)
+        input: Data written to the command's stdin
 
     Returns:
         subprocess.CompletedProcess: The completed process
 
     Raises:
         GitCommandError: If the command fails and check=True
+        GitTimeoutError: If the command exceeds its timeout
+        GitCancelledError: If the active command_scope was cancelled
     """
+    scope = _command_scope.get()
+    if timeout is None and scope is not None:
+        timeout = scope.timeout
+    if scope is not None and scope.cancelled:
+        raise GitCancelledError("Git command cancelled")
+
+    full_command = ["git", *command]
     try:
-        full_command = ["git", *command]
         merged_env = {**os.environ, **(env or {})}
         # Ensure git never blocks on interactive prompts inside the executor.
         merged_env["GIT_TERMINAL_PROMPT"] = "0"
 
-        result = subprocess.run(
+        pipe = subprocess.PIPE if capture_output else None
+        process = subprocess.Popen(
             full_command,
             cwd=cwd,
-            check=False,
-            capture_output=capture_output,
+            stdin=subprocess.PIPE if input is not None else None,
+            stdout=pipe,
+            stderr=pipe,
             text=text,
             env=merged_env,
         )
+    except FileNotFoundError:
+        raise GitError("Git is not installed or not in PATH") from None
 
-        stderr = result.stderr.strip() if result.stderr else ""
-        if result.returncode != 0 and _looks_like_not_a_repository(stderr):
-            raise GitNotRepositoryError(stderr or "Not a git repository")
+    if scope is not None:
+        scope._register(process)
+    try:
+        stdout, stderr_output = process.communicate(input=input, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.communicate()
+        raise GitTimeoutError(shlex.join(full_command), timeout or 0) from None
+    finally:
+        if scope is not None:
+            scope._unregister(process)
+
+    if scope is not None and scope.cancelled:
+        raise GitCancelledError("Git command cancelled")
+
+    result = subprocess.CompletedProcess(
+        full_command, process.returncode, stdout, stderr_output
+    )
 
-        if check and result.returncode != 0:
-            raise GitCommandError(
-                command=shlex.join(full_command),
-                returncode=result.returncode,
-                stderr=stderr or None,
-            )
+    stderr = result.stderr.strip() if result.stderr else ""
+    if result.returncode != 0 and _looks_like_not_a_repository(stderr):
+        raise GitNotRepositoryError(stderr or "Not a git repository")
 
-        return result
-    except FileNotFoundError:
-        raise GitError("Git is not installed or not in PATH") from None
+    if check and result.returncode != 0:
+        raise GitCommandError(
+            command=shlex.join(full_command),
+            returncode=result.returncode,
+            stderr=stderr or None,
+        )
+
+    return result
 
 
 def is_repository(cwd: str | Path | None = None) -> bool:
@@ -447,6 +564,31 @@ def get_status(cwd: str | Path | None = None) -> GitStatus:
     )
 
 
+def list_untracked_files(
+    cwd: str | Path | None = None, env: dict[str, str] | None = None
+) -> list[str]:
+    """
+    List files that are neither in the index nor ignored.
+
+    Args:
+        cwd: Working directory
+        env: Extra environment, e.g. GIT_INDEX_FILE for a private index
+
+    Returns:
+        list: Untracked paths relative to the repository root
+
+    Raises:
+        GitNotRepositoryError: If not a git repository
+    """
+    result = _run_git_command(
+        ["ls-files", "-z", "--others", "--exclude-standard"],
+        cwd=cwd,
+        check=True,
+        env=env,
+    )
+    return [path for path in result.stdout.split("\0") if path]
+
+
 def add_files(
     files: str | list[str],
     cwd: str | Path | None = None,
@@ -637,6 +779,8 @@ def diff(
     cwd: str | Path | None = None,
     context_lines: int | None = None,
     name_only: bool = False,
+    base: str | None = None,
+    env: dict[str, str] | None = None,
 ) -> str:
     """
     Show differences between commits or files.
@@ -647,6 +791,8 @@ def diff(
         cwd: Working directory
         context_lines: Number of context lines
         name_only: If True, only show file names
+        base: Commit to compare against instead of the index (or HEAD if cached)
+        env: Extra environment, e.g. GIT_INDEX_FILE for a private index
 
     Returns:
         str: Diff output
@@ -662,10 +808,12 @@ def diff(
         args.extend(["-U", str(context_lines)])
     if name_only:
         args.append("--name-only")
+    if base:
+        args.append(base)
     if file:
-        args.append(file)
+        args.extend(["--", file])
 
-    result = _run_git_command(args, cwd=cwd, check=False)
+    result = _run_git_command(args, cwd=cwd, check=False, env=env)
     return result.stdout
 
 
@@ -708,6 +856,132 @@ def get_numstat(
     return numstat
 
 
+def get_diff_entries(
+    cwd: str | Path | None = None,
+    cached: bool = False,
+    base: str | None = None,
+    env: dict[str, str] | None = None,
+) -> dict[str, GitDiffEntry]:
+    """
+    Get blob ids, modes and line counts for all changed files in one call.
+
+    Args:
+        cwd: Working directory
+        cached: If True, compare the index against HEAD instead of the work tree
+            against the index
+        base: Commit to compare against instead of the index (or HEAD if cached)
+        env: Extra environment, e.g. GIT_INDEX_FILE for a private index
+
+    Returns:
+        dict: Mapping of file path to GitDiffEntry
+
+    Raises:
+        GitNotRepositoryError: If not a git repository
+    """
+    # Full blob ids: callers use them as exact cache keys.
+    args = ["diff", "--raw", "--numstat", "--no-renames", "--no-abbrev", "-z"]
+    if cached:
+        args.append("--cached")
+    if base:
+        args.append(base)
+
+    result = _run_git_command(args, cwd=cwd, check=True, env=env)
+
+    entries: dict[str, GitDiffEntry] = {}
+    tokens = result.stdout.split("\x00")
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if not token:
+            i += 1
+            continue
+
+        if token.startswith(":"):
+            # ":<src mode> <dst mode> <src blob> <dst blob> <status>" NUL "<path>"
+            parts = token[1:].split(" ")
+            path = tokens[i + 1] if i + 1 < len(tokens) else ""
+            if len(parts) >= 5 and path:
+                entries[path] = GitDiffEntry(
+                    path=path,
+                    src_mode=parts[0],
+                    dst_mode=parts[1],
+                    src_blob=parts[2],
+                    dst_blob=parts[3],
+                    status=parts[4],
+                )
+            i += 2
+            continue
+
+        # "<added>\t<deleted>\t<path>"
+        parts = token.split("\t", 2)
+        if len(parts) == 3 and parts[2] in entries:
+            try:
+                entry = entries[parts[2]]
+                entry.added_lines = int(parts[0]) if parts[0] != "-" else 0
+                entry.deleted_lines = int(parts[1]) if parts[1] != "-" else 0
+            except ValueError:
+                pass
+        i += 1
+
+    return entries
+
+
+def diff_files(
+    files: list[str],
+    cached: bool = False,
+    cwd: str | Path | None = None,
+    base: str | None = None,
+    env: dict[str, str] | None = None,
+) -> dict[str, str]:
+    """
+    Show the diff of several files with a single git invocation.
+
+    Args:
+        files: Paths to diff (relative to the repository root)
+        cached: If True, show staged changes
+        cwd: Working directory
+        base: Commit to compare against instead of the index (or HEAD if cached)
+        env: Extra environment, e.g. GIT_INDEX_FILE for a private index
+
+    Returns:
+        dict: Mapping of file path to its diff output. Files without changes,
+        and files whose header git quotes (unusual characters), are omitted.
+        The text for each file matches ``diff(file=...)``.
+
+    Raises:
+        GitNotRepositoryError: If not a git repository
+    """
+    if not files:
+        return {}
+
+    args = ["diff", "--no-renames"]
+    if cached:
+        args.append("--cached")
+    if base:
+        args.append(base)
+    args.extend(["--", *files])
+
+    result = _run_git_command(args, cwd=cwd, check=False, env=env)
+
+    headers = {f"diff --git a/{file} b/{file}": file for file in files}
+    diffs: dict[str, str] = {}
+    current: str | None = None
+    chunk: list[str] = []
+    for line in result.stdout.splitlines(keepends=True):
+        if line.startswith("diff --git "):
+            if current is not None:
+                diffs[current] = "".join(chunk)
+            current = headers.get(line.rstrip("\n"))
+            chunk = [line]
+            continue
+        if current is not None:
+            chunk.append(line)
+    if current is not None:
+        diffs[current] = "".join(chunk)
+
+    return diffs
+
+
 def create_branch(
     name: str,
     start_point: str | None = None,
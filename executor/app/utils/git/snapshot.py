@@ -0,0 +1,412 @@
+"""
+Workspace snapshots that stay out of the user's way.
+
+A snapshot is a commit object built from a private index file
+(``GIT_INDEX_FILE``) and referenced only by tags: HEAD, the current branch and
+the user's staging area are never touched. The private index is kept between
+snapshots, so only files that changed since the previous snapshot are hashed,
+and new or modified files that are too large or binary are left out. The
+excluded paths are recorded next to the index so that diffs against a
+snapshot can leave them out too.
+"""
+
+import os
+import shutil
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from app.utils.git.operations import GitCommandError, _run_git_command, get_git_dir
+
+SNAPSHOT_INDEX_NAME = "poco-snapshot.index"
+# Index describing a run's base snapshot, used to diff the work tree against it.
+BASE_INDEX_NAME = "poco-base.index"
+# Paths left out of the latest snapshot: its commit id on the first line, then
+# the NUL-separated paths.
+EXCLUDED_PATHS_NAME = "poco-snapshot.excluded"
+# Bytes inspected when deciding whether a file is binary (same heuristic as git).
+BINARY_SNIFF_BYTES = 8000
+
+_IDENTITY_ENV = {
+    "GIT_AUTHOR_NAME": "poco",
+    "GIT_AUTHOR_EMAIL": "poco@local",
+    "GIT_COMMITTER_NAME": "poco",
+    "GIT_COMMITTER_EMAIL": "poco@local",
+}
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw.strip())
+    except Exception:
+        return default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    return raw.strip().lower() in {"1", "true", "yes", "y", "on"}
+
+
+@dataclass
+class SnapshotPolicy:
+    """What goes into a snapshot and when the repository is cleaned up.
+
+    Attributes:
+        max_file_bytes: New or modified files larger than this are excluded
+            (0 disables the limit).
+        exclude_binary: Exclude new or modified files that look binary.
+        keep_runs: Number of most recent runs whose tags are kept (0 keeps all).
+        gc_loose_objects: Start ``git gc`` once this many loose objects exist
+            (0 disables).
+        gc_packs: Start ``git gc`` once this many packs exist (0 disables).
+        gc_prune: Expiry passed to ``git gc --prune``.
+    """
+
+    max_file_bytes: int = 5 * 1024 * 1024
+    exclude_binary: bool = True
+    keep_runs: int = 50
+    gc_loose_objects: int = 2000
+    gc_packs: int = 20
+    gc_prune: str = "1.hour.ago"
+
+    @classmethod
+    def from_env(cls) -> "SnapshotPolicy":
+        default = cls()
+        return cls(
+            max_file_bytes=_env_int(
+                "POCO_SNAPSHOT_MAX_FILE_BYTES", default.max_file_bytes
+            ),
+            exclude_binary=_env_bool(
+                "POCO_SNAPSHOT_EXCLUDE_BINARY", default.exclude_binary
+            ),
+            keep_runs=_env_int("POCO_SNAPSHOT_KEEP_RUNS", default.keep_runs),
+            gc_loose_objects=_env_int(
+                "POCO_SNAPSHOT_GC_LOOSE_OBJECTS", default.gc_loose_objects
+            ),
+            gc_packs=_env_int("POCO_SNAPSHOT_GC_PACKS", default.gc_packs),
+            gc_prune=(os.getenv("POCO_SNAPSHOT_GC_PRUNE") or "").strip()
+            or default.gc_prune,
+        )
+
+    def needs_gc(self, stats: "ObjectStats") -> bool:
+        return (0 < self.gc_loose_objects <= stats.loose) or (
+            0 < self.gc_packs <= stats.packs
+        )
+
+
+@dataclass
+class ObjectStats:
+    """Subset of ``git count-objects -v``."""
+
+    loose: int = 0
+    loose_kb: int = 0
+    packs: int = 0
+    pack_kb: int = 0
+
+
+@dataclass
+class SnapshotResult:
+    """A created snapshot, with the numbers worth logging."""
+
+    commit: str
+    tree: str
+    parent: str | None
+    # New or modified paths found since the previous snapshot.
+    changed_paths: int
+    excluded_paths: list[str] = field(default_factory=list)
+    objects_written: int = 0
+    objects: ObjectStats = field(default_factory=ObjectStats)
+    timings_ms: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> int:
+        return sum(self.timings_ms.values())
+
+
+def count_objects(cwd: str | Path) -> ObjectStats:
+    """Return loose/packed object statistics of the repository."""
+    result = _run_git_command(["count-objects", "-v"], cwd=cwd, check=True)
+    values: dict[str, int] = {}
+    for line in result.stdout.splitlines():
+        key, _, value = line.partition(":")
+        try:
+            values[key.strip()] = int(value.strip())
+        except ValueError:
+            continue
+    return ObjectStats(
+        loose=values.get("count", 0),
+        loose_kb=values.get("size", 0),
+        packs=values.get("packs", 0),
+        pack_kb=values.get("size-pack", 0),
+    )
+
+
+def run_gc(cwd: str | Path, prune: str = "1.hour.ago") -> None:
+    """Repack the repository and drop unreachable objects older than ``prune``."""
+    _run_git_command(["gc", "--quiet", f"--prune={prune}"], cwd=cwd, check=True)
+
+
+def prune_run_refs(prefix: str, keep: int, cwd: str | Path) -> list[str]:
+    """Delete the refs of all but the ``keep`` most recent runs under ``prefix``.
+
+    Refs are grouped by the path component right below ``prefix`` (one group
+    per run); runs are ordered by the newest commit any of their refs points to.
+
+    Returns:
+        The deleted ref names.
+    """
+    if keep <= 0:
+        return []
+    prefix = prefix.rstrip("/") + "/"
+    result = _run_git_command(
+        ["for-each-ref", "--sort=-committerdate", "--format=%(refname)", prefix],
+        cwd=cwd,
+        check=True,
+    )
+    runs: dict[str, list[str]] = {}
+    for ref in result.stdout.splitlines():
+        run = ref[len(prefix) :].split("/", 1)[0]
+        if run:
+            runs.setdefault(run, []).append(ref)
+
+    stale = [ref for refs in list(runs.values())[keep:] for ref in refs]
+    if stale:
+        _run_git_command(
+            ["update-ref", "--stdin"],
+            cwd=cwd,
+            check=True,
+            input="".join(f"delete {ref}\n" for ref in stale),
+        )
+    return stale
+
+
+def _is_excluded(path: Path, policy: SnapshotPolicy) -> bool:
+    try:
+        if path.is_symlink() or not path.is_file():
+            return False
+        if 0 < policy.max_file_bytes < path.stat().st_size:
+            return True
+        if policy.exclude_binary:
+            with path.open("rb") as handle:
+                return b"\0" in handle.read(BINARY_SNIFF_BYTES)
+    except OSError:
+        # Unreadable files would make `git add` fail for the whole batch.
+        return True
+    return False
+
+
+def _seed_index(git_dir: Path, index_path: Path) -> None:
+    # Start from the user's index: its stat cache lets the first snapshot skip
+    # hashing every file that is unchanged since it was staged.
+    user_index = git_dir / "index"
+    if user_index.is_file():
+        shutil.copyfile(user_index, index_path)
+    else:
+        index_path.unlink(missing_ok=True)
+
+
+def resolve_commit(ref: str, cwd: str | Path) -> str | None:
+    """Return the commit ``ref`` points to, or None if it does not exist."""
+    result = _run_git_command(
+        ["rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"],
+        cwd=cwd,
+        check=False,
+    )
+    commit = result.stdout.strip()
+    return commit if result.returncode == 0 and commit else None
+
+
+def _build_tree(
+    cwd: str | Path,
+    env: dict[str, str],
+    policy: SnapshotPolicy,
+    lap: Callable[[str], None],
+) -> tuple[list[str], list[str], str]:
+    listed = _run_git_command(
+        ["ls-files", "-z", "--others", "--modified", "--exclude-standard"],
+        cwd=cwd,
+        check=True,
+        env=env,
+    )
+    # Modified-and-deleted paths show up once per flag.
+    changed = list(dict.fromkeys(p for p in listed.stdout.split("\0") if p))
+    lap("scan")
+
+    staged: list[str] = []
+    excluded: list[str] = []
+    root = Path(cwd)
+    for path in changed:
+        (excluded if _is_excluded(root / path, policy) else staged).append(path)
+    if staged:
+        _run_git_command(
+            [
+                "--literal-pathspecs",
+                "add",
+                "-A",
+                "--pathspec-from-file=-",
+                "--pathspec-file-nul",
+            ],
+            cwd=cwd,
+            check=True,
+            env=env,
+            input="\0".join(staged),
+        )
+    lap("stage")
+
+    tree = _run_git_command(["write-tree"], cwd=cwd, check=True, env=env)
+    return changed, excluded, tree.stdout.strip()
+
+
+def create_snapshot(
+    cwd: str | Path,
+    message: str,
+    policy: SnapshotPolicy | None = None,
+    parent: str | None = "HEAD",
+) -> SnapshotResult:
+    """
+    Snapshot the working tree under ``cwd`` as a commit without touching HEAD.
+
+    Files that are new or modified since the previous snapshot and match the
+    exclusion policy are skipped: new ones stay out of the snapshot, tracked
+    ones keep their previously snapshotted content.
+
+    Args:
+        cwd: Working directory (paths outside it keep their previous content)
+        message: Commit message
+        policy: Exclusion policy (default: SnapshotPolicy.from_env())
+        parent: Ref used as the snapshot's parent, if it exists
+
+    Returns:
+        SnapshotResult: The snapshot commit and its statistics
+
+    Raises:
+        GitNotRepositoryError: If not a git repository
+        GitCommandError: If a git command fails
+    """
+    policy = policy or SnapshotPolicy.from_env()
+    timings: dict[str, int] = {}
+    started = time.monotonic()
+
+    def lap(step: str) -> None:
+        nonlocal started
+        now = time.monotonic()
+        timings[step] = int((now - started) * 1000)
+        started = now
+
+    git_dir = get_git_dir(cwd)
+    index_path = git_dir / SNAPSHOT_INDEX_NAME
+    if not index_path.exists():
+        _seed_index(git_dir, index_path)
+    env = {"GIT_INDEX_FILE": str(index_path)}
+    before = count_objects(cwd)
+
+    try:
+        changed, excluded, tree = _build_tree(cwd, env, policy, lap)
+    except GitCommandError:
+        # The private index references objects that are gone (e.g. pruned by gc
+        # after the snapshots holding them were deleted); rebuild it once.
+        _seed_index(git_dir, index_path)
+        changed, excluded, tree = _build_tree(cwd, env, policy, lap)
+
+    parent_commit = resolve_commit(parent, cwd) if parent else None
+    args = ["-c", "commit.gpgsign=false", "commit-tree", tree, "-m", message]
+    if parent_commit:
+        args.extend(["-p", parent_commit])
+    commit = _run_git_command(
+        args, cwd=cwd, check=True, env={**env, **_IDENTITY_ENV}
+    ).stdout.strip()
+    _write_excluded_paths(git_dir / EXCLUDED_PATHS_NAME, commit, excluded)
+    lap("commit")
+
+    after = count_objects(cwd)
+    return SnapshotResult(
+        commit=commit,
+        tree=tree,
+        parent=parent_commit,
+        changed_paths=len(changed),
+        excluded_paths=excluded,
+        objects_written=max(0, after.loose - before.loose),
+        objects=after,
+        timings_ms=timings,
+    )
+
+
+def _write_excluded_paths(path: Path, commit: str, excluded: list[str]) -> None:
+    # Written to a temporary file first so readers never see a partial list. A
+    # failed write leaves the previous list, which names another commit.
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        tmp_path.write_text(
+            f"{commit}\n" + "\0".join(excluded),
+            encoding="utf-8",
+            errors="surrogateescape",
+        )
+        tmp_path.replace(path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+def read_excluded_paths(commit: str, cwd: str | Path) -> frozenset[str]:
+    """Return the paths ``create_snapshot`` left out of ``commit``.
+
+    The list is only kept for the latest snapshot; for older commits (or if it
+    is missing) an empty set is returned.
+    """
+    path = get_git_dir(cwd) / EXCLUDED_PATHS_NAME
+    try:
+        content = path.read_text(encoding="utf-8", errors="surrogateescape")
+    except OSError:
+        return frozenset()
+    header, _, paths = content.partition("\n")
+    if header.strip() != commit:
+        return frozenset()
+    return frozenset(p for p in paths.split("\0") if p)
+
+
+def seed_base_index(commit: str, cwd: str | Path) -> dict[str, str]:
+    """Prepare a private index describing ``commit`` for diffing the work tree.
+
+    The snapshot index is copied while it still describes ``commit`` (it does
+    until the run's next snapshot), so its stat cache spares hashing unchanged
+    files; otherwise the index is read from the commit's tree.
+
+    Returns:
+        Environment selecting the index (``GIT_INDEX_FILE``)
+    """
+    git_dir = get_git_dir(cwd)
+    index_path = git_dir / BASE_INDEX_NAME
+    env = {"GIT_INDEX_FILE": str(index_path)}
+    snapshot_index = git_dir / SNAPSHOT_INDEX_NAME
+    if snapshot_index.is_file():
+        shutil.copyfile(snapshot_index, index_path)
+        written = _run_git_command(["write-tree"], cwd=cwd, check=False, env=env)
+        tree = _run_git_command(
+            ["rev-parse", "--verify", "--quiet", f"{commit}^{{tree}}"],
+            cwd=cwd,
+            check=False,
+        )
+        if written.returncode == 0 and written.stdout.strip() == tree.stdout.strip():
+            return env
+    _run_git_command(["read-tree", commit], cwd=cwd, check=True, env=env)
+    return env
+
+
+def adopt_snapshot(commit: str, cwd: str | Path) -> None:
+    """Make ``commit`` the first commit of an unborn branch.
+
+    The user's index is replaced by the snapshot index, which describes exactly
+    that commit, so the working tree shows up as clean.
+    """
+    _run_git_command(["update-ref", "HEAD", commit, ""], cwd=cwd, check=True)
+    git_dir = get_git_dir(cwd)
+    index_path = git_dir / SNAPSHOT_INDEX_NAME
+    if index_path.is_file():
+        shutil.copyfile(index_path, git_dir / "index")
+    else:
+        _run_git_command(["read-tree", commit], cwd=cwd, check=True)
@@ -0,0 +1,127 @@
+import struct
+import zlib
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# PNG color type -> samples per pixel (8-bit, non-palette images only).
+_CHANNELS = {0: 1, 2: 3, 4: 2, 6: 4}
+
+
+def decode_png_grayscale(data: bytes) -> tuple[int, int, list[int]]:
+    """Decode a small 8-bit PNG into grayscale pixels (row-major).
+
+    Only what Chrome's screenshot encoder produces is supported (8-bit gray/RGB,
+    with or without alpha, non-interlaced); meant for tiny frames, not photos.
+
+    Raises:
+        ValueError: The data is not a supported PNG.
+    """
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError("not a PNG")
+
+    width = height = channels = 0
+    idat: list[bytes] = []
+    pos = len(PNG_SIGNATURE)
+    while pos + 8 <= len(data):
+        length, chunk_type = struct.unpack(">I4s", data[pos : pos + 8])
+        chunk = data[pos + 8 : pos + 8 + length]
+        pos += 12 + length
+        if chunk_type == b"IHDR":
+            width, height, depth, color_type, _, _, interlace = struct.unpack(
+                ">IIBBBBB", chunk
+            )
+            channels = _CHANNELS.get(color_type, 0)
+            if depth != 8 or interlace or not channels:
+                raise ValueError("unsupported PNG format")
+        elif chunk_type == b"IDAT":
+            idat.append(chunk)
+        elif chunk_type == b"IEND":
+            break
+    if not width or not height or not idat:
+        raise ValueError("incomplete PNG")
+
+    raw = zlib.decompress(b"".join(idat))
+    stride = width * channels
+    if len(raw) < (stride + 1) * height:
+        raise ValueError("truncated PNG data")
+
+    pixels: list[int] = []
+    prev = bytearray(stride)
+    offset = 0
+    for _ in range(height):
+        filter_type = raw[offset]
+        line = bytearray(raw[offset + 1 : offset + 1 + stride])
+        offset += stride + 1
+        _unfilter(filter_type, line, prev, channels)
+        if channels >= 3:
+            pixels.extend(
+                (line[x] * 299 + line[x + 1] * 587 + line[x + 2] * 114) // 1000
+                for x in range(0, stride, channels)
+            )
+        else:
+            pixels.extend(line[x] for x in range(0, stride, channels))
+        prev = line
+    return width, height, pixels
+
+
+def _unfilter(filter_type: int, line: bytearray, prev: bytearray, bpp: int) -> None:
+    if filter_type == 0:
+        return
+    for x in range(len(line)):
+        left = line[x - bpp] if x >= bpp else 0
+        up = prev[x]
+        if filter_type == 1:
+            predictor = left
+        elif filter_type == 2:
+            predictor = up
+        elif filter_type == 3:
+            predictor = (left + up) // 2
+        elif filter_type == 4:
+            up_left = prev[x - bpp] if x >= bpp else 0
+            estimate = left + up - up_left
+            dist_left = abs(estimate - left)
+            dist_up = abs(estimate - up)
+            dist_up_left = abs(estimate - up_left)
+            if dist_left <= dist_up and dist_left <= dist_up_left:
+                predictor = left
+            elif dist_up <= dist_up_left:
+                predictor = up
+            else:
+                predictor = up_left
+        else:
+            raise ValueError(f"unknown PNG filter {filter_type}")
+        line[x] = (line[x] + predictor) & 0xFF
+
+
+def dhash(width: int, height: int, pixels: list[int], hash_size: int = 16) -> int:
+    """Difference hash of a grayscale image (``hash_size ** 2`` bits).
+
+    The image is box-averaged to ``(hash_size + 1) x hash_size`` cells; each bit
+    says whether a cell is brighter than its right neighbour.
+    """
+    cols = hash_size + 1
+    rows = hash_size
+    cells: list[float] = []
+    for row in range(rows):
+        y0 = row * height // rows
+        y1 = max(y0 + 1, (row + 1) * height // rows)
+        for col in range(cols):
+            x0 = col * width // cols
+            x1 = max(x0 + 1, (col + 1) * width // cols)
+            total = 0
+            for y in range(y0, min(y1, height)):
+                base = y * width
+                total += sum(pixels[base + x0 : base + min(x1, width)])
+            cells.append(total / ((y1 - y0) * (x1 - x0)))
+
+    value = 0
+    for row in range(rows):
+        for col in range(hash_size):
+            left = cells[row * cols + col]
+            right = cells[row * cols + col + 1]
+            value = (value << 1) | (1 if left > right else 0)
+    return value
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
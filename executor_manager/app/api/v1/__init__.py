@@ -9,6 +9,7 @@ from app.api.v1 import (
     user_input_requests,
     workspace,
 )
+from app.core.http_client import get_http_client_stats
 from app.core.settings import get_settings
 from app.schemas.response import Response
 from app.scheduler.scheduler_config import scheduler
@@ -46,5 +47,6 @@ async def health():
             "service": settings.app_name,
             "status": "healthy",
             "scheduler_running": scheduler.running,
+            "http_client": get_http_client_stats(),
         }
     )
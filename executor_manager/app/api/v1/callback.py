@@ -3,7 +3,11 @@ import logging
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 
-from app.schemas.callback import AgentCallbackRequest, CallbackReceiveResponse
+from app.schemas.callback import (
+    AgentCallbackBatchRequest,
+    AgentCallbackRequest,
+    CallbackReceiveResponse,
+)
 from app.schemas.response import Response, ResponseSchema
 from app.services.callback_service import CallbackService
 
@@ -18,3 +22,13 @@ async def receive_callback(callback: AgentCallbackRequest) -> JSONResponse:
     """Receive callback from Executor and forward to Backend."""
     result = await callback_service.process_callback(callback)
     return Response.success(data=result.model_dump(), message="Callback received")
+
+
+@router.post("/batch", response_model=ResponseSchema[list[CallbackReceiveResponse]])
+async def receive_callback_batch(batch: AgentCallbackBatchRequest) -> JSONResponse:
+    """Receive a batch of callbacks from Executor and forward it to Backend."""
+    results = await callback_service.process_callback_batch(batch.callbacks)
+    return Response.success(
+        data=[result.model_dump() for result in results],
+        message="Callbacks received",
+    )
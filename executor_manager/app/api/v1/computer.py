@@ -1,6 +1,10 @@
 from fastapi import APIRouter, File, Form, UploadFile
 
-from app.schemas.computer import ComputerScreenshotUploadResponse
+from app.schemas.computer import (
+    ComputerScreenshotCopyRequest,
+    ComputerScreenshotCopyResponse,
+    ComputerScreenshotUploadResponse,
+)
 from app.schemas.response import Response, ResponseSchema
 from app.services.computer_service import ComputerService
 
@@ -17,13 +21,30 @@ async def upload_browser_screenshot(
     session_id: str = Form(...),
     tool_use_id: str = Form(...),
     file: UploadFile = File(...),
+    thumbnail: UploadFile | None = File(None),
 ):
-    """Upload a browser screenshot produced by the executor."""
+    """Upload a browser screenshot (and optional thumbnail) produced by the executor."""
     raw = await file.read()
+    thumbnail_raw = await thumbnail.read() if thumbnail is not None else None
     payload = computer_service.upload_browser_screenshot(
         session_id=session_id,
         tool_use_id=tool_use_id,
         content_type=file.content_type or "image/png",
         data=raw,
+        thumbnail=thumbnail_raw,
     )
     return Response.success(data=payload.model_dump(), message="Screenshot uploaded")
+
+
+@router.post(
+    "/screenshots/copy",
+    response_model=ResponseSchema[ComputerScreenshotCopyResponse],
+)
+async def copy_browser_screenshot(request: ComputerScreenshotCopyRequest):
+    """Reuse the screenshot of an earlier tool call whose page did not change."""
+    payload = computer_service.copy_browser_screenshot(
+        session_id=request.session_id,
+        tool_use_id=request.tool_use_id,
+        source_tool_use_id=request.source_tool_use_id,
+    )
+    return Response.success(data=payload.model_dump(), message="Screenshot copied")
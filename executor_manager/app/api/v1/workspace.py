@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import APIRouter, Query
 from fastapi.responses import FileResponse
 from fastapi.responses import JSONResponse
@@ -6,10 +8,12 @@ from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
 from app.schemas.response import Response, ResponseSchema
 from app.schemas.workspace import FileNode
+from app.services.workspace_export_service import WorkspaceExportService
 from app.services.workspace_manager import WorkspaceManager
 
 router = APIRouter(prefix="/workspace", tags=["workspace"])
 workspace_manager = WorkspaceManager()
+workspace_export_service = WorkspaceExportService()
 
 
 @router.get("/stats", response_model=ResponseSchema[dict])
@@ -48,6 +52,18 @@ async def archive_workspace(
         raise AppException(error_code=ErrorCode.WORKSPACE_ARCHIVE_FAILED)
 
 
+@router.post("/export-archive/{session_id}", response_model=ResponseSchema[dict])
+async def build_export_archive(session_id: str) -> JSONResponse:
+    """Build the exported workspace archive (archive.zip) if it is out of date."""
+    archive_key = await asyncio.to_thread(
+        workspace_export_service.build_archive, session_id
+    )
+    return Response.success(
+        data={"archive_key": archive_key},
+        message="Workspace archive ready" if archive_key else "No workspace archive",
+    )
+
+
 @router.delete("/{user_id}/{session_id}", response_model=ResponseSchema[dict])
 async def delete_workspace(
     user_id: str,
@@ -34,6 +34,7 @@ class ErrorCode(Enum):
 
     CONTAINER_START_FAILED = (31001, "Failed to start container")
     CONTAINER_NOT_FOUND = (31002, "Container not found")
+    CONTAINER_CAPACITY_EXHAUSTED = (31003, "No executor container capacity available")
 
     INTERNAL_ERROR = (50000, "Internal server error")
 
@@ -0,0 +1,110 @@
+import logging
+from typing import Any
+
+import httpx
+
+from app.core.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+_client: httpx.AsyncClient | None = None
+# Long-polls hold a connection for their whole wait, so they get their own pool and
+# cannot starve callbacks and run claims on the shared one.
+_long_poll_client: httpx.AsyncClient | None = None
+# Connection reuse counters reported on /health.
+_requests = 0
+_new_connections = 0
+
+
+async def _trace(event_name: str, info: dict[str, Any]) -> None:
+    global _new_connections
+    # httpcore emits connect events only when the pool opens a new connection.
+    if event_name == "connection.connect_tcp.complete":
+        _new_connections += 1
+
+
+async def _on_request(request: httpx.Request) -> None:
+    global _requests
+    _requests += 1
+    request.extensions["trace"] = _trace
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _build_client(limits: httpx.Limits) -> httpx.AsyncClient:
+    settings = get_settings()
+    http2 = settings.http_client_http2
+    if http2 and not _http2_available():
+        logger.warning("http_client_http2_unavailable_falling_back_to_http1")
+        http2 = False
+
+    # Transport-level retries only cover establishing a connection (connect
+    # errors/timeouts), never a sent request, so they are safe for POSTs. Failed or
+    # timed-out requests are not retried here.
+    transport = httpx.AsyncHTTPTransport(
+        http2=http2,
+        limits=limits,
+        retries=max(0, settings.http_client_connect_retries),
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(settings.http_client_timeout_seconds),
+        event_hooks={"request": [_on_request]},
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled HTTP client (created lazily)."""
+    global _client
+    if _client is None or _client.is_closed:
+        settings = get_settings()
+        _client = _build_client(
+            httpx.Limits(
+                max_connections=settings.http_client_max_connections,
+                max_keepalive_connections=settings.http_client_max_keepalive_connections,
+                keepalive_expiry=settings.http_client_keepalive_expiry_seconds,
+            )
+        )
+    return _client
+
+
+def get_long_poll_http_client() -> httpx.AsyncClient:
+    """Return the pooled HTTP client reserved for long-poll requests.
+
+    Each waiter holds a connection for its whole wait, so the pool has no
+    connection cap (a capped pool would fail extra waiters with PoolTimeout);
+    only the number of idle connections kept alive is bounded.
+    """
+    global _long_poll_client
+    if _long_poll_client is None or _long_poll_client.is_closed:
+        settings = get_settings()
+        _long_poll_client = _build_client(
+            httpx.Limits(
+                max_connections=None,
+                max_keepalive_connections=max(
+                    0, settings.http_client_long_poll_max_keepalive_connections
+                ),
+                keepalive_expiry=settings.http_client_keepalive_expiry_seconds,
+            )
+        )
+    return _long_poll_client
+
+
+async def close_http_client() -> None:
+    global _client, _long_poll_client
+    clients = (_client, _long_poll_client)
+    _client = _long_poll_client = None
+    for client in clients:
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+
+def get_http_client_stats() -> dict[str, int]:
+    return {"requests": _requests, "new_connections": _new_connections}
@@ -1,8 +1,10 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 
+from app.core.http_client import close_http_client
 from app.core.settings import get_settings
 from app.scheduler.scheduler_config import scheduler
 
@@ -13,10 +15,26 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     settings = get_settings()
 
+    from app.services.workspace_manager import WorkspaceManager
+
+    logger.info("Rebuilding workspace session index...")
+    await asyncio.to_thread(WorkspaceManager().rebuild_session_index)
+
     logger.info("Starting APScheduler...")
     scheduler.start()
     logger.info("APScheduler started")
 
+    container_pool = None
+    if (
+        settings.executor_warm_pool_size > 0
+        or settings.executor_browser_warm_pool_size > 0
+    ):
+        from app.scheduler.task_dispatcher import TaskDispatcher
+
+        logger.info("Starting executor warm pool...")
+        container_pool = TaskDispatcher.get_container_pool()
+        await container_pool.start_warm_pool()
+
     pull_service = None
     pull_job_ids: list[str] = []
     if settings.task_pull_enabled:
@@ -77,6 +95,13 @@ async def lifespan(app: FastAPI):
         await pull_service.shutdown()
         logger.info("Run pull service stopped")
 
+    if container_pool:
+        logger.info("Stopping executor warm pool...")
+        await container_pool.stop_warm_pool()
+        logger.info("Executor warm pool stopped")
+
+    await close_http_client()
+
     logger.info("Shutting down APScheduler...")
     scheduler.shutdown()
     logger.info("APScheduler shut down")
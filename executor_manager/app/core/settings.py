@@ -20,6 +20,31 @@ class Settings(BaseSettings):
     executor_url: str = Field(default="http://localhost:8080")
     callback_base_url: str = Field(default="http://localhost:8001")
 
+    # Shared, connection-pooled HTTP client (manager -> backend / executor hops)
+    http_client_max_connections: int = Field(
+        default=100, alias="HTTP_CLIENT_MAX_CONNECTIONS"
+    )
+    http_client_max_keepalive_connections: int = Field(
+        default=20, alias="HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS"
+    )
+    http_client_keepalive_expiry_seconds: float = Field(
+        default=30.0, alias="HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS"
+    )
+    http_client_timeout_seconds: float = Field(
+        default=5.0, alias="HTTP_CLIENT_TIMEOUT_SECONDS"
+    )
+    # Retries establishing a connection only; sent requests are never retried.
+    http_client_connect_retries: int = Field(
+        default=2, alias="HTTP_CLIENT_CONNECT_RETRIES"
+    )
+    # Long-polls (user input waits) use a separate, uncapped pool since each holds
+    # a connection for its whole wait; this bounds only its idle connections.
+    http_client_long_poll_max_keepalive_connections: int = Field(
+        default=50, alias="HTTP_CLIENT_LONG_POLL_MAX_KEEPALIVE_CONNECTIONS"
+    )
+    # Requires the optional `h2` package; falls back to HTTP/1.1 when missing.
+    http_client_http2: bool = Field(default=False, alias="HTTP_CLIENT_HTTP2")
+
     # Scheduler configuration
     max_concurrent_tasks: int = Field(default=5)
     task_timeout_seconds: int = Field(default=3600)
@@ -38,6 +63,22 @@ class Settings(BaseSettings):
     # include staging skills/attachments + spawning the executor container, which may take
     # longer than 30s on slow networks or large repos.
     task_claim_lease_seconds: int = Field(default=180, alias="TASK_CLAIM_LEASE_SECONDS")
+    # Long-poll duration of interval pull rules (0 disables long-polling and keeps
+    # the pure interval polling).
+    task_pull_wait_seconds: float = Field(default=20.0, alias="TASK_PULL_WAIT_SECONDS")
+
+    # Per-user config lookups (env vars, MCP, skills, subagents, slash commands,
+    # CLAUDE.md) are reused while the backend's user config version is unchanged.
+    user_config_cache_max_users: int = Field(
+        default=1024, alias="USER_CONFIG_CACHE_MAX_USERS"
+    )
+    user_config_cache_ttl_seconds: float = Field(
+        default=600.0, alias="USER_CONFIG_CACHE_TTL_SECONDS"
+    )
+    # Lookups that carry secrets (env map, MCP configs) expire sooner.
+    user_config_cache_secret_ttl_seconds: float = Field(
+        default=60.0, alias="USER_CONFIG_CACHE_SECRET_TTL_SECONDS"
+    )
 
     # Optional schedule config file (TOML/JSON). When provided, it becomes the source of truth.
     schedule_config_path: str | None = Field(default=None, alias="SCHEDULE_CONFIG_PATH")
@@ -48,7 +89,7 @@ class Settings(BaseSettings):
         default=30, alias="SCHEDULED_TASKS_DISPATCH_INTERVAL_SECONDS"
     )
     scheduled_tasks_dispatch_batch_size: int = Field(
-        default=50, alias="SCHEDULED_TASKS_DISPATCH_BATCH_SIZE"
+        default=200, alias="SCHEDULED_TASKS_DISPATCH_BATCH_SIZE"
     )
 
     # Queue-based scheduling (AgentRun.schedule_mode)
@@ -92,7 +133,16 @@ class Settings(BaseSettings):
     default_model: str = Field(
         default="claude-sonnet-4-20250514", alias="DEFAULT_MODEL"
     )
+    # Cap on live executor containers on this host (ephemeral and persistent); runs are
+    # only claimed while a slot is free. <= 0 disables the cap.
     max_executor_containers: int = Field(default=10, alias="MAX_EXECUTOR_CONTAINERS")
+    # Host headroom required to start new containers (0 disables each check; all off
+    # by default since sensible floors depend on the host).
+    admission_min_memory_mb: int = Field(default=0, alias="ADMISSION_MIN_MEMORY_MB")
+    admission_min_disk_mb: int = Field(default=0, alias="ADMISSION_MIN_DISK_MB")
+    admission_max_load_per_cpu: float = Field(
+        default=0.0, alias="ADMISSION_MAX_LOAD_PER_CPU"
+    )
     executor_image: str = Field(
         default="ghcr.io/poco-ai/poco-executor:lite", alias="EXECUTOR_IMAGE"
     )
@@ -101,10 +151,38 @@ class Settings(BaseSettings):
     executor_browser_image: str | None = Field(
         default="ghcr.io/poco-ai/poco-executor:full", alias="EXECUTOR_BROWSER_IMAGE"
     )
+    # Max executor containers being created concurrently (docker run + readiness wait).
+    container_create_concurrency: int = Field(
+        default=4, alias="CONTAINER_CREATE_CONCURRENCY"
+    )
+    # Warm pool: idle, already-healthy executor containers that new ephemeral sessions are
+    # bound to instantly (0 disables the pool for that image).
+    executor_warm_pool_size: int = Field(default=0, alias="EXECUTOR_WARM_POOL_SIZE")
+    executor_browser_warm_pool_size: int = Field(
+        default=0, alias="EXECUTOR_BROWSER_WARM_POOL_SIZE"
+    )
+    executor_warm_pool_refill_interval_seconds: int = Field(
+        default=10, alias="EXECUTOR_WARM_POOL_REFILL_INTERVAL_SECONDS"
+    )
     # Default desktop viewport used by the Playwright MCP inside executor containers.
     poco_browser_viewport_size: str = Field(
         default="1366x768", alias="POCO_BROWSER_VIEWPORT_SIZE"
     )
+    # Browser step screenshots: jpeg | webp | png, compression quality, thumbnail width
+    # (0 disables) and the perceptual-hash distance under which a frame is reused
+    # instead of uploaded (negative disables deduplication).
+    poco_browser_screenshot_format: str = Field(
+        default="jpeg", alias="POCO_BROWSER_SCREENSHOT_FORMAT"
+    )
+    poco_browser_screenshot_quality: int = Field(
+        default=80, alias="POCO_BROWSER_SCREENSHOT_QUALITY"
+    )
+    poco_browser_screenshot_thumbnail_width: int = Field(
+        default=320, alias="POCO_BROWSER_SCREENSHOT_THUMBNAIL_WIDTH"
+    )
+    poco_browser_screenshot_dedup_distance: int = Field(
+        default=4, alias="POCO_BROWSER_SCREENSHOT_DEDUP_DISTANCE"
+    )
     # When the manager spawns executor containers via the Docker daemon, it maps the executor
     # service to a host port and then calls back into it. This host must be reachable from the
     # manager process itself (e.g. "localhost" on bare-metal, or "host.docker.internal" when
@@ -129,6 +207,15 @@ class Settings(BaseSettings):
     workspace_ignore_dot_files: bool = Field(
         default=True, alias="WORKSPACE_IGNORE_DOT_FILES"
     )
+    # Incremental export: keep a per-session index of what was last uploaded and only
+    # upload new/changed files. archive.zip is built on download, and only rebuilt when
+    # the file set changed since the last build.
+    workspace_export_incremental: bool = Field(
+        default=True, alias="WORKSPACE_EXPORT_INCREMENTAL"
+    )
+    workspace_export_archive_enabled: bool = Field(
+        default=True, alias="WORKSPACE_EXPORT_ARCHIVE_ENABLED"
+    )
     s3_endpoint: str | None = Field(default=None, alias="S3_ENDPOINT")
     s3_access_key: str | None = Field(default=None, alias="S3_ACCESS_KEY")
     s3_secret_key: str | None = Field(default=None, alias="S3_SECRET_KEY")
@@ -140,6 +227,15 @@ class Settings(BaseSettings):
     )
     s3_read_timeout_seconds: int = Field(default=60, alias="S3_READ_TIMEOUT_SECONDS")
     s3_max_attempts: int = Field(default=3, alias="S3_MAX_ATTEMPTS")
+    # Total concurrent S3 requests for bulk transfers (skill/input staging, workspace
+    # export), split between files and the multipart parts of each file.
+    s3_transfer_max_workers: int = Field(default=8, alias="S3_TRANSFER_MAX_WORKERS")
+    s3_multipart_threshold_mb: int = Field(
+        default=16, alias="S3_MULTIPART_THRESHOLD_MB"
+    )
+    s3_multipart_chunksize_mb: int = Field(
+        default=16, alias="S3_MULTIPART_CHUNKSIZE_MB"
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env",
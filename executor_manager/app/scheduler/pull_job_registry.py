@@ -30,6 +30,8 @@ def register_pull_jobs(
         return job_ids
 
     now_utc = datetime.now(timezone.utc)
+    # Schedule modes served by the long-poll loop; None means all modes.
+    long_poll_modes: list[str] | None = []
 
     for rule in config.rules:
         if not rule.enabled:
@@ -47,6 +49,13 @@ def register_pull_jobs(
                 next_run_time=now_utc if rule.start_immediately else None,
             )
             job_ids.append(job_id)
+            if long_poll_modes is not None:
+                if rule.schedule_modes:
+                    long_poll_modes.extend(
+                        m for m in rule.schedule_modes if m not in long_poll_modes
+                    )
+                else:
+                    long_poll_modes = None
             continue
 
         if isinstance(rule, WindowPullRule):
@@ -85,6 +94,11 @@ def register_pull_jobs(
             )
             job_ids.append(poll_job_id)
 
+    # Interval jobs stay registered as a fallback; they skip while the long-poll
+    # holds the free capacity.
+    if long_poll_modes is None or long_poll_modes:
+        pull_service.start_long_poll(long_poll_modes)
+
     return job_ids
 
 
@@ -51,6 +51,16 @@ class WorkspaceState(BaseModel):
     last_change: datetime
 
 
+class WorkspaceStateDelta(BaseModel):
+    """Workspace changes relative to the previously reported workspace state."""
+
+    repository: str | None = None
+    branch: str | None = None
+    last_change: datetime
+    file_keys: list[str] = Field(default_factory=list)  # "<status>:<path>"
+    upserted_files: list[FileChange] = Field(default_factory=list)
+
+
 class BrowserState(BaseModel):
     """Browser/desktop capability state exposed to the UI."""
 
@@ -67,6 +77,19 @@ class AgentCurrentState(BaseModel):
     current_step: str | None = None
 
 
+class AgentStateDelta(BaseModel):
+    """Changed sections of the agent state relative to ``base_seq``."""
+
+    base_seq: int
+    changed: list[str] = Field(default_factory=list)
+    todos: list[TodoItem] | None = None
+    mcp_status: list[McpStatus] | None = None
+    browser: BrowserState | None = None
+    workspace_state: WorkspaceState | None = None
+    current_step: str | None = None
+    workspace_delta: WorkspaceStateDelta | None = None
+
+
 class AgentCallbackRequest(BaseModel):
     """Agent execution callback request."""
 
@@ -77,6 +100,8 @@ class AgentCallbackRequest(BaseModel):
     error_message: str | None = None
     new_message: object | None = None
     state_patch: AgentCurrentState | None = None
+    state_delta: AgentStateDelta | None = None
+    state_seq: int | None = None
     sdk_session_id: str | None = None
     workspace_files_prefix: str | None = None
     workspace_manifest_key: str | None = None
@@ -84,6 +109,12 @@ class AgentCallbackRequest(BaseModel):
     workspace_export_status: str | None = None
 
 
+class AgentCallbackBatchRequest(BaseModel):
+    """A batch of executor callbacks for one session, in send order."""
+
+    callbacks: list[AgentCallbackRequest] = Field(default_factory=list)
+
+
 class CallbackReceiveResponse(BaseModel):
     """Callback receive response."""
 
@@ -91,3 +122,5 @@ class CallbackReceiveResponse(BaseModel):
     session_id: str
     callback_status: CallbackStatus
     progress: int
+    # Backend dropped the state delta; the executor must send a full snapshot next.
+    state_resync_required: bool = False
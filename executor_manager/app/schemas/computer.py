@@ -7,3 +7,16 @@ class ComputerScreenshotUploadResponse(BaseModel):
     key: str
     content_type: str
     size_bytes: int
+    thumbnail_key: str | None = None
+
+
+class ComputerScreenshotCopyRequest(BaseModel):
+    session_id: str
+    tool_use_id: str
+    source_tool_use_id: str
+
+
+class ComputerScreenshotCopyResponse(BaseModel):
+    session_id: str
+    tool_use_id: str
+    keys: list[str]
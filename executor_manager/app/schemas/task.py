@@ -93,3 +93,5 @@ class ContainerStatsResponse(BaseModel):
     persistent_containers: int
     ephemeral_containers: int
     containers: list[dict]
+    warm_pool: dict | None = None
+    admission: dict | None = None
@@ -0,0 +1,191 @@
+import asyncio
+import logging
+import os
+import shutil
+import time
+from collections.abc import Callable
+from typing import Any
+
+import docker
+
+from app.core.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Docker is asked for the live container count at most this often.
+DOCKER_COUNT_TTL_SECONDS = 5.0
+
+
+def _available_memory_mb() -> int | None:
+    """MemAvailable from /proc/meminfo, or None where it is not available."""
+    try:
+        with open("/proc/meminfo", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        return None
+    return None
+
+
+def _free_disk_mb(path: str) -> int | None:
+    try:
+        return shutil.disk_usage(path).free // (1024 * 1024)
+    except OSError:
+        return None
+
+
+def _load_per_cpu() -> float | None:
+    try:
+        load_1m = os.getloadavg()[0]
+    except (AttributeError, OSError):
+        return None
+    return load_1m / (os.cpu_count() or 1)
+
+
+class AdmissionController:
+    """Decides whether the host can take another executor container.
+
+    Capacity is ``MAX_EXECUTOR_CONTAINERS`` minus live containers (ephemeral and
+    persistent, including ones Docker still runs from before a restart) minus
+    slots reserved for runs being claimed or started. Host headroom (memory,
+    workspace disk, load) must also be above the configured floors; each check
+    is disabled by setting it to 0.
+    """
+
+    def __init__(
+        self,
+        docker_client: docker.DockerClient,
+        *,
+        tracked_count: Callable[[], int],
+        warm_count: Callable[[], int],
+    ) -> None:
+        settings = get_settings()
+        self.docker_client = docker_client
+        self.max_containers = settings.max_executor_containers
+        self.min_memory_mb = settings.admission_min_memory_mb
+        self.min_disk_mb = settings.admission_min_disk_mb
+        self.max_load_per_cpu = settings.admission_max_load_per_cpu
+        self.workspace_root = settings.workspace_root
+        self._tracked_count = tracked_count
+        self._warm_count = warm_count
+        self._reserved = 0
+        self._docker_count: int | None = None
+        self._docker_counted_at = 0.0
+        self._refresh_task: asyncio.Task[None] | None = None
+        self.rejected = 0
+
+    @property
+    def reserved(self) -> int:
+        return self._reserved
+
+    def reserve(self, count: int = 1) -> None:
+        self._reserved += count
+
+    def release(self, count: int = 1) -> None:
+        self._reserved = max(0, self._reserved - count)
+
+    def live_containers(self) -> int:
+        """Executor containers serving sessions (idle warm containers excluded)."""
+        tracked = self._tracked_count()
+        if self._docker_count is None:
+            return tracked
+        # Warm containers carry the same owner label; only idle ones are free.
+        return max(tracked, self._docker_count - self._warm_count())
+
+    async def refresh(self, *, force: bool = False) -> None:
+        """Re-count live containers in Docker when the cached count is stale."""
+        if (
+            not force
+            and time.monotonic() - self._docker_counted_at < DOCKER_COUNT_TTL_SECONDS
+        ):
+            return
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_docker_count())
+        await asyncio.shield(self._refresh_task)
+
+    async def _refresh_docker_count(self) -> None:
+        try:
+            containers = await asyncio.to_thread(
+                self.docker_client.containers.list,
+                filters={"label": "owner=executor_manager"},
+            )
+        except Exception as exc:
+            logger.warning("admission_docker_count_failed", extra={"error": str(exc)})
+            return
+        finally:
+            self._docker_counted_at = time.monotonic()
+        self._docker_count = len(containers)
+
+    def pressure_reason(self) -> str | None:
+        """Why the host cannot take another container right now, if it cannot."""
+        if self.min_memory_mb > 0:
+            memory_mb = _available_memory_mb()
+            if memory_mb is not None and memory_mb < self.min_memory_mb:
+                return f"memory_available_mb={memory_mb}"
+        if self.min_disk_mb > 0:
+            disk_mb = _free_disk_mb(self.workspace_root)
+            if disk_mb is not None and disk_mb < self.min_disk_mb:
+                return f"disk_free_mb={disk_mb}"
+        if self.max_load_per_cpu > 0:
+            load = _load_per_cpu()
+            if load is not None and load > self.max_load_per_cpu:
+                return f"load_per_cpu={load:.2f}"
+        return None
+
+    def free_slots(self) -> int | None:
+        """Container slots left under the cap (None when uncapped)."""
+        if self.max_containers <= 0:
+            return None
+        return max(0, self.max_containers - self.live_containers() - self._reserved)
+
+    def available_slots(self) -> int | None:
+        """Slots new runs may be claimed for: 0 under host pressure, None if unlimited."""
+        if self.pressure_reason() is not None:
+            return 0
+        return self.free_slots()
+
+    def check_reserved(self) -> str | None:
+        """Re-check a reserved slot right before its container is created.
+
+        Returns:
+            The rejection reason, or None if the run may start.
+        """
+        reason = self.pressure_reason()
+        if (
+            reason is None
+            and self.max_containers > 0
+            and self.live_containers() + self._reserved > self.max_containers
+        ):
+            reason = "max_executor_containers"
+        if reason is not None:
+            self.rejected += 1
+        return reason
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current capacity and utilization, for the load endpoint."""
+        live = self.live_containers()
+        capacity = self.max_containers if self.max_containers > 0 else None
+        return {
+            "capacity": capacity,
+            "live_containers": live,
+            "reserved": self._reserved,
+            "free_slots": self.free_slots(),
+            "utilization": (
+                round((live + self._reserved) / capacity, 3) if capacity else None
+            ),
+            "pressure": self.pressure_reason(),
+            "rejected": self.rejected,
+            "host": {
+                "memory_available_mb": _available_memory_mb(),
+                "disk_free_mb": _free_disk_mb(self.workspace_root),
+                "load_per_cpu": (
+                    round(load, 2) if (load := _load_per_cpu()) is not None else None
+                ),
+            },
+            "limits": {
+                "min_memory_mb": self.min_memory_mb,
+                "min_disk_mb": self.min_disk_mb,
+                "max_load_per_cpu": self.max_load_per_cpu,
+            },
+        }
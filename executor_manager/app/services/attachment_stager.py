@@ -9,7 +9,7 @@ from urllib.parse import urlparse
 
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
-from app.services.storage_service import S3StorageService
+from app.services.storage_service import DownloadItem, S3StorageService
 from app.services.workspace_manager import WorkspaceManager
 
 logger = logging.getLogger(__name__)
@@ -45,6 +45,7 @@ class AttachmentStager:
         inputs_root.mkdir(parents=True, exist_ok=True)
 
         staged: list[dict[str, Any]] = []
+        downloads: list[DownloadItem] = []
         for item in inputs:
             if not isinstance(item, dict):
                 continue
@@ -68,23 +69,7 @@ class AttachmentStager:
                     )
                 destination = inputs_root / rel_path
                 destination.parent.mkdir(parents=True, exist_ok=True)
-                step_started = time.perf_counter()
-                self.storage_service.download_file(
-                    key=str(s3_key), destination=destination
-                )
-                logger.info(
-                    "timing",
-                    extra={
-                        "step": "input_stage_file_download",
-                        "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                        "user_id": user_id,
-                        "session_id": session_id,
-                        # "name" is reserved in LogRecord (logger name).
-                        "input_name": name or destination.name,
-                        "rel_path": rel_path,
-                        "s3_key": str(s3_key),
-                    },
-                )
+                downloads.append(DownloadItem(key=str(s3_key), destination=destination))
                 staged.append(
                     self._build_staged(item, rel_path, name or destination.name)
                 )
@@ -117,6 +102,9 @@ class AttachmentStager:
                 staged.append(self._build_staged(item, rel_path, name or repo_name))
                 continue
 
+        # File inputs are fetched together on the bounded transfer pool.
+        download_stats = self.storage_service.download_files(downloads)
+
         logger.info(
             "timing",
             extra={
@@ -126,6 +114,9 @@ class AttachmentStager:
                 "session_id": session_id,
                 "inputs_requested": len(inputs),
                 "inputs_staged": len(staged),
+                "files_downloaded": download_stats.objects,
+                "bytes_downloaded": download_stats.bytes,
+                "download_throughput_mb_s": download_stats.throughput_mb_s,
             },
         )
         return staged
@@ -1,5 +1,4 @@
-import httpx
-
+from app.core.http_client import get_http_client, get_long_poll_http_client
 from app.core.settings import get_settings
 from app.core.observability.request_context import (
     generate_request_id,
@@ -26,35 +25,53 @@ class BackendClient:
 
     async def create_session(self, user_id: str, config: dict) -> dict:
         """Create a session, returns session info dict with session_id and sdk_session_id."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/sessions",
-                json={"user_id": user_id, "config": config},
-                headers=self._trace_headers(),
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["data"]
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/sessions",
+            json={"user_id": user_id, "config": config},
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["data"]
 
     async def update_session_status(self, session_id: str, status: str) -> None:
         """Update session status."""
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(
-                f"{self.base_url}/api/v1/sessions/{session_id}",
-                json={"status": status},
-                headers=self._trace_headers(),
-            )
-            response.raise_for_status()
+        client = get_http_client()
+        response = await client.patch(
+            f"{self.base_url}/api/v1/sessions/{session_id}",
+            json={"status": status},
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
+
+    async def forward_callback(self, callback_data: dict) -> dict:
+        """Forward Executor callback to Backend and return its result."""
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/callback",
+            json=callback_data,
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
+        data = response.json().get("data")
+        return data if isinstance(data, dict) else {}
 
-    async def forward_callback(self, callback_data: dict) -> None:
-        """Forward Executor callback to Backend."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/callback",
-                json=callback_data,
-                headers=self._trace_headers(),
-            )
-            response.raise_for_status()
+    async def forward_callback_batch(self, callbacks: list[dict]) -> list[dict]:
+        """Forward a batch of Executor callbacks to Backend in one request.
+
+        Returns:
+            Backend's per-callback results, in order.
+        """
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/callback/batch",
+            json={"callbacks": callbacks},
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
+        data = response.json().get("data")
+        return [item if isinstance(item, dict) else {} for item in data or []]
 
     async def claim_run(
         self,
@@ -67,87 +84,143 @@ class BackendClient:
         if schedule_modes:
             payload["schedule_modes"] = schedule_modes
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/runs/claim",
-                json=payload,
-                headers=self._trace_headers(),
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data")
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/runs/claim",
+            json=payload,
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data")
+
+    async def claim_runs(
+        self,
+        worker_id: str,
+        lease_seconds: int = 30,
+        schedule_modes: list[str] | None = None,
+        limit: int = 1,
+        wait_seconds: float = 0,
+    ) -> list[dict]:
+        """Claim up to ``limit`` runs, long-polling up to ``wait_seconds``."""
+        payload: dict = {
+            "worker_id": worker_id,
+            "lease_seconds": lease_seconds,
+            "limit": limit,
+            "wait_seconds": wait_seconds,
+        }
+        if schedule_modes:
+            payload["schedule_modes"] = schedule_modes
+
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/runs/claim-batch",
+            json=payload,
+            headers=self._trace_headers(),
+            timeout=wait_seconds + self.settings.http_client_timeout_seconds,
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data") or []
 
     async def start_run(self, run_id: str, worker_id: str) -> dict:
         """Mark run as running."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/runs/{run_id}/start",
-                json={"worker_id": worker_id},
-                headers=self._trace_headers(),
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["data"]
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/runs/{run_id}/start",
+            json={"worker_id": worker_id},
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["data"]
 
     async def fail_run(
         self, run_id: str, worker_id: str, error_message: str | None = None
     ) -> dict:
         """Mark run as failed."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/runs/{run_id}/fail",
-                json={"worker_id": worker_id, "error_message": error_message},
-                headers=self._trace_headers(),
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["data"]
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/runs/{run_id}/fail",
+            json={"worker_id": worker_id, "error_message": error_message},
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["data"]
+
+    async def release_run(self, run_id: str, worker_id: str) -> dict:
+        """Return a claimed run to the queue (it could not be started here)."""
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/runs/{run_id}/release",
+            json={"worker_id": worker_id},
+            headers=self._trace_headers(),
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["data"]
 
     async def get_env_map(self, user_id: str) -> dict[str, str]:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/internal/env-vars/map",
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    "X-User-Id": user_id,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {}) or {}
+        client = get_http_client()
+        response = await client.get(
+            f"{self.base_url}/api/v1/internal/env-vars/map",
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {}) or {}
+
+    async def get_user_config_version(self, user_id: str) -> str:
+        """Fetch the version of the user's config inputs (changes on any edit)."""
+        client = get_http_client()
+        response = await client.get(
+            f"{self.base_url}/api/v1/internal/user-config/version",
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return str((data.get("data") or {}).get("version") or "")
 
     async def resolve_mcp_config(self, user_id: str, server_ids: list[int]) -> dict:
         """Resolve effective MCP config for execution based on selected server ids."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/internal/mcp-config/resolve",
-                json={"server_ids": server_ids},
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    "X-User-Id": user_id,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {}) or {}
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/internal/mcp-config/resolve",
+            json={"server_ids": server_ids},
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {}) or {}
 
     async def resolve_skill_config(self, user_id: str, skill_ids: list[int]) -> dict:
         """Resolve effective skill config for execution based on selected skill ids."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/internal/skill-config/resolve",
-                json={"skill_ids": skill_ids},
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    "X-User-Id": user_id,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {}) or {}
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/internal/skill-config/resolve",
+            json={"skill_ids": skill_ids},
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {}) or {}
 
     async def resolve_subagents(
         self, user_id: str, subagent_ids: list[int] | None
@@ -160,97 +233,115 @@ class BackendClient:
         payload: dict = {}
         if subagent_ids is not None:
             payload["subagent_ids"] = subagent_ids
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/internal/subagents/resolve",
-                json=payload,
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    "X-User-Id": user_id,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {}) or {}
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/internal/subagents/resolve",
+            json=payload,
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {}) or {}
 
     async def resolve_slash_commands(
         self, user_id: str, names: list[str] | None = None
     ) -> dict[str, str]:
         """Resolve enabled slash commands for execution (rendered markdown)."""
         payload: dict = {"names": names or []}
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/internal/slash-commands/resolve",
-                json=payload,
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    "X-User-Id": user_id,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            resolved = data.get("data", {}) or {}
-            if not isinstance(resolved, dict):
-                return {}
-            return {str(k): str(v) for k, v in resolved.items() if isinstance(v, str)}
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/internal/slash-commands/resolve",
+            json=payload,
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        resolved = data.get("data", {}) or {}
+        if not isinstance(resolved, dict):
+            return {}
+        return {str(k): str(v) for k, v in resolved.items() if isinstance(v, str)}
 
     async def get_claude_md(self, user_id: str) -> dict:
         """Fetch user-level CLAUDE.md settings for execution staging."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/internal/claude-md",
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    "X-User-Id": user_id,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            result = data.get("data", {}) or {}
-            return result if isinstance(result, dict) else {}
+        client = get_http_client()
+        response = await client.get(
+            f"{self.base_url}/api/v1/internal/claude-md",
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                "X-User-Id": user_id,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        result = data.get("data", {}) or {}
+        return result if isinstance(result, dict) else {}
 
-    async def dispatch_due_scheduled_tasks(self, limit: int = 50) -> dict:
+    async def dispatch_due_scheduled_tasks(self, limit: int = 200) -> dict:
         """Trigger backend to dispatch due scheduled tasks into the run queue."""
         payload = {"limit": max(1, int(limit))}
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/internal/scheduled-tasks/dispatch-due",
-                json=payload,
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("data", {}) or {}
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/internal/scheduled-tasks/dispatch-due",
+            json=payload,
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get("data", {}) or {}
 
     async def create_user_input_request(self, payload: dict) -> dict:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/v1/internal/user-input-requests",
-                json=payload,
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["data"]
+        client = get_http_client()
+        response = await client.post(
+            f"{self.base_url}/api/v1/internal/user-input-requests",
+            json=payload,
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["data"]
 
     async def get_user_input_request(self, request_id: str) -> dict:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/api/v1/internal/user-input-requests/{request_id}",
-                headers={
-                    "X-Internal-Token": self.settings.internal_api_token,
-                    **self._trace_headers(),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["data"]
+        client = get_http_client()
+        response = await client.get(
+            f"{self.base_url}/api/v1/internal/user-input-requests/{request_id}",
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                **self._trace_headers(),
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["data"]
+
+    async def wait_user_input_request(
+        self, request_id: str, wait_seconds: float
+    ) -> dict:
+        """Get a user input request, long-polling while it is pending."""
+        client = get_long_poll_http_client()
+        response = await client.get(
+            f"{self.base_url}/api/v1/internal/user-input-requests/{request_id}/wait",
+            params={"wait_seconds": wait_seconds},
+            headers={
+                "X-Internal-Token": self.settings.internal_api_token,
+                **self._trace_headers(),
+            },
+            timeout=wait_seconds + self.settings.http_client_timeout_seconds,
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["data"]
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 from datetime import datetime, timezone
+from typing import Any
 
 from app.schemas.callback import AgentCallbackRequest, CallbackReceiveResponse
 from app.services.backend_client import BackendClient
@@ -61,6 +62,9 @@ class CallbackService:
     def _filter_state_patch(
         cls, callback: AgentCallbackRequest
     ) -> AgentCallbackRequest:
+        if callback.state_delta:
+            callback = cls._filter_state_delta(callback)
+
         state = callback.state_patch
         if not state:
             return callback
@@ -114,6 +118,72 @@ class CallbackService:
         )
         return callback.model_copy(update={"state_patch": updated_state})
 
+    @classmethod
+    def _filter_state_delta(
+        cls, callback: AgentCallbackRequest
+    ) -> AgentCallbackRequest:
+        """Apply the state_patch filters to a delta.
+
+        Totals are not part of a workspace delta; the backend derives them from the
+        merged file changes, so dropping ignored files here keeps them consistent.
+        """
+        delta = callback.state_delta
+        update: dict[str, Any] = {}
+
+        if delta.mcp_status:
+            filtered_mcp = [
+                m
+                for m in delta.mcp_status
+                if not cls._is_internal_mcp_server(m.server_name)
+            ]
+            if len(filtered_mcp) != len(delta.mcp_status):
+                update["mcp_status"] = filtered_mcp
+
+        workspace_state = delta.workspace_state
+        if workspace_state and workspace_state.file_changes:
+            filtered_changes = [
+                fc
+                for fc in workspace_state.file_changes
+                if not cls._is_ignored_workspace_path(fc.path)
+            ]
+            if len(filtered_changes) != len(workspace_state.file_changes):
+                update["workspace_state"] = workspace_state.model_copy(
+                    update={
+                        "file_changes": filtered_changes,
+                        "total_added_lines": sum(
+                            fc.added_lines for fc in filtered_changes
+                        ),
+                        "total_deleted_lines": sum(
+                            fc.deleted_lines for fc in filtered_changes
+                        ),
+                    }
+                )
+
+        workspace_delta = delta.workspace_delta
+        if workspace_delta:
+            file_keys = [
+                key
+                for key in workspace_delta.file_keys
+                if not cls._is_ignored_workspace_path(key.partition(":")[2])
+            ]
+            upserted = [
+                fc
+                for fc in workspace_delta.upserted_files
+                if not cls._is_ignored_workspace_path(fc.path)
+            ]
+            if len(file_keys) != len(workspace_delta.file_keys) or len(upserted) != len(
+                workspace_delta.upserted_files
+            ):
+                update["workspace_delta"] = workspace_delta.model_copy(
+                    update={"file_keys": file_keys, "upserted_files": upserted}
+                )
+
+        if not update:
+            return callback
+        return callback.model_copy(
+            update={"state_delta": delta.model_copy(update=update)}
+        )
+
     async def process_callback(
         self, callback: AgentCallbackRequest
     ) -> CallbackReceiveResponse:
@@ -128,9 +198,58 @@ class CallbackService:
         Raises:
             AppException: If callback forwarding to backend fails
         """
-        from app.core.errors.error_codes import ErrorCode
-        from app.core.errors.exceptions import AppException
+        callback, payload = self._prepare_callback(callback)
+
+        try:
+            # Forward callback to backend
+            result = await backend_client.forward_callback(payload)
+            await self._handle_forwarded(callback)
+            return self._build_receive_response(callback, result)
+
+        except Exception:
+            logger.exception(
+                "callback_forward_failed",
+                extra={"session_id": callback.session_id, "status": callback.status},
+            )
+            raise self._forward_failed_error()
+
+    async def process_callback_batch(
+        self, callbacks: list[AgentCallbackRequest]
+    ) -> list[CallbackReceiveResponse]:
+        """Forward a batch of executor callbacks to Backend in one request.
+
+        Raises:
+            AppException: If callback forwarding to backend fails
+        """
+        prepared = [self._prepare_callback(callback) for callback in callbacks]
+        if not prepared:
+            return []
+
+        try:
+            results = await backend_client.forward_callback_batch(
+                [payload for _, payload in prepared]
+            )
+            responses = []
+            for index, (callback, _) in enumerate(prepared):
+                await self._handle_forwarded(callback)
+                result = results[index] if index < len(results) else {}
+                responses.append(self._build_receive_response(callback, result))
+            return responses
 
+        except Exception:
+            logger.exception(
+                "callback_batch_forward_failed",
+                extra={
+                    "session_id": prepared[0][0].session_id,
+                    "callback_count": len(prepared),
+                },
+            )
+            raise self._forward_failed_error()
+
+    def _prepare_callback(
+        self, callback: AgentCallbackRequest
+    ) -> tuple[AgentCallbackRequest, dict[str, Any]]:
+        """Log and filter a callback; return it with the payload for Backend."""
         # High-frequency callbacks: keep RUNNING as DEBUG; only completed/failed stay at INFO.
         summary_level = (
             logging.INFO
@@ -164,49 +283,70 @@ class CallbackService:
                     "todo_count": todo_count,
                     "mcp_count": mcp_count,
                     "file_change_count": file_count,
+                    "state_seq": callback.state_seq,
+                },
+            )
+        elif callback.state_delta:
+            delta = callback.state_delta
+            logger.debug(
+                "callback_state_delta_summary",
+                extra={
+                    "session_id": callback.session_id,
+                    "state_seq": callback.state_seq,
+                    "base_seq": delta.base_seq,
+                    "changed_sections": delta.changed,
+                    "upserted_file_count": (
+                        len(delta.workspace_delta.upserted_files)
+                        if delta.workspace_delta
+                        else 0
+                    ),
                 },
             )
 
-        try:
-            payload_model = callback
-            if callback.status in ["completed", "failed"]:
-                payload_model = callback.model_copy(
-                    update={"workspace_export_status": "pending"}
-                )
-            payload = payload_model.model_dump(mode="json")
+        payload_model = callback
+        if callback.status in ["completed", "failed"]:
+            payload_model = callback.model_copy(
+                update={"workspace_export_status": "pending"}
+            )
+        return callback, payload_model.model_dump(mode="json")
 
-            # Forward callback to backend
-            await backend_client.forward_callback(payload)
+    async def _handle_forwarded(self, callback: AgentCallbackRequest) -> None:
+        if callback.status not in ["completed", "failed"]:
+            return
 
-            if callback.status in ["completed", "failed"]:
-                from app.scheduler.task_dispatcher import TaskDispatcher
+        from app.scheduler.task_dispatcher import TaskDispatcher
 
-                logger.info(
-                    "task_terminal_callback_received",
-                    extra={
-                        "session_id": callback.session_id,
-                        "status": callback.status,
-                    },
-                )
-                asyncio.create_task(self._export_and_forward(callback))
-                await TaskDispatcher.on_task_complete(callback.session_id)
-
-            return CallbackReceiveResponse(
-                status="received",
-                session_id=callback.session_id,
-                callback_status=callback.status,
-                progress=callback.progress,
-            )
+        logger.info(
+            "task_terminal_callback_received",
+            extra={
+                "session_id": callback.session_id,
+                "status": callback.status,
+            },
+        )
+        asyncio.create_task(self._export_and_forward(callback))
+        await TaskDispatcher.on_task_complete(callback.session_id)
 
-        except Exception:
-            logger.exception(
-                "callback_forward_failed",
-                extra={"session_id": callback.session_id, "status": callback.status},
-            )
-            raise AppException(
-                error_code=ErrorCode.CALLBACK_FORWARD_FAILED,
-                message="Failed to forward callback to backend",
-            )
+    @staticmethod
+    def _build_receive_response(
+        callback: AgentCallbackRequest, result: dict[str, Any] | None = None
+    ) -> CallbackReceiveResponse:
+        return CallbackReceiveResponse(
+            status="received",
+            session_id=callback.session_id,
+            callback_status=callback.status,
+            progress=callback.progress,
+            state_resync_required=bool((result or {}).get("state_resync_required")),
+        )
+
+    @staticmethod
+    def _forward_failed_error() -> Exception:
+        from app.core.errors.error_codes import ErrorCode
+        from app.core.errors.exceptions import AppException
+
+        return AppException(
+            error_code=ErrorCode.CALLBACK_FORWARD_FAILED,
+            message="Failed to forward callback to backend",
+        )
 
     async def _export_and_forward(self, callback: AgentCallbackRequest) -> None:
         try:
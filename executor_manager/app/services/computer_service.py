@@ -2,13 +2,20 @@ import re
 
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
-from app.schemas.computer import ComputerScreenshotUploadResponse
+from app.schemas.computer import (
+    ComputerScreenshotCopyResponse,
+    ComputerScreenshotUploadResponse,
+)
 from app.services.storage_service import S3StorageService
 from app.services.workspace_manager import WorkspaceManager
 
 
 _SAFE_TOKEN = re.compile(r"[^A-Za-z0-9._-]+")
 
+# Screenshot content type -> object key extension (the backend looks keys up by it).
+SCREENSHOT_EXTENSIONS = {"image/jpeg": "jpg", "image/webp": "webp", "image/png": "png"}
+THUMBNAIL_SUFFIX = ".thumb.jpg"
+
 
 def _sanitize_token(value: str) -> str:
     token = (value or "").strip()
@@ -29,14 +36,7 @@ class ComputerService:
         self._workspace_manager = workspace_manager or WorkspaceManager()
         self._storage_service = storage_service or S3StorageService()
 
-    def upload_browser_screenshot(
-        self,
-        *,
-        session_id: str,
-        tool_use_id: str,
-        content_type: str,
-        data: bytes,
-    ) -> ComputerScreenshotUploadResponse:
+    def _screenshot_key_base(self, session_id: str, tool_use_id: str) -> str:
         user_id = self._workspace_manager.resolve_user_id(session_id)
         if not user_id:
             raise AppException(
@@ -47,20 +47,86 @@ class ComputerService:
 
         safe_session_id = _sanitize_token(session_id)
         safe_tool_use_id = _sanitize_token(tool_use_id)
-
         # Keep the key deterministic so the frontend can map (session_id, tool_use_id) -> screenshot.
-        key = f"replays/{user_id}/{safe_session_id}/browser/{safe_tool_use_id}.png"
+        return f"replays/{user_id}/{safe_session_id}/browser/{safe_tool_use_id}"
 
+    def upload_browser_screenshot(
+        self,
+        *,
+        session_id: str,
+        tool_use_id: str,
+        content_type: str,
+        data: bytes,
+        thumbnail: bytes | None = None,
+    ) -> ComputerScreenshotUploadResponse:
+        content_type = content_type or "image/png"
+        extension = SCREENSHOT_EXTENSIONS.get(content_type)
+        if not extension:
+            raise AppException(
+                error_code=ErrorCode.BAD_REQUEST,
+                message="Unsupported screenshot content type",
+                details={"content_type": content_type},
+            )
+
+        key_base = self._screenshot_key_base(session_id, tool_use_id)
+        key = f"{key_base}.{extension}"
         self._storage_service.put_object(
             key=key,
             body=data,
-            content_type=content_type or "image/png",
+            content_type=content_type,
         )
 
+        thumbnail_key = None
+        if thumbnail:
+            thumbnail_key = f"{key_base}{THUMBNAIL_SUFFIX}"
+            self._storage_service.put_object(
+                key=thumbnail_key,
+                body=thumbnail,
+                content_type="image/jpeg",
+            )
+
         return ComputerScreenshotUploadResponse(
             session_id=session_id,
             tool_use_id=tool_use_id,
             key=key,
-            content_type=content_type or "image/png",
+            content_type=content_type,
             size_bytes=len(data),
+            thumbnail_key=thumbnail_key,
+        )
+
+    def copy_browser_screenshot(
+        self,
+        *,
+        session_id: str,
+        tool_use_id: str,
+        source_tool_use_id: str,
+    ) -> ComputerScreenshotCopyResponse:
+        """Reuse another tool call's screenshot (and thumbnail) for this tool call.
+
+        Used when the page did not change between the two calls; the objects
+        are copied inside the bucket.
+        """
+        source_base = self._screenshot_key_base(session_id, source_tool_use_id)
+        key_base = self._screenshot_key_base(session_id, tool_use_id)
+        source_keys = list(self._storage_service.list_objects(f"{source_base}."))
+        if not source_keys:
+            raise AppException(
+                error_code=ErrorCode.NOT_FOUND,
+                message="Source screenshot not found",
+                details={
+                    "session_id": session_id,
+                    "source_tool_use_id": source_tool_use_id,
+                },
+            )
+
+        keys: list[str] = []
+        for source_key in source_keys:
+            key = f"{key_base}{source_key[len(source_base) :]}"
+            self._storage_service.copy_object(source_key=source_key, key=key)
+            keys.append(key)
+
+        return ComputerScreenshotCopyResponse(
+            session_id=session_id,
+            tool_use_id=tool_use_id,
+            keys=keys,
         )
@@ -1,5 +1,14 @@
+import asyncio
 import logging
+import os
+import shutil
 import time
+import uuid
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import docker
@@ -8,7 +17,9 @@ import httpx
 
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
+from app.core.http_client import get_http_client
 from app.core.settings import get_settings
+from app.services.admission_controller import AdmissionController
 from app.services.workspace_manager import WorkspaceManager
 
 if TYPE_CHECKING:
@@ -16,6 +27,49 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+WARM_CONTAINER_NAME_PREFIX = "executor-warm-"
+
+
+@dataclass
+class WarmContainer:
+    """An idle, already-healthy executor container waiting for a session."""
+
+    container: "Container"
+    container_id: str
+    slot_dir: Path
+    executor_url: str
+    browser_enabled: bool
+
+
+@dataclass
+class WarmPoolStats:
+    hits: int = 0
+    misses: int = 0
+    created: int = 0
+    failed: int = 0
+    discarded: int = 0
+    time_to_ready_ms_total: int = 0
+    time_to_ready_ms_last: int = 0
+    cold_start_ms_last: int = 0
+    bind_ms_last: int = 0
+
+    def to_dict(self) -> dict[str, int | float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "created": self.created,
+            "failed": self.failed,
+            "discarded": self.discarded,
+            "time_to_ready_ms_avg": (
+                int(self.time_to_ready_ms_total / self.created) if self.created else 0
+            ),
+            "time_to_ready_ms_last": self.time_to_ready_ms_last,
+            "cold_start_ms_last": self.cold_start_ms_last,
+            "bind_ms_last": self.bind_ms_last,
+        }
+
 
 class ContainerPool:
     """Executor container pool with ephemeral and persistent modes."""
@@ -28,6 +82,59 @@ class ContainerPool:
         self.containers: dict[str, "Container"] = {}
         self.session_to_container: dict[str, str] = {}
 
+        # Docker SDK calls are blocking; they run in worker threads, and container creation
+        # is bounded so a burst of dispatches cannot saturate the daemon.
+        self._create_semaphore = asyncio.Semaphore(
+            max(1, self.settings.container_create_concurrency)
+        )
+
+        # Warm pool bookkeeping, keyed by browser_enabled.
+        self._warm_idle: dict[bool, deque[WarmContainer]] = {
+            False: deque(),
+            True: deque(),
+        }
+        self._warm_pending: dict[bool, int] = {False: 0, True: 0}
+        self._warm_stats = WarmPoolStats()
+        self._warm_refill_task: asyncio.Task[None] | None = None
+        self._warm_wakeup = asyncio.Event()
+
+        self.admission = AdmissionController(
+            self.docker_client,
+            tracked_count=lambda: len(self.containers),
+            warm_count=self._warm_count,
+        )
+
+    @asynccontextmanager
+    async def admitted(self, container_id: str | None = None) -> AsyncIterator[None]:
+        """Hold an admission slot while a container for a direct task is created.
+
+        Pulled runs reserve their slot at claim time; tasks submitted directly go
+        through the same checks here. Reusing a live container needs no slot.
+
+        Raises:
+            AppException: If the host has no capacity for another container
+        """
+        if container_id and container_id in self.containers:
+            yield
+            return
+        await self.admission.refresh()
+        self.admission.reserve()
+        try:
+            reason = self.admission.check_reserved()
+            if reason is not None:
+                logger.warning(
+                    "container_admission_rejected",
+                    extra={"container_id": container_id, "reason": reason},
+                )
+                raise AppException(
+                    error_code=ErrorCode.CONTAINER_CAPACITY_EXHAUSTED,
+                    message=f"No executor container capacity available ({reason})",
+                )
+            yield
+        finally:
+            # Once the container exists (or failed) it is counted as live instead.
+            self.admission.release()
+
     async def get_or_create_container(
         self,
         session_id: str,
@@ -36,6 +143,7 @@ class ContainerPool:
         browser_enabled: bool = False,
         container_mode: str = "ephemeral",
         container_id: str | None = None,
+        workspace_ready: asyncio.Event | None = None,
     ) -> tuple[str, str]:
         """Get or create container.
 
@@ -45,14 +153,38 @@ class ContainerPool:
             browser_enabled: Whether this container needs the desktop/browser stack (noVNC/Chrome).
             container_mode: ephemeral | persistent
             container_id: Existing container ID to reuse
+            workspace_ready: Set once the session workspace directory is final, i.e.
+                no warm-container bind will move it anymore; files may be staged
+                into it from then on, while a new container is still starting.
 
         Returns:
             (executor_url, container_id)
         """
+        try:
+            return await self._get_or_create_container(
+                session_id,
+                user_id,
+                browser_enabled=browser_enabled,
+                container_mode=container_mode,
+                container_id=container_id,
+                workspace_ready=workspace_ready,
+            )
+        finally:
+            if workspace_ready is not None:
+                workspace_ready.set()
+
+    async def _get_or_create_container(
+        self,
+        session_id: str,
+        user_id: str,
+        *,
+        browser_enabled: bool,
+        container_mode: str,
+        container_id: str | None,
+        workspace_ready: asyncio.Event | None,
+    ) -> tuple[str, str]:
         overall_started = time.perf_counter()
-        published_host = (
-            self.settings.executor_published_host or ""
-        ).strip() or "localhost"
+        published_host = self._published_host()
         if container_id and container_id in self.containers:
             logger.info(
                 f"Reusing existing container {container_id} for session {session_id}"
@@ -62,7 +194,7 @@ class ContainerPool:
 
             # Best-effort refresh port mappings.
             try:
-                container.reload()
+                await asyncio.to_thread(container.reload)
             except Exception:
                 pass
 
@@ -101,19 +233,57 @@ class ContainerPool:
                     container_id,
                 )
 
+        # Persistent containers are long-lived, so only ephemeral sessions use the warm pool.
+        if container_mode == "ephemeral":
+            warm = await self._acquire_warm_container(
+                session_id=session_id,
+                user_id=user_id,
+                browser_enabled=browser_enabled,
+            )
+            if warm:
+                logger.info(
+                    "timing",
+                    extra={
+                        "step": "container_warm_bind_total",
+                        "duration_ms": int(
+                            (time.perf_counter() - overall_started) * 1000
+                        ),
+                        "session_id": session_id,
+                        "user_id": user_id,
+                        "container_id": warm[1],
+                        "browser_enabled": bool(browser_enabled),
+                    },
+                )
+                return warm
+
+        if workspace_ready is not None:
+            workspace_ready.set()
+        async with self._create_semaphore:
+            return await self._create_container(
+                session_id=session_id,
+                user_id=user_id,
+                browser_enabled=browser_enabled,
+                container_mode=container_mode,
+                overall_started=overall_started,
+            )
+
+    async def _create_container(
+        self,
+        *,
+        session_id: str,
+        user_id: str,
+        browser_enabled: bool,
+        container_mode: str,
+        overall_started: float,
+    ) -> tuple[str, str]:
         container_id = f"exec-{session_id[:8]}"
         container_name = f"executor-{session_id[:8]}"
 
         # Remove stale container with the same name (best-effort).
         step_started = time.perf_counter()
-        removed_stale = False
-        try:
-            old_container = self.docker_client.containers.get(container_name)
-            logger.warning(f"Removing stale container {container_name}")
-            old_container.remove(force=True)
-            removed_stale = True
-        except docker.errors.NotFound:
-            pass
+        removed_stale = await asyncio.to_thread(
+            self._remove_container_by_name, container_name
+        )
         logger.info(
             "timing",
             extra={
@@ -157,19 +327,11 @@ class ContainerPool:
         step_started = time.perf_counter()
         image = self._resolve_executor_image(browser_enabled=browser_enabled)
         ports = {"8000/tcp": None}
-        environment = {
-            "ANTHROPIC_AUTH_TOKEN": self.settings.anthropic_token,
-            "ANTHROPIC_BASE_URL": self.settings.anthropic_base_url,
-            "DEFAULT_MODEL": self.settings.default_model,
-            "WORKSPACE_PATH": "/workspace",
-            "USER_ID": user_id,
-            "SESSION_ID": session_id,
-        }
-        if browser_enabled:
-            environment["POCO_BROWSER_VIEWPORT_SIZE"] = (
-                self.settings.poco_browser_viewport_size
-            )
-        container = self.docker_client.containers.run(
+        environment = self._container_environment(
+            browser_enabled=browser_enabled, user_id=user_id, session_id=session_id
+        )
+        container = await asyncio.to_thread(
+            self.docker_client.containers.run,
             image=image,
             name=container_name,
             environment=environment,
@@ -197,10 +359,10 @@ class ContainerPool:
         self.containers[container_id] = container
         self.session_to_container[session_id] = container_id
 
-        self._wait_for_container_ready(container)
+        await self._wait_for_container_ready(container)
 
         step_started = time.perf_counter()
-        container.reload()
+        await asyncio.to_thread(container.reload)
         port_info = container.ports.get("8000/tcp")
         if not port_info:
             raise AppException(
@@ -219,13 +381,16 @@ class ContainerPool:
             },
         )
         host_port = port_info[0]["HostPort"]
-        executor_url = f"http://{published_host}:{host_port}"
+        executor_url = f"http://{self._published_host()}:{host_port}"
 
-        self._wait_for_service_ready(executor_url)
+        await self._wait_for_service_ready(executor_url)
 
         logger.info(
             f"Container {container_id} started for session {session_id} on port {host_port}"
         )
+        self._warm_stats.cold_start_ms_last = int(
+            (time.perf_counter() - overall_started) * 1000
+        )
         logger.info(
             "timing",
             extra={
@@ -241,6 +406,330 @@ class ContainerPool:
         )
         return executor_url, container_id
 
+    def _warm_targets(self) -> dict[bool, int]:
+        return {
+            False: max(0, self.settings.executor_warm_pool_size),
+            True: max(0, self.settings.executor_browser_warm_pool_size),
+        }
+
+    async def start_warm_pool(self) -> None:
+        """Start the background refill loop for pre-warmed executor containers."""
+        if self._warm_refill_task or not any(self._warm_targets().values()):
+            return
+        await asyncio.to_thread(self._remove_orphan_warm_containers)
+        self._warm_refill_task = asyncio.create_task(self._warm_refill_loop())
+        logger.info("warm_pool_started", extra={"targets": self._warm_targets()})
+
+    async def stop_warm_pool(self) -> None:
+        """Stop refilling and remove idle warm containers (bound ones keep running)."""
+        task = self._warm_refill_task
+        self._warm_refill_task = None
+        if task:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+        idle: list[WarmContainer] = []
+        for queue in self._warm_idle.values():
+            idle.extend(queue)
+            queue.clear()
+        for warm in idle:
+            await asyncio.to_thread(self._discard_warm_container, warm)
+        await asyncio.to_thread(self._remove_orphan_warm_containers)
+
+    def _wake_warm_refill(self) -> None:
+        if self._warm_refill_task:
+            self._warm_wakeup.set()
+
+    async def _warm_refill_loop(self) -> None:
+        interval = max(1, self.settings.executor_warm_pool_refill_interval_seconds)
+        while True:
+            try:
+                await self._refill_warm_pool()
+            except Exception:
+                logger.exception("warm_pool_refill_failed")
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._warm_wakeup.wait(), timeout=interval)
+            self._warm_wakeup.clear()
+
+    def _warm_count(self) -> int:
+        return sum(len(q) for q in self._warm_idle.values()) + sum(
+            self._warm_pending.values()
+        )
+
+    async def _refill_warm_pool(self) -> None:
+        # Warm containers count against MAX_EXECUTOR_CONTAINERS like bound ones.
+        room = self.admission.free_slots()
+        if room is not None:
+            room -= self._warm_count()
+        spawns = []
+        for browser_enabled, target in self._warm_targets().items():
+            missing = (
+                target
+                - len(self._warm_idle[browser_enabled])
+                - self._warm_pending[browser_enabled]
+            )
+            if room is not None:
+                missing = min(missing, room)
+                room -= max(0, missing)
+            spawns.extend(self._spawn_warm(browser_enabled) for _ in range(missing))
+        if spawns:
+            await asyncio.gather(*spawns)
+
+    async def _spawn_warm(self, browser_enabled: bool) -> None:
+        self._warm_pending[browser_enabled] += 1
+        try:
+            async with self._create_semaphore:
+                warm = await self._spawn_warm_container(browser_enabled)
+        except Exception as exc:
+            self._warm_stats.failed += 1
+            logger.warning(
+                "warm_container_spawn_failed",
+                extra={"browser_enabled": browser_enabled, "error": str(exc)},
+            )
+            return
+        finally:
+            self._warm_pending[browser_enabled] -= 1
+        self._warm_idle[browser_enabled].append(warm)
+
+    async def _spawn_warm_container(self, browser_enabled: bool) -> WarmContainer:
+        started = time.perf_counter()
+        slot_id = uuid.uuid4().hex[:12]
+        container_id = f"warm-{slot_id}"
+        slot_dir = self.workspace_manager.warm_dir / slot_id
+        slot_workspace = slot_dir / "workspace"
+        slot_workspace.mkdir(parents=True, exist_ok=True)
+
+        labels = {
+            "owner": "executor_manager",
+            "container_id": container_id,
+            "container_mode": "ephemeral",
+            "browser_enabled": "true" if browser_enabled else "false",
+            "warm": "true",
+        }
+        image = self._resolve_executor_image(browser_enabled=browser_enabled)
+        container = None
+        try:
+            container = await asyncio.to_thread(
+                self.docker_client.containers.run,
+                image=image,
+                name=f"{WARM_CONTAINER_NAME_PREFIX}{slot_id}",
+                environment=self._container_environment(
+                    browser_enabled=browser_enabled
+                ),
+                volumes={str(slot_workspace): {"bind": "/workspace", "mode": "rw"}},
+                ports={"8000/tcp": None},
+                detach=True,
+                auto_remove=True,
+                labels=labels,
+                extra_hosts={"host.docker.internal": "host-gateway"},
+            )
+            await self._wait_for_container_ready(container)
+            await asyncio.to_thread(container.reload)
+            port_info = container.ports.get("8000/tcp")
+            if not port_info:
+                raise AppException(
+                    error_code=ErrorCode.CONTAINER_START_FAILED,
+                    message=f"Container {container.name} has no port mapping",
+                )
+            executor_url = f"http://{self._published_host()}:{port_info[0]['HostPort']}"
+            await self._wait_for_service_ready(executor_url)
+        except BaseException:
+            # Also covers cancellation (manager shutdown) mid-spawn.
+            if container is not None:
+                with suppress(Exception):
+                    await asyncio.to_thread(container.remove, force=True)
+            shutil.rmtree(slot_dir, ignore_errors=True)
+            raise
+
+        duration_ms = int((time.perf_counter() - started) * 1000)
+        self._warm_stats.created += 1
+        self._warm_stats.time_to_ready_ms_total += duration_ms
+        self._warm_stats.time_to_ready_ms_last = duration_ms
+        logger.info(
+            "timing",
+            extra={
+                "step": "container_warm_ready",
+                "duration_ms": duration_ms,
+                "container_id": container_id,
+                "image": image,
+                "browser_enabled": browser_enabled,
+            },
+        )
+        return WarmContainer(
+            container=container,
+            container_id=container_id,
+            slot_dir=slot_dir,
+            executor_url=executor_url,
+            browser_enabled=browser_enabled,
+        )
+
+    async def _acquire_warm_container(
+        self,
+        *,
+        session_id: str,
+        user_id: str,
+        browser_enabled: bool,
+    ) -> tuple[str, str] | None:
+        """Bind an idle warm container to the session, or return None on a miss."""
+        if not self._warm_targets()[browser_enabled]:
+            return None
+
+        idle = self._warm_idle[browser_enabled]
+        while idle:
+            warm = idle.popleft()
+            self._wake_warm_refill()
+            started = time.perf_counter()
+            try:
+                if not await self._probe_health(warm.executor_url):
+                    raise RuntimeError("warm container failed health probe")
+                await asyncio.to_thread(
+                    self._bind_warm_container, warm, user_id, session_id
+                )
+            except Exception as exc:
+                self._warm_stats.discarded += 1
+                logger.warning(
+                    "warm_container_discarded",
+                    extra={
+                        "session_id": session_id,
+                        "container_id": warm.container_id,
+                        "error": str(exc),
+                    },
+                )
+                await asyncio.to_thread(self._discard_warm_container, warm)
+                continue
+
+            self.containers[warm.container_id] = warm.container
+            self.session_to_container[session_id] = warm.container_id
+            self._warm_stats.hits += 1
+            self._warm_stats.bind_ms_last = int((time.perf_counter() - started) * 1000)
+            return warm.executor_url, warm.container_id
+
+        self._warm_stats.misses += 1
+        self._wake_warm_refill()
+        return None
+
+    def _bind_warm_container(
+        self, warm: WarmContainer, user_id: str, session_id: str
+    ) -> None:
+        """Attach the session workspace to a warm container.
+
+        Bind mounts follow the directory, not the path: the warm slot directory (already
+        mounted at /workspace) is renamed into the session's workspace location after
+        moving any staged entries into it. Both live under WORKSPACE_ROOT, so every step
+        is a same-filesystem rename.
+        """
+        session_dir = self.workspace_manager.get_workspace_path(
+            user_id=user_id, session_id=session_id, create=True
+        )
+        target = session_dir / "workspace"
+        slot_workspace = warm.slot_dir / "workspace"
+
+        moved: list[str] = []
+        try:
+            for entry in list(target.iterdir()):
+                os.rename(entry, slot_workspace / entry.name)
+                moved.append(entry.name)
+            target.rmdir()
+        except Exception:
+            for name in moved:
+                with suppress(Exception):
+                    os.rename(slot_workspace / name, target / name)
+            raise
+        os.rename(slot_workspace, target)
+        shutil.rmtree(warm.slot_dir, ignore_errors=True)
+
+        # Use the deterministic session name so name-based lookups (cancel_task) work.
+        container_name = f"executor-{session_id[:8]}"
+        try:
+            with suppress(docker.errors.NotFound):
+                self.docker_client.containers.get(container_name).remove(force=True)
+            warm.container.rename(container_name)
+        except Exception as exc:
+            logger.warning(
+                "warm_container_rename_failed",
+                extra={"container_id": warm.container_id, "error": str(exc)},
+            )
+
+    def _discard_warm_container(self, warm: WarmContainer) -> None:
+        with suppress(Exception):
+            warm.container.remove(force=True)
+        shutil.rmtree(warm.slot_dir, ignore_errors=True)
+
+    def _remove_orphan_warm_containers(self) -> None:
+        """Remove idle warm containers left behind (e.g. by a previous manager process)."""
+        try:
+            found = self.docker_client.containers.list(
+                all=True, filters={"label": ["owner=executor_manager", "warm=true"]}
+            )
+        except Exception as exc:
+            logger.warning(f"Failed to list warm containers: {exc}")
+            return
+        tracked = {c.id for c in self.containers.values()}
+        for container in found:
+            if container.id in tracked:
+                continue
+            if not (container.name or "").startswith(WARM_CONTAINER_NAME_PREFIX):
+                continue
+            with suppress(Exception):
+                container.remove(force=True)
+        with suppress(Exception):
+            for slot_dir in self.workspace_manager.warm_dir.iterdir():
+                if not any(
+                    slot_dir == warm.slot_dir
+                    for queue in self._warm_idle.values()
+                    for warm in queue
+                ):
+                    shutil.rmtree(slot_dir, ignore_errors=True)
+
+    @staticmethod
+    async def _probe_health(executor_url: str) -> bool:
+        try:
+            response = await get_http_client().get(
+                f"{executor_url}/health", timeout=1.0
+            )
+            return response.status_code == 200
+        except httpx.HTTPError:
+            return False
+
+    def _published_host(self) -> str:
+        return (self.settings.executor_published_host or "").strip() or "localhost"
+
+    def _container_environment(
+        self,
+        *,
+        browser_enabled: bool,
+        user_id: str | None = None,
+        session_id: str | None = None,
+    ) -> dict[str, str]:
+        environment = {
+            "ANTHROPIC_AUTH_TOKEN": self.settings.anthropic_token,
+            "ANTHROPIC_BASE_URL": self.settings.anthropic_base_url,
+            "DEFAULT_MODEL": self.settings.default_model,
+            "WORKSPACE_PATH": "/workspace",
+        }
+        if user_id:
+            environment["USER_ID"] = user_id
+        if session_id:
+            environment["SESSION_ID"] = session_id
+        if browser_enabled:
+            environment["POCO_BROWSER_VIEWPORT_SIZE"] = (
+                self.settings.poco_browser_viewport_size
+            )
+            environment["POCO_BROWSER_SCREENSHOT_FORMAT"] = (
+                self.settings.poco_browser_screenshot_format
+            )
+            environment["POCO_BROWSER_SCREENSHOT_QUALITY"] = str(
+                self.settings.poco_browser_screenshot_quality
+            )
+            environment["POCO_BROWSER_SCREENSHOT_THUMBNAIL_WIDTH"] = str(
+                self.settings.poco_browser_screenshot_thumbnail_width
+            )
+            environment["POCO_BROWSER_SCREENSHOT_DEDUP_DISTANCE"] = str(
+                self.settings.poco_browser_screenshot_dedup_distance
+            )
+        return environment
+
     def _resolve_executor_image(self, *, browser_enabled: bool) -> str:
         """Pick executor image based on browser requirement."""
         if not browser_enabled:
@@ -261,79 +750,131 @@ class ContainerPool:
         raw = str(labels.get("browser_enabled", "")).strip().lower()
         return raw in {"true", "1", "yes"}
 
-    def _wait_for_container_ready(
+    def _remove_container_by_name(self, container_name: str) -> bool:
+        """Remove a stale container with the given name (best-effort)."""
+        try:
+            old_container = self.docker_client.containers.get(container_name)
+        except docker.errors.NotFound:
+            return False
+        logger.warning(f"Removing stale container {container_name}")
+        old_container.remove(force=True)
+        return True
+
+    def _next_container_event(
+        self, docker_id: str, since: int, until: int
+    ) -> str | None:
+        """Block until the container starts or dies (or `until` passes)."""
+        events = self.docker_client.events(
+            since=since,
+            until=until,
+            decode=True,
+            filters={
+                "type": "container",
+                "container": docker_id,
+                "event": ["start", "die", "oom", "destroy"],
+            },
+        )
+        try:
+            for event in events:
+                action = str(event.get("Action") or event.get("status") or "")
+                if action in {"start", "die", "oom", "destroy"}:
+                    return action
+        finally:
+            with suppress(Exception):
+                events.close()
+        return None
+
+    async def _wait_for_container_ready(
         self,
         container: "Container",
         timeout: int = 30,
     ) -> None:
-        """Wait for container to start."""
+        """Wait for container to start, driven by the docker events stream."""
         started = time.perf_counter()
-        attempts = 0
+        # Subscribe from slightly in the past so a start that raced the first
+        # status check is still delivered.
+        since = int(time.time()) - 1
+        until = int(time.time()) + timeout
 
-        while time.perf_counter() - started < timeout:
-            attempts += 1
-            container.reload()
-            if container.status == "running":
-                logger.info(
-                    "timing",
-                    extra={
-                        "step": "container_wait_running",
-                        "duration_ms": int((time.perf_counter() - started) * 1000),
-                        "attempts": attempts,
-                        "container_name": container.name,
-                        "status": container.status,
-                    },
+        await asyncio.to_thread(container.reload)
+        event = "start" if container.status == "running" else None
+        if event is None:
+            try:
+                event = await asyncio.wait_for(
+                    asyncio.to_thread(
+                        self._next_container_event, container.id, since, until
+                    ),
+                    timeout=timeout + 1,
                 )
-                return
-            time.sleep(1)
+            except asyncio.TimeoutError:
+                event = None
+            with suppress(Exception):
+                await asyncio.to_thread(container.reload)
+
+        if event == "start" and container.status in {"running", "created"}:
+            logger.info(
+                "timing",
+                extra={
+                    "step": "container_wait_running",
+                    "duration_ms": int((time.perf_counter() - started) * 1000),
+                    "container_name": container.name,
+                    "status": container.status,
+                },
+            )
+            return
 
         logger.warning(
             "timing",
             extra={
                 "step": "container_wait_running_timeout",
                 "duration_ms": int((time.perf_counter() - started) * 1000),
-                "attempts": attempts,
                 "container_name": container.name,
                 "status": container.status,
+                "event": event,
             },
         )
+        if event in {"die", "oom", "destroy"}:
+            raise AppException(
+                error_code=ErrorCode.CONTAINER_START_FAILED,
+                message=f"Container {container.name} exited during startup ({event})",
+            )
         raise AppException(
             error_code=ErrorCode.CONTAINER_START_FAILED,
             message=f"Container {container.name} failed to start within {timeout}s",
         )
 
-    def _wait_for_service_ready(
+    async def _wait_for_service_ready(
         self,
         executor_url: str,
         timeout: int = 60,
     ) -> None:
-        """Wait for executor HTTP service to be ready."""
+        """Wait for executor HTTP service to be ready (async probes with backoff)."""
         started = time.perf_counter()
         attempts = 0
         health_url = f"{executor_url}/health"
+        delay = 0.05
 
+        client = get_http_client()
         while time.perf_counter() - started < timeout:
             attempts += 1
             try:
-                with httpx.Client(timeout=2.0) as client:
-                    response = client.get(health_url)
-                    if response.status_code == 200:
-                        logger.info(
-                            "timing",
-                            extra={
-                                "step": "container_wait_service_ready",
-                                "duration_ms": int(
-                                    (time.perf_counter() - started) * 1000
-                                ),
-                                "attempts": attempts,
-                                "executor_url": executor_url,
-                            },
-                        )
-                        logger.info(f"Executor service ready at {executor_url}")
-                        return
+                response = await client.get(health_url, timeout=2.0)
+                if response.status_code == 200:
+                    logger.info(
+                        "timing",
+                        extra={
+                            "step": "container_wait_service_ready",
+                            "duration_ms": int((time.perf_counter() - started) * 1000),
+                            "attempts": attempts,
+                            "executor_url": executor_url,
+                        },
+                    )
+                    logger.info(f"Executor service ready at {executor_url}")
+                    return
             except httpx.RequestError:
                 pass
-            time.sleep(1)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 1.0)
 
         logger.warning(
             "timing",
@@ -373,7 +914,7 @@ class ContainerPool:
             if container_mode == "ephemeral":
                 logger.info(f"Container {container_id} is ephemeral, stopping")
                 try:
-                    container.stop(timeout=10)
+                    await asyncio.to_thread(container.stop, timeout=10)
                 except Exception as e:
                     logger.error(f"Failed to stop container {container_id}: {e}")
 
@@ -398,12 +939,12 @@ class ContainerPool:
             return
 
         try:
-            container.stop(timeout=10)
+            await asyncio.to_thread(container.stop, timeout=10)
         except Exception as e:
             logger.error(f"Failed to stop container {cid}: {e}")
 
         try:
-            container.remove(force=True)
+            await asyncio.to_thread(container.remove, force=True)
         except Exception:
             # Best-effort: the container might have already been removed.
             pass
@@ -440,8 +981,10 @@ class ContainerPool:
 
         # Prefer exact match by full session_id label.
         try:
-            found = self.docker_client.containers.list(
-                all=True, filters={"label": f"session_id={session_id}"}
+            found = await asyncio.to_thread(
+                self.docker_client.containers.list,
+                all=True,
+                filters={"label": f"session_id={session_id}"},
             )
             _extend_unique(found)
         except Exception:
@@ -450,8 +993,10 @@ class ContainerPool:
         # Best-effort: if we know the logical container_id label, try to locate by that label too.
         if container_id:
             try:
-                found = self.docker_client.containers.list(
-                    all=True, filters={"label": f"container_id={container_id}"}
+                found = await asyncio.to_thread(
+                    self.docker_client.containers.list,
+                    all=True,
+                    filters={"label": f"container_id={container_id}"},
                 )
                 _extend_unique(found)
             except Exception:
@@ -460,7 +1005,7 @@ class ContainerPool:
         # Fallback to deterministic name (used by get_or_create_container).
         try:
             name = f"executor-{session_id[:8]}"
-            found = self.docker_client.containers.get(name)
+            found = await asyncio.to_thread(self.docker_client.containers.get, name)
             _extend_unique([found])
         except docker.errors.NotFound:
             pass
@@ -478,7 +1023,7 @@ class ContainerPool:
             labels = getattr(container, "labels", None) or {}
             logical_id = labels.get("container_id")
             try:
-                container.stop(timeout=10)
+                await asyncio.to_thread(container.stop, timeout=10)
                 logger.info(
                     "container_stopped",
                     extra={
@@ -514,7 +1059,7 @@ class ContainerPool:
                 for sid in bound_sessions:
                     self.session_to_container.pop(sid, None)
 
-    def get_container_stats(self) -> dict[str, int | list[dict]]:
+    def get_container_stats(self) -> dict[str, int | list[dict] | dict]:
         """Get container statistics."""
         persistent = 0
         ephemeral = 0
@@ -539,4 +1084,20 @@ class ContainerPool:
                 }
                 for c in self.containers.values()
             ],
+            "warm_pool": {
+                **self._warm_stats.to_dict(),
+                "targets": {
+                    "executor": self._warm_targets()[False],
+                    "browser": self._warm_targets()[True],
+                },
+                "idle": {
+                    "executor": len(self._warm_idle[False]),
+                    "browser": len(self._warm_idle[True]),
+                },
+                "pending": {
+                    "executor": self._warm_pending[False],
+                    "browser": self._warm_pending[True],
+                },
+            },
+            "admission": self.admission.snapshot(),
         }
@@ -1,5 +1,6 @@
 import httpx
 
+from app.core.http_client import get_http_client
 from app.core.settings import get_settings
 from app.core.observability.request_context import (
     generate_request_id,
@@ -48,23 +49,23 @@ class ExecutorClient:
             callback_base_url: Base URL for callback-related APIs
             sdk_session_id: Claude SDK session ID for resuming conversations
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{executor_url}/v1/tasks/execute",
-                json={
-                    "session_id": session_id,
-                    "run_id": run_id,
-                    "prompt": prompt,
-                    "callback_url": callback_url,
-                    "callback_token": callback_token,
-                    "callback_base_url": callback_base_url,
-                    "config": config,
-                    "sdk_session_id": sdk_session_id,
-                    "permission_mode": permission_mode or "default",
-                },
-                headers=self._trace_headers(),
-                timeout=httpx.Timeout(30.0, connect=10.0),
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["session_id"]
+        client = get_http_client()
+        response = await client.post(
+            f"{executor_url}/v1/tasks/execute",
+            json={
+                "session_id": session_id,
+                "run_id": run_id,
+                "prompt": prompt,
+                "callback_url": callback_url,
+                "callback_token": callback_token,
+                "callback_base_url": callback_base_url,
+                "config": config,
+                "sdk_session_id": sdk_session_id,
+                "permission_mode": permission_mode or "default",
+            },
+            headers=self._trace_headers(),
+            timeout=httpx.Timeout(30.0, connect=10.0),
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["session_id"]
@@ -3,6 +3,8 @@ import logging
 import os
 import socket
 import time
+from collections.abc import Awaitable, Callable, Coroutine
+from contextlib import suppress
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -16,9 +18,63 @@ from app.services.attachment_stager import AttachmentStager
 from app.services.claude_md_stager import ClaudeMdStager
 from app.services.slash_command_stager import SlashCommandStager
 from app.services.sub_agent_stager import SubAgentStager
+from app.services.user_config_cache import UserConfigCache
 
 logger = logging.getLogger(__name__)
 
+# How often claiming is re-checked while the host has no free capacity.
+CAPACITY_RECHECK_SECONDS = 2.0
+
+
+async def _gather_stages(*coros: Coroutine[Any, Any, Any]) -> list[Any]:
+    """Run dispatch stages concurrently; the first failure cancels the others.
+
+    Returns (or raises) only after every stage has finished, so nothing is still
+    writing into the workspace once the caller fails the run. The first error is
+    re-raised unwrapped to keep log lines and the run's error message readable.
+    """
+    tasks: list[asyncio.Task[Any]] = []
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(coro) for coro in coros]
+    except BaseExceptionGroup as group:
+        raise group.exceptions[0] from None
+    return [task.result() for task in tasks]
+
+
+class DispatchTrace:
+    """Stage timings of one run dispatch, logged as a single record.
+
+    Stages may overlap; each records its offset from the start of the dispatch
+    and its own duration.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.stages: dict[str, dict[str, Any]] = {}
+
+    def elapsed_ms(self) -> int:
+        return int((time.perf_counter() - self.started) * 1000)
+
+    async def stage[T](self, name: str, awaitable: Awaitable[T]) -> T:
+        stage_started = time.perf_counter()
+        failed = True
+        try:
+            result = await awaitable
+            failed = False
+            return result
+        finally:
+            entry: dict[str, Any] = {
+                "start_ms": int((stage_started - self.started) * 1000),
+                "duration_ms": int((time.perf_counter() - stage_started) * 1000),
+            }
+            if failed:
+                entry["failed"] = True
+            self.stages[name] = entry
+
+    def annotate(self, name: str, **fields: Any) -> None:
+        self.stages.setdefault(name, {}).update(fields)
+
 
 class RunPullService:
     """Background service that pulls queued runs from Backend and dispatches them."""
@@ -28,7 +84,11 @@ class RunPullService:
         self.backend_client = BackendClient()
         self.executor_client = ExecutorClient()
         self.container_pool = TaskDispatcher.get_container_pool()
-        self.config_resolver = ConfigResolver(self.backend_client)
+        self.admission = self.container_pool.admission
+        self.user_config_cache = UserConfigCache(self.backend_client)
+        self.config_resolver = ConfigResolver(
+            self.backend_client, config_cache=self.user_config_cache
+        )
         self.skill_stager = SkillStager()
         self.attachment_stager = AttachmentStager()
         self.claude_md_stager = ClaudeMdStager()
@@ -36,11 +96,15 @@ class RunPullService:
         self.subagent_stager = SubAgentStager()
 
         self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
-        self._semaphore = asyncio.Semaphore(self.settings.max_concurrent_tasks)
         self._tasks: set[asyncio.Task[None]] = set()
+        # Slots requested by in-flight claim calls; counted against capacity.
+        self._reserved_slots = 0
+        self._capacity_available = asyncio.Event()
+        self._long_poll_task: asyncio.Task[None] | None = None
         self._shutdown = False
         self._logged_started = False
         self._windows_until: dict[str, datetime] = {}
+        self._window_modes: dict[str, list[str]] = {}
         self._window_locks: dict[str, asyncio.Lock] = {}
 
     def _get_window_lock(self, window_id: str) -> asyncio.Lock:
@@ -77,6 +141,7 @@ class RunPullService:
             now_utc = datetime.now(timezone.utc)
             until_utc = now_utc + timedelta(minutes=window_minutes)
             self._windows_until[window_id] = until_utc
+            self._window_modes[window_id] = schedule_modes or []
             logger.info(
                 f"Window opened (id={window_id}, until={until_utc.isoformat()}, schedule_modes={schedule_modes})"
             )
@@ -101,68 +166,175 @@ class RunPullService:
         now_utc = datetime.now(timezone.utc)
         if now_utc >= until_utc:
             self._windows_until.pop(window_id, None)
+            self._window_modes.pop(window_id, None)
             return
 
+        self._window_modes[window_id] = schedule_modes or []
         await self.poll(schedule_modes=schedule_modes)
 
+    def _free_slots(self) -> int:
+        slots = (
+            self.settings.max_concurrent_tasks - len(self._tasks) - self._reserved_slots
+        )
+        container_slots = self.admission.available_slots()
+        if container_slots is not None:
+            slots = min(slots, container_slots)
+        return slots
+
+    def _log_started(self, lease_seconds: int) -> None:
+        if self._logged_started:
+            return
+        logger.info(
+            f"RunPullService started (worker_id={self.worker_id}, "
+            f"lease={lease_seconds}s, max_concurrent={self.settings.max_concurrent_tasks}, "
+            f"max_containers={self.settings.max_executor_containers})"
+        )
+        self._logged_started = True
+
     async def poll(self, schedule_modes: list[str] | None = None) -> None:
         """Poll backend run queue and dispatch as many as capacity allows."""
         if self._shutdown:
             return
+        try:
+            while not self._shutdown:
+                await self.admission.refresh()
+                limit = self._free_slots()
+                if limit <= 0:
+                    return
+                claimed = await self._claim_batch(schedule_modes, limit=limit)
+                if claimed < limit:
+                    return
+        except Exception as e:
+            logger.error(f"Failed to claim run from backend: {e}")
 
-        lease_seconds = max(5, int(self.settings.task_claim_lease_seconds))
-
-        if not self._logged_started:
-            logger.info(
-                f"RunPullService started (worker_id={self.worker_id}, "
-                f"lease={lease_seconds}s, max_concurrent={self.settings.max_concurrent_tasks})"
-            )
-            self._logged_started = True
+    def start_long_poll(self, schedule_modes: list[str] | None = None) -> None:
+        """Start long-polling the backend for runs of the given schedule modes.
 
-        while not self._shutdown and not self._semaphore.locked():
-            await self._semaphore.acquire()
+        The backend holds each claim request open until runs become claimable,
+        so runs are dispatched without waiting for the next interval tick.
+        While a long-poll holds the free capacity, interval polls are no-ops;
+        modes of open pull windows are added to the long-poll instead.
 
+        Args:
+            schedule_modes: Modes of the interval rules (None or empty for all).
+        """
+        if self._shutdown or self.settings.task_pull_wait_seconds <= 0:
+            return
+        if self._long_poll_task and not self._long_poll_task.done():
+            return
+        self._long_poll_task = asyncio.create_task(
+            self._long_poll(schedule_modes or [])
+        )
+
+    def _long_poll_modes(self, interval_modes: list[str]) -> list[str] | None:
+        if not interval_modes:
+            return None
+        modes = list(interval_modes)
+        now_utc = datetime.now(timezone.utc)
+        for window_id, window_modes in self._window_modes.items():
+            until_utc = self._windows_until.get(window_id)
+            if not until_utc or now_utc >= until_utc:
+                continue
+            if not window_modes:
+                return None
+            modes.extend(m for m in window_modes if m not in modes)
+        return modes
+
+    async def _long_poll(self, interval_modes: list[str]) -> None:
+        wait_seconds = self.settings.task_pull_wait_seconds
+        backoff = 1.0
+        while not self._shutdown:
             try:
-                step_started = time.perf_counter()
-                claim = await self.backend_client.claim_run(
-                    worker_id=self.worker_id,
-                    lease_seconds=lease_seconds,
-                    schedule_modes=schedule_modes,
-                )
-                if claim:
-                    logger.info(
-                        "timing",
-                        extra={
-                            "step": "run_pull_claim_run",
-                            "duration_ms": int(
-                                (time.perf_counter() - step_started) * 1000
-                            ),
-                            "worker_id": self.worker_id,
-                            "lease_seconds": lease_seconds,
-                            "schedule_modes": schedule_modes,
-                        },
+                await self.admission.refresh()
+            except Exception as e:
+                logger.warning(f"Failed to refresh executor capacity: {e}")
+            limit = self._free_slots()
+            if limit <= 0:
+                # Host headroom and containers removed elsewhere change without an
+                # event, so capacity is re-checked periodically as well.
+                self._capacity_available.clear()
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._capacity_available.wait(),
+                        timeout=CAPACITY_RECHECK_SECONDS,
                     )
+                continue
+            try:
+                await self._claim_batch(
+                    self._long_poll_modes(interval_modes),
+                    limit=limit,
+                    wait_seconds=wait_seconds,
+                )
+                backoff = 1.0
             except Exception as e:
-                logger.error(f"Failed to claim run from backend: {e}")
-                self._semaphore.release()
-                return
+                logger.error(f"Failed to long-poll runs from backend: {e}")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
 
-            if not claim:
-                self._semaphore.release()
-                return
+    async def _claim_batch(
+        self,
+        schedule_modes: list[str] | None,
+        *,
+        limit: int,
+        wait_seconds: float = 0,
+    ) -> int:
+        """Claim up to ``limit`` runs and start dispatching them.
+
+        Returns:
+            Number of claimed runs.
+        """
+        lease_seconds = max(5, int(self.settings.task_claim_lease_seconds))
+        self._log_started(lease_seconds)
+
+        # Container slots stay reserved for claimed runs until their container exists.
+        self._reserved_slots += limit
+        self.admission.reserve(limit)
+        claims: list[dict[str, Any]] = []
+        try:
+            step_started = time.perf_counter()
+            claims = await self.backend_client.claim_runs(
+                worker_id=self.worker_id,
+                lease_seconds=lease_seconds,
+                schedule_modes=schedule_modes,
+                limit=limit,
+                wait_seconds=wait_seconds,
+            )
+        finally:
+            self._reserved_slots -= limit
+            self.admission.release(limit - len(claims))
+            self._capacity_available.set()
 
+        if claims:
+            logger.info(
+                "timing",
+                extra={
+                    "step": "run_pull_claim_run",
+                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
+                    "worker_id": self.worker_id,
+                    "lease_seconds": lease_seconds,
+                    "schedule_modes": schedule_modes,
+                    "claimed": len(claims),
+                    "wait_seconds": wait_seconds,
+                },
+            )
+        for claim in claims:
             task = asyncio.create_task(self._handle_claim(claim))
             self._tasks.add(task)
             task.add_done_callback(self._on_task_done)
+        return len(claims)
 
     async def shutdown(self) -> None:
         """Request shutdown and cancel inflight dispatch tasks."""
         self._shutdown = True
+        if self._long_poll_task:
+            self._long_poll_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._long_poll_task
         await self._drain_tasks()
 
     def _on_task_done(self, task: asyncio.Task[None]) -> None:
         self._tasks.discard(task)
-        self._semaphore.release()
+        self._capacity_available.set()
         try:
             exc = task.exception()
         except asyncio.CancelledError:
@@ -180,7 +352,7 @@ class RunPullService:
         self._tasks.clear()
 
     async def _handle_claim(self, claim: dict[str, Any]) -> None:
-        dispatch_started = time.perf_counter()
+        trace = DispatchTrace()
         run = claim.get("run") or {}
         run_id = run.get("run_id")
         session_id = run.get("session_id")
@@ -192,11 +364,29 @@ class RunPullService:
         permission_mode = str(run.get("permission_mode") or "default").strip()
 
         if not run_id or not session_id or not user_id or not prompt:
+            self.admission.release()
             logger.error(f"Invalid claim payload: {claim}")
             return
 
         container_mode = config_snapshot.get("container_mode", "ephemeral")
         container_id = config_snapshot.get("container_id")
+        # Resolution never changes this flag, so the container can start right away.
+        browser_enabled = bool(config_snapshot.get("browser_enabled"))
+
+        # A run reusing a live persistent container needs no new slot; otherwise
+        # the slot reserved at claim time is re-checked, since the host may have
+        # filled up while the claim was held open.
+        needs_slot = not (
+            container_id and container_id in self.container_pool.containers
+        )
+        if not needs_slot:
+            self.admission.release()
+        else:
+            reason = self.admission.check_reserved()
+            if reason is not None:
+                self.admission.release()
+                await self._release_claim(str(run_id), session_id, reason)
+                return
 
         callback_url = f"{self.settings.callback_base_url}/api/v1/callback"
         ctx = {
@@ -205,193 +395,72 @@ class RunPullService:
             "user_id": user_id,
         }
 
-        try:
-            step_started = time.perf_counter()
-            resolved_config = await self.config_resolver.resolve(
-                user_id,
-                config_snapshot,
-                session_id=session_id,
-                run_id=str(run_id),
-            )
-            logger.info(
-                "timing",
-                extra={
-                    "step": "run_dispatch_resolve_config",
-                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                    **ctx,
-                },
-            )
-
-            step_started = time.perf_counter()
-            staged_skills = self.skill_stager.stage_skills(
-                user_id=user_id,
-                session_id=session_id,
-                skills=resolved_config.get("skill_files") or {},
-            )
-            resolved_config["skill_files"] = staged_skills
-            logger.info(
-                "timing",
-                extra={
-                    "step": "run_dispatch_stage_skills",
-                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                    "skills_staged": len(staged_skills),
-                    **ctx,
-                },
-            )
-
-            step_started = time.perf_counter()
-            staged_inputs = self.attachment_stager.stage_inputs(
-                user_id=user_id,
-                session_id=session_id,
-                inputs=resolved_config.get("input_files") or [],
-            )
-            resolved_config["input_files"] = staged_inputs
-            logger.info(
-                "timing",
-                extra={
-                    "step": "run_dispatch_stage_inputs",
-                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                    "inputs_staged": len(staged_inputs),
-                    **ctx,
-                },
-            )
-
-            step_started = time.perf_counter()
-            resolved_commands = await self.backend_client.resolve_slash_commands(
-                user_id=user_id
-            )
-            staged_commands = self.slash_command_stager.stage_commands(
-                user_id=user_id,
-                session_id=session_id,
-                commands=resolved_commands,
-            )
-            logger.info(
-                "timing",
-                extra={
-                    "step": "run_dispatch_stage_slash_commands",
-                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                    "commands_staged": len(staged_commands),
-                    **ctx,
-                },
+        # Container creation (or warm-container binding) only needs the workspace
+        # directory, so it overlaps with config resolution and file staging. Files
+        # are staged once the workspace is final: a warm bind moves the directory.
+        workspace_ready = asyncio.Event()
+        container_task = asyncio.create_task(
+            trace.stage(
+                "get_or_create_container",
+                self.container_pool.get_or_create_container(
+                    session_id=session_id,
+                    user_id=user_id,
+                    browser_enabled=browser_enabled,
+                    container_mode=container_mode,
+                    container_id=container_id,
+                    workspace_ready=workspace_ready,
+                ),
             )
-
-            # Stage user-level CLAUDE.md (persistent instructions) into ~/.claude.
-            step_started = time.perf_counter()
-            try:
-                claude_md = await self.backend_client.get_claude_md(user_id=user_id)
-                enabled = bool(claude_md.get("enabled"))
-                content = (
-                    claude_md.get("content")
-                    if isinstance(claude_md.get("content"), str)
-                    else ""
-                )
-                staged_md = self.claude_md_stager.stage(
+        )
+        if needs_slot:
+            # Once the container exists (or failed) it is counted as live instead.
+            container_task.add_done_callback(lambda _: self.admission.release())
+        try:
+            resolved_config, _, _ = await _gather_stages(
+                self._resolve_and_stage_config(
+                    trace,
                     user_id=user_id,
                     session_id=session_id,
-                    enabled=enabled,
-                    content=content,
-                )
-                bytes_val = staged_md.get("bytes", 0)
-                logger.info(
-                    "timing",
-                    extra={
-                        "step": "run_dispatch_stage_claude_md",
-                        "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                        "enabled": bool(staged_md.get("enabled")),
-                        "bytes": int(bytes_val) if isinstance(bytes_val, int) else 0,
-                        **ctx,
-                    },
-                )
-            except Exception as exc:
-                # Best-effort: don't block execution if CLAUDE.md staging fails.
-                logger.warning(
-                    f"Failed to stage CLAUDE.md for session {session_id}: {exc}"
-                )
-
-            step_started = time.perf_counter()
-            raw_agents_val = resolved_config.pop("subagent_raw_agents", None)
-            raw_agents = raw_agents_val if isinstance(raw_agents_val, dict) else {}
-            try:
-                staged_agents = self.subagent_stager.stage_raw_agents(
+                    run_id=str(run_id),
+                    config_snapshot=config_snapshot,
+                    workspace_ready=workspace_ready,
+                ),
+                self._stage_slash_commands(
+                    trace,
                     user_id=user_id,
                     session_id=session_id,
-                    raw_agents=raw_agents,
-                )
-                logger.info(
-                    "timing",
-                    extra={
-                        "step": "run_dispatch_stage_subagents",
-                        "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                        "subagents_requested": len(raw_agents),
-                        "subagents_staged": len(staged_agents),
-                        **ctx,
-                    },
-                )
-            except Exception as exc:
-                # Best-effort: keep tasks running even if staging fails.
-                logger.warning(
-                    f"Failed to stage subagents for session {session_id}: {exc}"
-                )
-
-            step_started = time.perf_counter()
-            browser_enabled = bool(resolved_config.get("browser_enabled"))
-            (
-                executor_url,
-                container_id,
-            ) = await self.container_pool.get_or_create_container(
-                session_id=session_id,
-                user_id=user_id,
-                browser_enabled=browser_enabled,
-                container_mode=container_mode,
-                container_id=container_id,
-            )
-            logger.info(
-                "timing",
-                extra={
-                    "step": "run_dispatch_get_or_create_container",
-                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                    "container_mode": container_mode,
-                    "container_id": container_id,
-                    "browser_enabled": browser_enabled,
-                    **ctx,
-                },
+                    workspace_ready=workspace_ready,
+                ),
+                self._stage_claude_md(
+                    trace,
+                    user_id=user_id,
+                    session_id=session_id,
+                    workspace_ready=workspace_ready,
+                ),
             )
+            executor_url, container_id = await container_task
 
-            step_started = time.perf_counter()
-            await self.executor_client.execute_task(
-                executor_url=executor_url,
-                session_id=session_id,
-                run_id=str(run_id),
-                prompt=prompt,
-                callback_url=callback_url,
-                callback_token=self.settings.callback_token,
-                config=resolved_config,
-                callback_base_url=self.settings.callback_base_url,
-                sdk_session_id=sdk_session_id,
-                permission_mode=permission_mode,
-            )
-            logger.info(
-                "timing",
-                extra={
-                    "step": "run_dispatch_executor_execute_task",
-                    "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                    "container_id": container_id,
-                    **ctx,
-                },
+            await trace.stage(
+                "executor_execute_task",
+                self.executor_client.execute_task(
+                    executor_url=executor_url,
+                    session_id=session_id,
+                    run_id=str(run_id),
+                    prompt=prompt,
+                    callback_url=callback_url,
+                    callback_token=self.settings.callback_token,
+                    config=resolved_config,
+                    callback_base_url=self.settings.callback_base_url,
+                    sdk_session_id=sdk_session_id,
+                    permission_mode=permission_mode,
+                ),
             )
             try:
-                step_started = time.perf_counter()
-                await self.backend_client.start_run(
-                    run_id=run_id, worker_id=self.worker_id
-                )
-                logger.info(
-                    "timing",
-                    extra={
-                        "step": "run_dispatch_backend_start_run",
-                        "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                        "worker_id": self.worker_id,
-                        **ctx,
-                    },
+                await trace.stage(
+                    "backend_start_run",
+                    self.backend_client.start_run(
+                        run_id=run_id, worker_id=self.worker_id
+                    ),
                 )
             except Exception as e:
                 logger.error(f"Failed to mark run {run_id} as running: {e}")
@@ -401,9 +470,12 @@ class RunPullService:
                 "timing",
                 extra={
                     "step": "run_dispatch_total",
-                    "duration_ms": int((time.perf_counter() - dispatch_started) * 1000),
+                    "duration_ms": trace.elapsed_ms(),
+                    "stages": trace.stages,
                     "container_mode": container_mode,
                     "container_id": container_id,
+                    "browser_enabled": browser_enabled,
+                    "worker_id": self.worker_id,
                     **ctx,
                 },
             )
@@ -414,6 +486,17 @@ class RunPullService:
                 f"{type(e).__name__}: {e}",
                 exc_info=True,
             )
+            logger.info(
+                "timing",
+                extra={
+                    "step": "run_dispatch_failed",
+                    "duration_ms": trace.elapsed_ms(),
+                    "stages": trace.stages,
+                    **ctx,
+                },
+            )
+            # Let a container that is still starting settle so it gets cleaned up.
+            await asyncio.gather(container_task, return_exceptions=True)
             try:
                 await self.backend_client.fail_run(
                     run_id=run_id, worker_id=self.worker_id, error_message=str(e)
@@ -427,3 +510,201 @@ class RunPullService:
                 logger.error(
                     f"Failed to cancel task for session {session_id}: {cancel_err}"
                 )
+
+    async def _release_claim(self, run_id: str, session_id: str, reason: str) -> None:
+        """Hand a claimed run back to the queue; it was never started here."""
+        logger.warning(
+            "run_claim_released",
+            extra={
+                "run_id": run_id,
+                "session_id": session_id,
+                "worker_id": self.worker_id,
+                "reason": reason,
+            },
+        )
+        try:
+            await self.backend_client.release_run(
+                run_id=run_id, worker_id=self.worker_id
+            )
+        except Exception as e:
+            # The claim lease expires and the run is re-queued by the backend.
+            logger.error(f"Failed to release run {run_id}: {e}")
+
+    @staticmethod
+    async def _run_stager[T](
+        workspace_ready: asyncio.Event, func: Callable[..., T], **kwargs: Any
+    ) -> T:
+        """Run a stager once the session workspace is final.
+
+        Stagers do blocking file and network I/O, so they run on worker threads;
+        each writes its own directory of the session workspace.
+        """
+        await workspace_ready.wait()
+        future = asyncio.ensure_future(asyncio.to_thread(func, **kwargs))
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # The thread cannot be interrupted; wait for it so the stager is done
+            # writing before the dispatch is torn down.
+            with suppress(Exception):
+                await future
+            raise
+
+    async def _resolve_and_stage_config(
+        self,
+        trace: DispatchTrace,
+        *,
+        user_id: str,
+        session_id: str,
+        run_id: str,
+        config_snapshot: dict[str, Any],
+        workspace_ready: asyncio.Event,
+    ) -> dict[str, Any]:
+        """Resolve the run config, then stage the files it references."""
+        resolved_config = await trace.stage(
+            "resolve_config",
+            self.config_resolver.resolve(
+                user_id,
+                config_snapshot,
+                session_id=session_id,
+                run_id=run_id,
+            ),
+        )
+        raw_agents_val = resolved_config.pop("subagent_raw_agents", None)
+        raw_agents = raw_agents_val if isinstance(raw_agents_val, dict) else {}
+
+        staged_skills, staged_inputs, _ = await _gather_stages(
+            trace.stage(
+                "stage_skills",
+                self._run_stager(
+                    workspace_ready,
+                    self.skill_stager.stage_skills,
+                    user_id=user_id,
+                    session_id=session_id,
+                    skills=resolved_config.get("skill_files") or {},
+                ),
+            ),
+            trace.stage(
+                "stage_inputs",
+                self._run_stager(
+                    workspace_ready,
+                    self.attachment_stager.stage_inputs,
+                    user_id=user_id,
+                    session_id=session_id,
+                    inputs=resolved_config.get("input_files") or [],
+                ),
+            ),
+            self._stage_subagents(
+                trace,
+                user_id=user_id,
+                session_id=session_id,
+                raw_agents=raw_agents,
+                workspace_ready=workspace_ready,
+            ),
+        )
+        trace.annotate("stage_skills", skills_staged=len(staged_skills))
+        trace.annotate("stage_inputs", inputs_staged=len(staged_inputs))
+        resolved_config["skill_files"] = staged_skills
+        resolved_config["input_files"] = staged_inputs
+        return resolved_config
+
+    async def _stage_slash_commands(
+        self,
+        trace: DispatchTrace,
+        *,
+        user_id: str,
+        session_id: str,
+        workspace_ready: asyncio.Event,
+    ) -> None:
+        resolved_commands = await trace.stage(
+            "resolve_slash_commands",
+            self.user_config_cache.get(
+                user_id,
+                ("slash_commands",),
+                lambda: self.backend_client.resolve_slash_commands(user_id=user_id),
+            ),
+        )
+        staged_commands = await trace.stage(
+            "stage_slash_commands",
+            self._run_stager(
+                workspace_ready,
+                self.slash_command_stager.stage_commands,
+                user_id=user_id,
+                session_id=session_id,
+                commands=resolved_commands,
+            ),
+        )
+        trace.annotate("stage_slash_commands", commands_staged=len(staged_commands))
+
+    async def _stage_claude_md(
+        self,
+        trace: DispatchTrace,
+        *,
+        user_id: str,
+        session_id: str,
+        workspace_ready: asyncio.Event,
+    ) -> None:
+        """Stage user-level CLAUDE.md (persistent instructions) into ~/.claude."""
+        try:
+            claude_md = await trace.stage(
+                "get_claude_md",
+                self.user_config_cache.get(
+                    user_id,
+                    ("claude_md",),
+                    lambda: self.backend_client.get_claude_md(user_id=user_id),
+                ),
+            )
+            content = (
+                claude_md.get("content")
+                if isinstance(claude_md.get("content"), str)
+                else ""
+            )
+            staged_md = await trace.stage(
+                "stage_claude_md",
+                self._run_stager(
+                    workspace_ready,
+                    self.claude_md_stager.stage,
+                    user_id=user_id,
+                    session_id=session_id,
+                    enabled=bool(claude_md.get("enabled")),
+                    content=content,
+                ),
+            )
+            bytes_val = staged_md.get("bytes", 0)
+            trace.annotate(
+                "stage_claude_md",
+                enabled=bool(staged_md.get("enabled")),
+                bytes=int(bytes_val) if isinstance(bytes_val, int) else 0,
+            )
+        except Exception as exc:
+            # Best-effort: don't block execution if CLAUDE.md staging fails.
+            logger.warning(f"Failed to stage CLAUDE.md for session {session_id}: {exc}")
+
+    async def _stage_subagents(
+        self,
+        trace: DispatchTrace,
+        *,
+        user_id: str,
+        session_id: str,
+        raw_agents: dict[str, Any],
+        workspace_ready: asyncio.Event,
+    ) -> None:
+        try:
+            staged_agents = await trace.stage(
+                "stage_subagents",
+                self._run_stager(
+                    workspace_ready,
+                    self.subagent_stager.stage_raw_agents,
+                    user_id=user_id,
+                    session_id=session_id,
+                    raw_agents=raw_agents,
+                ),
+            )
+            trace.annotate(
+                "stage_subagents",
+                subagents_requested=len(raw_agents),
+                subagents_staged=len(staged_agents),
+            )
+        except Exception as exc:
+            # Best-effort: keep tasks running even if staging fails.
+            logger.warning(f"Failed to stage subagents for session {session_id}: {exc}")
@@ -6,6 +6,9 @@ from app.core.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on back-to-back batches per tick when a backlog is due at once.
+MAX_BATCHES_PER_TICK = 20
+
 
 class ScheduledTaskDispatchService:
     """Background service that asks Backend to enqueue due scheduled tasks."""
@@ -15,12 +18,25 @@ class ScheduledTaskDispatchService:
         self.backend_client = backend_client or BackendClient()
 
     async def dispatch_due(self) -> None:
-        started = time.perf_counter()
         batch_size = max(1, int(self.settings.scheduled_tasks_dispatch_batch_size))
-        try:
-            payload = await self.backend_client.dispatch_due_scheduled_tasks(
-                limit=batch_size
-            )
+        for _ in range(MAX_BATCHES_PER_TICK):
+            started = time.perf_counter()
+            try:
+                payload = await self.backend_client.dispatch_due_scheduled_tasks(
+                    limit=batch_size
+                )
+            except Exception as e:
+                duration_ms = int((time.perf_counter() - started) * 1000)
+                logger.error(
+                    "scheduled_tasks_dispatch_failed",
+                    extra={
+                        "duration_ms": duration_ms,
+                        "batch_size": batch_size,
+                        "error": str(e),
+                    },
+                )
+                return
+
             duration_ms = int((time.perf_counter() - started) * 1000)
             logger.info(
                 "scheduled_tasks_dispatch",
@@ -30,13 +46,8 @@ class ScheduledTaskDispatchService:
                     "result": payload,
                 },
             )
-        except Exception as e:
-            duration_ms = int((time.perf_counter() - started) * 1000)
-            logger.error(
-                "scheduled_tasks_dispatch_failed",
-                extra={
-                    "duration_ms": duration_ms,
-                    "batch_size": batch_size,
-                    "error": str(e),
-                },
-            )
+            # A full batch means more tasks may still be due; stop when a batch
+            # made no progress (e.g. only failing tasks are left).
+            progressed = payload.get("dispatched") or payload.get("skipped")
+            if int(payload.get("claimed") or 0) < batch_size or not progressed:
+                return
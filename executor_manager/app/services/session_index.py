@@ -0,0 +1,109 @@
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_indexes: dict[Path, "SessionIndex"] = {}
+_indexes_lock = threading.Lock()
+
+
+class SessionIndex:
+    """Persistent session -> user index of active workspaces.
+
+    Backed by a small SQLite file under the workspace root, so resolving a
+    session's user does not scan every user directory. The index mirrors the
+    ``meta.json`` files and can be rebuilt from them at any time.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        # Mappings already written by this process; skips redundant upserts
+        # from the many get_workspace_path calls of one dispatch.
+        self._known: dict[str, str] = {}
+        self._conn = sqlite3.connect(
+            db_path, check_same_thread=False, isolation_level=None
+        )
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                "session_id TEXT PRIMARY KEY, user_id TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_sessions_user_id ON sessions (user_id)"
+            )
+
+    def add(self, session_id: str, user_id: str) -> None:
+        if self._known.get(session_id) == user_id:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sessions (session_id, user_id) VALUES (?, ?)",
+                (session_id, user_id),
+            )
+            self._known[session_id] = user_id
+
+    def remove(self, session_id: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM sessions WHERE session_id = ?", (session_id,)
+            )
+            self._known.pop(session_id, None)
+
+    def get_user_id(self, session_id: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT user_id FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def list_session_ids(self, user_id: str) -> list[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT session_id FROM sessions WHERE user_id = ?", (user_id,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def rebuild(self, active_dir: Path) -> int:
+        """Replace the index with the workspaces found under ``active_dir``.
+
+        A workspace is ``<active_dir>/<user_id>/<session_id>/meta.json``.
+
+        Returns:
+            Number of indexed sessions.
+        """
+        entries: dict[str, str] = {}
+        if active_dir.exists():
+            for meta_file in active_dir.glob("*/*/meta.json"):
+                session_dir = meta_file.parent
+                entries[session_dir.name] = session_dir.parent.name
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute("DELETE FROM sessions")
+                self._conn.executemany(
+                    "INSERT INTO sessions (session_id, user_id) VALUES (?, ?)",
+                    entries.items(),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._known = dict(entries)
+        return len(entries)
+
+
+def get_session_index(base_dir: Path) -> SessionIndex:
+    """Return the shared index of a workspace root (one per process)."""
+    key = base_dir.resolve()
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = SessionIndex(key / "session_index.db")
+            _indexes[key] = index
+        return index
@@ -7,7 +7,7 @@ from typing import Any
 
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
-from app.services.storage_service import S3StorageService
+from app.services.storage_service import DownloadItem, S3StorageService
 from app.services.workspace_manager import WorkspaceManager
 
 logger = logging.getLogger(__name__)
@@ -79,6 +79,7 @@ class SkillStager:
         removed = self._clean_skills_dir(skills_root, enabled_names)
 
         staged: dict[str, dict[str, Any]] = {}
+        downloads: list[DownloadItem] = []
         skills_root_resolved = skills_root.resolve()
         for name, spec in (skills or {}).items():
             if not isinstance(spec, dict):
@@ -100,30 +101,17 @@ class SkillStager:
             target_dir.mkdir(parents=True, exist_ok=True)
 
             try:
-                step_started = time.perf_counter()
                 if entry.get("is_prefix") or str(s3_key).endswith("/"):
-                    self.storage_service.download_prefix(
-                        prefix=str(s3_key), destination_dir=target_dir
+                    downloads.extend(
+                        self.storage_service.prefix_download_items(
+                            prefix=str(s3_key), destination_dir=target_dir
+                        )
                     )
                 else:
                     filename = Path(str(s3_key)).name
-                    destination = target_dir / filename
-                    self.storage_service.download_file(
-                        key=str(s3_key), destination=destination
+                    downloads.append(
+                        DownloadItem(key=str(s3_key), destination=target_dir / filename)
                     )
-                logger.info(
-                    "timing",
-                    extra={
-                        "step": "skill_stage_download",
-                        "duration_ms": int((time.perf_counter() - step_started) * 1000),
-                        "user_id": user_id,
-                        "session_id": session_id,
-                        "skill_name": name,
-                        "s3_key": str(s3_key),
-                        "is_prefix": bool(entry.get("is_prefix"))
-                        or str(s3_key).endswith("/"),
-                    },
-                )
             except Exception as exc:
                 raise AppException(
                     error_code=ErrorCode.SKILL_DOWNLOAD_FAILED,
@@ -137,6 +125,16 @@ class SkillStager:
                 "entry": entry,
             }
 
+        # Download every skill file in one bounded-concurrency batch so staging time
+        # scales with bandwidth rather than object count.
+        try:
+            download_stats = self.storage_service.download_files(downloads)
+        except Exception as exc:
+            raise AppException(
+                error_code=ErrorCode.SKILL_DOWNLOAD_FAILED,
+                message=f"Failed to stage skills: {exc}",
+            ) from exc
+
         logger.info(
             "timing",
             extra={
@@ -147,6 +145,9 @@ class SkillStager:
                 "skills_requested": len(skills or {}),
                 "skills_staged": len(staged),
                 "skills_removed": removed,
+                "files_downloaded": download_stats.objects,
+                "bytes_downloaded": download_stats.bytes,
+                "download_throughput_mb_s": download_stats.throughput_mb_s,
             },
         )
         return staged
@@ -1,8 +1,13 @@
 import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from pathlib import Path, PurePosixPath
-from typing import Any, Iterable
+from typing import Any, Iterable, TypeVar
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 
@@ -12,6 +17,48 @@ from app.core.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+_MB = 1024 * 1024
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class UploadItem:
+    file_path: str
+    key: str
+    content_type: str | None = None
+
+
+@dataclass(frozen=True)
+class DownloadItem:
+    key: str
+    destination: Path
+
+
+@dataclass
+class TransferBatchStats:
+    """Throughput metrics for one bulk transfer batch."""
+
+    operation: str
+    objects: int = 0
+    bytes: int = 0
+    duration_ms: int = 0
+
+    @property
+    def throughput_mb_s(self) -> float:
+        if self.duration_ms <= 0:
+            return 0.0
+        return round(self.bytes / _MB / (self.duration_ms / 1000), 2)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "operation": self.operation,
+            "objects": self.objects,
+            "bytes": self.bytes,
+            "duration_ms": self.duration_ms,
+            "throughput_mb_s": self.throughput_mb_s,
+        }
+
 
 class S3StorageService:
     def __init__(self) -> None:
@@ -42,10 +89,18 @@ class S3StorageService:
                 "mode": "standard",
             },
         }
+        # One budget of concurrent S3 requests: batches split it between files and
+        # the multipart parts of each file (see _part_concurrency).
+        self.max_workers = max(1, settings.s3_transfer_max_workers)
+        config_kwargs["max_pool_connections"] = max(10, self.max_workers)
         if settings.s3_force_path_style:
             config_kwargs["s3"] = {"addressing_style": "path"}
         config = Config(**config_kwargs) if config_kwargs else None
 
+        self._multipart_threshold = max(5, settings.s3_multipart_threshold_mb) * _MB
+        self._multipart_chunksize = max(5, settings.s3_multipart_chunksize_mb) * _MB
+        self.transfer_config = self._transfer_config(self.max_workers)
+
         self.client = boto3.client(
             "s3",
             endpoint_url=settings.s3_endpoint,
@@ -55,19 +110,32 @@ class S3StorageService:
             config=config,
         )
 
+    def _transfer_config(self, max_concurrency: int) -> TransferConfig:
+        return TransferConfig(
+            multipart_threshold=self._multipart_threshold,
+            multipart_chunksize=self._multipart_chunksize,
+            max_concurrency=max_concurrency,
+        )
+
     def upload_file(
-        self, *, file_path: str, key: str, content_type: str | None = None
+        self,
+        *,
+        file_path: str,
+        key: str,
+        content_type: str | None = None,
+        transfer_config: TransferConfig | None = None,
     ) -> None:
         extra_args: dict[str, Any] = {}
         if content_type:
             extra_args["ContentType"] = content_type
         try:
-            if extra_args:
-                self.client.upload_file(
-                    file_path, self.bucket, key, ExtraArgs=extra_args
-                )
-            else:
-                self.client.upload_file(file_path, self.bucket, key)
+            self.client.upload_file(
+                file_path,
+                self.bucket,
+                key,
+                ExtraArgs=extra_args or None,
+                Config=transfer_config or self.transfer_config,
+            )
         except (ClientError, BotoCoreError) as exc:
             logger.error(f"Failed to upload {file_path} to {key}: {exc}")
             raise AppException(
@@ -96,6 +164,42 @@ class S3StorageService:
                 details={"key": key, "error": str(exc)},
             ) from exc
 
+    def copy_object(self, *, source_key: str, key: str) -> None:
+        """Server-side copy within the bucket (no data passes through here)."""
+        try:
+            self.client.copy_object(
+                Bucket=self.bucket,
+                Key=key,
+                CopySource={"Bucket": self.bucket, "Key": source_key},
+            )
+        except (ClientError, BotoCoreError) as exc:
+            logger.error(f"Failed to copy object {source_key} to {key}: {exc}")
+            raise AppException(
+                error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+                message="Failed to copy object",
+                details={"source_key": source_key, "key": key, "error": str(exc)},
+            ) from exc
+
+    def delete_objects(self, keys: list[str]) -> None:
+        # DeleteObjects accepts at most 1000 keys per request.
+        for start in range(0, len(keys), 1000):
+            batch = keys[start : start + 1000]
+            try:
+                self.client.delete_objects(
+                    Bucket=self.bucket,
+                    Delete={
+                        "Objects": [{"Key": key} for key in batch],
+                        "Quiet": True,
+                    },
+                )
+            except (ClientError, BotoCoreError) as exc:
+                logger.error(f"Failed to delete {len(batch)} objects: {exc}")
+                raise AppException(
+                    error_code=ErrorCode.EXTERNAL_SERVICE_ERROR,
+                    message="Failed to delete objects",
+                    details={"keys": batch[:10], "error": str(exc)},
+                ) from exc
+
     def list_objects(self, prefix: str) -> Iterable[str]:
         try:
             paginator = self.client.get_paginator("list_objects_v2")
@@ -112,10 +216,21 @@ class S3StorageService:
                 details={"prefix": prefix, "error": str(exc)},
             ) from exc
 
-    def download_file(self, *, key: str, destination: Path) -> None:
+    def download_file(
+        self,
+        *,
+        key: str,
+        destination: Path,
+        transfer_config: TransferConfig | None = None,
+    ) -> None:
         try:
             destination.parent.mkdir(parents=True, exist_ok=True)
-            self.client.download_file(self.bucket, key, str(destination))
+            self.client.download_file(
+                self.bucket,
+                key,
+                str(destination),
+                Config=transfer_config or self.transfer_config,
+            )
         except (ClientError, BotoCoreError) as exc:
             logger.error(f"Failed to download {key}: {exc}")
             raise AppException(
@@ -124,7 +239,11 @@ class S3StorageService:
                 details={"key": key, "error": str(exc)},
             ) from exc
 
-    def download_prefix(self, *, prefix: str, destination_dir: Path) -> None:
+    def prefix_download_items(
+        self, *, prefix: str, destination_dir: Path
+    ) -> list[DownloadItem]:
+        """List objects under a prefix and map them to safe local destinations."""
+        items: list[DownloadItem] = []
         for key in self.list_objects(prefix):
             if key.endswith("/"):
                 continue
@@ -132,7 +251,86 @@ class S3StorageService:
             if not relative:
                 continue
             target = self._safe_destination(destination_dir, relative)
-            self.download_file(key=key, destination=target)
+            items.append(DownloadItem(key=key, destination=target))
+        return items
+
+    def download_prefix(
+        self, *, prefix: str, destination_dir: Path
+    ) -> TransferBatchStats:
+        items = self.prefix_download_items(
+            prefix=prefix, destination_dir=destination_dir
+        )
+        return self.download_files(items)
+
+    def upload_files(self, items: list[UploadItem]) -> TransferBatchStats:
+        """Upload many files concurrently on the bounded transfer pool."""
+
+        def upload(item: UploadItem, config: TransferConfig) -> int:
+            self.upload_file(
+                file_path=item.file_path,
+                key=item.key,
+                content_type=item.content_type,
+                transfer_config=config,
+            )
+            return Path(item.file_path).stat().st_size
+
+        return self._run_batch("upload", items, upload)
+
+    def download_files(self, items: list[DownloadItem]) -> TransferBatchStats:
+        """Download many objects concurrently on the bounded transfer pool."""
+
+        def download(item: DownloadItem, config: TransferConfig) -> int:
+            self.download_file(
+                key=item.key, destination=item.destination, transfer_config=config
+            )
+            return item.destination.stat().st_size
+
+        return self._run_batch("download", items, download)
+
+    def _run_batch(
+        self,
+        operation: str,
+        items: list[T],
+        fn: Callable[[T, TransferConfig], int],
+    ) -> TransferBatchStats:
+        stats = TransferBatchStats(operation=operation)
+        if not items:
+            return stats
+
+        started = time.perf_counter()
+        workers = min(self.max_workers, len(items))
+        # Split the request budget: files run in parallel, so each multipart
+        # transfer only gets its share (workers * parts <= max_workers).
+        part_concurrency = max(1, self.max_workers // workers)
+        config = self._transfer_config(part_concurrency)
+        executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=f"s3-{operation}"
+        )
+        try:
+            futures = [executor.submit(fn, item, config) for item in items]
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in done:
+                exc = future.exception()
+                if exc is not None:
+                    raise exc
+            for future in futures:
+                stats.bytes += future.result()
+                stats.objects += 1
+        finally:
+            # Fail fast: drop queued transfers once any transfer failed.
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        stats.duration_ms = int((time.perf_counter() - started) * 1000)
+        logger.info(
+            "timing",
+            extra={
+                "step": f"s3_batch_{operation}",
+                "workers": workers,
+                "part_concurrency": part_concurrency,
+                **stats.to_dict(),
+            },
+        )
+        return stats
 
     @staticmethod
     def _safe_destination(destination_dir: Path, relative: str) -> Path:
@@ -6,6 +6,7 @@ import httpx
 
 from app.core.errors.error_codes import ErrorCode
 from app.core.errors.exceptions import AppException
+from app.core.http_client import get_http_client
 from app.core.observability.request_context import get_request_id, get_trace_id
 from app.core.settings import get_settings
 from app.scheduler.scheduler_config import scheduler
@@ -101,16 +102,17 @@ class TaskService:
                 container_pool = TaskDispatcher.get_container_pool()
                 step_started = time.perf_counter()
                 browser_enabled = bool(config.get("browser_enabled"))
-                (
-                    container_url,
-                    container_id,
-                ) = await container_pool.get_or_create_container(
-                    session_id=session_id,
-                    user_id=user_id,
-                    browser_enabled=browser_enabled,
-                    container_mode=container_mode,
-                    container_id=container_id,
-                )
+                async with container_pool.admitted(container_id):
+                    (
+                        container_url,
+                        container_id,
+                    ) = await container_pool.get_or_create_container(
+                        session_id=session_id,
+                        user_id=user_id,
+                        browser_enabled=browser_enabled,
+                        container_mode=container_mode,
+                        container_id=container_id,
+                    )
                 logger.info(
                     "timing",
                     extra={
@@ -173,6 +175,8 @@ class TaskService:
                 container_id=container_id,
             )
 
+        except AppException:
+            raise
         except httpx.HTTPStatusError as e:
             logger.error(f"Failed to create session: {e}")
             raise AppException(
@@ -231,13 +235,13 @@ class TaskService:
         backend_client = BackendClient()
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{backend_client.settings.backend_url}/api/v1/sessions/{session_id}",
-                    headers=backend_client._trace_headers(),
-                )
-                response.raise_for_status()
-                data = response.json()
+            client = get_http_client()
+            response = await client.get(
+                f"{backend_client.settings.backend_url}/api/v1/sessions/{session_id}",
+                headers=backend_client._trace_headers(),
+            )
+            response.raise_for_status()
+            data = response.json()
 
             # Parse backend response (backend returns wrapped ResponseSchema)
             session_data = data.get("data", data)
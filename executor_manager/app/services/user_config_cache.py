@@ -0,0 +1,106 @@
+import asyncio
+import copy
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.core.settings import get_settings
+from app.services.backend_client import BackendClient
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _UserEntry:
+    version: str
+    # lookup key -> (stored at, value)
+    values: dict[Hashable, tuple[float, Any]] = field(default_factory=dict)
+
+
+class UserConfigCache:
+    """Versioned cache of per-user config lookups made for every run.
+
+    Each lookup first asks the backend for the user's config version (one cheap
+    call, shared by concurrent lookups of the same user) and reuses the stored
+    value while the version is unchanged. Values also expire after a TTL, which
+    is shorter for lookups carrying secrets. When the version cannot be fetched
+    the lookup goes straight to the backend.
+    """
+
+    def __init__(self, backend_client: BackendClient | None = None) -> None:
+        settings = get_settings()
+        self.backend_client = backend_client or BackendClient()
+        self.max_users = settings.user_config_cache_max_users
+        self.ttl_seconds = settings.user_config_cache_ttl_seconds
+        self.secret_ttl_seconds = settings.user_config_cache_secret_ttl_seconds
+        self._entries: OrderedDict[str, _UserEntry] = OrderedDict()
+        self._pending_versions: dict[str, asyncio.Future[str | None]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_users > 0
+
+    async def get(
+        self,
+        user_id: str,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        *,
+        secret: bool = False,
+    ) -> Any:
+        """Return the cached value of a lookup, loading it on a miss.
+
+        Callers get a copy, so they may mutate the result freely.
+        """
+        if not self.enabled:
+            return await loader()
+        version = await self._current_version(user_id)
+        if not version:
+            return await loader()
+
+        ttl = self.secret_ttl_seconds if secret else self.ttl_seconds
+        entry = self._entries.get(user_id)
+        if entry is not None and entry.version == version:
+            cached = entry.values.get(key)
+            if cached is not None and time.monotonic() - cached[0] < ttl:
+                return copy.deepcopy(cached[1])
+
+        value = await loader()
+        entry = self._entries.get(user_id)
+        # The version was read before loading, so the value is at least as new.
+        if entry is not None and entry.version == version:
+            entry.values[key] = (time.monotonic(), value)
+        return copy.deepcopy(value)
+
+    async def _current_version(self, user_id: str) -> str | None:
+        pending = self._pending_versions.get(user_id)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch_version(user_id))
+            self._pending_versions[user_id] = pending
+            pending.add_done_callback(
+                lambda _: self._pending_versions.pop(user_id, None)
+            )
+        return await asyncio.shield(pending)
+
+    async def _fetch_version(self, user_id: str) -> str | None:
+        try:
+            version = await self.backend_client.get_user_config_version(user_id)
+        except Exception as exc:
+            logger.warning(
+                "user_config_version_failed",
+                extra={"user_id": user_id, "error": str(exc)},
+            )
+            return None
+        if not version:
+            return None
+
+        entry = self._entries.get(user_id)
+        if entry is None or entry.version != version:
+            self._entries[user_id] = _UserEntry(version=version)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_users:
+            self._entries.popitem(last=False)
+        return version
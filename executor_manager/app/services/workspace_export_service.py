@@ -1,14 +1,19 @@
+import hashlib
 import json
 import logging
 import mimetypes
 import os
+import threading
+import time
 import zipfile
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 from app.core.errors.exceptions import AppException
+from app.core.settings import get_settings
 from app.schemas.workspace import WorkspaceExportResult
-from app.services.storage_service import S3StorageService
+from app.services.storage_service import S3StorageService, UploadItem
 from app.services.workspace_manager import WorkspaceManager
 
 logger = logging.getLogger(__name__)
@@ -17,9 +22,30 @@ logger = logging.getLogger(__name__)
 workspace_manager = WorkspaceManager()
 storage_service = S3StorageService()
 
+# Per-session export index, stored next to meta.json (outside the exported workspace).
+EXPORT_INDEX_FILENAME = "export_index.json"
+EXPORT_INDEX_VERSION = 1
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Serializes exports and archive builds of a session (both rewrite its index).
+_session_locks: dict[str, threading.Lock] = {}
+_session_locks_guard = threading.Lock()
+
+
+def _session_lock(session_id: str) -> threading.Lock:
+    with _session_locks_guard:
+        return _session_locks.setdefault(session_id, threading.Lock())
+
 
 class WorkspaceExportService:
+    def __init__(self) -> None:
+        self.settings = get_settings()
+
     def export_workspace(self, session_id: str) -> WorkspaceExportResult:
+        with _session_lock(session_id):
+            return self._export_workspace(session_id)
+
+    def _export_workspace(self, session_id: str) -> WorkspaceExportResult:
         user_id = workspace_manager.resolve_user_id(session_id)
         if not user_id:
             return WorkspaceExportResult(
@@ -40,65 +66,129 @@ class WorkspaceExportService:
         files_prefix = f"{prefix}/files"
         manifest_key = f"{prefix}/manifest.json"
         archive_key = f"{prefix}/archive.zip"
+        index_path = workspace_dir.parent / EXPORT_INDEX_FILENAME
+        archive_enabled = self.settings.workspace_export_archive_enabled
 
         try:
+            started = time.perf_counter()
+            previous = (
+                self._load_index(index_path)
+                if self.settings.workspace_export_incremental
+                else {}
+            )
+            previous_files: dict[str, dict[str, Any]] = previous.get("files") or {}
+
             files = self._collect_files(workspace_dir)
             manifest = {
-                "version": 1,
+                "version": 2,
                 "generated_at": datetime.now(timezone.utc).isoformat(),
                 "files": [],
             }
+            index_files: dict[str, dict[str, Any]] = {}
+            pending_uploads: list[UploadItem] = []
 
             for file_path in files:
                 rel_path = file_path.relative_to(workspace_dir).as_posix()
                 object_key = f"{files_prefix}/{rel_path}"
                 mime_type, _ = mimetypes.guess_type(file_path.name)
+                stat = file_path.stat()
 
-                storage_service.upload_file(
-                    file_path=str(file_path),
-                    key=object_key,
-                    content_type=mime_type,
+                entry = self._reuse_entry(
+                    previous_files.get(rel_path), stat, object_key
                 )
+                if entry is None:
+                    sha256 = self._hash_file(file_path)
+                    prev = previous_files.get(rel_path)
+                    if (
+                        not prev
+                        or prev.get("sha256") != sha256
+                        or prev.get("key") != object_key
+                    ):
+                        pending_uploads.append(
+                            UploadItem(
+                                file_path=str(file_path),
+                                key=object_key,
+                                content_type=mime_type,
+                            )
+                        )
+                    entry = {
+                        "key": object_key,
+                        "size": stat.st_size,
+                        "mtime_ns": stat.st_mtime_ns,
+                        "sha256": sha256,
+                    }
+                index_files[rel_path] = entry
 
                 manifest["files"].append(
                     {
                         "path": rel_path,
                         "key": object_key,
-                        "size": file_path.stat().st_size,
+                        "size": stat.st_size,
                         "mimeType": mime_type,
                         "status": "uploaded",
+                        "sha256": entry["sha256"],
                         "last_modified": datetime.fromtimestamp(
-                            file_path.stat().st_mtime, tz=timezone.utc
+                            stat.st_mtime, tz=timezone.utc
                         ).isoformat(),
                     }
                 )
 
+            upload_stats = storage_service.upload_files(pending_uploads)
+
+            removed_keys = [
+                str(entry.get("key"))
+                for rel_path, entry in previous_files.items()
+                if rel_path not in index_files and entry.get("key")
+            ]
+            if removed_keys:
+                storage_service.delete_objects(removed_keys)
+
             storage_service.put_object(
                 key=manifest_key,
                 body=json.dumps(manifest, ensure_ascii=False).encode("utf-8"),
                 content_type="application/json",
             )
 
-            archive_path = self._create_archive(
-                workspace_dir=workspace_dir,
-                session_id=session_id,
-                files=files,
+            # archive.zip is built on download (build_archive); an export only marks
+            # it stale when the exported file set changed.
+            archive_stale = bool(
+                pending_uploads
+                or removed_keys
+                or previous.get("archive_stale", True)
+                or not previous.get("archive_key")
             )
-            storage_service.upload_file(
-                file_path=str(archive_path),
-                key=archive_key,
-                content_type="application/zip",
+
+            self._save_index(
+                index_path,
+                {
+                    "version": EXPORT_INDEX_VERSION,
+                    "exported_at": manifest["generated_at"],
+                    "archive_key": previous.get("archive_key"),
+                    "archive_stale": archive_stale,
+                    "files": index_files,
+                },
             )
 
-            try:
-                archive_path.unlink(missing_ok=True)
-            except Exception:
-                logger.warning(f"Failed to cleanup archive temp file: {archive_path}")
+            logger.info(
+                "timing",
+                extra={
+                    "step": "workspace_export_total",
+                    "duration_ms": int((time.perf_counter() - started) * 1000),
+                    "user_id": user_id,
+                    "session_id": session_id,
+                    "files_total": len(files),
+                    "files_uploaded": upload_stats.objects,
+                    "bytes_uploaded": upload_stats.bytes,
+                    "upload_throughput_mb_s": upload_stats.throughput_mb_s,
+                    "files_removed": len(removed_keys),
+                    "archive_stale": archive_stale,
+                },
+            )
 
             return WorkspaceExportResult(
                 workspace_files_prefix=files_prefix,
                 workspace_manifest_key=manifest_key,
-                workspace_archive_key=archive_key,
+                workspace_archive_key=archive_key if archive_enabled else None,
                 workspace_export_status="ready",
             )
         except AppException as exc:
@@ -112,6 +202,126 @@ class WorkspaceExportService:
                 error=str(exc), workspace_export_status="failed"
             )
 
+    def build_archive(self, session_id: str) -> str | None:
+        """Build and upload archive.zip if the last export changed the file set.
+
+        Returns:
+            The archive key, or None if archives are disabled or the workspace
+            has not been exported.
+        """
+        if not self.settings.workspace_export_archive_enabled:
+            return None
+        user_id = workspace_manager.resolve_user_id(session_id)
+        if not user_id:
+            return None
+        workspace_dir = workspace_manager.get_session_workspace_dir(
+            user_id=user_id, session_id=session_id
+        )
+        if not workspace_dir:
+            return None
+
+        with _session_lock(session_id):
+            index_path = workspace_dir.parent / EXPORT_INDEX_FILENAME
+            index = self._load_index(index_path)
+            if not index:
+                return None
+            archive_key = f"workspaces/{user_id}/{session_id}/archive.zip"
+            if index.get("archive_key") == archive_key and not index.get(
+                "archive_stale", True
+            ):
+                return archive_key
+
+            started = time.perf_counter()
+            files = self._collect_files(workspace_dir)
+            self._upload_archive(
+                workspace_dir=workspace_dir,
+                session_id=session_id,
+                files=files,
+                archive_key=archive_key,
+            )
+            self._save_index(
+                index_path,
+                {**index, "archive_key": archive_key, "archive_stale": False},
+            )
+            logger.info(
+                "timing",
+                extra={
+                    "step": "workspace_archive_build",
+                    "duration_ms": int((time.perf_counter() - started) * 1000),
+                    "user_id": user_id,
+                    "session_id": session_id,
+                    "files_total": len(files),
+                },
+            )
+            return archive_key
+
+    @staticmethod
+    def _reuse_entry(
+        previous: dict[str, Any] | None, stat: os.stat_result, object_key: str
+    ) -> dict[str, Any] | None:
+        """Return the previous index entry when size and mtime are unchanged."""
+        if not previous or not previous.get("sha256"):
+            return None
+        if previous.get("key") != object_key:
+            return None
+        if previous.get("size") != stat.st_size:
+            return None
+        if previous.get("mtime_ns") != stat.st_mtime_ns:
+            return None
+        return previous
+
+    @staticmethod
+    def _hash_file(file_path: Path) -> str:
+        digest = hashlib.sha256()
+        with file_path.open("rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _load_index(index_path: Path) -> dict[str, Any]:
+        if not index_path.exists():
+            return {}
+        try:
+            data = json.loads(index_path.read_text(encoding="utf-8"))
+        except Exception as exc:
+            logger.warning(f"Ignoring unreadable export index {index_path}: {exc}")
+            return {}
+        if not isinstance(data, dict) or data.get("version") != EXPORT_INDEX_VERSION:
+            return {}
+        return data
+
+    @staticmethod
+    def _save_index(index_path: Path, index: dict[str, Any]) -> None:
+        tmp_path = index_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(index), encoding="utf-8")
+        os.replace(tmp_path, index_path)
+
+    def _upload_archive(
+        self,
+        *,
+        workspace_dir: Path,
+        session_id: str,
+        files: list[Path],
+        archive_key: str,
+    ) -> None:
+        archive_path = self._create_archive(
+            workspace_dir=workspace_dir,
+            session_id=session_id,
+            files=files,
+        )
+        try:
+            storage_service.upload_file(
+                file_path=str(archive_path),
+                key=archive_key,
+                content_type="application/zip",
+            )
+        finally:
+            try:
+                archive_path.unlink(missing_ok=True)
+            except Exception:
+                logger.warning(f"Failed to cleanup archive temp file: {archive_path}")
+
     def _collect_files(self, workspace_dir: Path) -> list[Path]:
         files: list[Path] = []
         ignore_names = workspace_manager._ignore_names
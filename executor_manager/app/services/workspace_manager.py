@@ -1,14 +1,17 @@
 import json
 import logging
 import mimetypes
+import os
 import shutil
 import tarfile
+import uuid
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Literal
 
 from app.core.settings import Settings, get_settings
+from app.services.session_index import SessionIndex, get_session_index
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +37,8 @@ class WorkspaceManager:
     active_dir: Path
     archive_dir: Path
     temp_dir: Path
+    warm_dir: Path
+    session_index: SessionIndex
 
     def __init__(self):
         self.settings = get_settings()
@@ -41,9 +46,12 @@ class WorkspaceManager:
         self.active_dir = self.base_dir / "active"
         self.archive_dir = self.base_dir / "archive"
         self.temp_dir = self.base_dir / "temp"
+        # Workspace slots of pre-warmed executor containers (see ContainerPool).
+        self.warm_dir = self.base_dir / "warm"
         self.ignore_dot_files = self.settings.workspace_ignore_dot_files
 
         self._init_directories()
+        self.session_index = get_session_index(self.base_dir)
 
         self._ignore_names = {
             ".git",
@@ -64,7 +72,12 @@ class WorkspaceManager:
 
     def _init_directories(self) -> None:
         """Initialize directory structure."""
-        for directory in [self.active_dir, self.archive_dir, self.temp_dir]:
+        for directory in [
+            self.active_dir,
+            self.archive_dir,
+            self.temp_dir,
+            self.warm_dir,
+        ]:
             directory.mkdir(parents=True, exist_ok=True)
             logger.debug("workspace_dir_ready", extra={"path": str(directory)})
 
@@ -86,6 +99,7 @@ class WorkspaceManager:
             (session_dir / "logs").mkdir(exist_ok=True)
 
             self._write_meta(session_dir, user_id, session_id)
+            self.session_index.add(session_id, user_id)
 
         return session_dir
 
@@ -102,15 +116,21 @@ class WorkspaceManager:
         return workspace_dir
 
     def resolve_user_id(self, session_id: str) -> str | None:
-        """Resolve user_id for a session by scanning workspace roots."""
-        if not self.active_dir.exists():
+        """Resolve user_id for a session from the session index."""
+        user_id = self.session_index.get_user_id(session_id)
+        if user_id is None:
             return None
-        for user_dir in self.active_dir.iterdir():
-            if not user_dir.is_dir():
-                continue
-            if (user_dir / session_id).exists():
-                return user_dir.name
-        return None
+        if not (self.active_dir / user_id / session_id).exists():
+            # Removed behind our back (e.g. by another process); drop the stale entry.
+            self.session_index.remove(session_id)
+            return None
+        return user_id
+
+    def rebuild_session_index(self) -> int:
+        """Rebuild the session index from the workspaces' meta.json files."""
+        count = self.session_index.rebuild(self.active_dir)
+        logger.info("workspace_session_index_rebuilt", extra={"sessions": count})
+        return count
 
     def list_workspace_files(
         self,
@@ -240,7 +260,11 @@ class WorkspaceManager:
         )
 
         meta_file = session_dir / "meta.json"
-        _ = meta_file.write_text(json.dumps(meta.to_dict(), indent=2), encoding="utf-8")
+        # Stagers prepare a workspace from several threads at once; replace the
+        # file atomically so readers never see a partial write.
+        tmp_file = session_dir / f".meta.json.{uuid.uuid4().hex}.tmp"
+        _ = tmp_file.write_text(json.dumps(meta.to_dict(), indent=2), encoding="utf-8")
+        os.replace(tmp_file, meta_file)
         logger.debug(
             "workspace_meta_written",
             extra={"session_id": session_id, "meta_file": str(meta_file)},
@@ -306,6 +330,7 @@ class WorkspaceManager:
             self.update_meta_status(user_id, session_id, "archived")
 
             shutil.rmtree(session_dir)
+            self.session_index.remove(session_id)
 
             logger.info(f"Archived workspace: {session_dir} -> {archive_file}")
             return str(archive_file)
@@ -337,6 +362,7 @@ class WorkspaceManager:
 
         try:
             shutil.rmtree(session_dir)
+            self.session_index.remove(session_id)
             logger.info(f"Deleted workspace: {session_dir}")
             return True
         except Exception as e:
@@ -422,17 +448,9 @@ class WorkspaceManager:
 
     def get_user_workspaces(self, user_id: str) -> list[dict[str, str | int]]:
         """Get all workspaces for a user."""
-        user_dir = self.active_dir / user_id
-
-        if not user_dir.exists():
-            return []
-
         workspaces: list[dict[str, str | int]] = []
-        for session_dir in user_dir.iterdir():
-            if not session_dir.is_dir():
-                continue
-
-            meta = self.get_meta(user_id, session_dir.name)
+        for session_id in self.session_index.list_session_ids(user_id):
+            meta = self.get_meta(user_id, session_id)
             if meta:
                 workspaces.append(meta.to_dict())
 
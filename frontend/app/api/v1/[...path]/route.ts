@@ -62,6 +62,8 @@ async function proxyRequest(
     method,
     headers,
     redirect: "manual",
+    // Abort the upstream request (e.g. an SSE stream) when the client goes away.
+    signal: request.signal,
   };
 
   if (hasBody) {
@@ -31,6 +31,7 @@ const browserScreenshotSchema = sessionIdSchema.extend({
 export type ListSessionsInput = z.infer<typeof listSessionsSchema>;
 export type GetExecutionSessionInput = z.infer<typeof executionSessionSchema>;
 export type GetMessagesInput = z.infer<typeof getMessagesSchema>;
+export type GetRawMessagesInput = z.infer<typeof sessionIdSchema>;
 export type GetFilesInput = z.infer<typeof sessionIdSchema>;
 export type GetRunsBySessionInput = z.infer<typeof sessionIdSchema>;
 export type GetToolExecutionsInput = z.infer<typeof toolExecutionsSchema>;
@@ -53,6 +54,11 @@ export async function getMessagesAction(input: GetMessagesInput) {
   return chatService.getMessages(sessionId, { realUserMessageIds });
 }
 
+export async function getRawMessagesAction(input: GetRawMessagesInput) {
+  const { sessionId } = sessionIdSchema.parse(input);
+  return chatService.getRawMessages(sessionId);
+}
+
 export async function getFilesAction(input: GetFilesInput) {
   const { sessionId } = sessionIdSchema.parse(input);
   return chatService.getFiles(sessionId);
@@ -129,7 +129,10 @@ export function AssistantMessage({ message, runUsage }: AssistantMessageProps) {
         </div>
 
         <div className="text-foreground text-base break-words w-full min-w-0">
-          <MessageContent content={message.content} />
+          <MessageContent
+            content={message.content}
+            truncatedMessageId={message.truncated_message_id}
+          />
           {message.status === "streaming" && <TypingIndicator />}
         </div>
 
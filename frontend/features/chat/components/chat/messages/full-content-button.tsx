@@ -0,0 +1,38 @@
+"use client";
+
+import * as React from "react";
+import { Loader2 } from "lucide-react";
+import { Button } from "@/components/ui/button";
+import { useT } from "@/lib/i18n/client";
+
+interface FullContentButtonProps {
+  isLoading: boolean;
+  hasError: boolean;
+  onLoad: () => void;
+}
+
+/**
+ * Shown under a truncated preview; fetches the full payload on click.
+ */
+export function FullContentButton({
+  isLoading,
+  hasError,
+  onLoad,
+}: FullContentButtonProps) {
+  const { t } = useT("translation");
+
+  return (
+    <Button
+      variant="ghost"
+      size="sm"
+      className="h-6 px-2 text-xs text-muted-foreground hover:text-foreground"
+      onClick={onLoad}
+      disabled={isLoading}
+    >
+      {isLoading ? <Loader2 className="size-3 animate-spin" /> : null}
+      {hasError
+        ? t("chat.loadFullContentFailed", "Failed to load, retry")
+        : t("chat.loadFullContent", "Show full content")}
+    </Button>
+  );
+}
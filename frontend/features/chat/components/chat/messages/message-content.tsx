@@ -7,6 +7,9 @@ import type { MessageBlock } from "@/features/chat/types";
 import type { ToolUseBlock, ToolResultBlock } from "@/features/chat/types";
 import { Brain } from "lucide-react";
 import { ToolChain } from "./tool-chain";
+import { FullContentButton } from "./full-content-button";
+import { useFullContent } from "@/features/chat/hooks/use-full-content";
+import { chatService } from "@/features/chat/services/chat-service";
 import remarkBreaks from "remark-breaks";
 import { MarkdownCode, MarkdownPre } from "@/components/shared/markdown-code";
 import { useT } from "@/lib/i18n/client";
@@ -32,10 +35,19 @@ const ImgBlock = ({
 
 export function MessageContent({
   content,
+  truncatedMessageId,
 }: {
   content: string | MessageBlock[];
+  // Set when string content is a preview of an offloaded message.
+  truncatedMessageId?: number;
 }) {
   const { t } = useT("translation");
+  const {
+    fullContent,
+    isLoading: isLoadingFull,
+    error: fullContentError,
+    load: loadFullContent,
+  } = useFullContent(chatService.getFullMessageText);
 
   // Helper function to extract text content from message
   const getTextContent = (content: string | MessageBlock[]): string => {
@@ -59,72 +71,92 @@ export function MessageContent({
     return clean(String(content));
   };
 
-  const textContent = getTextContent(content);
+  const textContent =
+    (truncatedMessageId !== undefined
+      ? fullContent[truncatedMessageId]
+      : undefined) ?? getTextContent(content);
+
+  const renderFullContentButton = (messageIds: number[]) => {
+    const pending = messageIds.filter((id) => fullContent[id] === undefined);
+    if (pending.length === 0) return null;
+    return (
+      <FullContentButton
+        isLoading={isLoadingFull}
+        hasError={!!fullContentError}
+        onLoad={() => void loadFullContent(pending)}
+      />
+    );
+  };
 
   // If content is string, render as before
   if (typeof content === "string") {
     return (
-      <div className="prose prose-base dark:prose-invert max-w-none break-words break-all w-full min-w-0 [&_pre]:whitespace-pre-wrap [&_pre]:break-words [&_code]:break-words [&_p]:break-words [&_p]:break-all [&_*]:break-words [&_*]:break-all">
-        <ReactMarkdown
-          remarkPlugins={[remarkGfm, remarkBreaks]}
-          components={{
-            pre: MarkdownPre,
-            code: MarkdownCode,
-            a: ({ children, href, ...props }: LinkProps) => (
-              <a
-                className="text-foreground underline underline-offset-4 decoration-muted-foreground/30 hover:decoration-foreground transition-colors"
-                target="_blank"
-                rel="noopener noreferrer"
-                href={href}
-                {...props}
-              >
-                {children}
-              </a>
-            ),
-            h1: ({ children }) => (
-              <h1 className="text-xl font-bold mb-4 mt-6 text-foreground">
-                {children}
-              </h1>
-            ),
-            h2: ({ children }) => (
-              <h2 className="text-lg font-bold mb-3 mt-5 text-foreground">
-                {children}
-              </h2>
-            ),
-            h3: ({ children }) => (
-              <h3 className="text-base font-bold mb-2 mt-4 text-foreground">
-                {children}
-              </h3>
-            ),
-            hr: () => <hr className="my-4 border-border" />,
-            img: ImgBlock,
-            table: ({ children }) => (
-              <div className="overflow-x-auto my-4 rounded-lg border border-border">
-                <table className="w-full border-collapse text-sm">
+      <div className="w-full min-w-0">
+        <div className="prose prose-base dark:prose-invert max-w-none break-words break-all w-full min-w-0 [&_pre]:whitespace-pre-wrap [&_pre]:break-words [&_code]:break-words [&_p]:break-words [&_p]:break-all [&_*]:break-words [&_*]:break-all">
+          <ReactMarkdown
+            remarkPlugins={[remarkGfm, remarkBreaks]}
+            components={{
+              pre: MarkdownPre,
+              code: MarkdownCode,
+              a: ({ children, href, ...props }: LinkProps) => (
+                <a
+                  className="text-foreground underline underline-offset-4 decoration-muted-foreground/30 hover:decoration-foreground transition-colors"
+                  target="_blank"
+                  rel="noopener noreferrer"
+                  href={href}
+                  {...props}
+                >
                   {children}
-                </table>
-              </div>
-            ),
-            thead: ({ children }) => (
-              <thead className="bg-muted/50">{children}</thead>
-            ),
-            tbody: ({ children }) => (
-              <tbody className="divide-y divide-border">{children}</tbody>
-            ),
-            th: ({ children }) => (
-              <th className="border-b border-border px-4 py-3 text-left font-semibold text-foreground">
-                {children}
-              </th>
-            ),
-            td: ({ children }) => (
-              <td className="border-b border-border px-4 py-3 text-foreground">
-                {children}
-              </td>
-            ),
-          }}
-        >
-          {textContent}
-        </ReactMarkdown>
+                </a>
+              ),
+              h1: ({ children }) => (
+                <h1 className="text-xl font-bold mb-4 mt-6 text-foreground">
+                  {children}
+                </h1>
+              ),
+              h2: ({ children }) => (
+                <h2 className="text-lg font-bold mb-3 mt-5 text-foreground">
+                  {children}
+                </h2>
+              ),
+              h3: ({ children }) => (
+                <h3 className="text-base font-bold mb-2 mt-4 text-foreground">
+                  {children}
+                </h3>
+              ),
+              hr: () => <hr className="my-4 border-border" />,
+              img: ImgBlock,
+              table: ({ children }) => (
+                <div className="overflow-x-auto my-4 rounded-lg border border-border">
+                  <table className="w-full border-collapse text-sm">
+                    {children}
+                  </table>
+                </div>
+              ),
+              thead: ({ children }) => (
+                <thead className="bg-muted/50">{children}</thead>
+              ),
+              tbody: ({ children }) => (
+                <tbody className="divide-y divide-border">{children}</tbody>
+              ),
+              th: ({ children }) => (
+                <th className="border-b border-border px-4 py-3 text-left font-semibold text-foreground">
+                  {children}
+                </th>
+              ),
+              td: ({ children }) => (
+                <td className="border-b border-border px-4 py-3 text-foreground">
+                  {children}
+                </td>
+              ),
+            }}
+          >
+            {textContent}
+          </ReactMarkdown>
+        </div>
+        {truncatedMessageId !== undefined
+          ? renderFullContentButton([truncatedMessageId])
+          : null}
       </div>
     );
   }
@@ -191,76 +223,82 @@ export function MessageContent({
             </details>
           );
         } else {
+          const truncatedIds: number[] = [];
           const text = group.blocks
-            .map((b) => (b._type === "TextBlock" ? b.text : ""))
+            .map((b) => {
+              if (b._type !== "TextBlock") return "";
+              if (b.truncated_message_id === undefined) return b.text;
+              truncatedIds.push(b.truncated_message_id);
+              return fullContent[b.truncated_message_id] ?? b.text;
+            })
             .join("\n\n");
           if (!text.trim()) return null;
 
           return (
-            <div
-              key={index}
-              className="prose prose-base dark:prose-invert max-w-none break-words break-all w-full min-w-0 [&_pre]:whitespace-pre-wrap [&_pre]:break-words [&_code]:break-words [&_p]:break-words [&_p]:break-all [&_*]:break-words [&_*]:break-all"
-            >
-              <ReactMarkdown
-                remarkPlugins={[remarkGfm, remarkBreaks]}
-                components={{
-                  pre: MarkdownPre,
-                  code: MarkdownCode,
-                  a: ({ children, href, ...props }: LinkProps) => (
-                    <a
-                      className="text-foreground underline underline-offset-4 decoration-muted-foreground/30 hover:decoration-foreground transition-colors"
-                      target="_blank"
-                      rel="noopener noreferrer"
-                      href={href}
-                      {...props}
-                    >
-                      {children}
-                    </a>
-                  ),
-                  h1: ({ children }) => (
-                    <h1 className="text-xl font-bold mb-4 mt-6 text-foreground">
-                      {children}
-                    </h1>
-                  ),
-                  h2: ({ children }) => (
-                    <h2 className="text-lg font-bold mb-3 mt-5 text-foreground">
-                      {children}
-                    </h2>
-                  ),
-                  h3: ({ children }) => (
-                    <h3 className="text-base font-bold mb-2 mt-4 text-foreground">
-                      {children}
-                    </h3>
-                  ),
-                  hr: () => <hr className="my-4 border-border" />,
-                  img: ImgBlock,
-                  table: ({ children }) => (
-                    <div className="overflow-x-auto my-4 rounded-lg border border-border">
-                      <table className="w-full border-collapse text-sm">
+            <div key={index} className="w-full min-w-0">
+              <div className="prose prose-base dark:prose-invert max-w-none break-words break-all w-full min-w-0 [&_pre]:whitespace-pre-wrap [&_pre]:break-words [&_code]:break-words [&_p]:break-words [&_p]:break-all [&_*]:break-words [&_*]:break-all">
+                <ReactMarkdown
+                  remarkPlugins={[remarkGfm, remarkBreaks]}
+                  components={{
+                    pre: MarkdownPre,
+                    code: MarkdownCode,
+                    a: ({ children, href, ...props }: LinkProps) => (
+                      <a
+                        className="text-foreground underline underline-offset-4 decoration-muted-foreground/30 hover:decoration-foreground transition-colors"
+                        target="_blank"
+                        rel="noopener noreferrer"
+                        href={href}
+                        {...props}
+                      >
+                        {children}
+                      </a>
+                    ),
+                    h1: ({ children }) => (
+                      <h1 className="text-xl font-bold mb-4 mt-6 text-foreground">
+                        {children}
+                      </h1>
+                    ),
+                    h2: ({ children }) => (
+                      <h2 className="text-lg font-bold mb-3 mt-5 text-foreground">
                         {children}
-                      </table>
-                    </div>
-                  ),
-                  thead: ({ children }) => (
-                    <thead className="bg-muted/50">{children}</thead>
-                  ),
-                  tbody: ({ children }) => (
-                    <tbody className="divide-y divide-border">{children}</tbody>
-                  ),
-                  th: ({ children }) => (
-                    <th className="border-b border-border px-4 py-3 text-left font-semibold text-foreground">
-                      {children}
-                    </th>
-                  ),
-                  td: ({ children }) => (
-                    <td className="border-b border-border px-4 py-3 text-foreground">
-                      {children}
-                    </td>
-                  ),
-                }}
-              >
-                {text}
-              </ReactMarkdown>
+                      </h2>
+                    ),
+                    h3: ({ children }) => (
+                      <h3 className="text-base font-bold mb-2 mt-4 text-foreground">
+                        {children}
+                      </h3>
+                    ),
+                    hr: () => <hr className="my-4 border-border" />,
+                    img: ImgBlock,
+                    table: ({ children }) => (
+                      <div className="overflow-x-auto my-4 rounded-lg border border-border">
+                        <table className="w-full border-collapse text-sm">
+                          {children}
+                        </table>
+                      </div>
+                    ),
+                    thead: ({ children }) => (
+                      <thead className="bg-muted/50">{children}</thead>
+                    ),
+                    tbody: ({ children }) => (
+                      <tbody className="divide-y divide-border">{children}</tbody>
+                    ),
+                    th: ({ children }) => (
+                      <th className="border-b border-border px-4 py-3 text-left font-semibold text-foreground">
+                        {children}
+                      </th>
+                    ),
+                    td: ({ children }) => (
+                      <td className="border-b border-border px-4 py-3 text-foreground">
+                        {children}
+                      </td>
+                    ),
+                  }}
+                >
+                  {text}
+                </ReactMarkdown>
+              </div>
+              {renderFullContentButton(truncatedIds)}
             </div>
           );
         }
@@ -19,6 +19,9 @@ import {
   CollapsibleTrigger,
 } from "@/components/ui/collapsible";
 import { Badge } from "@/components/ui/badge";
+import { FullContentButton } from "./full-content-button";
+import { useFullContent } from "@/features/chat/hooks/use-full-content";
+import { chatService } from "@/features/chat/services/chat-service";
 
 interface ToolChainProps {
   blocks: (ToolUseBlock | ToolResultBlock)[];
@@ -63,6 +66,29 @@ function ToolStep({ toolUse, toolResult, isOpen, onToggle }: ToolStepProps) {
   const isError = toolResult?.is_error;
   const isLoading = !isCompleted;
   const isTaskTool = toolUse.name === "Task";
+  const truncatedMessageId = toolResult?.truncated_message_id;
+
+  const fetchFullOutput = React.useCallback(
+    (toolUseId: string) =>
+      chatService.getFullToolResult(truncatedMessageId ?? 0, toolUseId),
+    [truncatedMessageId],
+  );
+  const {
+    fullContent: fullOutput,
+    isLoading: isLoadingFullOutput,
+    error: fullOutputError,
+    load: loadFullOutput,
+  } = useFullContent(fetchFullOutput);
+  const resultContent = toolResult
+    ? (fullOutput[toolResult.tool_use_id] ?? toolResult.content)
+    : "";
+  const canLoadFullOutput =
+    !!toolResult &&
+    truncatedMessageId !== undefined &&
+    fullOutput[toolResult.tool_use_id] === undefined;
+  const onLoadFullOutput = () => {
+    if (toolResult) void loadFullOutput([toolResult.tool_use_id]);
+  };
 
   const playwrightBrowserMeta = React.useMemo(() => {
     if (!toolUse.name.startsWith(POCO_PLAYWRIGHT_MCP_PREFIX)) return null;
@@ -131,9 +157,9 @@ function ToolStep({ toolUse, toolResult, isOpen, onToggle }: ToolStepProps) {
 
   const outputText = React.useMemo(() => {
     if (!toolResult) return "";
-    if (!isTaskTool) return toolResult.content;
+    if (!isTaskTool) return resultContent;
     try {
-      const parsed = JSON.parse(toolResult.content);
+      const parsed = JSON.parse(resultContent);
       if (
         parsed &&
         typeof parsed === "object" &&
@@ -146,8 +172,8 @@ function ToolStep({ toolUse, toolResult, isOpen, onToggle }: ToolStepProps) {
     } catch {
       // fall back to raw content
     }
-    return toolResult.content;
-  }, [isTaskTool, toolResult]);
+    return resultContent;
+  }, [isTaskTool, resultContent, toolResult]);
 
   const toolLabel = playwrightBrowserMeta
     ? `${t("chat.statusBar.browser")} (${playwrightBrowserMeta.toolName})`
@@ -234,6 +260,13 @@ function ToolStep({ toolUse, toolResult, isOpen, onToggle }: ToolStepProps) {
                     {outputText}
                   </pre>
                 </div>
+                {canLoadFullOutput ? (
+                  <FullContentButton
+                    isLoading={isLoadingFullOutput}
+                    hasError={!!fullOutputError}
+                    onLoad={onLoadFullOutput}
+                  />
+                ) : null}
               </div>
             )}
 
@@ -1,13 +1,17 @@
 import { useEffect, useRef, useState, useCallback, useMemo } from "react";
 import { sendMessageAction } from "@/features/chat/actions/session-actions";
 import {
-  getMessagesAction,
+  getRawMessagesAction,
   getRunsBySessionAction,
 } from "@/features/chat/actions/query-actions";
+import { buildChatMessages } from "@/features/chat/services/chat-service";
+import { useSessionEvents } from "@/features/chat/hooks/use-session-events";
 import type {
   ChatMessage,
   ExecutionSession,
   InputFile,
+  MessageResponse,
+  MessageWithFilesResponse,
   UsageResponse,
 } from "@/features/chat/types";
 
@@ -32,7 +36,8 @@ interface UseChatMessagesReturn {
  *
  * Responsibilities:
  * - Load message history when session changes
- * - Poll for new messages during active sessions
+ * - Append new messages from the session event stream during active sessions
+ * - Poll for new messages only while the event stream is disconnected
  * - Merge local optimistic messages with server messages
  * - Calculate display messages with streaming status
  * - Handle typing indicator state
@@ -53,6 +58,11 @@ export function useChatMessages({
 
   const lastLoadedSessionIdRef = useRef<string | null>(null);
   const realUserMessageIdsRef = useRef<number[] | null>(null);
+  // Raw server messages by id; the timeline is rebuilt from them.
+  const rawMessagesRef = useRef<Map<number, MessageWithFilesResponse>>(
+    new Map(),
+  );
+  const rebuildTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
 
   const refreshRealUserMessageIds = useCallback(async () => {
     if (!session?.session_id) return;
@@ -79,6 +89,15 @@ export function useChatMessages({
     }
   }, [session?.session_id]);
 
+  const buildServerMessages = useCallback(() => {
+    const raw = Array.from(rawMessagesRef.current.values()).sort(
+      (a, b) => a.id - b.id,
+    );
+    return buildChatMessages(raw, {
+      realUserMessageIds: realUserMessageIdsRef.current ?? undefined,
+    });
+  }, []);
+
   const fetchMessagesWithFilter = useCallback(
     async (sessionId: string) => {
       // Ensure we have a whitelist of real user input message ids (per run).
@@ -86,13 +105,12 @@ export function useChatMessages({
         await refreshRealUserMessageIds();
       }
 
-      const realUserMessageIds = realUserMessageIdsRef.current ?? undefined;
-      return getMessagesAction({
-        sessionId,
-        realUserMessageIds,
-      });
+      const raw = await getRawMessagesAction({ sessionId });
+      // Fetched rows carry attachments; they replace streamed copies.
+      raw.forEach((message) => rawMessagesRef.current.set(message.id, message));
+      return buildServerMessages();
     },
-    [refreshRealUserMessageIds],
+    [buildServerMessages, refreshRealUserMessageIds],
   );
 
   // Helper to merge new server messages with local optimistic messages
@@ -198,7 +216,52 @@ export function useChatMessages({
     ],
   );
 
-  // Load and poll for messages
+  const isTerminal = ["completed", "failed", "stopped", "canceled"].includes(
+    session?.status ?? "",
+  );
+
+  // Rebuild the timeline once per burst of streamed messages.
+  const scheduleRebuild = useCallback(() => {
+    if (rebuildTimerRef.current) return;
+    rebuildTimerRef.current = setTimeout(() => {
+      rebuildTimerRef.current = null;
+      const server = buildServerMessages();
+      setInternalContextsByUserMessageId(
+        server.internalContextsByUserMessageId,
+      );
+      setMessages((prev) => mergeMessages(prev, server.messages));
+    }, 100);
+  }, [buildServerMessages, mergeMessages]);
+
+  useEffect(() => {
+    return () => {
+      if (rebuildTimerRef.current) clearTimeout(rebuildTimerRef.current);
+      rebuildTimerRef.current = null;
+    };
+  }, [session?.session_id]);
+
+  const appendStreamedMessage = useCallback(
+    (message: MessageResponse) => {
+      if (rawMessagesRef.current.has(message.id)) return;
+      rawMessagesRef.current.set(message.id, message);
+      const realIds = realUserMessageIdsRef.current;
+      if (message.role === "user" && realIds && !realIds.includes(message.id)) {
+        // Possibly a new run's input; refresh runs before classifying it.
+        void refreshRealUserMessageIds().then(scheduleRebuild);
+        return;
+      }
+      scheduleRebuild();
+    },
+    [refreshRealUserMessageIds, scheduleRebuild],
+  );
+
+  const isStreaming = useSessionEvents({
+    sessionId: session?.session_id,
+    enabled: !!session?.session_id && !isTerminal,
+    onMessage: appendStreamedMessage,
+  });
+
+  // Load messages, and poll while the event stream is down
   useEffect(() => {
     if (!session?.session_id) return;
 
@@ -209,6 +272,7 @@ export function useChatMessages({
       setIsTyping(false);
       setInternalContextsByUserMessageId({});
       realUserMessageIdsRef.current = null;
+      rawMessagesRef.current = new Map();
       setRunUsageByUserMessageId({});
       lastLoadedSessionIdRef.current = session.session_id;
     }
@@ -238,12 +302,10 @@ export function useChatMessages({
     // Setup polling
     let interval: NodeJS.Timeout;
 
-    const isTerminal = ["completed", "failed", "stopped", "canceled"].includes(
-      session.status,
-    );
-
     if (session.session_id && !isTerminal) {
-      interval = setInterval(fetchMessages, pollingInterval);
+      if (!isStreaming) {
+        interval = setInterval(fetchMessages, pollingInterval);
+      }
     } else if (session.session_id && isTerminal) {
       console.log(
         `%c [Message Polling] Stopped for session ${session.session_id}`,
@@ -258,7 +320,8 @@ export function useChatMessages({
     };
   }, [
     session?.session_id,
-    session?.status,
+    isTerminal,
+    isStreaming,
     mergeMessages,
     pollingInterval,
     fetchMessagesWithFilter,
@@ -22,6 +22,9 @@ import { useT } from "@/lib/i18n/client";
 import { getBrowserScreenshotAction } from "@/features/chat/actions/query-actions";
 import type { ToolExecutionResponse } from "@/features/chat/types";
 import { useToolExecutions } from "./hooks/use-tool-executions";
+import { useFullContent } from "@/features/chat/hooks/use-full-content";
+import { chatService } from "@/features/chat/services/chat-service";
+import { FullContentButton } from "../../chat/messages/full-content-button";
 import { ApiError } from "@/lib/errors";
 import { Button } from "@/components/ui/button";
 import { Slider } from "@/components/ui/slider";
@@ -165,6 +168,14 @@ export function ComputerPanel({
     limit: 2000,
   });
 
+  // Full outputs of executions whose tool_output is a truncated preview.
+  const {
+    fullContent: fullOutputs,
+    isLoading: isLoadingFullOutput,
+    error: fullOutputError,
+    load: loadFullOutput,
+  } = useFullContent(chatService.getToolExecutionOutput);
+
   // --- Screenshot caching (persists across tab switches) ---
   const screenshotCacheRef = React.useRef(new Map<string, string | null>());
   const [browserScreenshotUrls, setBrowserScreenshotUrls] = React.useState<
@@ -486,7 +497,15 @@ export function ComputerPanel({
         : "";
     const isDone = Boolean(selectedFrame.execution.tool_output);
     const isError = selectedFrame.execution.is_error;
-    const result = parseBashResult(selectedFrame.execution);
+    const executionId = selectedFrame.execution.id;
+    const fullOutput = fullOutputs[executionId];
+    const result = parseBashResult(
+      fullOutput !== undefined
+        ? { ...selectedFrame.execution, tool_output: fullOutput }
+        : selectedFrame.execution,
+    );
+    const canLoadFullOutput =
+      !!selectedFrame.execution.tool_output_url && fullOutput === undefined;
 
     return (
       <div className="h-full w-full bg-card">
@@ -520,6 +539,13 @@ export function ComputerPanel({
                 {t("computer.terminal.running")}
               </div>
             )}
+            {isDone && canLoadFullOutput ? (
+              <FullContentButton
+                isLoading={isLoadingFullOutput}
+                hasError={!!fullOutputError}
+                onLoad={() => void loadFullOutput([executionId])}
+              />
+            ) : null}
             {isDone && typeof result.exitCode === "number" ? (
               <div
                 className={cn(
@@ -2,8 +2,25 @@
 
 import { useCallback, useEffect, useRef, useState } from "react";
 import { getToolExecutionsAction } from "@/features/chat/actions/query-actions";
+import { useSessionEvents } from "@/features/chat/hooks/use-session-events";
 import type { ToolExecutionResponse } from "@/features/chat/types";
 
+// Keep what the event stream delivered while a fetch was in flight.
+function mergeExecutions(
+  fetched: ToolExecutionResponse[],
+  current: ToolExecutionResponse[],
+): ToolExecutionResponse[] {
+  const currentById = new Map(current.map((item) => [item.id, item]));
+  const merged = fetched.map((item) => {
+    const streamed = currentById.get(item.id);
+    currentById.delete(item.id);
+    return streamed && streamed.tool_output && !item.tool_output
+      ? streamed
+      : item;
+  });
+  return [...merged, ...currentById.values()];
+}
+
 interface UseToolExecutionsOptions {
   sessionId?: string;
   isActive?: boolean;
@@ -38,7 +55,7 @@ export function useToolExecutions({
         offset: 0,
       });
       if (seq !== requestSeqRef.current) return;
-      setExecutions(data);
+      setExecutions((prev) => mergeExecutions(data, prev));
       setError(null);
     } catch (err) {
       if (seq !== requestSeqRef.current) return;
@@ -65,15 +82,31 @@ export function useToolExecutions({
     void fetchOnce();
   }, [fetchOnce, sessionId]);
 
-  // Poll while active.
+  const upsertExecution = useCallback((execution: ToolExecutionResponse) => {
+    setExecutions((prev) => {
+      const index = prev.findIndex((item) => item.id === execution.id);
+      if (index === -1) return [...prev, execution];
+      const next = [...prev];
+      next[index] = execution;
+      return next;
+    });
+  }, []);
+
+  const isStreaming = useSessionEvents({
+    sessionId,
+    enabled: isActive,
+    onToolExecution: upsertExecution,
+  });
+
+  // Poll while active and the event stream is down.
   useEffect(() => {
     if (!sessionId) return;
-    if (!isActive) return;
+    if (!isActive || isStreaming) return;
     const id = setInterval(() => {
       void fetchOnce();
     }, pollingIntervalMs);
     return () => clearInterval(id);
-  }, [fetchOnce, isActive, pollingIntervalMs, sessionId]);
+  }, [fetchOnce, isActive, isStreaming, pollingIntervalMs, sessionId]);
 
   return { executions, isLoading, error, refetch: fetchOnce };
 }
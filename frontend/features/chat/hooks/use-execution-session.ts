@@ -1,7 +1,12 @@
 import { useState, useCallback, useEffect, useRef } from "react";
 import { getExecutionSessionAction } from "@/features/chat/actions/query-actions";
 import { useAdaptivePolling } from "./use-adaptive-polling";
-import type { ExecutionSession } from "@/features/chat/types";
+import { useSessionEvents } from "./use-session-events";
+import { toExecutionStatus } from "@/features/chat/services/chat-service";
+import type {
+  ExecutionSession,
+  SessionStateResponse,
+} from "@/features/chat/types";
 import { playTaskCompleteSound } from "@/lib/utils/sound";
 
 interface UseExecutionSessionOptions {
@@ -62,7 +67,8 @@ interface UseExecutionSessionReturn {
  *
  * Features:
  * - Fetches session data from API
- * - Automatically polls while session is active
+ * - Follows state changes over the session event stream while active
+ * - Polls only while the event stream is disconnected
  * - Adaptive polling with exponential backoff on errors
  * - Persists user_prompt across session updates
  * - Polling interval controlled by NEXT_PUBLIC_SESSION_POLLING_INTERVAL env variable
@@ -190,9 +196,28 @@ export function useExecutionSession({
     }
   }, [session, sessionId, onPollingStop]);
 
+  const applyState = useCallback((state: SessionStateResponse) => {
+    setSession((prev) =>
+      prev
+        ? {
+            ...prev,
+            status: toExecutionStatus(state.status),
+            state_patch: state.state_patch ?? {},
+            time: state.updated_at,
+          }
+        : prev,
+    );
+  }, []);
+
+  const isStreaming = useSessionEvents({
+    sessionId,
+    enabled: isSessionActive,
+    onState: applyState,
+  });
+
   const { currentInterval, errorCount, trigger } = useAdaptivePolling({
     callback: fetchSession,
-    isActive: isSessionActive,
+    isActive: isSessionActive && !isStreaming,
     interval: pollingInterval,
     enableBackoff,
   });
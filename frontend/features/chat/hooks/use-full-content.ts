@@ -0,0 +1,64 @@
+"use client";
+
+import { useCallback, useState } from "react";
+
+interface UseFullContentReturn<K extends string | number, V> {
+  /**
+   * Loaded full content by key
+   */
+  fullContent: Partial<Record<K, V>>;
+  isLoading: boolean;
+  error: Error | null;
+  /**
+   * Fetch the full content of the given keys (already loaded keys are skipped)
+   */
+  load: (keys: K[]) => Promise<void>;
+}
+
+/**
+ * Lazily fetches the full version of truncated payload previews
+ *
+ * Offloaded messages and tool outputs are rendered from their preview; the
+ * full payload is only requested when the user asks for it.
+ *
+ * @example
+ * ```tsx
+ * const { fullContent, isLoading, load } = useFullContent(
+ *   chatService.getFullMessageText,
+ * );
+ * ```
+ */
+export function useFullContent<K extends string | number, V = string>(
+  fetchFull: (key: K) => Promise<V>,
+): UseFullContentReturn<K, V> {
+  const [fullContent, setFullContent] = useState<Partial<Record<K, V>>>({});
+  const [isLoading, setIsLoading] = useState(false);
+  const [error, setError] = useState<Error | null>(null);
+
+  const load = useCallback(
+    async (keys: K[]) => {
+      const missing = keys.filter((key) => fullContent[key] === undefined);
+      if (missing.length === 0) return;
+      setIsLoading(true);
+      setError(null);
+      try {
+        const values = await Promise.all(missing.map((key) => fetchFull(key)));
+        setFullContent((prev) => {
+          const next = { ...prev };
+          missing.forEach((key, index) => {
+            next[key] = values[index];
+          });
+          return next;
+        });
+      } catch (err) {
+        console.error("[FullContent] Failed to load full content:", err);
+        setError(err as Error);
+      } finally {
+        setIsLoading(false);
+      }
+    },
+    [fetchFull, fullContent],
+  );
+
+  return { fullContent, isLoading, error, load };
+}
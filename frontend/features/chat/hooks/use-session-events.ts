@@ -0,0 +1,207 @@
+"use client";
+
+import { useEffect, useRef, useState } from "react";
+import { API_ENDPOINTS, API_PREFIX, getApiBaseUrl } from "@/lib/api-client";
+import type {
+  MessageResponse,
+  SessionStateResponse,
+  ToolExecutionResponse,
+} from "@/features/chat/types";
+
+export interface SessionEventHandlers {
+  onMessage?: (message: MessageResponse) => void;
+  onToolExecution?: (execution: ToolExecutionResponse) => void;
+  onState?: (state: SessionStateResponse) => void;
+}
+
+type ConnectionListener = (connected: boolean) => void;
+
+const RECONNECT_MIN_DELAY_MS = 1000;
+const RECONNECT_MAX_DELAY_MS = 30000;
+
+/**
+ * One EventSource per session, shared by every subscribed hook.
+ *
+ * The browser reconnects dropped streams itself and resumes with the
+ * Last-Event-ID header. When the stream is closed for good (e.g. an HTTP
+ * error), it is reopened with the last event id as ?cursor= after a backoff.
+ */
+class SessionEventStream {
+  private source: EventSource | null = null;
+  private lastEventId: string | null = null;
+  private reconnectTimer: ReturnType<typeof setTimeout> | null = null;
+  private reconnectDelay = RECONNECT_MIN_DELAY_MS;
+  private readonly handlers = new Set<SessionEventHandlers>();
+  private readonly connectionListeners = new Set<ConnectionListener>();
+  connected = false;
+
+  constructor(private readonly sessionId: string) {}
+
+  get size(): number {
+    return this.handlers.size;
+  }
+
+  subscribe(handlers: SessionEventHandlers, onConnection: ConnectionListener) {
+    this.handlers.add(handlers);
+    this.connectionListeners.add(onConnection);
+    if (!this.source && !this.reconnectTimer) this.open();
+    onConnection(this.connected);
+  }
+
+  unsubscribe(
+    handlers: SessionEventHandlers,
+    onConnection: ConnectionListener,
+  ) {
+    this.handlers.delete(handlers);
+    this.connectionListeners.delete(onConnection);
+  }
+
+  close() {
+    if (this.reconnectTimer) {
+      clearTimeout(this.reconnectTimer);
+      this.reconnectTimer = null;
+    }
+    this.source?.close();
+    this.source = null;
+    this.setConnected(false);
+  }
+
+  private open() {
+    const query = this.lastEventId
+      ? `?cursor=${encodeURIComponent(this.lastEventId)}`
+      : "";
+    const url = `${getApiBaseUrl()}${API_PREFIX}${API_ENDPOINTS.sessionEvents(this.sessionId)}${query}`;
+    const source = new EventSource(url);
+    this.source = source;
+
+    source.onopen = () => {
+      this.reconnectDelay = RECONNECT_MIN_DELAY_MS;
+      this.setConnected(true);
+    };
+    source.onerror = () => {
+      // Let callers fall back to polling until the stream is back.
+      this.setConnected(false);
+      if (source.readyState === EventSource.CLOSED) {
+        this.scheduleReconnect();
+      }
+    };
+
+    this.listen<MessageResponse>(source, "message", (handler, data) =>
+      handler.onMessage?.(data),
+    );
+    this.listen<ToolExecutionResponse>(
+      source,
+      "tool_execution",
+      (handler, data) => handler.onToolExecution?.(data),
+    );
+    this.listen<SessionStateResponse>(source, "state", (handler, data) =>
+      handler.onState?.(data),
+    );
+    source.addEventListener("end", () => this.close());
+  }
+
+  private listen<T>(
+    source: EventSource,
+    event: string,
+    dispatch: (handler: SessionEventHandlers, data: T) => void,
+  ) {
+    source.addEventListener(event, (raw) => {
+      const message = raw as MessageEvent<string>;
+      if (message.lastEventId) this.lastEventId = message.lastEventId;
+      let data: T;
+      try {
+        data = JSON.parse(message.data) as T;
+      } catch (error) {
+        console.error("[SessionEvents] Invalid event payload:", error);
+        return;
+      }
+      this.handlers.forEach((handler) => dispatch(handler, data));
+    });
+  }
+
+  private scheduleReconnect() {
+    this.source?.close();
+    this.source = null;
+    const delay = this.reconnectDelay;
+    this.reconnectDelay = Math.min(delay * 2, RECONNECT_MAX_DELAY_MS);
+    this.reconnectTimer = setTimeout(() => {
+      this.reconnectTimer = null;
+      if (this.handlers.size > 0) this.open();
+    }, delay);
+  }
+
+  private setConnected(connected: boolean) {
+    if (this.connected === connected) return;
+    this.connected = connected;
+    this.connectionListeners.forEach((listener) => listener(connected));
+  }
+}
+
+const streams = new Map<string, SessionEventStream>();
+
+interface UseSessionEventsOptions extends SessionEventHandlers {
+  sessionId?: string;
+  /**
+   * Whether to keep the stream open
+   */
+  enabled?: boolean;
+}
+
+/**
+ * Subscribes to the server-sent events of a session
+ *
+ * Returns whether the stream is currently connected; callers should poll
+ * only while it is not.
+ *
+ * @example
+ * ```tsx
+ * const isStreaming = useSessionEvents({
+ *   sessionId,
+ *   enabled: isSessionActive,
+ *   onState: (state) => updateSession({ status: state.status }),
+ * });
+ * ```
+ */
+export function useSessionEvents({
+  sessionId,
+  enabled = true,
+  onMessage,
+  onToolExecution,
+  onState,
+}: UseSessionEventsOptions): boolean {
+  const [isConnected, setIsConnected] = useState(false);
+  const handlersRef = useRef<SessionEventHandlers>({});
+
+  useEffect(() => {
+    handlersRef.current = { onMessage, onToolExecution, onState };
+  });
+
+  useEffect(() => {
+    if (!sessionId || !enabled || typeof EventSource === "undefined") {
+      setIsConnected(false);
+      return;
+    }
+
+    // Stable wrapper so handler identity changes don't resubscribe.
+    const handlers: SessionEventHandlers = {
+      onMessage: (data) => handlersRef.current.onMessage?.(data),
+      onToolExecution: (data) => handlersRef.current.onToolExecution?.(data),
+      onState: (data) => handlersRef.current.onState?.(data),
+    };
+
+    const stream = streams.get(sessionId) ?? new SessionEventStream(sessionId);
+    streams.set(sessionId, stream);
+    stream.subscribe(handlers, setIsConnected);
+
+    return () => {
+      stream.unsubscribe(handlers, setIsConnected);
+      if (stream.size === 0) {
+        stream.close();
+        streams.delete(sessionId);
+      }
+      setIsConnected(false);
+    };
+  }, [enabled, sessionId]);
+
+  return isConnected;
+}
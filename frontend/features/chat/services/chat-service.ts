@@ -18,6 +18,8 @@ import type {
   TaskEnqueueResponse,
   TaskConfig,
   InputFile,
+  MessageWithFilesResponse,
+  ToolResultBlock,
   ConfigSnapshot,
   RunResponse,
 } from "@/features/chat/types";
@@ -65,6 +67,27 @@ function cleanText(text: string): string {
   return text.replace(/\uFFFD/g, "");
 }
 
+// Marker appended by the backend to strings cut short in payload previews.
+const TRUNCATED_PREVIEW = /\[truncated \d+ chars\]/;
+
+function extractMessageText(contentObj: MessageContentShape): string {
+  if (isNonEmptyString(contentObj.text)) {
+    return cleanText(contentObj.text);
+  }
+  if (!Array.isArray(contentObj.content)) return "";
+  return contentObj.content
+    .filter((b) => typeIncludes(b?._type, "TextBlock"))
+    .map((b) => (isNonEmptyString(b.text) ? cleanText(b.text) : ""))
+    .filter((t) => t.trim().length > 0)
+    .join("\n\n");
+}
+
+function toolResultText(content: unknown): string {
+  return cleanText(
+    typeof content === "string" ? content : (JSON.stringify(content) ?? ""),
+  );
+}
+
 /**
  * Parse config_snapshot from API response to ConfigSnapshot type
  */
@@ -91,6 +114,21 @@ function parseConfigSnapshot(
   };
 }
 
+/**
+ * Map a backend session status to the execution session status
+ */
+export function toExecutionStatus(status: string): ExecutionSession["status"] {
+  return status === "completed"
+    ? "completed"
+    : status === "failed"
+      ? "failed"
+      : status === "canceled" || status === "cancelled"
+        ? "canceled"
+        : status === "running"
+          ? "running"
+          : "accepted";
+}
+
 function toExecutionSession(
   session: SessionResponse,
   progress: number = 0,
@@ -98,16 +136,7 @@ function toExecutionSession(
   return {
     session_id: session.session_id,
     time: session.updated_at,
-    status:
-      session.status === "completed"
-        ? "completed"
-        : session.status === "failed"
-          ? "failed"
-          : session.status === "canceled" || session.status === "cancelled"
-            ? "canceled"
-            : session.status === "running"
-              ? "running"
-              : "accepted",
+    status: toExecutionStatus(session.status),
     progress,
     state_patch: session.state_patch ?? {},
     config_snapshot: parseConfigSnapshot(session.config_snapshot),
@@ -130,6 +159,8 @@ function createDefaultSession(sessionId: string): ExecutionSession {
   };
 }
 
+const MESSAGES_PAGE_SIZE = 1000;
+
 function buildQuery(params?: Record<string, string | number | undefined>) {
   if (!params) return "";
   const searchParams = new URLSearchParams();
@@ -140,6 +171,270 @@ function buildQuery(params?: Record<string, string | number | undefined>) {
   return query ? `?${query}` : "";
 }
 
+/**
+ * Group raw session messages into chat timeline messages.
+ *
+ * Pure so callers holding raw messages (e.g. from the session event stream)
+ * can rebuild the timeline without refetching the history.
+ */
+export function buildChatMessages(
+  messages: MessageWithFilesResponse[],
+  options?: { realUserMessageIds?: number[] },
+): {
+  messages: ChatMessage[];
+  internalContextsByUserMessageId: Record<string, string[]>;
+} {
+  const realUserMessageIdSet = new Set(options?.realUserMessageIds ?? []);
+  // If we can't reliably identify "real user inputs" (runs not available),
+  // fall back to showing all user messages and do not build internal contexts.
+  const canClassifyUserMessages = realUserMessageIdSet.size > 0;
+
+  const processedMessages: ChatMessage[] = [];
+  const internalContextsByUserMessageId: Record<string, string[]> = {};
+  const subagentTranscriptByToolUseId: Record<string, string[]> = {};
+  let currentAssistantMessage: ChatMessage | null = null;
+  let currentTurnUserMessageId: string | null = null;
+
+  for (const msg of messages) {
+    const contentObj = msg.content as MessageContentShape;
+    if (
+      typeIncludes(contentObj._type, "SystemMessage") &&
+      contentObj.subtype === "init"
+    ) {
+      continue;
+    }
+
+    const parentToolUseId = isNonEmptyString(contentObj.parent_tool_use_id)
+      ? contentObj.parent_tool_use_id.trim()
+      : null;
+
+    // Subagent messages are nested under a parent tool call (e.g., Task).
+    // We keep them out of the main timeline and attach a flattened transcript to the parent ToolUseBlock.
+    if (parentToolUseId) {
+      const nestedTexts: string[] = [];
+      if (isNonEmptyString(contentObj.text)) {
+        nestedTexts.push(cleanText(contentObj.text));
+      }
+      if (Array.isArray(contentObj.content)) {
+        for (const block of contentObj.content) {
+          if (!typeIncludes(block?._type, "TextBlock")) continue;
+          if (isNonEmptyString(block.text)) {
+            nestedTexts.push(cleanText(block.text));
+          }
+        }
+      }
+      const cleaned = nestedTexts
+        .map((t) => t.trim())
+        .filter(Boolean)
+        .join("\n\n");
+      if (cleaned) {
+        subagentTranscriptByToolUseId[parentToolUseId] = [
+          ...(subagentTranscriptByToolUseId[parentToolUseId] || []),
+          cleaned,
+        ];
+      }
+      continue;
+    }
+
+    if (msg.role === "assistant" && Array.isArray(contentObj.content)) {
+      const blocks = contentObj.content;
+
+      const toolUseBlocks = blocks.filter((b) =>
+        typeIncludes(b?._type, "ToolUseBlock"),
+      );
+
+      if (toolUseBlocks.length > 0) {
+        if (!currentAssistantMessage) {
+          currentAssistantMessage = {
+            id: msg.id.toString(),
+            role: "assistant",
+            content: [],
+            status: "completed",
+            timestamp: msg.created_at,
+          };
+          processedMessages.push(currentAssistantMessage);
+        }
+
+        const existingBlocks =
+          currentAssistantMessage.content as MessageBlock[];
+
+        const uiToolBlocks = toolUseBlocks.map((b) => ({
+          _type: "ToolUseBlock" as const,
+          id: typeof b.id === "string" ? b.id : String(b.id ?? ""),
+          name: typeof b.name === "string" ? b.name : String(b.name ?? ""),
+          input:
+            b.input && typeof b.input === "object"
+              ? (b.input as Record<string, unknown>)
+              : {},
+        }));
+
+        currentAssistantMessage.content = [
+          ...existingBlocks,
+          ...uiToolBlocks,
+        ];
+      }
+    }
+
+    // ToolResultBlock is typically a user-role message (Anthropic style), but some providers
+    // may emit it under assistant-role. Don't rely on msg.role to attach results.
+    if (Array.isArray(contentObj.content)) {
+      const blocks = contentObj.content;
+      const toolResultBlocks = blocks.filter((b) =>
+        typeIncludes(b?._type, "ToolResultBlock"),
+      );
+
+      if (toolResultBlocks.length > 0) {
+        if (!currentAssistantMessage) {
+          currentAssistantMessage = {
+            id: msg.id.toString(),
+            role: "assistant",
+            content: [],
+            status: "completed",
+            timestamp: msg.created_at,
+          };
+          processedMessages.push(currentAssistantMessage);
+        }
+
+        const uiResultBlocks = toolResultBlocks.map((b): ToolResultBlock => {
+          const content = toolResultText(b.content);
+          return {
+            _type: "ToolResultBlock",
+            tool_use_id:
+              typeof b.tool_use_id === "string"
+                ? b.tool_use_id
+                : String(b.tool_use_id ?? ""),
+            content,
+            is_error: !!b.is_error,
+            truncated_message_id: TRUNCATED_PREVIEW.test(content)
+              ? msg.id
+              : undefined,
+          };
+        });
+        const existingBlocks =
+          currentAssistantMessage.content as MessageBlock[];
+        currentAssistantMessage.content = [
+          ...existingBlocks,
+          ...uiResultBlocks,
+        ];
+
+        // Keep ToolResultBlock out of the user timeline.
+        if (msg.role === "user") continue;
+      }
+    }
+
+    if (msg.role === "assistant" && Array.isArray(contentObj.content)) {
+      const blocks = contentObj.content;
+      const thinkingBlocks = blocks.filter((b) =>
+        typeIncludes(b?._type, "ThinkingBlock"),
+      );
+
+      const uiThinkingBlocks = thinkingBlocks
+        .map((b) => ({
+          _type: "ThinkingBlock" as const,
+          thinking: cleanText(b.thinking || ""),
+          signature: b.signature,
+        }))
+        .filter((b) => b.thinking.trim().length > 0);
+
+      if (uiThinkingBlocks.length > 0) {
+        if (!currentAssistantMessage) {
+          currentAssistantMessage = {
+            id: msg.id.toString(),
+            role: "assistant",
+            content: [],
+            status: "completed",
+            timestamp: msg.created_at,
+          };
+          processedMessages.push(currentAssistantMessage);
+        }
+
+        const existingBlocks =
+          currentAssistantMessage.content as MessageBlock[];
+
+        currentAssistantMessage.content = [
+          ...existingBlocks,
+          ...uiThinkingBlocks,
+        ];
+      }
+    }
+
+    const textContent = extractMessageText(contentObj);
+    const truncatedMessageId = msg.content_url ? msg.id : undefined;
+
+    if (textContent) {
+      if (msg.role === "user") {
+        // A user-role message from the SDK is not always a real user input.
+        // Real user inputs are identified by AgentRun.user_message_id (per turn).
+        const isRealUserMessage = canClassifyUserMessages
+          ? realUserMessageIdSet.has(msg.id)
+          : true;
+
+        if (!isRealUserMessage) {
+          // Keep internal user-role text for optional inline display (debug/UX),
+          // but do not render it as a user bubble.
+          if (currentTurnUserMessageId) {
+            internalContextsByUserMessageId[currentTurnUserMessageId] = [
+              ...(internalContextsByUserMessageId[
+                currentTurnUserMessageId
+              ] || []),
+              textContent,
+            ];
+          }
+          continue;
+        }
+
+        currentAssistantMessage = null;
+        currentTurnUserMessageId = msg.id.toString();
+        processedMessages.push({
+          id: msg.id.toString(),
+          role: "user",
+          content: textContent,
+          status: "completed",
+          timestamp: msg.created_at,
+          attachments: msg.attachments ?? undefined,
+          truncated_message_id: truncatedMessageId,
+        });
+      } else {
+        if (currentAssistantMessage) {
+          const existingBlocks =
+            currentAssistantMessage.content as MessageBlock[];
+          existingBlocks.push({
+            _type: "TextBlock",
+            text: textContent,
+            truncated_message_id: truncatedMessageId,
+          });
+        } else {
+          processedMessages.push({
+            id: msg.id.toString(),
+            role: "assistant",
+            content: textContent,
+            status: "completed",
+            timestamp: msg.created_at,
+            truncated_message_id: truncatedMessageId,
+          });
+        }
+      }
+    }
+  }
+
+  // Attach subagent transcript to tool blocks (main timeline only).
+  for (const message of processedMessages) {
+    if (message.role !== "assistant") continue;
+    if (!Array.isArray(message.content)) continue;
+    message.content = (message.content as MessageBlock[]).map((block) => {
+      if (block._type !== "ToolUseBlock") return block;
+      const transcript = subagentTranscriptByToolUseId[block.id];
+      if (!transcript || transcript.length === 0) return block;
+      return { ...block, subagent_transcript: transcript };
+    });
+  }
+
+  return {
+    messages: processedMessages,
+    internalContextsByUserMessageId,
+  };
+}
+
 export const chatService = {
   listSessions: async (params?: {
     user_id?: string;
@@ -280,6 +575,27 @@ export const chatService = {
     );
   },
 
+  getRawMessages: async (
+    sessionId: string,
+  ): Promise<MessageWithFilesResponse[]> => {
+    // Page through the history by message id; a full page may have more after it.
+    const messages: MessageWithFilesResponse[] = [];
+    let afterId: number | undefined;
+    for (;;) {
+      const query = buildQuery({
+        limit: MESSAGES_PAGE_SIZE,
+        after_id: afterId,
+      });
+      const page = await apiClient.get<MessageWithFilesResponse[]>(
+        `${API_ENDPOINTS.sessionMessagesWithFiles(sessionId)}${query}`,
+      );
+      messages.push(...page);
+      if (page.length < MESSAGES_PAGE_SIZE) break;
+      afterId = page[page.length - 1].id;
+    }
+    return messages;
+  },
+
   getMessages: async (
     sessionId: string,
     options?: { realUserMessageIds?: number[] },
@@ -288,275 +604,41 @@ export const chatService = {
     internalContextsByUserMessageId: Record<string, string[]>;
   }> => {
     try {
-      const realUserMessageIdSet = new Set(options?.realUserMessageIds ?? []);
-      // If we can't reliably identify "real user inputs" (runs not available),
-      // fall back to showing all user messages and do not build internal contexts.
-      const canClassifyUserMessages = realUserMessageIdSet.size > 0;
-
-      const messages = await apiClient.get<
-        {
-          id: number;
-          role: string;
-          content: Record<string, unknown>;
-          attachments?: InputFile[];
-          created_at: string;
-          updated_at: string;
-        }[]
-      >(API_ENDPOINTS.sessionMessagesWithFiles(sessionId));
-
-      const processedMessages: ChatMessage[] = [];
-      const internalContextsByUserMessageId: Record<string, string[]> = {};
-      const subagentTranscriptByToolUseId: Record<string, string[]> = {};
-      let currentAssistantMessage: ChatMessage | null = null;
-      let currentTurnUserMessageId: string | null = null;
-
-      for (const msg of messages) {
-        const contentObj = msg.content as MessageContentShape;
-        if (
-          typeIncludes(contentObj._type, "SystemMessage") &&
-          contentObj.subtype === "init"
-        ) {
-          continue;
-        }
-
-        const parentToolUseId = isNonEmptyString(contentObj.parent_tool_use_id)
-          ? contentObj.parent_tool_use_id.trim()
-          : null;
-
-        // Subagent messages are nested under a parent tool call (e.g., Task).
-        // We keep them out of the main timeline and attach a flattened transcript to the parent ToolUseBlock.
-        if (parentToolUseId) {
-          const nestedTexts: string[] = [];
-          if (isNonEmptyString(contentObj.text)) {
-            nestedTexts.push(cleanText(contentObj.text));
-          }
-          if (Array.isArray(contentObj.content)) {
-            for (const block of contentObj.content) {
-              if (!typeIncludes(block?._type, "TextBlock")) continue;
-              if (isNonEmptyString(block.text)) {
-                nestedTexts.push(cleanText(block.text));
-              }
-            }
-          }
-          const cleaned = nestedTexts
-            .map((t) => t.trim())
-            .filter(Boolean)
-            .join("\n\n");
-          if (cleaned) {
-            subagentTranscriptByToolUseId[parentToolUseId] = [
-              ...(subagentTranscriptByToolUseId[parentToolUseId] || []),
-              cleaned,
-            ];
-          }
-          continue;
-        }
-
-        if (msg.role === "assistant" && Array.isArray(contentObj.content)) {
-          const blocks = contentObj.content;
-
-          const toolUseBlocks = blocks.filter((b) =>
-            typeIncludes(b?._type, "ToolUseBlock"),
-          );
-
-          if (toolUseBlocks.length > 0) {
-            if (!currentAssistantMessage) {
-              currentAssistantMessage = {
-                id: msg.id.toString(),
-                role: "assistant",
-                content: [],
-                status: "completed",
-                timestamp: msg.created_at,
-              };
-              processedMessages.push(currentAssistantMessage);
-            }
-
-            const existingBlocks =
-              currentAssistantMessage.content as MessageBlock[];
-
-            const uiToolBlocks = toolUseBlocks.map((b) => ({
-              _type: "ToolUseBlock" as const,
-              id: typeof b.id === "string" ? b.id : String(b.id ?? ""),
-              name: typeof b.name === "string" ? b.name : String(b.name ?? ""),
-              input:
-                b.input && typeof b.input === "object"
-                  ? (b.input as Record<string, unknown>)
-                  : {},
-            }));
-
-            currentAssistantMessage.content = [
-              ...existingBlocks,
-              ...uiToolBlocks,
-            ];
-          }
-        }
-
-        // ToolResultBlock is typically a user-role message (Anthropic style), but some providers
-        // may emit it under assistant-role. Don't rely on msg.role to attach results.
-        if (Array.isArray(contentObj.content)) {
-          const blocks = contentObj.content;
-          const toolResultBlocks = blocks.filter((b) =>
-            typeIncludes(b?._type, "ToolResultBlock"),
-          );
-
-          if (toolResultBlocks.length > 0) {
-            if (!currentAssistantMessage) {
-              currentAssistantMessage = {
-                id: msg.id.toString(),
-                role: "assistant",
-                content: [],
-                status: "completed",
-                timestamp: msg.created_at,
-              };
-              processedMessages.push(currentAssistantMessage);
-            }
-
-            const uiResultBlocks = toolResultBlocks.map((b) => ({
-              _type: "ToolResultBlock" as const,
-              tool_use_id:
-                typeof b.tool_use_id === "string"
-                  ? b.tool_use_id
-                  : String(b.tool_use_id ?? ""),
-              content: cleanText(
-                typeof b.content === "string"
-                  ? b.content
-                  : (JSON.stringify(b.content) ?? ""),
-              ),
-              is_error: !!b.is_error,
-            }));
-            const existingBlocks =
-              currentAssistantMessage.content as MessageBlock[];
-            currentAssistantMessage.content = [
-              ...existingBlocks,
-              ...uiResultBlocks,
-            ];
-
-            // Keep ToolResultBlock out of the user timeline.
-            if (msg.role === "user") continue;
-          }
-        }
-
-        if (msg.role === "assistant" && Array.isArray(contentObj.content)) {
-          const blocks = contentObj.content;
-          const thinkingBlocks = blocks.filter((b) =>
-            typeIncludes(b?._type, "ThinkingBlock"),
-          );
-
-          const uiThinkingBlocks = thinkingBlocks
-            .map((b) => ({
-              _type: "ThinkingBlock" as const,
-              thinking: cleanText(b.thinking || ""),
-              signature: b.signature,
-            }))
-            .filter((b) => b.thinking.trim().length > 0);
-
-          if (uiThinkingBlocks.length > 0) {
-            if (!currentAssistantMessage) {
-              currentAssistantMessage = {
-                id: msg.id.toString(),
-                role: "assistant",
-                content: [],
-                status: "completed",
-                timestamp: msg.created_at,
-              };
-              processedMessages.push(currentAssistantMessage);
-            }
-
-            const existingBlocks =
-              currentAssistantMessage.content as MessageBlock[];
-
-            currentAssistantMessage.content = [
-              ...existingBlocks,
-              ...uiThinkingBlocks,
-            ];
-          }
-        }
-
-        let textContent = "";
-        if (isNonEmptyString(contentObj.text)) {
-          textContent = cleanText(contentObj.text);
-        } else if (Array.isArray(contentObj.content)) {
-          const textBlocks = contentObj.content
-            .filter((b) => typeIncludes(b?._type, "TextBlock"))
-            .map((b) => (isNonEmptyString(b.text) ? cleanText(b.text) : ""))
-            .filter((t) => t.trim().length > 0);
-          if (textBlocks.length > 0) textContent = textBlocks.join("\n\n");
-        }
-
-        if (textContent) {
-          if (msg.role === "user") {
-            // A user-role message from the SDK is not always a real user input.
-            // Real user inputs are identified by AgentRun.user_message_id (per turn).
-            const isRealUserMessage = canClassifyUserMessages
-              ? realUserMessageIdSet.has(msg.id)
-              : true;
-
-            if (!isRealUserMessage) {
-              // Keep internal user-role text for optional inline display (debug/UX),
-              // but do not render it as a user bubble.
-              if (currentTurnUserMessageId) {
-                internalContextsByUserMessageId[currentTurnUserMessageId] = [
-                  ...(internalContextsByUserMessageId[
-                    currentTurnUserMessageId
-                  ] || []),
-                  textContent,
-                ];
-              }
-              continue;
-            }
-
-            currentAssistantMessage = null;
-            currentTurnUserMessageId = msg.id.toString();
-            processedMessages.push({
-              id: msg.id.toString(),
-              role: "user",
-              content: textContent,
-              status: "completed",
-              timestamp: msg.created_at,
-              attachments: msg.attachments,
-            });
-          } else {
-            if (currentAssistantMessage) {
-              const existingBlocks =
-                currentAssistantMessage.content as MessageBlock[];
-              existingBlocks.push({
-                _type: "TextBlock",
-                text: textContent,
-              });
-            } else {
-              processedMessages.push({
-                id: msg.id.toString(),
-                role: "assistant",
-                content: textContent,
-                status: "completed",
-                timestamp: msg.created_at,
-              });
-            }
-          }
-        }
-      }
-
-      // Attach subagent transcript to tool blocks (main timeline only).
-      for (const message of processedMessages) {
-        if (message.role !== "assistant") continue;
-        if (!Array.isArray(message.content)) continue;
-        message.content = (message.content as MessageBlock[]).map((block) => {
-          if (block._type !== "ToolUseBlock") return block;
-          const transcript = subagentTranscriptByToolUseId[block.id];
-          if (!transcript || transcript.length === 0) return block;
-          return { ...block, subagent_transcript: transcript };
-        });
-      }
-
-      return {
-        messages: processedMessages,
-        internalContextsByUserMessageId,
-      };
+      const messages = await chatService.getRawMessages(sessionId);
+      return buildChatMessages(messages, options);
     } catch (error) {
       console.error("[Chat Service] Failed to get messages:", error);
       return { messages: [], internalContextsByUserMessageId: {} };
     }
   },
 
+  // Full text of a message whose content was offloaded (truncated_message_id).
+  getFullMessageText: async (messageId: number): Promise<string> => {
+    const content = await apiClient.get<MessageContentShape>(
+      API_ENDPOINTS.messageContent(messageId),
+    );
+    return extractMessageText(content);
+  },
+
+  // Full output of a truncated ToolResultBlock.
+  getFullToolResult: async (
+    messageId: number,
+    toolUseId: string,
+  ): Promise<string> => {
+    const output = await apiClient.get<{ content?: unknown } | null>(
+      API_ENDPOINTS.messageToolOutput(messageId, toolUseId),
+    );
+    return toolResultText(output?.content);
+  },
+
+  getToolExecutionOutput: async (
+    executionId: string,
+  ): Promise<Record<string, unknown> | null> => {
+    return apiClient.get<Record<string, unknown> | null>(
+      API_ENDPOINTS.toolExecutionOutput(executionId),
+    );
+  },
+
   getFiles: async (sessionId?: string): Promise<FileNode[]> => {
     if (!sessionId) return [];
 
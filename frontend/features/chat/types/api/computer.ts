@@ -5,4 +5,5 @@
 export interface ComputerBrowserScreenshotResponse {
   tool_use_id: string;
   url: string;
+  thumbnail_url?: string | null;
 }
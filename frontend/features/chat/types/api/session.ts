@@ -63,10 +63,16 @@ export interface MessageResponse {
   id: number;
   role: string;
   content: Record<string, unknown>;
+  // Set when content is a truncated preview of an offloaded message.
+  content_url?: string | null;
   created_at: string; // ISO datetime
   updated_at: string; // ISO datetime
 }
 
+export interface MessageWithFilesResponse extends MessageResponse {
+  attachments?: InputFile[] | null;
+}
+
 export interface ToolExecutionResponse {
   id: string; // UUID
   message_id: number | null;
@@ -74,6 +80,8 @@ export interface ToolExecutionResponse {
   tool_name: string;
   tool_input: Record<string, unknown> | null;
   tool_output: Record<string, unknown> | null;
+  // Set when tool_output is a truncated preview of an offloaded output.
+  tool_output_url?: string | null;
   is_error: boolean;
   duration_ms: number | null;
   created_at: string; // ISO datetime
@@ -16,6 +16,8 @@ export type MessageStatus =
 export type TextBlock = {
   _type: "TextBlock";
   text: string;
+  // Set when the text is a preview of an offloaded message.
+  truncated_message_id?: number;
 };
 
 export type ThinkingBlock = {
@@ -38,6 +40,8 @@ export type ToolResultBlock = {
   tool_use_id: string;
   content: string;
   is_error: boolean;
+  // Set when the content is a preview; the full output is fetched on demand.
+  truncated_message_id?: number;
 };
 
 export type MessageBlock =
@@ -68,6 +72,8 @@ export type ChatMessage = {
   };
   parentId?: string;
   attachments?: InputFile[];
+  // Set when string content is a preview of an offloaded message.
+  truncated_message_id?: number;
 };
 
 export type ChatSession = {
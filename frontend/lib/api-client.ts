@@ -15,6 +15,7 @@ export const API_ENDPOINTS = {
     `/sessions/${sessionId}/messages-with-files`,
   sessionToolExecutions: (sessionId: string) =>
     `/sessions/${sessionId}/tool-executions`,
+  sessionEvents: (sessionId: string) => `/sessions/${sessionId}/events`,
   sessionBrowserScreenshot: (sessionId: string, toolUseId: string) =>
     `/sessions/${sessionId}/computer/browser/${toolUseId}`,
   sessionUsage: (sessionId: string) => `/sessions/${sessionId}/usage`,
@@ -90,9 +91,14 @@ export const API_ENDPOINTS = {
 
   // Messages
   message: (messageId: number) => `/messages/${messageId}`,
+  messageContent: (messageId: number) => `/messages/${messageId}/content`,
+  messageToolOutput: (messageId: number, toolUseId: string) =>
+    `/messages/${messageId}/tool-outputs/${encodeURIComponent(toolUseId)}`,
 
   // Tool Executions
   toolExecution: (executionId: string) => `/tool-executions/${executionId}`,
+  toolExecutionOutput: (executionId: string) =>
+    `/tool-executions/${executionId}/output`,
 
   // Other
   projects: "/projects",